@@ -0,0 +1,60 @@
+"""
+Measure batch extraction throughput by worker count.
+
+Generates a batch of synthetic multi-page Siema invoices and extracts it
+in-process and then with process pools of increasing size, without the
+result cache. Pools are started and warmed up before timing, the way the
+app keeps them alive between batches.
+
+Usage:
+    python benchmarks/bench_parallel.py [--files 48] [--pages 3] [--workers 1 2 4]
+"""
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.synthetic import siema_invoice  # noqa: E402
+from invoice_extractor import VENDORS_BY_KEY  # noqa: E402
+from invoice_extractor.batch import extract_batch, make_worker_pool  # noqa: E402
+from invoice_extractor.document import PdfDocument  # noqa: E402
+
+
+def run_batch(contents: list, executor=None) -> float:
+    spec = VENDORS_BY_KEY["siema"]
+    documents = [PdfDocument(content, f"invoice-{i}.pdf") for i, content in enumerate(contents)]
+    start = time.perf_counter()
+    rows = sum(len(result.rows) for result in extract_batch(documents, spec, executor=executor))
+    elapsed = time.perf_counter() - start
+    assert rows, "synthetic invoices produced no rows"
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=48)
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    contents = [siema_invoice(str(10000 + i), pages=args.pages) for i in range(args.files)]
+    print(f"{args.files} files x {args.pages} pages, {os.cpu_count()} CPU(s)")
+
+    baseline = run_batch(contents)
+    print(f"{'in-process':<12} {baseline:7.2f} s   {args.files / baseline:7.1f} files/s")
+
+    for workers in args.workers:
+        with make_worker_pool(workers) as pool:
+            # Warm-up: spawn every worker and import the extractor there
+            run_batch(contents[:workers], pool)
+            elapsed = run_batch(contents, pool)
+        print(f"{workers:>2} worker(s) {elapsed:7.2f} s   {args.files / elapsed:7.1f} files/s   "
+              f"x{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Measure the per-line cost of matching the extractor patterns.
+
+Every extractor keeps its patterns as module-level compiled objects. This
+compares calling them directly with the module-level re functions the
+extractors used before, which look each pattern up in re's internal cache
+(and recompile it once more than re._MAXCACHE distinct patterns are in
+use, as happens when a session touches many vendors).
+
+Two pattern sets are timed over the lines of a synthetic Siema invoice:
+the Siema module's own patterns, and the patterns of every vendor module.
+
+Usage:
+    python benchmarks/bench_regex.py [--pages 3] [--repeat 5]
+"""
+import argparse
+import importlib
+import os
+import re
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.synthetic import siema_invoice_lines  # noqa: E402
+from invoice_extractor import VENDOR_REGISTRY  # noqa: E402
+
+
+def module_patterns(module) -> list:
+    """Every compiled pattern a module defines at module level, including tuples of them."""
+    patterns = []
+    for value in vars(module).values():
+        if isinstance(value, re.Pattern):
+            patterns.append(value)
+        elif isinstance(value, tuple) and value and all(isinstance(item, re.Pattern) for item in value):
+            patterns.extend(value)
+    return patterns
+
+
+def time_inline(patterns: list, lines: list, repeat: int) -> float:
+    sources = [(pattern.pattern, pattern.flags) for pattern in patterns]
+    best = float("inf")
+    for _ in range(repeat):
+        re.purge()
+        start = time.perf_counter()
+        for line in lines:
+            for source, flags in sources:
+                re.search(source, line, flags)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_compiled(patterns: list, lines: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            for pattern in patterns:
+                pattern.search(line)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    lines = [line for page in siema_invoice_lines(pages=args.pages) for line in page]
+    pattern_sets = {
+        "siema": module_patterns(VENDOR_REGISTRY["Siema"].module),
+        "all vendors": [pattern for spec in VENDOR_REGISTRY.values()
+                        for pattern in module_patterns(spec.module)]
+        + module_patterns(importlib.import_module("invoice_extractor.common")),
+    }
+    print(f"{len(lines)} lines, re cache size {re._MAXCACHE}")
+
+    for label, patterns in pattern_sets.items():
+        inline = time_inline(patterns, lines, args.repeat)
+        compiled = time_compiled(patterns, lines, args.repeat)
+        print(f"{label:<12} {len(patterns):5d} patterns   "
+              f"inline {inline / len(lines) * 1e6:9.1f} us/line   "
+              f"compiled {compiled / len(lines) * 1e6:9.1f} us/line   x{inline / compiled:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Measure text extraction down to an anchor line against whole-page extraction.
+
+For every vendor whose extractor reads pages only down to the line closing
+its items table (`_TEXT_END_RE`, see DocumentPage.text_through()), each
+page is read both ways from a freshly opened document: the number of
+characters handed to text layout, the time per page and the extracted rows
+are compared. Without PDF files, a synthetic Siema invoice with a bank and
+legal footer is used.
+
+Usage:
+    python benchmarks/bench_regions.py [--pages 3] [--repeat 5]
+    python benchmarks/bench_regions.py --vendor siema invoice1.pdf invoice2.pdf
+"""
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.synthetic import INVOICE_FOOTER, siema_invoice  # noqa: E402
+from invoice_extractor import VENDORS_BY_KEY  # noqa: E402
+from invoice_extractor.document import PdfDocument, chars_above  # noqa: E402
+
+
+def count_chars(content: bytes, anchor) -> tuple:
+    """Characters on all pages, and the ones down to each page's `anchor` line."""
+    total = kept = 0
+    with PdfDocument(content) as document:
+        for page in document.pages:
+            plumber_page = page.plumber_page
+            total += len(plumber_page.chars)
+            bottom = page._anchor_bottom(anchor)
+            kept += len(plumber_page.chars if bottom is None else plumber_page.filter(chars_above(bottom)).chars)
+    return total, kept
+
+
+def time_pages(content: bytes, anchor, repeat: int) -> float:
+    """Best time to read every page of a freshly opened document."""
+    best = float("inf")
+    for _ in range(repeat):
+        with PdfDocument(content) as document:
+            start = time.perf_counter()
+            for page in document.pages:
+                if anchor:
+                    page.text_through(anchor)
+                else:
+                    page.extract_text()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def full_page_rows(spec, content: bytes) -> list:
+    """The vendor's rows with every page read whole."""
+    with PdfDocument(content) as document:
+        for page in document.pages:
+            page.text_through = lambda anchor, page=page: page.extract_text()
+        return spec.extractor(document)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("files", nargs="*", help="PDF files of one vendor (default: synthetic Siema invoice)")
+    parser.add_argument("--vendor", help="vendor key of the files")
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.files:
+        if not args.vendor:
+            parser.error("--vendor is required with PDF files")
+        samples = {args.vendor: []}
+        for path in args.files:
+            with open(path, "rb") as f:
+                samples[args.vendor].append(f.read())
+    else:
+        samples = {"siema": [siema_invoice(pages=args.pages, footer=INVOICE_FOOTER)]}
+        for spec in VENDORS_BY_KEY.values():
+            if spec.key not in samples and getattr(spec.module, "_TEXT_END_RE", None):
+                print(f"{spec.key}: reads pages down to an anchor but has no synthetic invoice; pass its PDFs")
+
+    for key, contents in samples.items():
+        spec = VENDORS_BY_KEY[key]
+        anchor = getattr(spec.module, "_TEXT_END_RE", None)
+        if not anchor:
+            print(f"{key}: reads whole pages")
+            continue
+        total = kept = pages = 0
+        full = cropped = 0.0
+        same_rows = True
+        for content in contents:
+            chars, region_chars = count_chars(content, anchor)
+            total += chars
+            kept += region_chars
+            with PdfDocument(content) as document:
+                pages += len(document.pages)
+            full += time_pages(content, None, args.repeat)
+            cropped += time_pages(content, anchor, args.repeat)
+            same_rows &= spec.extractor(content) == full_page_rows(spec, content)
+        print(f"{key:<12} {pages:4d} pages   chars {total:7d} -> {kept:7d} ({kept / max(total, 1):.0%})   "
+              f"full page {full / pages * 1e3:7.2f} ms/page   to anchor {cropped / pages * 1e3:7.2f} ms/page   "
+              f"x{full / cropped:.2f}   rows {'identical' if same_rows else 'DIFFER'}")
+
+
+if __name__ == "__main__":
+    main()
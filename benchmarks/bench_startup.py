@@ -0,0 +1,73 @@
+"""
+Measure cold-start and rerun latency of the Streamlit entry script.
+
+Cold start runs the script in a fresh interpreter, the way the first page
+load does. Rerun executes the already-loaded script again in the same
+process, the way Streamlit does on every widget interaction.
+
+Usage:
+    python benchmarks/bench_startup.py [--script invoiceextreaction.py] [--runs 10]
+"""
+import argparse
+import logging
+import os
+import runpy
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _quiet_streamlit() -> None:
+    """Silence the 'missing ScriptRunContext' warnings of bare-mode execution."""
+    logging.disable(logging.WARNING)
+
+
+def measure_cold_start(script: str, runs: int) -> list:
+    code = (
+        "import logging, runpy, sys; logging.disable(logging.WARNING); "
+        f"sys.path.insert(0, {REPO_ROOT!r}); runpy.run_path({script!r})"
+    )
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def measure_rerun(script: str, runs: int) -> list:
+    _quiet_streamlit()
+    sys.path.insert(0, REPO_ROOT)
+    # First execution pays for imports; it is what cold start already covers.
+    runpy.run_path(script)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        runpy.run_path(script)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(label: str, timings: list) -> None:
+    print(f"{label:<12} min {min(timings) * 1000:8.1f} ms   "
+          f"median {statistics.median(timings) * 1000:8.1f} ms   ({len(timings)} runs)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--script", default=os.path.join(REPO_ROOT, "invoiceextreaction.py"))
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    script = os.path.abspath(args.script)
+    print(f"Script: {script}")
+    _report("cold start", measure_cold_start(script, args.runs))
+    _report("rerun", measure_rerun(script, args.runs))
+
+
+if __name__ == "__main__":
+    main()
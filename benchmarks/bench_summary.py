@@ -0,0 +1,91 @@
+"""
+Measure the per-invoice Extraction Summary on a large batch.
+
+Compares the former summary, which filtered the DataFrame once per invoice
+number and wrote four to six lines per invoice, with summarize_invoices(),
+one groupby pass rendered as a single table. The batch is synthetic: rows
+shaped like the Siema extractor's, spread over invoices of a few pages each.
+
+Usage:
+    python benchmarks/bench_summary.py [--rows 50000] [--items-per-invoice 20] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from invoice_extractor.summary import summarize_invoices  # noqa: E402
+
+ITEMS_PER_PAGE = 8
+
+
+def make_batch(rows: int, items_per_invoice: int) -> pd.DataFrame:
+    """`rows` extracted rows, `items_per_invoice` per invoice, with pages and order numbers."""
+    return pd.DataFrame([{
+        'invoice_number': str(240000 + row // items_per_invoice),
+        'invoice_date': '01.02.2024',
+        'order_number': f"4500{(row // ITEMS_PER_PAGE) % 1000:04d}",
+        'item_number': f"SM 0402-{row % 97}.5/600",
+        'description': 'Diethrich Scissors 13.5 cm - laterally angled, 60 degrees',
+        'quantity': str(1 + row % 9),
+        'unit_price': '59.15',
+        'page': 1 + (row % items_per_invoice) // ITEMS_PER_PAGE,
+    } for row in range(rows)])
+
+
+def per_invoice_filtering(df: pd.DataFrame) -> list:
+    """The former summary: one boolean filter per invoice, lines collected instead of st.write()."""
+    lines = []
+    for invoice_num in df['invoice_number'].unique():
+        invoice_data = df[df['invoice_number'] == invoice_num]
+        lines.append(f"Invoice {invoice_num}:")
+        lines.append(f"  - Total items: {len(invoice_data)}")
+        if 'page_number' in invoice_data.columns:
+            lines.append(f"  - Pages with items: {sorted(invoice_data['page_number'].unique())}")
+        elif 'page' in invoice_data.columns:
+            lines.append(f"  - Pages with items: {sorted(invoice_data['page'].unique())}")
+        else:
+            lines.append("  - Page information: Not available")
+        if 'po_number' in invoice_data.columns and not invoice_data['po_number'].isnull().all():
+            lines.append(f"  - PO Numbers: {', '.join(map(str, invoice_data['po_number'].unique()))}")
+        if 'order_number' in invoice_data.columns and not invoice_data['order_number'].isnull().all():
+            lines.append(f"  - Order Numbers: {', '.join(map(str, invoice_data['order_number'].unique()))}")
+        lines.append("")
+    return lines
+
+
+def best_time(function, df: pd.DataFrame, repeat: int) -> tuple:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(df)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--items-per-invoice", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    df = make_batch(args.rows, args.items_per_invoice)
+    invoices = df['invoice_number'].nunique()
+    filtering, lines = best_time(per_invoice_filtering, df, args.repeat)
+    grouped, summary = best_time(summarize_invoices, df, args.repeat)
+    same_counts = summary['items'].tolist() == [
+        int(line.rsplit(" ", 1)[1]) for line in lines if line.startswith("  - Total items")]
+    print(f"{len(df)} rows, {invoices} invoices")
+    print(f"per-invoice filtering {filtering * 1e3:9.1f} ms   {len(lines)} st.write() calls")
+    print(f"groupby summary       {grouped * 1e3:9.1f} ms   1 table of {len(summary)} rows   "
+          f"x{filtering / grouped:.0f}   item counts {'identical' if same_counts else 'DIFFER'}")
+
+
+if __name__ == "__main__":
+    main()
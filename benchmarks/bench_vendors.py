@@ -0,0 +1,279 @@
+"""
+Benchmark every vendor extractor and check its rows against golden CSVs.
+
+Each vendor's extractor is run over its sample invoice from
+benchmarks/corpus.py, plus any real invoices found under --pdfs
+DIR/<vendor key>/*.pdf. Per vendor it reports pages and rows per second,
+peak RSS, and how the time splits between pdfplumber and the vendor's own
+parsing. The rows of every invoice, in the canonical schema as text_frame()
+shows them, are compared with benchmarks/golden/<vendor key>/<invoice>.csv,
+so a performance change that alters an extracted value fails the run (exit
+status 1). So does an invoice that detect_vendor() does not confidently
+attribute to its vendor, and, for a page-independent vendor, an invoice
+whose pages extracted one at a time, as the pool's page shards are, give
+other rows than the whole document, and rows with numbers canonical_frame()
+cannot read, or whose separators do not fit the vendor's locale (a German
+"48,90" from a vendor not flagged decimal_comma). Finally the sample rows of
+all vendors run go through canonical_frame() as one mixed batch, which must
+read every vendor's numbers and dates as it does for that vendor alone and,
+when every vendor runs, match benchmarks/golden/mixed.csv.
+
+The sample goldens were first written from the extractors of the original
+single-file app, each vendor's numbers and dates read with the locale and
+formats they were emitted in there, so they pin today's output to it.
+
+The split comes from running the extractor twice on one document. The first
+(cold) run has pdfplumber lay out the text of the pages it reads. The second
+(warm) run finds that text cached on the document, so it measures parsing
+alone. pdfplumber's share is the difference. Peak RSS is read in a fresh
+process per vendor, which imports the vendor and reads its invoices once.
+
+Usage:
+    python benchmarks/bench_vendors.py [--vendor siema avalign] [--repeat 3]
+    python benchmarks/bench_vendors.py --pdfs invoices/
+    python benchmarks/bench_vendors.py --update-golden
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.corpus import VENDOR_PAGES, vendor_invoice  # noqa: E402
+from invoice_extractor import VENDORS_BY_KEY  # noqa: E402
+from invoice_extractor.detect import detect_vendor  # noqa: E402
+from invoice_extractor.document import PdfDocument  # noqa: E402
+from invoice_extractor.schema import (  # noqa: E402
+    CANONICAL_SCHEMA, _misread_numbers, canonical_frame, column_mapping, text_frame,
+)
+
+GOLDEN_DIR = os.path.join(REPO_ROOT, "benchmarks", "golden")
+MIXED_GOLDEN = os.path.join(GOLDEN_DIR, "mixed.csv")
+SAMPLE_NAME = "sample"
+
+
+def load_invoices(key: str, pdf_dir) -> list:
+    """(name, PDF bytes) of the vendor's sample invoice and its PDFs under `pdf_dir`."""
+    invoices = [(SAMPLE_NAME, vendor_invoice(key))]
+    vendor_dir = os.path.join(pdf_dir, key) if pdf_dir else None
+    if vendor_dir and os.path.isdir(vendor_dir):
+        for file_name in sorted(os.listdir(vendor_dir)):
+            if file_name.lower().endswith(".pdf"):
+                with open(os.path.join(vendor_dir, file_name), "rb") as f:
+                    invoices.append((os.path.splitext(file_name)[0], f.read()))
+    return invoices
+
+
+def canonical_csv(batches: list) -> str:
+    """(vendor, rows) pairs as CSV text of their canonical_frame(), as text_frame() shows it."""
+    return text_frame(canonical_frame(batches)).to_csv(index=False, lineterminator="\n")
+
+
+def check_golden(path: str, text: str, update: bool) -> str:
+    """Compare canonical_csv() text with its golden CSV, or rewrite it with `update`."""
+    name = os.path.relpath(path, GOLDEN_DIR)
+    if update:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        return "written"
+    if not os.path.exists(path):
+        return "MISSING"
+    with open(path, encoding="utf-8", newline="") as f:
+        golden = f.read()
+    if text == golden:
+        return "ok"
+    for number, (line, expected) in enumerate(zip(text.splitlines(), golden.splitlines()), 1):
+        if line != expected:
+            print(f"  {name} line {number}:\n    golden {expected}\n    now    {line}")
+            break
+    else:
+        print(f"  {name}: {text.count(chr(10)) - 1} rows, golden has {golden.count(chr(10)) - 1}")
+    return "DIFFERS"
+
+
+def check_detection(key: str, name: str, content: bytes) -> str:
+    """'ok' if the invoice is confidently detected as the vendor's, else what was detected."""
+    detection = detect_vendor(content)
+    if detection.is_confident() and detection.spec.key == key:
+        return "ok"
+    detected = detection.spec.key if detection.spec else "nothing"
+    print(f"  {key}/{name}: detected {detected} (confidence {detection.confidence:.2f})")
+    return "WRONG"
+
+
+def check_shards(spec, name: str, content: bytes, rows: list) -> str:
+    """'ok' if extracting each page as its own shard gives the document's rows, '-' if not page independent."""
+    if not spec.page_independent:
+        return "-"
+    with PdfDocument(content) as document:
+        page_count = len(document.pages)
+    sharded = []
+    for index in range(page_count):
+        with PdfDocument(content, page_shard=range(index, index + 1)) as document:
+            sharded.extend(spec.extractor(document))
+    if sharded == rows:
+        return "ok"
+    print(f"  {spec.key}/{name}: {len(sharded)} rows from single-page shards, {len(rows)} from the document")
+    return "DIFFERS"
+
+
+def check_numbers(spec, name: str, rows: list) -> str:
+    """
+    'ok' if canonical_frame() reads every printed number of the rows, each
+    with separators that fit the vendor's decimal_comma; '-' without rows.
+    """
+    if not rows:
+        return "-"
+    df = canonical_frame([(spec, rows)])
+    decimal_comma = pd.Series(spec.decimal_comma, index=df.index)
+    misread = []
+    for column, target in column_mapping(spec, rows[0]).items():
+        if CANONICAL_SCHEMA.get(target) in ("number", "decimal", "integer"):
+            values = pd.Series([row.get(column) for row in rows], index=df.index, dtype="string")
+            flags = _misread_numbers(values, df[target], decimal_comma)
+            misread.extend(f"{column}={value!r}" for value in values[flags])
+    if not misread:
+        return "ok"
+    print(f"  {spec.key}/{name}: {len(misread)} number(s) not read or misread: {', '.join(misread[:3])}")
+    return "MISREAD"
+
+
+def check_mixed_batch(batches: list) -> str:
+    """'ok' if canonical_frame() reads each vendor's rows in one mixed batch as it reads them alone."""
+    batches = [(spec, rows) for spec, rows in batches if rows]
+    mixed = canonical_frame(batches)
+    start = 0
+    differing = []
+    for spec, rows in batches:
+        alone = canonical_frame([(spec, rows)])
+        part = mixed.iloc[start:start + len(rows)].reset_index(drop=True)
+        start += len(rows)
+        for column in alone.columns:
+            if (CANONICAL_SCHEMA.get(column) in ("number", "decimal", "integer", "date")
+                    and alone[column].astype(str).tolist() != part[column].astype(str).tolist()):
+                differing.append(f"{spec.key}.{column}")
+    if not differing:
+        return "ok"
+    print(f"  mixed batch: {', '.join(differing)} read differently than alone")
+    return "DIFFERS"
+
+
+def time_invoice(spec, content: bytes, repeat: int) -> tuple:
+    """Best cold and warm extraction times, and the page count and rows."""
+    cold = warm = float("inf")
+    for _ in range(repeat):
+        with PdfDocument(content) as document:
+            start = time.perf_counter()
+            rows = spec.extractor(document)
+            cold = min(cold, time.perf_counter() - start)
+            start = time.perf_counter()
+            spec.extractor(document)
+            warm = min(warm, time.perf_counter() - start)
+            pages = len(document.pages)
+    return cold, warm, pages, rows
+
+
+def _peak_rss(key: str, contents: list) -> tuple:
+    """Peak RSS in bytes of this process before and after extracting `contents`."""
+    spec = VENDORS_BY_KEY[key]
+    spec.extractor(PdfDocument(vendor_invoice(key)))  # warm-up: imports pdfplumber and the vendor
+    scale = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is in KiB on Linux
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    for content in contents:
+        spec.extractor(PdfDocument(content))
+    return before, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def peak_rss(key: str, contents: list) -> tuple:
+    """_peak_rss() in a freshly spawned process, so vendors do not share a high-water mark."""
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(_peak_rss, (key, contents))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--vendor", nargs="+", choices=sorted(VENDOR_PAGES), metavar="KEY",
+                        help="vendor keys to run (default: all)")
+    parser.add_argument("--pdfs", metavar="DIR", help="directory of real invoices, one subdirectory per vendor key")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-rss", action="store_true", help="skip the peak RSS measurement")
+    parser.add_argument("--update-golden", action="store_true", help="rewrite the golden CSVs from the current rows")
+    args = parser.parse_args()
+    measure_rss = resource is not None and not args.no_rss
+
+    failed = []
+    total_pages = total_rows = 0
+    total_cold = total_warm = 0.0
+    samples = []
+    for key in args.vendor or list(VENDORS_BY_KEY):
+        spec = VENDORS_BY_KEY[key]
+        invoices = load_invoices(key, args.pdfs)
+        pages = row_count = 0
+        cold = warm = 0.0
+        statuses = set()
+        detections = set()
+        shards = set()
+        numbers = set()
+        for name, content in invoices:
+            invoice_cold, invoice_warm, invoice_pages, rows = time_invoice(spec, content, args.repeat)
+            cold += invoice_cold
+            warm += invoice_warm
+            pages += invoice_pages
+            row_count += len(rows)
+            if name == SAMPLE_NAME:
+                samples.append((spec, rows))
+            golden = os.path.join(GOLDEN_DIR, key, f"{name}.csv")
+            statuses.add(check_golden(golden, canonical_csv([(spec, rows)]), args.update_golden))
+            detections.add(check_detection(key, name, content))
+            shards.add(check_shards(spec, name, content, rows))
+            numbers.add(check_numbers(spec, name, rows))
+        status = "DIFFERS" if "DIFFERS" in statuses else "MISSING" if "MISSING" in statuses else statuses.pop()
+        detected = "WRONG" if "WRONG" in detections else "ok"
+        sharding = "DIFFERS" if "DIFFERS" in shards else shards.pop()
+        number_status = "MISREAD" if "MISREAD" in numbers else numbers.pop()
+        if (status in ("DIFFERS", "MISSING") or detected == "WRONG" or sharding == "DIFFERS"
+                or number_status == "MISREAD"):
+            failed.append(key)
+        rss = ""
+        if measure_rss:
+            before, peak = peak_rss(key, [content for _, content in invoices])
+            rss = f"   peak RSS {peak / 2**20:6.1f} MB (+{(peak - before) / 2**20:4.1f})"
+        plumber = max(cold - warm, 0.0)
+        print(f"{key:<18} {len(invoices):2d} file(s) {pages:3d} pages {row_count:4d} rows   "
+              f"{pages / cold:7.1f} pages/s {row_count / cold:8.1f} rows/s   "
+              f"pdfplumber {plumber * 1e3:7.2f} ms ({plumber / cold:4.0%})   parsing {warm * 1e3:6.2f} ms"
+              f"{rss}   golden {status}   detection {detected}   shards {sharding}   numbers {number_status}")
+        total_pages += pages
+        total_rows += row_count
+        total_cold += cold
+        total_warm += warm
+
+    total_plumber = max(total_cold - total_warm, 0.0)
+    print(f"{'total':<18} {total_pages:3d} pages {total_rows:5d} rows   {total_pages / total_cold:7.1f} pages/s "
+          f"{total_rows / total_cold:8.1f} rows/s   pdfplumber {total_plumber / total_cold:.0%} of the time")
+    if len(samples) > 1:
+        mixed = check_mixed_batch(samples)
+        if len(samples) == len(VENDORS_BY_KEY) and mixed == "ok":
+            mixed = check_golden(MIXED_GOLDEN, canonical_csv(samples), args.update_golden)
+        print(f"mixed batch of {len(samples)} vendors: {mixed}")
+        if mixed in ("DIFFERS", "MISSING"):
+            failed.append("mixed batch")
+    if failed:
+        print(f"golden, detection, shard or number mismatch: {', '.join(failed)} "
+              f"(rerun with --update-golden if a changed output is intended)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
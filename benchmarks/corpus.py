@@ -0,0 +1,1200 @@
+"""
+Sample invoices of every supported vendor for the vendor benchmark.
+
+VENDOR_PAGES holds, for each vendor key, the text lines of each page of a
+short invoice in that vendor's layout: a header, two or three line items
+with their lot, order and article lines, and the table's closing line.
+vendor_invoice() prints them into a PDF with synthetic.make_pdf(), so the
+extractors see them through pdfplumber exactly as they would a real
+invoice. The samples follow the layouts the parsers expect, including their
+quirks; the rows extracted from them are recorded in benchmarks/golden/.
+"""
+from typing import Dict, List
+
+from benchmarks.synthetic import make_pdf, siema_invoice_lines
+
+VENDOR_PAGES: Dict[str, List[List[str]]] = {
+    "bumuller": [
+        [
+            "Bumüller GmbH",
+            "Invoice No. 2411870 from 03.06.2024",
+            "your order no. 4500128500",
+            "10-120-14",
+            "Your Item No. BU-1214",
+            "LOT# B2406-01",
+            "Gouge forceps Luer 14 cm",
+            "6pcs 24,80 148,80",
+            "10-120-17",
+            "Your Item No. BU-1217",
+            "Gouge forceps Luer 17 cm",
+            "LOT# B2406-02",
+            "4pcs 26,30 105,20",
+        ],
+        [
+            "Bumüller GmbH",
+            "your order no. 4500128501",
+            "10-124-18",
+            "Your Item No. BU-2418",
+            "LOT# B2406-03",
+            "3pcs 31,00 93,00",
+        ],
+    ],
+    "avalign": [
+        [
+            "Avalign German Specialty Instruments",
+            "Invoice: 240603",
+            "Date: 6/4/2024",
+            "Reference PO: 4500128600",
+            "1.00 N123-45 Scissors Metzenbaum 2.00 EA $ 1,234.50 $ 2,469.00",
+            "Lot/Qty: 12345 / 2",
+            "2.00 N124-10 Probe double ended 5.00 EA $ 14.20 $ 71.00",
+            "Lot/Qty: 12346 / 5",
+        ],
+    ],
+    "amilazzo": [
+        [
+            "A. Milazzo Medizintechnik GmbH - Tuttlingen",
+            "INVOICE NO.: 240815",
+            "Date: 15.08.2024",
+            "POS ARTICLE description qty. each price",
+            "1 Needle holder Mayo-Hegar 14 cm your art.-no.: MI-1020",
+            "M.N.24-08/1234 3 74,78 224,34",
+            "Lot number 2408-117",
+            "2 Dissecting forceps 16 cm your art.-no.: MI-2044",
+            "M.N.24-08/1234 4 91,52 366,08",
+            "Lot number 2408-205",
+            "total net 590,42",
+        ],
+    ],
+    "ackermann": [
+        [
+            "Ackermann Instrumente GmbH - Rudolf-Diesel-Str. 3 - 78604 Rietheim-Weilheim",
+            "Invoice No. 2024117 from 12.03.2024",
+            "Pos. Item No. Your Order No. Qty. Price Discount Total",
+            "10 Item No. NS52500-28-01-1 266870 3pcs. 252,12 23,72 576,96",
+            "Desc. Bone rongeur Luer 15 cm",
+            "curved, 5 mm",
+            "Your Order No. 4500123456 - 01.03.2024",
+            "Lot. 24-0117",
+            "20 Item No. NS11020-16 266870 5pcs. 48,90 4,60 221,50",
+            "Desc. Needle holder Mathieu 16 cm",
+            "Your Order No. 4500123456 - 01.03.2024",
+            "Lot. 24-0203",
+            "Subtotal 798,46",
+        ],
+    ],
+    "betzler": [
+        [
+            "A. Betzler GmbH - Medizintechnik",
+            "Invoice No. 31245",
+            "Date: 04.06.2024",
+            "pos. article description qty. price amount",
+            "your order no. 4500098765 - 28.05.2024",
+            "1 BA 6001-18 micro-scissor, round handle 4 118,19 472,76",
+            "straight, 18 cm",
+            "your art.-no.: N-60018",
+            "MDL Reg. No.: 12345/2024",
+            "Lot number 2405-33",
+            "your order no. 4500098766 - 29.05.2024",
+            "2 BA 2210-14 needle holder, tungsten carbide 5 64,20 321,00",
+            "your art.-no.: N-22101",
+            "Lot number 2405-41",
+            "Total net 793,76",
+        ],
+    ],
+    "hipp": [
+        [
+            "Anton Hipp GmbH - Chirurgische Instrumente",
+            "Invoice No. 70123 Date: 14.02.2024",
+            "Order confirmation 55012",
+            "Your order 4500112233 dtd. 01.02.2024",
+            "3 (1) 1.045.14 AUFRICHT Nasal Speculum 14.5 cm 3,00pcs 20,14 60,42",
+            "Lot: 240117",
+            "4 (2) 1.102.16 KILLIAN Nasal Speculum 16 cm 2,00pcs 31,50 63,00",
+            "Lot: 240122",
+            "Value of goods 123,42",
+        ],
+    ],
+    "aspen": [
+        [
+            "Aspen Surgical Products, Inc.",
+            "6945 Southbelt Dr. SE | Caledonia, MI 49316 11/6/23 CD3038894",
+            "phone: (888) 364-7004 | fax: (616) 698-9281 11/3/23 C1166613",
+            "Part No Description Invoice Qty U of M Unit Price Net Amount",
+            "Line No",
+            "096129BBG Bard-Parker Blade #10 Carbon 4 BX 48.20 192.80",
+            "sterile, 50/box",
+            "LOT: 2311-0412 HTS: 9018.90 COO: US",
+            "372610 Scalpel handle #3 2 EA 12.75 25.50",
+            "LOT: 2310-0988",
+            "Sub Total 218.30",
+        ],
+    ],
+    "bahadir": [
+        [
+            "Bahadir USA LLC",
+            "Invoice # 2664",
+            "Date # 3/14/2024",
+            "P.O. # 450077",
+            "Line Item Description Qty Rate Amount",
+            "1 BU.22.145 Metzenbaum scissors curved 14.5 cm 6 38.50 231.00",
+            "2 BU.31.180 Adson forceps 1x2 teeth 12 cm 10 14.25 142.50",
+            "Lot # 240311",
+            "Total 373.50",
+        ],
+    ],
+    "bauer_hasselbarth": [
+        [
+            "Bauer & Haselbarth Chirurg GmbH",
+            "Invoice Number 240518",
+            "Date 22.05.2024",
+            "Customer Number 10233",
+            "Your Order Number 4500123987",
+            "Pos. Art-No. Description Qty. Price Total",
+            "1 BH-1020 Nasal speculum Killian 14 cm 5 p. 12,50 62,50",
+            "with marking",
+            "LOT: 24117",
+            "2 BH-3310 Uterine Sound Sims 32 cm 3 p. 18,40 55,20",
+            "LOT: 24120",
+            "total 117,70",
+        ],
+    ],
+    "biselli": [
+        [
+            "Biselli Medical Instruments",
+            "INVOICE NO. 24117",
+            "Date 18.04.2024",
+            "Cust.-No. 20811",
+            "Your Order No. 4500124410 - 02.04.2024",
+            "Delivery Note No. 31877 At 17.04.2024",
+            "FDA Registration No. DEV 96 11 617",
+            "Pos. Art.-No. Description Qty. Price Total",
+            "1 BI-0812 Castroviejo Needle Holder 14 cm 4 86,40 345,60",
+            "Lot No. 240412",
+            "LST: AB 1182",
+            "2 BI-0930 Micro Needle Holder straight 6 52,10 312,60",
+            "Total/EUR 658,20",
+        ],
+    ],
+    "blache": [
+        [
+            "Blache Medical GmbH",
+            "Invoice no. 240311",
+            "Invoice Date 11.03.2024",
+            "Your Customer no. 14002",
+            "Your VAT DE811234567",
+            "Pos. Article Description Quantity Price Total",
+            "1 BSI-1204 Bone curette Volkmann fig. 2 8 pcs. 21,30 170,40",
+            "oval, 17 cm",
+            "Your Order No. 4500120091",
+            "delivered with Delivery Note no. LS 240877 Date: 08.03.2024",
+            "PO-No. 4500120091/10",
+            "MDL no. 0815",
+            "2 N6971-15 Bone rongeur Stille-Luer 3 pcs. 96,00 288,00",
+            "Your Order No. 4500120091",
+            "Total / net 458,40",
+        ],
+    ],
+    "carl_teufel": [
+        [
+            "Carl Teufel GmbH & Co. KG",
+            "INVOICE NO. 41 402 1",
+            "Date: 12.03.2024",
+            "JS Page 1",
+            "Article Qty. Description Price Total",
+            "Your order no. 4500119876 - 28.02.2024",
+            "Your art.-no.: NT-4410",
+            "71-1204 4 Bone rongeur Luer 15 cm 64,50 258,00",
+            "curved",
+            "LOT 24A117",
+            "MDL-No. 82212",
+            "Your art.-no.: NT-4415",
+            "71-2210 2 Bone rongeur Stille 18 cm 112,00 224,00",
+            "LOT 24A203",
+            "Total net 482,00",
+            "Total/EUR 482,00",
+        ],
+    ],
+    "chirmed": [
+        [
+            "Chirmed Sp. z o.o.",
+            "VAT Invoice No. DEX/26/2024",
+            "Invoice 2024-03-27",
+            "Order no. 4500118812",
+            "Date of due: 2024-04-26",
+            "Currency: EUR",
+            "No. Description Code Quantity Unit price Value",
+            "1 Needle holder Mayo-Hegar 16 cm CH-1116 3 szt 24,10 72,30",
+            "2 Surgical scissors Mayo curved 17 cm 6szt 18,40 110,40",
+            "TOTAL 182,70",
+        ],
+    ],
+    "cm_instrumente": [
+        [
+            "CM Instrumente GmbH",
+            "INVOICE NO.: 240233",
+            "Date: 05.02.2024",
+            "Cust.-No.: 11870",
+            "POS ARTICLE description qty. each price",
+            "your order no. 4500117734 - 22.01.2024",
+            "your art.-no.: CM-3012",
+            "MDL Reg. No.: 1882",
+            "1 CM-3012 Hemostatic forceps Kelly 14 cm 12 9,80 117,60",
+            "curved",
+            "your art.-no.: CM-3020",
+            "2 CM-3020 Towel clamp Backhaus 11 cm 20 6,15 123,00",
+            "total net 240,60",
+        ],
+    ],
+    "cmf": [
+        [
+            "CMF Medicon Surgical, Inc.",
+            "Date Invoice #",
+            "2/26/2024 27319",
+            "Terms Ship Date P.O. No.",
+            "Net 30 2/23/2024 4500121",
+            "Item Description Qty Rate Amount",
+            "Bone cutter double action 18 cm Lot#: CM24-117 4 86.00 344.00",
+            "Wire twister 14 cm 2 41.50 83.00",
+            "TKG 1Z999AA10123456784 1 0.00 0.00",
+            "P & H 1 25.00 25.00",
+            "Subtotal 452.00",
+        ],
+    ],
+    "dannoritzer": [
+        [
+            "Dannoritzer Medizintechnik GmbH & Co. KG",
+            "INVOICE NO.: 202410",
+            "Date: 14.10.2024",
+            "Cust.-No.: 30117",
+            "Delivery Note 88122 at 11.10.2024",
+            "POS ARTICLE description qty. each price",
+            "Your order no. PO# 07102020 - 07.10.2024",
+            "1 REP-N6933-92Repair Novo Surgical N6933-92ECC 1 pcs. 30,00 30,00",
+            "re-sharpening",
+            "2 D-4410 Tonsil snare Brunings 3 pcs. 44,80 134,40",
+            "Your order no. PO# 02-2500097 - 09.10.2024",
+            "3 D-5120 Nasal forceps Hartmann 2 pcs. 61,00 122,00",
+            "Total net 286,40",
+        ],
+    ],
+    "dausch": [
+        [
+            "Dausch Medizintechnik GmbH",
+            "INVOICE NO.: 24188",
+            "Date: 19.06.2024",
+            "Cust.-No.: 40210",
+            "Delivery Note No. 77311 at 18.06.2024",
+            "POS ARTICLE description qty. each price",
+            "your order no. 4500130021 - 03.06.2024",
+            "10 75D876/6/28 Bone hook Cottle 18 cm 4 22,50 90,00",
+            "sharp",
+            "Lot: 24-0611",
+            "your art.-no.: NV-2211",
+            "20 70D726/23 Periosteal elevator 5 31,20 156,00",
+            "Lot: 24-0613",
+            "total net 246,00",
+        ],
+    ],
+    "denzel": [
+        [
+            "Denzel Medical GmbH",
+            "INVOICE NO.: 31902",
+            "Date: 07.05.2024",
+            "Cust.-No.: 10877",
+            "POS ARTICLE description qty. each price",
+            "your order no. 4500126655 - 22.04.2024",
+            "1 01.71159 Dressing forceps standard 14.5 cm 25 3,90 97,50",
+            "lot number: D24-0412",
+            "MDL-NO. 4471",
+            "2 02.10330 Tissue forceps Adson 1x2 12 cm 10 5,40 54,00",
+            "lot number: D24-0417",
+            "carry-over 151,50",
+        ],
+        [
+            "Denzel Medical GmbH",
+            "INVOICE NO.: 31902",
+            "Date: 07.05.2024",
+            "POS ARTICLE description qty. each price",
+            "your order no. 4500126701 - 25.04.2024",
+            "3 05.44120 Scissors Metzenbaum curved 18 cm 6 12,80 76,80",
+            "lot number: D24-0420",
+            "total net 228,30",
+        ],
+    ],
+    "efinger": [
+        [
+            "Efinger Instruments GmbH",
+            "Ref. Novo Surgical order 4500127788",
+            "A/R Invoice",
+            "Document No. Date Page",
+            "102400312 4/17/2024 1 / 1",
+            "# Description Quantity Price Total EUR",
+            "Based on your Purchase Order 4500127788",
+            "1 Bone Curette Spratt straight 4.00 Stck 38.50 154.00",
+            "Item Code: EF-2210",
+            "Batch-Nr. B24-0409",
+            "2 Raspatory Freer double ended 10.00 Stck 11.20 112.00",
+            "Item Code: EF-3105",
+            "Batch-Nr. B24-0411",
+            "Net Amount 266.00",
+        ],
+    ],
+    "elmed": [
+        [
+            "ELMED Incorporated",
+            "Date Invoice #",
+            "9/11/2024 2409221",
+            "P.O. Number P.O. Date Terms Due Date Rep Ship Date Via",
+            "0016332 06/17/2024 Net 30 10/11/2024 SS 9/11/2024 UPS GROUND",
+            "Order Ship B/O Item No. Description Price Each Amount",
+            "6 6 G1911-68 TITANIUM JEWELER BIPOLAR FORCEPS, 162.00 972.00",
+            "STRAIGHT, 0.5MM TIPS",
+            "UDI#: 00850012345678",
+            "1 1 9014-4054FDI 5MM, 45CM, CLEAR FLUSH, WAVE 646.75 646.75",
+            "1 1 HNDL PACKING AND HANDLING 25.00 25.00",
+            "UPS TRACKING #: 1Z999AA10123456784",
+            "Subtotal 1,643.75",
+        ],
+    ],
+    "ermis": [
+        [
+            "Ermis MedTech GmbH",
+            "PROFORMA-INVOICE: 240091",
+            "Date: 26.03.2024",
+            "Cust.-No.: 50021",
+            "Your inq. No. 4500125120 - 18.03.2024",
+            "Ref-No.: EM-7781",
+            "Delivery: DAP Boston",
+            "POS article description qty. each price",
+            "1 ER290.100 3/4 Wire Basket 4pcs 92,93 371,72",
+            "stainless steel",
+            "2 ER310.220 Sterilisation tray perforated 2pcs 148,00 296,00",
+            "total net 667,72",
+        ],
+    ],
+    "esma": [
+        [
+            "ESMA Inc.",
+            "Date Invoice #",
+            "4/22/2024 11873",
+            "QTY UNITS DESCRIPTION ITEM RATE AMOUNT",
+            "6 ea Kerrison rongeur 40 deg 2mm KR4020 310.00 1,860.00",
+            "thin foot plate",
+            "2 ea Pituitary rongeur straight 3x10mm PR3102 275.00 550.00",
+            "1 Shipping Charges 35.00 35.00",
+            "Shipped 4/22/2024 Trk# 1Z999AA10123456785",
+            "Total 2,445.00",
+        ],
+    ],
+    "euromed": [
+        [
+            "EUROMED SURGICAL",
+            "Invoice No : EM/24/0311 Dated : 11/03/2024",
+            "AWB No : 176-12345675",
+            "PO No Item Description Qty Unit Rate Amount",
+            "QUANTITY & DESCRIPTION OF GOODS",
+            "PARCEL 1",
+            "0017240 G6561-65 harrington forceps 26cm GTN # 18 PCS 25.00 450.00",
+            "G586G6561650",
+            "Excess Qty G6561-65 harrington forceps 26cm 6 PCS 25.00 150.00",
+            "PARCEL 2",
+            "0017241 G4410-18 debakey forceps 18cm GTIN # G586G4410180 12 PCS 19.50 234.00",
+            "atraumatic",
+            "Total USD: 834.00",
+        ],
+    ],
+    "faulhaber": [
+        [
+            "Faulhaber Pinzetten e.K.",
+            "INVOICE NO.: 24311",
+            "Date: 02.07.2024",
+            "Cust.-No.: 10412",
+            "Deb.-Nr.: 774120",
+            "POS ARTICLE description qty. each discount price",
+            "your order no. 4500131234 - 20.06.2024",
+            "1 12/1014 Micro forceps straight 11 cm 5 24,00 30 % 84,00",
+            "platform 0.3 mm",
+            "your art.-no.: NV-7710",
+            "Lot number F24-117",
+            "2 14/2220 Splinter forceps 9 cm 10 8,50 85,00",
+            "Lot number F24-121",
+            "total net 169,00",
+        ],
+    ],
+    "fetzer": [
+        [
+            "Fetzer Instruments Inc.",
+            "DATE INVOICE NO. PAGE",
+            "3/18/2024 118842 1",
+            "ORDER NO. ORDER DATE CUSTOMER NO. CUSTOMER P.O. SALESPERSON SHIP DATE SHIP VIA",
+            "4233755 3/15/2024 40026 4500128 12 3/18/2024 UPS Ground",
+            "qty. ord qty. ship. qty. B/O unit item no. description each ext. price",
+            "10 10 0 ea. FZ-1102 Adson forceps 1x2 12 cm 14.20 142.00",
+            "Lot No. FZ24-031",
+            "Country of origin: Germany",
+            "4 4 0 ea. FZ-2250 Gelpi retractor 18 cm 48.75 195.00",
+            "sharp",
+            "Lot No. FZ24-036",
+            "Sales Amt. 337.00",
+        ],
+    ],
+    "gebruder": [
+        [
+            "Gebrüder Martin GmbH & Co. KG",
+            "Stand: 30.09.2024",
+            "OFFENE POSTEN FÜR KUNDE: 10233 - Novo Surgical Inc.; WÄHRUNG: EUR",
+            "RECHNR. RECHDAT. NETTO MWST BRUTTO FÄLLIG TAGE MAHNST. ÜBERF. ZA",
+            "24711 02.08.2024 1240,50 0,00 1240,50 01.09.2024 30 0 -29 UE",
+            "24893 21.08.2024 388,20 0,00 388,20 20.09.2024 30 0 -10 UE",
+            "SUMME 1628,70 0,00 1628,70",
+        ],
+    ],
+    "geister": [
+        [
+            "Geister Medizintechnik GmbH",
+            "INVOICE # 240517",
+            "Date: 17.05.2024 Customer ID: 20451",
+            "Delivery Note No. 61220 dated 16.05.2024",
+            "Your Order # 4500127001 - 30.04.2024",
+            "POS REF TEXT QTY EACH € TOTAL €",
+            "001 17-1120 Bipolar forceps bayonet 20 cm 3 118,00 354,00",
+            "[NV-1120]",
+            "LOT# G24-0518",
+            "002 17-1132 Bipolar forceps straight 12 cm 5 72,40 362,00",
+            "insulated",
+            "LOT# G24-0521",
+            "Value of goods 716,00",
+        ],
+    ],
+    "georgalber": [
+        [
+            "Georg Alber GmbH",
+            "Invoice No. 24331 dated 14.05.2024",
+            "Customer No. 30288",
+            "Your Order No. 4500126990 - 29.04.2024",
+            "# Item Shipment Qty. Unit Each Total",
+            "1 Item No. 13-2014 31122 / 1 dated 10.05.2024 4 pcs. 48,20 192,80",
+            "Your Item No. NV-5511",
+            "Desc. Hegar uterine dilator 7/8 mm",
+            "double ended",
+            "Lot 2 x AB",
+            "2 Item No. 13-2016 31122 / 2 dated 10.05.2024 2 pcs. 52,00 104,00",
+            "Desc. Hegar uterine dilator 9/10 mm",
+            "Mark CE0123",
+            "Payment: 30 days net",
+        ],
+    ],
+    "getschhiller": [
+        [
+            "Getsch+Hiller Medizintechnik GmbH",
+            "INVOICE NO.: 240722",
+            "Date: 22.07.2024",
+            "Cust.-No.: 10299",
+            "Delivery Note No. 55410 at 19.07.2024",
+            "POS ARTICLE description qty. each price",
+            "your order no. 4500132200 - 08.07.2024",
+            "1 GH-2040 Wound retractor Senn 16 cm 6 21,80 130,80",
+            "blunt",
+            "your art.-no.: NV-2040",
+            "Lot number GH24-071",
+            "2 GH-3105 Skin hook Gillies 18 cm 8 9,60 76,80",
+            "Drwg. No. Z-3105",
+            "Lot number GH24-074",
+            "Terms of delivery: DAP",
+        ],
+    ],
+    "gordonbrush": [
+        [
+            "Gordon Brush Mfg. Co., Inc.",
+            "INVOICE DATE INVOICE # CUSTOMER PO TERMS",
+            "3/05/2024 118201 4500124 Net 30",
+            "Sales Order: 77120",
+            "Ship Via: FedEx Ground",
+            "LINE PART ID DESCRIPTION YOU WE UNIT EXTENDED",
+            "ORDERED SHIPPED PRICE PRICE",
+            "1 GB-2210 Cleaning brush nylon 6 mm 24 24 3.85EA $92.40",
+            "NV-2210 EA 3/05/2024",
+            "2 GB-3150 Channel brush 2.8 mm x 230 cm 50 50 1.95EA $97.50",
+            "single ended",
+            "SUBTOTAL $189.90",
+        ],
+    ],
+    "bissinger": [
+        [
+            "Günter Bissinger Medizintechnik GmbH",
+            "INVOICE NO.: 24066",
+            "Date: 06.06.2024",
+            "Cust.-No.: 10540",
+            "Delivery Note No. 24110 at 05.06.2024",
+            "your order no. 4500129901 - 21.05.2024",
+            "POS ARTICLE description qty. each price",
+            "1 80012345 Bipolar cable 4.5 m US-type 10 28,50 285,00",
+            "your art.-no.: NV-4500",
+            "Lot number B24-221",
+            "Customs tariff number 85444290",
+            "2 80012377 Bipolar forceps bayonet 19 cm 4 96,00 384,00",
+            "insulated, tip 1 mm",
+            "Lot number B24-230",
+            "carry-over 669,00",
+        ],
+        [
+            "Günter Bissinger Medizintechnik GmbH",
+            "INVOICE NO.: 24066",
+            "POS ARTICLE description qty. each price",
+            "your order no. 4500130077 - 28.05.2024",
+            "3 80014410 Monopolar electrode needle 2 mm 20 6,20 124,00",
+            "Drwg. No. Z-14410",
+            "Lot number B24-241",
+            "Total/EUR 793,00",
+        ],
+    ],
+    "hafner": [
+        [
+            "Hafner GmbH Medizintechnik",
+            "Invoice No. RE24117",
+            "Date 04.04.2024",
+            "Customer No. 10321",
+            "Your Order No. 4500125500 from 20.03.2024",
+            "Shipment 8812 / 1",
+            "# Item Shipment Qty. Unit Price (€) Amount (€)",
+            "1 Item No. 20-1140 8812 / 1 from 02.04.2024 6pcs. 34,50/ 207,00",
+            "Your Item N NV-1140",
+            "Lot Desc. Mosquito forceps curved 12 cm",
+            "delicate",
+            "Lot 2 x 3",
+            "manufactured 01.03.2024",
+            "2 Item No. 20-1180 8812 / 1 from 02.04.2024 4pcs. 41,00/ 164,00",
+            "Lot Desc. Kelly forceps straight 14 cm",
+            "Subtotal 371,00",
+        ],
+    ],
+    "heissmedical": [
+        [
+            "Heiss Medical GmbH",
+            "INVOICE NO.: 24519",
+            "Date: 19.05.2024",
+            "Cust.-No.: 10288",
+            "Delivery Note No. 33120 at 17.05.2024",
+            "your order no. 4500127312 - 06.05.2024",
+            "POS. ARTICLE description qty. each price",
+            "1 10245 Metzenbaum dissecting scissors 14 cm 5 42,10 210,50",
+            "your art.-no.: NV-1024",
+            "Lot number H24-0511",
+            "MDL Reg. No.: 771",
+            "2 10390 Mayo-Hegar needle holder 16 cm 8 27,80 222,40",
+            "Lot number H24-0514",
+            "total net 432,90",
+        ],
+    ],
+    "hermann": [
+        [
+            "Hermann Medizintechnik GmbH",
+            "COMMERCIAL INVOICE: 240812",
+            "Cust.-No. Date Our sign Your inq. No. Your inq. date",
+            "10771 12.08.2024 HM 4500133120 29.07.2024",
+            "POS ARTICLE description lot number: qty. each price",
+            "1 H10-2214 Gouge Partsch 5 mm 18 cm 3 46,20 138,60",
+            "hollow handle",
+            "lot number: HM24-081",
+            "your art.-no.: NV-2214",
+            "2 H12-1050 Chisel Partsch 8 mm H24/0077 2 44,00 88,00",
+            "MDL Reg. No.: 5512",
+            "total net 226,60",
+        ],
+    ],
+    "hgr": [
+        [
+            "HGR Medizintechnik GmbH",
+            "INVOICE NO.: 240512",
+            "Date: 12.08.2024",
+            "Cust.-No.: 10771",
+            "your order no. 4500133001 - 25.07.2024",
+            "POS ARTICLE description qty. each price",
+            "1 54-130/14 Bone rongeur Luer 14 cm 4 52,00 208,00",
+            "curved",
+            "Lot number HG24-0801",
+            "your art.-no.: NV-5413",
+            "2 55-210/18 Bone rongeur Stille 18 cm 2 96,50 193,00",
+            "LST #: 2241",
+            "total net 401,00",
+        ],
+        [
+            "HGR Medizintechnik GmbH",
+            "2nd reminder",
+            "Cust.-No.: 10771",
+            "Date: 01.10.2024",
+            "Invoice No. Invoice Date due since falling since gross amount",
+            "240512 12.08.2024 11.09.2024 20 Tage 401,00",
+        ],
+    ],
+    "holger": [
+        [
+            "Holger Medical Instruments",
+            "Invoice No. 55012",
+            "Invoice Date Customer ID",
+            "3/12/2024 C10221",
+            "Packing Slip 88214",
+            "Ln Qty Item Description",
+            "1 12 H2204 Kerrison rongeur 2mm 40 deg up",
+            "4500123 HL24-031 MDL7781 EA 12 12 $185.00 $2,220.00",
+            "2 6 K1180 Pituitary rongeur straight 3x10mm",
+            "4500123 HL24-044 MDL7790 EA 6 6 $142.50 $855.00",
+            "Net amount $3,075.00",
+        ],
+    ],
+    "ilg": [
+        [
+            "ILG Instrumente GmbH",
+            "INVOICE NO.: 240419",
+            "Date: 19.04.2024",
+            "Cust.-No.: 10990",
+            "Delivery Note No. 20418 at 18.04.2024",
+            "your order no. 4500125811 - 05.04.2024",
+            "POARTICLE description qty. each price",
+            "1 12-IL-140-01 Bone curette Brun 14 cm 4 18,50 74,00",
+            "oval cup",
+            "lot number: IL24-0411",
+            "Drawing no.: Z-140",
+            "Index: B",
+            "2 12-IL-160-02 Bone curette Brun 16 cm 4 19,80 79,20",
+            "lot number: IL24-0412",
+            "LST: 3345",
+            "total net 153,20",
+        ],
+    ],
+    "josef_betzler": [
+        [
+            "Josef Betzler GmbH",
+            "Invoice No.: 71203",
+            "Date: 22.04.2024",
+            "acc.no.: 20417",
+            "your ref.: 4500126001 dtd.: 10.04.2024",
+            "Orderconfirmation",
+            "Your order 4500126001 dtd. 10.04.2024",
+            "your Ref.: 88-140",
+            "1 JB-140-18 Tissue forceps 14 cm 10 ea 12,40 124,00",
+            "LST A1402",
+            "Charge: B2404-17",
+            "Classification: I",
+            "delicate serrated tips",
+            "your Ref.: 88-160",
+            "2 JB-160-20 Tissue forceps 16 cm 6 ea 14,90 89,40",
+            "Charge: B2404-18",
+            "Value of goods 213,40",
+        ],
+    ],
+    "kapp": [
+        [
+            "KAPP GmbH Chirurgische Instrumente",
+            "COMMERCIAL INVOICE : 240533",
+            "Date : 24.04.2024",
+            "Cust.-No. : 31007",
+            "Delivery Note No. 30512 dt. 23.04.2024",
+            "POS. ARTICLE description qty. each price",
+            "your order no. 4500126210 - 11.04.2024",
+            "1 K1202-14 Needle holder Mayo-Hegar 14 cm 8 21,60 172,80",
+            "tungsten carbide inserts",
+            "lot number: K24-1187",
+            "Device Listing: D334512",
+            "2 K1202-18 Needle holder Mayo-Hegar 18 cm 4 25,10 100,40",
+            "lot number: K24-1188",
+            "Our item-no. 55-1218",
+            "total net 273,20",
+        ],
+    ],
+    "kohler": [
+        [
+            "Kohler Medizintechnik GmbH",
+            "INVOICE NO.: 9012477",
+            "Date: 25.04.2024",
+            "Customer No.: 44120",
+            "Delivery Note No. 7765 of 24.04.2024",
+            "Pos. Ref. Description Qty. Unit Price Total",
+            "your order no. 4500126330 - 12.04.2024",
+            "1 10 Mosquito forceps curved 12 cm 20 6,40 128,00",
+            "Ref-No.: KO-112-12",
+            "LST: 12",
+            "Lot number 240412",
+            "2 20 Mosquito forceps straight 12 cm 20 6,10 122,00",
+            "Ref-No.: KO-111-12",
+            "fine pattern",
+            "Lot number 240413",
+            "total net 250,00",
+        ],
+    ],
+    "medin": [
+        [
+            "Medin Corporation",
+            "Invoice",
+            "118804",
+            "Invoice Date 4/26/2024",
+            "Packing Slip PS-55120",
+            "Ordered Shipped Description Tax Unit Price Amount",
+            "10 10 MD-2210 - Biopsy needle 14G 12.5000 125.00",
+            "Customer Order 4500126400",
+            "Customer Part ID: 77-2210",
+            "5 5 MD-2212 - Biopsy needle 16G 1,210.0000 6,050.00",
+            "Customer PO 4500126401",
+            "Sub Total 6,175.00",
+        ],
+    ],
+    "microqore": [
+        [
+            "microqore GmbH",
+            "INVOICE 240611 29.04.2024",
+            "Customer No. 15022",
+            "POS Item No. Desc. Quantity each Total",
+            "EUR EUR",
+            "Delivery305512 / 1 from 19.04.2024",
+            "10 MQ4-4060-21TC-C Micro scissors curved 15pieces",
+            "48,00 720,00",
+            "Drawing Z4060-21",
+            "15 x Lot2404 Lot-CodeA7",
+            "(M4060-21)",
+            "tungsten carbide",
+            "20 MQ4-4062-18 Micro forceps 6pieces",
+            "52,50 315,00",
+            "Lot2405 Lot-CodeB1",
+            "Line Value 1035,00",
+        ],
+    ],
+    "otto_ruttgers": [
+        [
+            "Otto Ruttgers GmbH & Co. KG",
+            "INVOICE NO. 552019",
+            "Cust.-No. 60133",
+            "Date 30.04.2024",
+            "Delivery Note No. 88120 at 29.04.2024",
+            "POS.ARTICLE description your order no. qty. each price",
+            "1 OR-1220 Dressing forceps 14 cm 12 pcs. 4,80 57,60",
+            "anatomical",
+            "your art.-no.: 11-1220",
+            "LOT 2404-09;",
+            "your order no. 4500126512 - 15.04.2024",
+            "2 OR-1240 Dressing forceps 16 cm 12 pcs. 5,30 63,60",
+            "LOT 2404-10;",
+            "your order no. 4500126513 - 16.04.2024",
+            "total net 121,20",
+        ],
+    ],
+    "phoenix": [
+        [
+            "Phoenix Instruments",
+            "Invoice Number: 0072215-IN",
+            "Invoice Date: 5/2/2024",
+            "Customer Number: 01-MEDI01",
+            "Order Number: 0071940",
+            "Order Date 4/18/2024",
+            "Customer P.O. 4500126600",
+            "Item Number Alias item Description Ordered Shipped Back Ordered Price Amount",
+            "106-5324 2.00 2.00 0.00 18.69 37.38",
+            "G1764-35 Kelly forceps curved Whse: 000",
+            "106-5330 3.00 3.00 0.00 21.15 63.45",
+            "G1764-40 Kelly forceps straight Whse: 000",
+            "Net Invoice 100.83",
+        ],
+    ],
+    "precision_medical": [
+        [
+            "Precision Medical Manufacturing",
+            "INVOICE Number: 33871",
+            "Date: April 30, 2024",
+            "ORDER NO. 21544",
+            "SHIP DATE 4/29/2024",
+            "101-204-330",
+            "QTY QTY BACK PMM PN / DESCRIPTION UNIT TOTAL",
+            "2 EA 2 - 5096-10/UR6107-21 Kerrison rongeur 3mm $245.00 $490.00",
+            "DATE CODE: 2404A",
+            "1 EA 1 - 5096-12/UR6107-23 Kerrison rongeur 5mm $1,260.00 $1,260.00",
+            "DATE CODE: 2404B",
+            "SUBTOTAL $1,750.00",
+        ],
+    ],
+    "rebstock": [
+        [
+            "Rebstock Instruments GmbH",
+            "COMMERCIAL INVOICE : 240877",
+            "DATE : 03.05.2024",
+            "CUST.-NO. : 5120",
+            "Delivery Note No. 41902 of 02.05.2024",
+            "POS ARTICLE DESCRIPTION QTY. UNIT TOTAL",
+            "Your order no. 4500126700 - 19.04.2024",
+            "1 12-04-140 Wound hook Volkmann 4 prongs 10 pcs. 9,20 92,00",
+            "blunt",
+            "your art.-no.: 33-4140",
+            "LST No.: R12",
+            "Lot No. RB2404",
+            "2 12-06-160 Wound hook Volkmann 6 prongs 10 pcs. 10,40 104,00",
+            "Lot No. RB2405",
+            "TOTAL/EUR 196,00",
+        ],
+    ],
+    "rica": [
+        [
+            "Rica Surgical Products, Inc.",
+            "Date Invoice #",
+            "05/06/2024 20117",
+            "Ord Number 18442",
+            "P.O. Number 4500126800",
+            "Quantity B/O Item Code Description Price Each Amount",
+            "20 0 WSR-6 Weitlaner retractor 6 in 10.32 206.40",
+            "LOT# R24-118",
+            "sharp prongs",
+            "10 0 WSR-8 Weitlaner retractor 8 in 12.75 127.50",
+            "LOT# R24-119",
+            "Total USD 333.90",
+        ],
+    ],
+    "rudischhauser": [
+        [
+            "Rudischhauser GmbH",
+            "INVOICE : 24118",
+            "Customer No. : 70031",
+            "Date : 07.05.2024",
+            "supplier no. : 4471",
+            "pos item description quantity € each € total",
+            "Your P.O. no. 4500126901 - 22.04.2024",
+            "1 RU 1204-14",
+            "Mayo scissors straight 14 cm 10 pcs. 7,90 € 79,00 €",
+            "supercut",
+            "Lot number 2404 / 11",
+            "2 RU 1206-17",
+            "Mayo scissors curved 17 cm 5 pcs. 8,60 € 43,00 €",
+            "Lot number 2404 / 12",
+            "Total net 122,00 €",
+        ],
+    ],
+    "rudolfstorz": [
+        [
+            "Rudolf Storz GmbH",
+            "INVOICE 2024318 Date 08.05.2024",
+            "Cust.-No.",
+            "PM 50321",
+            "POS ARTICLE description qty. each EUR",
+            "your order no. 4500127001 - 23.04.2024",
+            "1 RS-2204 Metzenbaum scissors 18 cm 1 St. 80,55 80,55",
+            "curved, blunt",
+            "Chargen-/Lot-Nr. 24-0815",
+            "2 RS-2206 Metzenbaum scissors 20 cm 2 St. 84,10 168,20",
+            "Chargen-/Lot-Nr. 24-0816",
+            "total net 248,75",
+        ],
+    ],
+    "ruhof": [
+        [
+            "The Ruhof Corporation",
+            "Invoice No. Date Order No. Order Date Customer No. P.O. No.",
+            "4969153-IN 5/9/2024 0890258 4/25/2024 00-0031456 0016494",
+            "UNITS UOM ITEM CODE DESCRIPTION PKGS PRICE AMOUNT",
+            "2 EACH 34560-21 PREPZYME w/BIOCLEAN TECH 2 16.91 33.82",
+            "(32oz/946ml with foam sprayer)",
+            "4 CASE 34519-27 ENDOZIME SLS 4 42.50 170.00",
+            "Net Invoice: 203.82",
+        ],
+    ],
+    "sua": [
+        [
+            "S.u.A. Martin GmbH & Co. KG",
+            "INVOICE NO.:240955",
+            "Cust.-No.:10884",
+            "Date:10.05.2024",
+            "DEV-No.:D-771",
+            "POS. ARTICLE description qty. each price",
+            "1 SAM 12/30 4 15,20 60,80",
+            "Bone rongeur Luer 15 cm",
+            "your order no. 4500127101 - 24.04.2024",
+            "your art.: 77-1230",
+            "Lot number 2405/3",
+            "2 SAM 12/32 2 17,40 34,80",
+            "Bone rongeur Luer 17 cm",
+            "your order no. 4500127101 - 24.04.2024",
+            "Lot number 2405/4",
+            "total net 95,60",
+        ],
+    ],
+    "schmid": [
+        [
+            "Schmid Medizintechnik",
+            "INVOICE NO.: 81432",
+            "Date: 13.05.2024",
+            "Cust.-No.: 2281",
+            "Delivery Note No. 61220 at 10.05.2024",
+            "POS article description qty. each price",
+            "1 SCH-4410 Tissue scissors 12 cm 6 11,30 67,80",
+            "your order no. 4500127202 - 26.04.2024",
+            "your art.-no.: 12-4410",
+            "lot number: S2405-1",
+            "sharp/sharp",
+            "2 SCH-4412 Tissue scissors 14 cm 6 12,80 76,80",
+            "your order no. 4500127202 - 26.04.2024",
+            "lot number: S2405-2",
+            "total net 144,60",
+        ],
+    ],
+    "sgs": [
+        [
+            "SGS North America Inc.",
+            "INVOICE No: 90233817",
+            "Issue Date : May 14, 2024",
+            "Client Medi Instruments Inc.",
+            "Account No. : 4410-22",
+            "Our Refer. No. : LAB-24-0512",
+            "Client Ref No. : QA-118",
+            "PO No. : 4500127300",
+            "Description Quantity Net Amount Amount",
+            "Sterility test ISO 11737-2 3 420.00 1,260.00",
+            "Bioburden determination 2 180.00 360.00",
+            "Processing Fee 25.00 25.00",
+            "Sub-Total 1,645.00",
+        ],
+    ],
+    "sibel": [
+        [
+            "SIBEL S.A.S.",
+            "INVOICE N° 24001187",
+            "Date 15/05/2024",
+            "Pos. Item N° Description Qty Unit Unit price Amount",
+            "1 18-2-0176-0010 DEBAKEY MICRO CLAMP 10 MM 1 1 510,88 510,88",
+            "Your article ref. : MC-0176",
+            "LOT : 24-1187",
+            "2 18-2-0176-0015 DEBAKEY MICRO CLAMP 15 MM 2 1 528,40 1056,80",
+            "Total ExVAT 1567,68",
+        ],
+    ],
+    # Two invoices in one PDF: rows of the second must not be lost after the first one's total
+    "siema": (siema_invoice_lines("24118", pages=2, items_per_page=3)
+              + siema_invoice_lines("24119", pages=2, items_per_page=3)),
+    "sigtech": [
+        [
+            "SignTech Inc.",
+            "DATE INVOICE NO. PAGE",
+            "5/16/2024 60221 1",
+            "ORDER NO. ORDER DATE CUST NO. CUSTOMER PO PURCHASE ORDER SHIP DATE SHIP VIA",
+            "18877 4/30/2024 3310 4500127400 PO-22 5/15/2024 UPS Ground",
+            "qty. ord qty. ship. qty. b/o unit item no. description unit price ext. price",
+            "10 10 0 EA ST-2210 Instrument tag laser marked 12.50 125.00",
+            "stainless steel",
+            "Lot No. LT2405",
+            "Country of origin: USA",
+            "5 5 0 EA ST-2212 Instrument tag blank 1,010.00 5,050.00",
+            "Sales Amt. 5,175.00",
+        ],
+    ],
+    "sis": [
+        [
+            "Surgical Instrument Service",
+            "Invoice # .......... S-24-0517",
+            "P.O. .......... 4500127500",
+            "Order Date .......... 5/1/2024",
+            "Date Shipped .......... 5/17/2024",
+            "Bill To:",
+            "NOVO SURGICAL SUPPLY",
+            "100 INDUSTRIAL DRIVE",
+            "USA",
+            "__________",
+            "Item Qty. Price Ext.",
+            "Sharpening scissors up to 7 in 12 $9.50 $114.00",
+            "incl. passivation",
+            "Retipping needle holder TC 4 $38.00 $152.00",
+            "Subtotal $266.00",
+        ],
+    ],
+    "sitec": [
+        [
+            "SITEC SURGICAL INSTRUMENTS",
+            "INVOICE NO. SI-24-0311",
+            "DATE: 5/20/2024",
+            "Country of Origin: PAKISTAN",
+            "S.# Product Description Order No. Qty Unit Price Amount",
+            "1 SI-1140 Adson forceps 12 cm 4500127600 50 2.85 142.50",
+            "serrated",
+            "LST 1140-A",
+            "2 SI-1142 Adson forceps 1x2 teeth 4500127600 50 3.10 155.00",
+            "TOTAL PIECES 100",
+        ],
+    ],
+    "smt": [
+        [
+            "SMT Surgical Medical Technology",
+            "INVOICE NO.: SMT-24-0420",
+            "Date: 21.05.2024",
+            "Your order no. 4500127700 - 06.05.2024",
+            "LST Reg. No.: 3004471",
+            "POS ARTICLE Description qty each total",
+            "1 SMT-3110 Iris scissors straight 10 6,90 69,00",
+            "Index: B",
+            "Lot number 24-118",
+            "2 SMT-3112 Iris scissors curved 10 7,20 72,00",
+            "delicate",
+            "Lot number 24-119",
+            "Value of goods 141,00",
+        ],
+    ],
+    "stengelin": [
+        [
+            "Stengelin Medical GmbH",
+            "I N V O I C E NO.: 241187",
+            "Date: 22.05.2024",
+            "Cust.-No.: 11902",
+            "DEV-No. 3011",
+            "POS ITEM NO. Article piece U-Price EUR",
+            "your order no. 4500127800 - 07.05.2024",
+            "10 03.510-38 Osteotome Lambotte 10 mm 2 38,40 76,80",
+            "straight",
+            "lot number L2405-07",
+            "LST-NO: 44-510",
+            "20 03.510-42 Osteotome Lambotte 15 mm 2 39,90 79,80",
+            "lot number L2405-08",
+            "item amount 156,60",
+        ],
+    ],
+    "steris": [
+        [
+            "STERIS Corporation",
+            "5960 Heisley Road Mentor OH Phone 440-354-2600 91288410",
+            "INVOICE DATE PAGE",
+            "23-MAY-24 1",
+            "CUSTOMER NUMBER",
+            "399024 52247",
+            "PURCHASE ORDER NUMBER",
+            "4500127900",
+            "SALES ORDER NUMBER",
+            "7712045",
+            "SHIP DATE 22-MAY-24",
+            "1Z999AA10123456784",
+            "LINE ORDERED BACK ORD. SHIPPED ITEM DESCRIPTION",
+            "1 0.00 30808 FLAT CAP VENT BROWN TINT DIA 0.625 X 25 25 1.00 14.84 371.00",
+            "0.187 IN",
+            "2 0.00 30810 FLAT CAP VENT BLUE TINT 10 10 1.00 15.20 152.00",
+            "SUBTOTAL 523.00",
+        ],
+    ],
+    "stork": [
+        [
+            "Stork Medical Instruments",
+            "INVOICE NO.: 240611",
+            "Date: 24.05.2024",
+            "Cust.-No.: 3307",
+            "Pos. Article No. description qty. each price",
+            "your order no. 4500128001 - 08.05.2024",
+            "LST. No.: 7712",
+            "1 54.468-01 Day Ear Hook Blunt 16.0cm 5 11,90 59,50",
+            "S.Nr. 1140 / Schmelze: 88A",
+            "2 54.468-02 Day Ear Hook Sharp 16.0cm 5 12,40 62,00",
+            "angled",
+            "total net 121,50",
+        ],
+    ],
+    "tontarra": [
+        [
+            "Tontarra Medizintechnik GmbH",
+            "INVOICE No.: 2400871",
+            "DATE: 27.05.2024",
+            "Customer: 20155",
+            "Our ref.: TM-4471",
+            "DEV: 30021",
+            "DELIVERY NOTE No. 2400799 date 24.05.2024",
+            "Pos. Art.No. Description Lot number qty. each price",
+            "your order 4500128101 - 10.05.2024",
+            "LST: 249-A",
+            "HS code: 90189084",
+            "10 249-072-05ATCC SWING-SYSTEM ® KERRISON Punch 82402970 1 699,40 699,40",
+            "2 mm, 130 degrees",
+            "your art.no.: KP-0502",
+            "20 TONO/249-072-04 SWING-SYSTEM ® KERRISON Punch T01-82102604 2 1.399,40 2.798,80",
+            "total net 3.498,20",
+        ],
+    ],
+    "total_titanium": [
+        [
+            "Total Titanium, Inc.",
+            "Invoice #: 118204",
+            "Invoice Date: 5/28/2024",
+            "PO Number: 4500128200",
+            "------------------------Part # / Description------------------------",
+            "H-0397 - Paton Spatula and Spoon DBL-Ended 6mm Teardrop- 5 $42.50/ EA $212.50",
+            "Shaped Spoon",
+            "Job Traveler 55120",
+            "H-0399 - Paton Spatula and Spoon DBL-Ended 8mm 3 $44.00/ EA $132.00",
+            "Sub-total: $344.50",
+        ],
+    ],
+    "vinzenz_sattler": [
+        [
+            "Vinzenz Sattler GmbH",
+            "Invoice No. 24117 from 29.05.2024",
+            "Customer No. 8812",
+            "DEV : 40117",
+            "Order Item Qty. each Total",
+            "4500128 / 1 - 13.05.2024",
+            "Listing No. L-3153",
+            "10 Item No. S 315 3206 12pcs. 8,40 100,80",
+            "Desc. Hegar dilator 6 mm",
+            "double ended",
+            "Lot 12 x 2405A",
+            "20 Item No. S 315 3208 12pcs. 8,90 106,80",
+            "Desc. Hegar dilator 8 mm",
+            "Lot 12 x 2405B",
+            "Line Value 207,60",
+        ],
+    ],
+    "vollrath": [
+        [
+            "The Vollrath Company, L.L.C.",
+            "Customer Order Number Order Date Terms Salesperson Invoice No. Invoice Date",
+            "4500128 05/14/24 NET30 Sales 17 2204115 05/30/24",
+            "Ordered Shipped U/M Catalog No. Item Description Unit Price Extension",
+            "6 6 EA 30042M STERILIZATION TRAY/BATH SET 4\" PAN 22 GA 45.9000 EA 275.40",
+            "with cover",
+            "12 12 EA 80122 INSTRUMENT TRAY 10 X 6 IN 18.2500 EA 219.00",
+            "Seller warrants that the goods are free of defects",
+        ],
+    ],
+    "weba": [
+        [
+            "WEBA Medizintechnik",
+            "INVOICE NO.: 241902",
+            "Date: 31.05.2024",
+            "Cust.-No.: 1552",
+            "DEV: 20934",
+            "Our sign: KB",
+            "Cred.No.: 70112",
+            "POS ARTICLE/ description qty. each price",
+            "your order no. 4500128301 - 15.05.2024",
+            "LST: 70 - 013",
+            "10 WB 70-013 Citelly Rongeur 2,0 mm bite 3 86,50 259,50",
+            "upwards",
+            "Lot number 2405-17 / 2405-18",
+            "your art.-no.: CR-20",
+            "20 WB 70-015 Citelly Rongeur 3,0 mm bite 3 88,20 264,60",
+            "Lot number 2405-19",
+            "total net 524,10",
+        ],
+    ],
+    "yw": [
+        [
+            "Y&W Technologies",
+            "Invoice Number: 95597",
+            "Invoice Date: 05/31/2024",
+            "Customer: NOVO SURGICAL",
+            "PO Number: 4500128400",
+            "JOB/LOT# 24-0531",
+            "Terms: Net 30",
+            "Item Quantity Description Revision Unit Price Amount",
+            "1 2 E7210-44E - Retractor blade 44 mm $125.00/ EA $250.00",
+            "anodized",
+            "Order No: 55120",
+            "Packing List: 8812",
+            "2 4 E7210-52E - Retractor blade 52 mm $1,130.00/ EA $4,520.00",
+            "Order No: 55120",
+            "Packing List: 8812",
+            "Sub-total: $4,770.00",
+        ],
+    ],
+}
+
+
+def vendor_invoice(key: str) -> bytes:
+    """The sample invoice of vendor `key` as a PDF."""
+    return make_pdf(VENDOR_PAGES[key])
@@ -0,0 +1,101 @@
+"""
+Synthetic invoice PDFs for the benchmarks.
+
+Writes minimal text-only PDFs (Helvetica, one text object per page) so the
+benchmarks run without real invoices. pdfplumber still does its full layout
+analysis on them, which is the cost the benchmarks care about.
+"""
+from typing import List, Sequence
+
+# Bank details and legal boilerplate at the foot of every page of a German invoice
+INVOICE_FOOTER = (
+    "Siegfried Martin GmbH - Medizintechnik - Im Gewerbepark 7 - 78532 Tuttlingen - Germany",
+    "Managing directors: S. Martin, K. Martin - Registered office: Tuttlingen - Register court: Stuttgart HRB 123456",
+    "VAT ID: DE123456789 - Tax No.: 12345/67890 - WEEE Reg. No.: DE 12345678 - EORI: DE1234567",
+    "Volksbank Schwarzwald-Donau-Neckar eG - IBAN: DE12 6439 0130 0012 3456 78 - BIC: GENODES1TUT",
+    "Sparkasse Tuttlingen - IBAN: DE98 6435 0070 0000 1234 56 - BIC: SOLADES1TUT",
+    "Our general terms and conditions of sale and delivery apply exclusively. Goods remain our property",
+    "until paid in full. Place of performance and jurisdiction is Tuttlingen. Payment: 30 days net.",
+)
+
+
+def _escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages: List[List[str]], footer: Sequence[str] = ()) -> bytes:
+    """
+    Build a PDF with one page per entry of `pages`, each a list of text
+    lines printed from the top, and the `footer` lines at the foot of every page.
+    """
+    objects: List[bytes] = []
+
+    def add(obj: bytes) -> int:
+        objects.append(obj)
+        return len(objects)
+
+    font_id = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+    pages_id = add(b"")  # filled in once the page ids are known
+    kids = []
+    for lines in pages:
+        ops = ["BT /F1 9 Tf 11 TL 40 800 Td"]
+        ops += [f"({_escape(line)}) Tj T*" for line in lines]
+        ops.append("ET")
+        if footer:
+            ops.append("BT /F1 7 Tf 9 TL 40 70 Td")
+            ops += [f"({_escape(line)}) Tj T*" for line in footer]
+            ops.append("ET")
+        stream = "\n".join(ops).encode("cp1252")
+        content_id = add(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        kids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 595 842] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 %d 0 R >> >> >>" % (pages_id, content_id, font_id)
+        ))
+    objects[pages_id - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids))
+    catalog_id = add(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + obj + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, catalog_id, xref)
+    return out
+
+
+def siema_invoice_lines(invoice_number: str = "12345", pages: int = 3,
+                        items_per_page: int = 12) -> List[List[str]]:
+    """The text lines of each page of a Siema-layout invoice, `items_per_page` line items per page."""
+    pdf_pages = []
+    position = 1
+    for page in range(pages):
+        lines = [
+            "SIEMA - Siegfried Martin GmbH - Medizintechnik",
+            f"INVOICE NO.: {invoice_number}",
+            "Date: 01.02.2024",
+            "Cust.-No.: 10042",
+            "POS ARTICLE description qty. each price",
+            f"your order no. 4500{page:04d} - 15.01.2024",
+        ]
+        for _ in range(items_per_page):
+            lines += [
+                f"{position} SM Diethrich Scissors 13.5 cm, 5 59,15 295,75",
+                f"0402-{position}.5/600 laterally angled, 60 degrees,",
+                "sharp, round",
+                f"Lot number {91000 + position}",
+            ]
+            position += 1
+        lines.append("carry-over" if page < pages - 1 else "total net 295,75")
+        pdf_pages.append(lines)
+    return pdf_pages
+
+
+def siema_invoice(invoice_number: str = "12345", pages: int = 3, items_per_page: int = 12,
+                  footer: Sequence[str] = ()) -> bytes:
+    """A multi-page invoice in the Siema layout, `items_per_page` line items per page."""
+    return make_pdf(siema_invoice_lines(invoice_number, pages, items_per_page), footer)
@@ -0,0 +1,9 @@
+"""
+Invoice data extraction package.
+
+Each supported vendor lives in its own module under invoice_extractor.vendors
+and is imported lazily through the registry.
+"""
+from .registry import VENDOR_REGISTRY, VENDORS_BY_KEY, VendorSpec, get_vendor_spec
+
+__all__ = ["VENDOR_REGISTRY", "VENDORS_BY_KEY", "VendorSpec", "get_vendor_spec"]
@@ -0,0 +1,281 @@
+"""
+Batch extraction over many documents, optionally across a process pool.
+
+pdfplumber is pure Python and CPU-bound, so a large upload only scales past
+one core with worker processes. Workers receive the raw PDF bytes and return
+plain rows; the cache is only read and written in the calling process.
+Long documents of page-independent vendors are additionally split into page
+shards. Results are yielded as files finish, each tagged with its upload
+index so callers can restore upload order, and carry the time the file
+spent in each extraction stage (see invoice_extractor.timing).
+"""
+import multiprocessing
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .cache import (CacheStats, ResultCache, cached_detect, cached_detection, cached_extract,
+                    cached_iter_rows, make_cache_key, make_detection_key)
+from .detect import Detection, detect_vendor, detection_from_scores
+from .document import PdfDocument
+from .registry import VENDORS_BY_KEY, VendorSpec
+from .timing import StageTimes, add_stage_times, record_stages
+
+# Page-independent documents longer than this are split into shards of this
+# many pages, so a single long statement keeps several workers busy.
+DEFAULT_SHARD_PAGES = 8
+
+# Called with the index of a document whose extraction raised, and the error
+ErrorHandler = Callable[[int, Exception], None]
+
+
+@dataclass
+class FileResult:
+    """
+    Rows extracted from one document of a batch, and the seconds spent in
+    each extraction stage (empty when the rows came from the cache).
+    """
+    index: int
+    name: str
+    spec: VendorSpec
+    rows: List[Dict]
+    detection: Optional[Detection] = None
+    stage_times: StageTimes = field(default_factory=dict)
+
+
+def make_worker_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    A process pool for extract_batch. Uses spawn so workers never inherit the
+    threads of a running Streamlit server; keep the pool around between
+    batches, as each worker pays for importing pdfplumber once.
+    """
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _resolve_spec(spec: VendorSpec, detection: Optional[Detection]) -> VendorSpec:
+    if detection is not None and detection.is_confident():
+        return detection.spec
+    return spec
+
+
+def _extract_file(content: bytes, name: str, vendor_key: str,
+                  auto_detect: bool) -> Tuple[Optional[Dict[str, float]], str, List[Dict], StageTimes]:
+    """Worker entry point: detect (optionally) and extract one PDF from its bytes."""
+    with record_stages() as stage_times, PdfDocument(content, name) as document:
+        detection = detect_vendor(document) if auto_detect else None
+        spec = _resolve_spec(VENDORS_BY_KEY[vendor_key], detection)
+        rows = spec.extractor(document)
+    return (detection.scores if detection else None), spec.key, rows, stage_times
+
+
+def _extract_shard(content: bytes, name: str, vendor_key: str, start: int,
+                   stop: int) -> Tuple[List[Dict], StageTimes]:
+    """Worker entry point: extract the rows of pages [start, stop) of one PDF."""
+    with record_stages() as stage_times, PdfDocument(content, name, page_shard=range(start, stop)) as document:
+        rows = VENDORS_BY_KEY[vendor_key].extractor(document)
+    return rows, stage_times
+
+
+def _cached_result(index: int, document: PdfDocument, spec: VendorSpec, auto_detect: bool,
+                   detection: Optional[Detection], cache: ResultCache) -> Optional[FileResult]:
+    """The file's result if both its detection (when needed) and rows are cached."""
+    if auto_detect and detection is None:
+        return None
+    file_spec = _resolve_spec(spec, detection)
+    rows = cache.get(make_cache_key(document.sha256, file_spec))
+    if rows is None:
+        return None
+    return FileResult(index, document.name, file_spec, rows, detection)
+
+
+def _extract_in_process(documents: Sequence[PdfDocument], spec: VendorSpec, auto_detect: bool,
+                        cache: Optional[ResultCache], stats: CacheStats) -> Iterator[FileResult]:
+    for index, document in enumerate(documents):
+        hits = stats.hits
+        with record_stages() as stage_times:
+            detection = cached_detect(document, cache) if auto_detect else None
+            file_spec = _resolve_spec(spec, detection)
+            rows = cached_extract(file_spec, document, cache, stats)
+        # Text stays cached on the document; only pdfplumber's parser state is released
+        document.close()
+        yield FileResult(index, document.name, file_spec, rows, detection,
+                         stage_times if stats.hits == hits else {})
+
+
+@dataclass
+class _PendingFile:
+    """A cache miss sent to the pool, possibly as several page shards."""
+    document: PdfDocument
+    spec: VendorSpec
+    detection: Optional[Detection]
+    shard_rows: List[Optional[List[Dict]]]
+    stage_times: StageTimes = field(default_factory=dict)
+    failed: bool = False
+
+
+def _page_shards(document: PdfDocument, shard_pages: int) -> List[range]:
+    page_count = len(document.pages)
+    return [range(start, min(start + shard_pages, page_count))
+            for start in range(0, page_count, shard_pages)]
+
+
+def _extract_in_pool(documents: Sequence[PdfDocument], spec: VendorSpec, auto_detect: bool,
+                     cache: Optional[ResultCache], stats: CacheStats, executor: Executor,
+                     shard_pages: int, on_error: Optional[ErrorHandler] = None) -> Iterator[FileResult]:
+    """
+    Without `on_error` the first failing document raises. With it, each
+    failing document is reported to it and yields a result without rows.
+    """
+    hits: List[FileResult] = []
+    files: Dict[int, _PendingFile] = {}
+    # future -> (file index, shard number); shard None means the whole file
+    pending: Dict[Future, Tuple[int, Optional[int]]] = {}
+    # Submit every miss before yielding anything so the pool starts working immediately
+    for index, document in enumerate(documents):
+        detection = cached_detection(document, cache) if auto_detect else None
+        result = _cached_result(index, document, spec, auto_detect, detection, cache) if cache else None
+        if result is not None:
+            stats.hits += 1
+            hits.append(result)
+            continue
+        if cache is not None:
+            stats.misses += 1
+
+        try:
+            shards = _page_shards(document, shard_pages) if auto_detect or spec.page_independent else []
+        except Exception as error:
+            if on_error is None:
+                raise
+            on_error(index, error)
+            hits.append(FileResult(index, document.name, spec, []))
+            continue
+        if len(shards) > 1:
+            # Long document: settle the vendor here (first page only) so that a
+            # page-independent extractor can be split across the workers.
+            if auto_detect and detection is None:
+                detection = cached_detect(document, cache)
+            file_spec = _resolve_spec(spec, detection)
+            document.close()
+            if file_spec.page_independent:
+                files[index] = _PendingFile(document, file_spec, detection, [None] * len(shards))
+                for shard_number, shard in enumerate(shards):
+                    future = executor.submit(_extract_shard, document.content, document.name,
+                                             file_spec.key, shard.start, shard.stop)
+                    pending[future] = (index, shard_number)
+                continue
+            files[index] = _PendingFile(document, file_spec, detection, [None])
+            future = executor.submit(_extract_file, document.content, document.name, file_spec.key, False)
+        else:
+            # Short document: the worker detects the vendor only if the cache has not seen it
+            document.close()
+            file_spec = _resolve_spec(spec, detection)
+            files[index] = _PendingFile(document, file_spec, detection, [None])
+            future = executor.submit(_extract_file, document.content, document.name, file_spec.key,
+                                     auto_detect and detection is None)
+        pending[future] = (index, None)
+
+    yield from hits
+
+    for future in as_completed(pending):
+        index, shard_number = pending[future]
+        file = files[index]
+        try:
+            if shard_number is None:
+                scores, used_key, rows, stage_times = future.result()
+                if scores is not None:
+                    file.detection = detection_from_scores(scores)
+                    if cache is not None:
+                        cache.put(make_detection_key(file.document.sha256), [{"scores": scores}])
+                file.spec = VENDORS_BY_KEY[used_key]
+                file.shard_rows[0] = rows
+            else:
+                file.shard_rows[shard_number], stage_times = future.result()
+        except Exception as error:
+            if on_error is None:
+                raise
+            if not file.failed:
+                on_error(index, error)
+            file.failed = True
+            file.shard_rows[shard_number or 0] = []
+            stage_times = {}
+        add_stage_times(file.stage_times, stage_times)
+        if any(rows is None for rows in file.shard_rows):
+            continue
+        if file.failed:
+            yield FileResult(index, file.document.name, file.spec, [], file.detection, file.stage_times)
+            continue
+
+        # Shards are merged in page order, matching a whole-document run
+        rows = [row for shard in file.shard_rows for row in shard]
+        if cache is not None:
+            cache.put(make_cache_key(file.document.sha256, file.spec), rows)
+        yield FileResult(index, file.document.name, file.spec, rows, file.detection, file.stage_times)
+
+
+def extract_batch(documents: Sequence[PdfDocument], spec: VendorSpec, auto_detect: bool = False,
+                  cache: Optional[ResultCache] = None, stats: Optional[CacheStats] = None,
+                  executor: Optional[Executor] = None,
+                  shard_pages: int = DEFAULT_SHARD_PAGES) -> Iterator[FileResult]:
+    """
+    Extract every document with `spec` (or its detected vendor when
+    `auto_detect` is set and detection is confident), yielding one FileResult
+    per document in completion order. Without an executor the documents are
+    processed one by one in this process; with one, cache misses are spread
+    across its workers, and documents longer than `shard_pages` whose
+    extractor is page independent are split into page shards of that size.
+    """
+    stats = stats if stats is not None else CacheStats()
+    if executor is None:
+        return _extract_in_process(documents, spec, auto_detect, cache, stats)
+    return _extract_in_pool(documents, spec, auto_detect, cache, stats, executor, shard_pages)
+
+
+def in_upload_order(results: Iterable[FileResult], count: int) -> Iterator[FileResult]:
+    """Re-sequence results that arrive in completion order back into upload order."""
+    waiting: Dict[int, FileResult] = {}
+    next_index = 0
+    for result in results:
+        waiting[result.index] = result
+        while next_index in waiting:
+            yield waiting.pop(next_index)
+            next_index += 1
+    assert next_index == count and not waiting
+
+
+def iter_batch_rows(documents: Sequence[PdfDocument], spec: VendorSpec, auto_detect: bool = False,
+                    cache: Optional[ResultCache] = None, stats: Optional[CacheStats] = None,
+                    executor: Optional[Executor] = None,
+                    shard_pages: int = DEFAULT_SHARD_PAGES,
+                    on_error: Optional[ErrorHandler] = None) -> Iterator[Tuple[int, VendorSpec, Dict]]:
+    """
+    Stream (document index, vendor, row) triples in upload order, the vendor
+    being the one whose extractor read the document. In-process, rows are
+    yielded as each page is parsed, so a consumer that writes them out holds
+    no more than one document's rows (those pending for the cache). With an
+    executor, rows arrive one whole document at a time.
+
+    Without `on_error` the first failing document raises. With it, each
+    failing document is reported to it, before any row of a later document
+    is yielded, and the batch carries on; rows the document yielded before
+    failing have been yielded already, so the caller decides what to do with
+    them.
+    """
+    stats = stats if stats is not None else CacheStats()
+    if executor is not None:
+        results = _extract_in_pool(documents, spec, auto_detect, cache, stats, executor, shard_pages, on_error)
+        for result in in_upload_order(results, len(documents)):
+            for row in result.rows:
+                yield result.index, result.spec, row
+        return
+
+    for index, document in enumerate(documents):
+        try:
+            detection = cached_detect(document, cache) if auto_detect else None
+            file_spec = _resolve_spec(spec, detection)
+            for row in cached_iter_rows(file_spec, document, cache, stats):
+                yield index, file_spec, row
+        except Exception as error:
+            if on_error is None:
+                raise
+            on_error(index, error)
+        document.close()
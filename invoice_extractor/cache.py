@@ -0,0 +1,236 @@
+"""
+Content-addressed cache of extraction results.
+
+Rows are stored under a key derived from the SHA-256 of the PDF bytes, the
+vendor and the extractor version, so re-uploading the same invoice (or a
+Streamlit rerun) returns the rows without opening the PDF. Bumping a
+VendorSpec.version invalidates that vendor's entries. Vendor detection
+results are cached the same way, keyed on the content hash and the signature
+set, so auto-detected files can be served from the cache too.
+
+Two tiers: an in-memory LRU bounded by bytes, backed by a directory of JSON
+files bounded by total size, evicting the least recently used files first.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .detect import SIGNATURES_DIGEST, Detection, detect_vendor, detection_from_scores
+from .document import PdfDocument
+from .registry import VendorSpec
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "INVOICE_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "invoice_extractor"),
+)
+DEFAULT_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_DISK_BYTES = 512 * 1024 * 1024
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss counts for one batch."""
+    hits: int = 0
+    misses: int = 0
+
+
+def make_cache_key(content_sha256: str, spec: VendorSpec) -> str:
+    return hashlib.sha256(f"{content_sha256}:{spec.key}:{spec.version}".encode()).hexdigest()
+
+
+def make_detection_key(content_sha256: str) -> str:
+    return hashlib.sha256(f"{content_sha256}:detect:{SIGNATURES_DIGEST}".encode()).hexdigest()
+
+
+class ResultCache:
+    """Two-tier (memory LRU + disk) cache of extracted rows keyed by content hash."""
+
+    def __init__(self, directory: Optional[str] = DEFAULT_CACHE_DIR,
+                 max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+                 max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES):
+        self.directory = directory
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, Tuple[List[Dict], int]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return [dict(row) for row in entry[0]]
+
+        payload = self._read_disk(key)
+        if payload is None:
+            return None
+        rows = json.loads(payload)
+        self._remember(key, rows, len(payload))
+        return [dict(row) for row in rows]
+
+    def put(self, key: str, rows: List[Dict]) -> None:
+        payload = json.dumps(rows, ensure_ascii=False, default=str).encode("utf-8")
+        self._remember(key, [dict(row) for row in rows], len(payload))
+        self._write_disk(key, payload)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self.directory:
+                for path, _, _ in self._disk_entries():
+                    _remove_quietly(path)
+            self._disk_bytes = 0
+
+    # Memory tier
+
+    def _remember(self, key: str, rows: List[Dict], size: int) -> None:
+        if size > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= previous[1]
+            self._memory[key] = (rows, size)
+            self._memory_bytes += size
+            while self._memory_bytes > self.max_memory_bytes:
+                _, (_, evicted_size) = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted_size
+
+    # Disk tier
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _disk_entries(self) -> List[Tuple[str, int, float]]:
+        """(path, size, last use) of every cache file."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                payload = f.read()
+            # Touch so size-based eviction drops the least recently used files first
+            os.utime(path)
+        except OSError:
+            return None
+        return payload
+
+    def _write_disk(self, key: str, payload: bytes) -> None:
+        if not self.directory or len(payload) > self.max_disk_bytes:
+            return
+        path = self._path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+        except OSError:
+            _remove_quietly(tmp_path)
+            return
+        # Two threads writing the same key must not both count it as new
+        with self._lock:
+            try:
+                existed = os.path.exists(path)
+                os.replace(tmp_path, path)
+            except OSError:
+                _remove_quietly(tmp_path)
+                return
+            if not existed:
+                self._disk_bytes += len(payload)
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Remove the least recently used files down to 90% of the limit. Called with the lock held."""
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        # Trim to 90% so a full cache doesn't rescan the directory on every write
+        target = self.max_disk_bytes * 0.9
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            _remove_quietly(path)
+            total -= size
+        self._disk_bytes = total
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def cached_iter_rows(spec: VendorSpec, document: PdfDocument, cache: Optional[ResultCache],
+                     stats: Optional[CacheStats] = None) -> Iterator[Dict]:
+    """
+    Yield the rows of `document` for `spec`, from the cache when possible.
+    A hit never touches pdfplumber; a miss streams the rows as the extractor
+    produces them and stores them once the document is exhausted.
+    """
+    if cache is None:
+        yield from spec.row_iterator(document)
+        return
+
+    key = make_cache_key(document.sha256, spec)
+    rows = cache.get(key)
+    if rows is not None:
+        if stats is not None:
+            stats.hits += 1
+        yield from rows
+        return
+
+    if stats is not None:
+        stats.misses += 1
+    rows = []
+    for row in spec.row_iterator(document):
+        rows.append(row)
+        yield row
+    cache.put(key, rows)
+
+
+def cached_extract(spec: VendorSpec, document: PdfDocument, cache: Optional[ResultCache],
+                   stats: Optional[CacheStats] = None) -> List[Dict]:
+    """List-returning form of cached_iter_rows()."""
+    return list(cached_iter_rows(spec, document, cache, stats))
+
+
+def cached_detection(document: PdfDocument, cache: Optional[ResultCache]) -> Optional[Detection]:
+    """The detection of `document` from an earlier run if cached, without detecting it otherwise."""
+    if cache is None:
+        return None
+    cached = cache.get(make_detection_key(document.sha256))
+    return detection_from_scores(cached[0]["scores"]) if cached is not None else None
+
+
+def cached_detect(document: PdfDocument, cache: Optional[ResultCache]) -> Detection:
+    """Detect the vendor of `document`, reusing the scores from an earlier run when cached."""
+    detection = cached_detection(document, cache)
+    if detection is not None:
+        return detection
+
+    detection = detect_vendor(document)
+    if cache is not None:
+        cache.put(make_detection_key(document.sha256), [{"scores": detection.scores}])
+    return detection
@@ -0,0 +1,253 @@
+"""
+Headless batch extraction.
+
+Runs the vendor extractors over a directory or glob of PDFs without
+Streamlit and streams the rows to CSV, JSON Lines or Parquet:
+
+    python -m invoice_extractor invoices/2023/ --vendor Siema -o siema.csv
+    python -m invoice_extractor "archive/**/*.pdf" --auto-detect --vendor hgr \
+        -o rows.parquet --workers 8
+
+Files are read in chunks and rows are streamed to the writer as they are
+parsed, so memory use stays flat on archives of thousands of invoices. Rows
+are written in file order. A file that cannot be read or extracted is
+reported on stderr and skipped, with none of its rows written, and the
+run ends with exit status 1.
+
+Rows are written in the canonical schema of invoice_extractor.schema, the
+same columns whichever vendor a file is read as. CSV and JSON Lines hold
+them as text, as the app's download does, and Parquet typed by the schema:
+dates, exact decimal prices, float quantities and integer pages.
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .batch import DEFAULT_SHARD_PAGES, iter_batch_rows, make_worker_pool
+from .cache import DEFAULT_CACHE_DIR, CacheStats, ResultCache
+from .document import PdfDocument
+from .registry import VENDOR_REGISTRY, VENDORS_BY_KEY, VendorSpec
+from .schema import CANONICAL_SCHEMA, arrow_schema, canonical_frame, column_mapping, text_frame
+
+OUTPUT_FORMATS = ("csv", "jsonl", "parquet")
+CHUNK_SIZE = 64
+WRITE_BATCH_ROWS = 1000
+
+
+def resolve_vendor(vendor: str) -> Optional[VendorSpec]:
+    """Look a vendor up by display name or module key, ignoring case."""
+    spec = VENDOR_REGISTRY.get(vendor) or VENDORS_BY_KEY.get(vendor)
+    if spec is not None:
+        return spec
+    folded = vendor.casefold()
+    for spec in VENDOR_REGISTRY.values():
+        if folded in (spec.name.casefold(), spec.key):
+            return spec
+    return None
+
+
+def find_pdfs(inputs: Iterable[str]) -> List[str]:
+    """Expand directories (recursively) and glob patterns into a sorted list of PDF paths."""
+    paths = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            pattern = os.path.join(item, "**", "*")
+        else:
+            pattern = item
+        for path in glob.glob(pattern, recursive=True):
+            if os.path.isfile(path) and path.lower().endswith(".pdf"):
+                paths.add(path)
+    return sorted(paths)
+
+
+def _text_rows(frame: pd.DataFrame, columns: Sequence[str]) -> List[List]:
+    """The frame's rows as text, in `columns` order, with None for missing values."""
+    text = text_frame(frame).reindex(columns=columns).astype(object)
+    return text.where(text.notna(), None).values.tolist()
+
+
+class _CsvWriter:
+    def __init__(self, path: str, columns: Sequence[str]):
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._columns = list(columns)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self._columns)
+
+    def write(self, frame: pd.DataFrame) -> None:
+        self._writer.writerows(_text_rows(frame, self._columns))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _JsonlWriter:
+    def __init__(self, path: str, columns: Sequence[str]):
+        self._file = open(path, "w", encoding="utf-8")
+        self._columns = list(columns)
+
+    def write(self, frame: pd.DataFrame) -> None:
+        for values in _text_rows(frame, self._columns):
+            row = dict(zip(self._columns, values))
+            self._file.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    """Writes the canonical columns with their schema.arrow_schema() types, other columns as strings."""
+
+    def __init__(self, path: str, columns: Sequence[str]):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("Parquet output needs pyarrow: pip install pyarrow")
+        self._pa = pa
+        self._schema = arrow_schema(columns)
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    def write(self, frame: pd.DataFrame) -> None:
+        if frame.empty:
+            return
+        arrays = [
+            self._pa.array(frame[field.name], type=field.type, from_pandas=True)
+            if field.name in frame.columns else self._pa.nulls(len(frame), field.type)
+            for field in self._schema
+        ]
+        self._writer.write_table(self._pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+_WRITERS = {"csv": _CsvWriter, "jsonl": _JsonlWriter, "parquet": _ParquetWriter}
+
+
+def _output_columns(spec: VendorSpec, auto_detect: bool) -> List[str]:
+    """
+    The canonical names of the vendor's columns, or of every vendor's when
+    files may be detected as others: the schema's columns in its order, then
+    the vendors' own.
+    """
+    specs = VENDOR_REGISTRY.values() if auto_detect else [spec]
+    columns: Dict[str, None] = {'vendor': None}
+    for each in specs:
+        columns.update(dict.fromkeys(column_mapping(each, each.columns).values()))
+    return ([column for column in CANONICAL_SCHEMA if column in columns]
+            + [column for column in columns if column not in CANONICAL_SCHEMA])
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m invoice_extractor",
+        description="Extract invoice line items from PDFs without the Streamlit UI.",
+    )
+    parser.add_argument("inputs", nargs="+", help="PDF files, directories or glob patterns")
+    parser.add_argument("--vendor", required=True,
+                        help="vendor display name or key (the fallback vendor with --auto-detect)")
+    parser.add_argument("-o", "--output", required=True, help="output file (.csv, .jsonl or .parquet)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS,
+                        help="output format (default: from the output file's extension)")
+    parser.add_argument("--auto-detect", action="store_true", help="detect each file's vendor")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default: 1)")
+    parser.add_argument("--shard-pages", type=int, default=DEFAULT_SHARD_PAGES,
+                        help="pages per shard for long page-independent documents")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="result cache directory")
+    parser.add_argument("--no-cache", action="store_true", help="do not read or write the result cache")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    spec = resolve_vendor(args.vendor)
+    if spec is None:
+        parser.error(f"unknown vendor {args.vendor!r}")
+    output_format = args.format or os.path.splitext(args.output)[1].lstrip(".").lower()
+    if output_format not in OUTPUT_FORMATS:
+        parser.error(f"cannot infer the output format of {args.output!r}; pass --format")
+    paths = find_pdfs(args.inputs)
+    if not paths:
+        parser.error("no PDF files found")
+
+    cache = None if args.no_cache else ResultCache(args.cache_dir)
+    executor = make_worker_pool(args.workers) if args.workers > 1 else None
+    writer = _WRITERS[output_format](args.output, _output_columns(spec, args.auto_detect))
+    stats = CacheStats()
+    row_count = 0
+    empty: List[str] = []
+    errors: Dict[str, str] = {}
+
+    start = time.perf_counter()
+    try:
+        for chunk_start in range(0, len(paths), CHUNK_SIZE):
+            documents = []
+            for path in paths[chunk_start:chunk_start + CHUNK_SIZE]:
+                try:
+                    with open(path, "rb") as f:
+                        documents.append(PdfDocument(f.read(), path))
+                except OSError as error:
+                    errors[path] = str(error)
+                    print(f"{path}: {error}", file=sys.stderr)
+            chunk_errors: Dict[int, Exception] = {}
+            file_rows = [0] * len(documents)
+            buffer: List[Tuple[VendorSpec, List[Dict]]] = []
+            buffered_rows = 0
+            rows = iter_batch_rows(documents, spec, args.auto_detect, cache, stats,
+                                   executor, args.shard_pages, chunk_errors.__setitem__)
+            # Rows are grouped per file, and a file's error is reported before
+            # the next file's first row, so a file is known to have succeeded
+            # once its group is complete.
+            # Buffered rows go through canonical_frame() a batch at a time.
+            for index, file_group in groupby(rows, key=itemgetter(0)):
+                file_group = list(file_group)
+                if index in chunk_errors:
+                    continue
+                file_rows[index] = len(file_group)
+                buffer.append((file_group[0][1], [row for _, _, row in file_group]))
+                buffered_rows += len(file_group)
+                if buffered_rows >= WRITE_BATCH_ROWS:
+                    writer.write(canonical_frame(buffer))
+                    buffer, buffered_rows = [], 0
+            if buffer:
+                writer.write(canonical_frame(buffer))
+            row_count += sum(file_rows)
+            for index, document in enumerate(documents):
+                if index in chunk_errors:
+                    error = chunk_errors[index]
+                    errors[document.name] = f"{type(error).__name__}: {error}"
+                    print(f"{document.name}: {errors[document.name]}", file=sys.stderr)
+                elif not file_rows[index]:
+                    empty.append(document.name)
+            print(f"{min(chunk_start + CHUNK_SIZE, len(paths))}/{len(paths)} files", file=sys.stderr)
+    finally:
+        writer.close()
+        if executor is not None:
+            executor.shutdown()
+    elapsed = time.perf_counter() - start
+
+    print(f"Wrote {row_count} rows from {len(paths) - len(errors)} files to {args.output}")
+    print(f"Elapsed {elapsed:.2f} s: {len(paths) / elapsed:.1f} files/s, {row_count / elapsed:.1f} rows/s")
+    if cache is not None:
+        print(f"Result cache: {stats.hits} hit(s), {stats.misses} miss(es)")
+    if empty:
+        print(f"{len(empty)} file(s) produced no rows:", file=sys.stderr)
+        for name in empty:
+            print(f"  {name}", file=sys.stderr)
+    if errors:
+        print(f"{len(errors)} file(s) failed and were skipped:", file=sys.stderr)
+        for name, error in errors.items():
+            print(f"  {name}: {error}", file=sys.stderr)
+        return 1
+    return 0
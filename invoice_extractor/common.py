@@ -0,0 +1,59 @@
+"""Helpers shared by several vendor extractors."""
+import re
+from typing import Dict, List
+
+from .timing import timed
+
+
+# Patterns, compiled once at import time
+_INVOICE_NUMBER_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'invoice no\.?\s*[:#]?\s*(\w+)',
+    r'rechnung nr\.?\s*[:#]?\s*(\w+)',
+    r'no\.\s*[:#]?\s*(\d+)',
+    r'invoice\s+(\w+)',
+    r'rechnung\s+(\w+)',
+))
+_DATE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'date\s*[:#]?\s*(\d{1,2}[\.\/]\d{1,2}[\.\/]\d{2,4})',
+    r'datum\s*[:#]?\s*(\d{1,2}[\.\/]\d{1,2}[\.\/]\d{2,4})',
+    r'rechnungsdatum\s*[:#]?\s*(\d{1,2}[\.\/]\d{1,2}[\.\/]\d{2,4})',
+    r'invoice date\s*[:#]?\s*(\d{1,2}[\.\/]\d{1,2}[\.\/]\d{2,4})',
+    r'from\s+(\d{1,2}\.\d{1,2}\.\d{4})',
+))
+_ORDER_NUMBER_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'order no\.?\s*[:#]?\s*(\w+)',
+    r'your order\s*[:#]?\s*(\w+)',
+    r'auftrag nr\.?\s*[:#]?\s*(\w+)',
+    r'purchase order\s*[:#]?\s*(\w+)',
+))
+
+
+@timed("header")
+def _extract_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract common invoice information from lines"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'order_number': ''
+    }
+    
+    for line in lines:
+        # Try multiple patterns for invoice number
+        for pattern in _INVOICE_NUMBER_PATTERNS:
+            match = pattern.search(line)
+            if match and not invoice_data['invoice_number']:
+                invoice_data['invoice_number'] = match.group(1)
+        
+        # Try multiple patterns for date
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(line)
+            if match and not invoice_data['invoice_date']:
+                invoice_data['invoice_date'] = match.group(1)
+        
+        # Try multiple patterns for order number
+        for pattern in _ORDER_NUMBER_PATTERNS:
+            match = pattern.search(line)
+            if match and not invoice_data['order_number']:
+                invoice_data['order_number'] = match.group(1)
+    
+    return invoice_data
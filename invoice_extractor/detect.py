@@ -0,0 +1,171 @@
+"""
+Automatic vendor detection from first-page fingerprints.
+
+Every vendor has a few signatures: strings its extractor already depends on,
+such as table headers or registration numbers, each with a weight saying how
+distinctive it is. The signatures are compiled once into SIGNATURE_INDEX.
+Detection only reads the first page's text, so it costs one extract_text()
+call plus a handful of regex searches, against a full extraction that parses
+every page.
+"""
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .document import DocumentSource, open_document
+from .registry import VENDORS_BY_KEY, VendorSpec
+
+# Files whose best score does not beat the runner-up by at least this much are
+# handed back to the caller to use the manually selected vendor.
+DEFAULT_MIN_CONFIDENCE = 0.5
+
+# vendor key -> [(regex, weight)]. Weights close to 1 are unique to the vendor
+# (company details, registration numbers, one-off table headers); low weights
+# are layout hints that several vendors share.
+SIGNATURES: Dict[str, List[Tuple[str, float]]] = {
+    'bumuller': [(r'Your Item No\.\s*\w+-\d+', 0.4), (r'\d+pcs\s+\d+,\d+\s+\d+,\d+', 0.4), (r'LOT#', 0.2)],
+    'avalign': [(r'Lot/Qty:', 0.6), (r'Reference PO:', 0.5), (r'\s+EA\s+\$', 0.3)],
+    'amilazzo': [(r'(?i)A\. Milazzo', 0.9), (r'M\.[A-Z]\.\d{2}-\d{2}/\d+', 0.7), (r'(?i)your art\.-no\.:', 0.2)],
+    'ackermann': [(r'\d+\s+Item No\.\s+\S+\s+\d+\s+\d+pcs\.', 0.7), (r'Desc\.', 0.2)],
+    'betzler': [(r'(?i)\bA\. Betzler\b', 0.9), (r'(?i)MDL Reg\. No\.:', 0.3), (r'(?i)your art\.-no\.:', 0.2)],
+    'hipp': [(r'(?i)Anton Hipp', 0.9), (r'Order confirmation\s+\d+', 0.6), (r'to be carried over', 0.5)],
+    'aspen': [(r'Part No\s+Description\s+Invoice Qty\s+U of M\s+Unit Price\s+Net Amount', 0.9),
+              (r'Caledonia.*\d{5}', 0.6)],
+    'bahadir': [(r'(?i)Bahadir', 0.9), (r'Date\s*#\s*\d{1,2}/\d{1,2}/\d{4}', 0.5), (r'Invoice\s*#\s*\d+', 0.2)],
+    'bauer_hasselbarth': [(r'Your Order Number\s+\d+', 0.6), (r'Invoice Number\s+\d+', 0.3),
+                          (r'Customer Number\s+\d+', 0.3)],
+    'biselli': [(r'FDA Registration No\. DEV 96 11 617', 1.0)],
+    'blache': [(r'delivered with Delivery Note no\.', 0.7), (r'Your VAT', 0.5), (r'PO-No\.', 0.3)],
+    'carl_teufel': [(r'(?i)Carl Teufel', 0.9),
+                    (r'(?i)MDL-No\.', 0.3), (r'Your order no\.\s*\d+\s*-\s*\d{2}\.\d{2}\.\d{4}', 0.2)],
+    'chirmed': [(r'No\.\s+Description\s+Code\s+Quantity\s+Unit', 0.9), (r'Date of due:', 0.7)],
+    'cm_instrumente': [(r'(?i)CM Instrumente', 0.9),
+                       (r'(?i)MDL Reg\. No\.:', 0.3), (r'(?i)INVOICE NO\.\s*:\s*\d+', 0.2)],
+    'cmf': [(r'(?i)CMF Medicon', 0.9), (r'FB - Sales Order #', 0.9), (r'Description\s+Qty\s+Rate\s+Amount', 0.3),
+            (r'Processing and Handling', 0.4)],
+    'dannoritzer': [(r'(?i)Dannoritzer', 0.9), (r'(?i)Your order no\.?\s*PO#', 0.7)],
+    'dausch': [(r'(?i)Dausch Medizintechnik', 0.9), (r'INVOICEN\s*O', 0.6), (r'LST No\.', 0.3)],
+    'denzel': [(r'(?i)Denzel Medical', 0.9), (r'(?m)^\d+\s+\d{2}\.\d{5}', 0.6), (r'(?i)lot number:', 0.2)],
+    'efinger': [(r'Description\s+Quantity\s+Price\s+Total EUR', 0.9),
+                (r'Based on your Purchase Order', 0.7), (r'Batch-Nr\.', 0.5)],
+    'elmed': [(r'Order\s+Ship\s+B/O\s+Item No\.\s+Description\s+Price Each\s+Amount', 0.9), (r'UDI#', 0.6)],
+    'ermis': [(r'(?i)Ermis MedTech', 0.9), (r'PROFORMA-INVOICE', 0.7), (r'Your inq\. No\.', 0.3)],
+    'esma': [(r'QTY\s+UNITS\s+DESCRIPTION\s+ITEM\s+RATE\s+AMOUNT', 0.9), (r'PAY FROM INVOICE', 0.6)],
+    'euromed': [(r'QUANTITY & DESCRIPTION OF GOODS', 0.8), (r'PO No\s+Item Description', 0.6),
+                (r'CERTIFIED TO BE CORRECT', 0.5)],
+    'faulhaber': [(r'Deb\.-Nr\.:', 0.8), (r'(?i)freight and package', 0.4)],
+    'fetzer': [(r'(?i)Fetzer Instruments', 0.9), (r'ORDER NO\.\s+ORDER DATE\s+CUSTOMER NO\.\s+CUSTOMER P\.O\.', 0.6),
+               (r'(?i)qty\. ord\s+qty\. ship\.\s+qty\. B/O', 0.3)],
+    'gebruder': [(r'OFFENE POSTEN FÜR KUNDE', 0.9), (r'RECHNR\.\s+RECHDAT\.\s+NETTO\s+MWST\s+BRUTTO', 0.9)],
+    'geister': [(r'POS\s+REF\s+TEXT\s+QTY\s+EACH', 0.9), (r'INVOICE\s*#\s*\d+', 0.2)],
+    'georgalber': [(r'#\s+Item\s+Shipment\s+Qty\.\s+Unit\s+Each\s+Total', 0.9)],
+    'getschhiller': [(r'(?i)Getsch\s*\+\s*Hiller', 0.9),
+                     (r'(?i)POS\s+ARTICLE\s+description\s+qty\.\s+each\s+price', 0.2), (r'Drwg\. No\.', 0.2)],
+    'gordonbrush': [(r'LINE\s+PART ID\s+DESCRIPTION\s+YOU\s+WE\s+UNIT\s+EXTENDED', 0.9),
+                    (r'Make Payment To', 0.4)],
+    'bissinger': [(r'(?i)Bissinger Medizintechnik', 0.9),
+                  (r'(?i)POS\s+ARTICLE\s+description\s+qty\.\s+each\s+price', 0.2), (r'Drwg\. No\.', 0.2)],
+    'hafner': [(r'#\s+Item\s+Shipment\s+Qty\.\s+Unit\s+Price\s+\(€\)\s+Amount\s+\(€\)', 0.9),
+               (r'Lot Desc\.', 0.5)],
+    'heissmedical': [(r'(?i)Heiss[- ]Medical', 0.9), (r'(?i)POS\.\s+ARTICLE\s+description\s+qty\.\s+each\s+price', 0.4),
+                     (r'(?i)MDL Reg\.? No\.?:', 0.2)],
+    'hermann': [(r'(?i)Hermann Medizintechnik', 0.9),
+                (r'Cust\.-No\.\s+Date\s+Our sign\s+Your inq\. No\.\s+Your inq\. date', 0.8),
+                (r'OC No\.?\s*:', 0.5)],
+    'hgr': [(r'(?i)HGR Medizintechnik', 0.9),
+            (r'Invoice No\.\s+Invoice Date\s+due since\s+falling since\s+gross amount', 0.8),
+            (r'(?i)LST\s*#', 0.3)],
+    'holger': [(r'(?i)Holger Medical', 0.9), (r'Certificate:', 0.4), (r'Packing Slip', 0.2)],
+    'ilg': [(r'(?i)POARTICLE\s+description', 0.8), (r'Index:', 0.2)],
+    'josef_betzler': [(r'Classification:', 0.6), (r'acc\.no\.:', 0.5), (r'Charge:', 0.4)],
+    'kapp': [(r'Device Listing:', 0.8), (r'Our item-no\.', 0.7)],
+    'kohler': [(r'Pos\.\s+Ref\.\s+Description', 0.8), (r'Valid until', 0.3)],
+    'medin': [(r'Customer Part ID:', 0.7), (r'Returned Goods Policy', 0.6)],
+    'microqore': [(r'POS\s+Item\s+No\.\s+Desc\.\s+Quantity\s+each\s+Total', 0.9), (r'Lot-Code', 0.7)],
+    'otto_ruttgers': [(r'POS\.ARTICLE\s+description\s+your order no\.', 0.9)],
+    'phoenix': [(r'Whse:\s*\d+', 0.6), (r'Less Discount', 0.4)],
+    'precision_medical': [(r'QTY\s+QTY\s+BACK\s+PMM PN', 0.9), (r'DATE CODE:', 0.5)],
+    'rebstock': [(r'POS\s+ARTICLE\s+DESCRIPTION\s+QTY\.\s+UNIT\s+TOTAL', 0.8), (r'LST No\.:', 0.3)],
+    'rica': [(r'Quantity\s+B/O\s+Item Code\s+Description\s+Price Each\s+Amount', 0.9), (r'Ord Number', 0.5)],
+    'rudischhauser': [(r'(?i)pos\s+item\s+description\s+quantity', 0.8), (r'(?i)supplier no\.', 0.5)],
+    'rudolfstorz': [(r'Chargen-/Lot-Nr\.', 0.9)],
+    'ruhof': [(r'UNITS\s+UOM\s+ITEM\s+CODE\s+DESCRIPTION', 0.9)],
+    'sua': [(r'S\.u\.A\. Martin', 0.9), (r'DII-NO\.', 0.8), (r'your art\.:', 0.4)],
+    'schmid': [(r'(?i)Schmid Medizintechnik', 0.9), (r'POS\s+article\s+description\s+qty', 0.3)],
+    'sgs': [(r'Quantity\s+Net Amount\s+Amount', 0.8), (r'Our Refer\. No\.', 0.7)],
+    'sibel': [(r'Pos\.\s+Item N°\s+Description', 0.9), (r'Total ExVAT', 0.6)],
+    'siema': [(r'(?i)\bSiema\b|Siegfried Martin GmbH', 0.9), (r'(?m)^\d+\s+SM\b', 0.5), (r'(?i)Customs tariff', 0.2)],
+    'sigtech': [(r'(?i)SignTech', 0.9), (r'(?i)qty\.\s+ord\s+qty\.\s+ship\.', 0.3)],
+    'sis': [(r'Invoice #\s+\.{5,}', 0.9)],
+    'sitec': [(r'S\.\#\s+Product Description', 0.9)],
+    'smt': [(r'LST Reg\. No', 0.7)],
+    'stengelin': [(r'POS\s+ITEM NO\.\s+Article\s+piece\s+U-Price', 0.9), (r'I N V O I C E', 0.8)],
+    'steris': [(r'Phone 440-354-2600', 0.95), (r'shop\.steris\.com', 0.95)],
+    'stork': [(r'Pos\.\s+Article\s+No\.\s+description', 0.8), (r'Schmelze:', 0.7)],
+    'tontarra': [(r'Pos\.\s+Art\.No\.\s+Description\s+Lot number', 0.9)],
+    'total_titanium': [(r'-{20,}Part # / Description-{20,}', 0.9), (r'Job Traveler', 0.5)],
+    'vinzenz_sattler': [(r'Order\s+Item\s+Qty\.\s+each\s+Total', 0.8), (r'Mandatory Notes', 0.5)],
+    'vollrath': [(r'Ordered\s+Shipped\s+U/M\s+Catalog No\.', 0.9), (r'Broken Case Charge', 0.5)],
+    'weba': [(r'POS\s+ARTICLE/\s+description', 0.9)],
+    'yw': [(r'ITEM#\s+QTY\s+LOT#\s+DESCRIPTION', 0.9),
+           (r'Item\s+Quantity\s+Description\s+Revision\s+Unit Price\s+Amount', 0.9)],
+}
+
+# Precompiled at import time: (compiled signature, vendor key, weight)
+SIGNATURE_INDEX: List[Tuple[re.Pattern, str, float]] = [
+    (re.compile(pattern), key, weight)
+    for key, signatures in SIGNATURES.items()
+    for pattern, weight in signatures
+]
+
+# Changes whenever a signature or weight changes, so cached detections go stale with them
+SIGNATURES_DIGEST = hashlib.sha256(repr(sorted(SIGNATURES.items())).encode()).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class Detection:
+    """
+    Result of vendor detection. `spec` is the best-scoring vendor (None when
+    nothing matched) and `confidence` is its lead over the runner-up, in [0, 1].
+    """
+    spec: Optional[VendorSpec]
+    confidence: float
+    scores: Dict[str, float] = field(default_factory=dict)
+
+    def is_confident(self, min_confidence: float = DEFAULT_MIN_CONFIDENCE) -> bool:
+        return self.spec is not None and self.confidence >= min_confidence
+
+
+def detect_vendor_from_text(first_page_text: str) -> Detection:
+    """Score every vendor against the first page's text and pick the best."""
+    # Combine the weights of all matched signatures of a vendor as independent
+    # evidence: score = 1 - prod(1 - weight).
+    misses: Dict[str, float] = {}
+    for regex, key, weight in SIGNATURE_INDEX:
+        if regex.search(first_page_text):
+            misses[key] = misses.get(key, 1.0) * (1.0 - weight)
+    return detection_from_scores({key: 1.0 - miss for key, miss in misses.items()})
+
+
+def detection_from_scores(scores: Dict[str, float]) -> Detection:
+    """Pick the best vendor from per-vendor scores, e.g. ones cached from an earlier run."""
+    if not scores:
+        return Detection(None, 0.0, scores)
+
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    best_key, best_score = ranked[0]
+    runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+    return Detection(VENDORS_BY_KEY[best_key], best_score - runner_up, scores)
+
+
+def detect_vendor(pdf_content: DocumentSource) -> Detection:
+    """
+    Detect the vendor of a PDF from its first page only. Pass a PdfDocument
+    to reuse the first page's text for the extraction that follows.
+    """
+    with open_document(pdf_content) as pdf:
+        if not pdf.pages:
+            return Detection(None, 0.0)
+        first_page_text = pdf.pages[0].text
+    return detect_vendor_from_text(first_page_text)
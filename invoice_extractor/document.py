@@ -0,0 +1,214 @@
+"""
+Shared per-document text layer.
+
+pdfminer layout analysis is by far the most expensive step of an extraction,
+so a PdfDocument parses each page at most once and caches the text. The same
+object can be handed to vendor detection, the extractor and the debug view.
+
+Extractors that only need the top of a page (the header block and the items
+table, not bank details or legal footers) can read the text down to an
+anchor line such as the one closing the items table, which skips text
+layout for everything below it.
+"""
+import hashlib
+import io
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Pattern, Union
+
+import pdfplumber
+
+from .timing import stage
+
+
+def chars_above(bottom: float) -> Callable[[dict], bool]:
+    """
+    A pdfplumber object filter keeping the characters whose centre lies
+    above `bottom`, in PDF points from the top of the page. Centres are used
+    so that a line is kept or dropped whole even where it touches `bottom`.
+    """
+
+    def above(obj: dict) -> bool:
+        return obj.get("object_type") == "char" and (obj["top"] + obj["bottom"]) / 2 < bottom
+
+    return above
+
+
+class DocumentPage:
+    """
+    One page of a PdfDocument. Behaves like a pdfplumber page for
+    extract_text(), but the text is extracted on first use and cached.
+    """
+
+    def __init__(self, document: "PdfDocument", index: int):
+        self._document = document
+        self.index = index
+        self.page_number = index + 1
+        self._text: Optional[str] = None
+        self._lines: Optional[List[str]] = None
+        self._text_through: Dict[Pattern[str], str] = {}
+
+    @property
+    def plumber_page(self) -> "pdfplumber.page.Page":
+        """The underlying pdfplumber page (reopens the document if it was closed)."""
+        return self._document.pdf.pages[self.index]
+
+    def extract_text(self) -> str:
+        if self._text is None:
+            if self._document.in_shard(self.index):
+                with stage("text"):
+                    self._text = self.plumber_page.extract_text() or ""
+            else:
+                self._text = ""
+        return self._text
+
+    def may_contain(self, *words: str) -> bool:
+        """
+        Cheap check whether the page can hold all of `words`, before its
+        text is laid out: each must occur in the page's characters, taken
+        in drawing order, ignoring case and whitespace. Words are checked
+        one by one, so header columns drawn in any order still pass; a page
+        without characters never does. Uses the cached text instead if it
+        has already been extracted.
+        """
+        if self._text is not None:
+            characters = self._text
+        elif self._document.in_shard(self.index):
+            with stage("text"):
+                characters = "".join(char["text"] for char in self.plumber_page.chars)
+        else:
+            return False
+        squeezed = "".join(characters.split()).casefold()
+        return bool(squeezed) and all("".join(word.split()).casefold() in squeezed for word in words)
+
+    def text_through(self, anchor: Pattern[str]) -> str:
+        """
+        The text of the page down to the last line holding a match of
+        `anchor`, such as the line closing an items table, so whatever is
+        printed below it is never laid out; the whole page's text when
+        nothing matches. Like may_contain(), `anchor` is searched in the
+        characters in drawing order without whitespace, so it is written
+        without spaces (and usually with re.IGNORECASE). Cached per anchor.
+        """
+        if anchor not in self._text_through:
+            text = ""
+            bottom = self._anchor_bottom(anchor)
+            if bottom is not None:
+                with stage("text"):
+                    text = self.plumber_page.filter(chars_above(bottom)).extract_text() or ""
+            self._text_through[anchor] = text
+        return self._text_through[anchor] or self.extract_text()
+
+    def _anchor_bottom(self, anchor: Pattern[str]) -> Optional[float]:
+        """The bottom of the last match of `anchor`, in PDF points from the top of the page."""
+        if not self._document.in_shard(self.index):
+            return None
+        with stage("text"):
+            page = self.plumber_page
+            chars = [char for char in page.chars if not char["text"].isspace()]
+            # A character's text can be a ligature of several letters: map each letter back to it
+            owners = [char for char in chars for _ in char["text"]]
+            matches = list(anchor.finditer("".join(char["text"] for char in chars)))
+        if not matches or not matches[-1].group():
+            return None
+        match = matches[-1]
+        return max(char["bottom"] for char in owners[match.start():match.end()])
+
+    @property
+    def text(self) -> str:
+        return self.extract_text()
+
+    @property
+    def lines(self) -> List[str]:
+        """The page text split on newlines. Shared between callers; do not mutate."""
+        if self._lines is None:
+            self._lines = self.text.split("\n")
+        return self._lines
+
+
+class PdfDocument:
+    """
+    A PDF opened once and shared by everything that reads it. Pages, page
+    text, lines and full text are all computed lazily and cached; close()
+    releases pdfplumber's parser state but keeps the extracted text.
+
+    With `page_shard`, only the pages whose index is in the shard are parsed;
+    every other page reads as empty. Page numbering is unchanged, so a
+    page-independent extractor run on a shard returns exactly the rows of
+    those pages.
+    """
+
+    def __init__(self, pdf_content: bytes, name: str = "", page_shard: Optional[range] = None):
+        self.content = pdf_content
+        self.name = name
+        self.page_shard = page_shard
+        self._pdf: Optional[pdfplumber.PDF] = None
+        self._pages: Optional[List[DocumentPage]] = None
+        self._full_text: Optional[str] = None
+        self._lines: Optional[List[str]] = None
+        self._sha256: Optional[str] = None
+
+    @property
+    def sha256(self) -> str:
+        """Hex digest of the raw PDF bytes; identifies the document without parsing it."""
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(self.content).hexdigest()
+        return self._sha256
+
+    def in_shard(self, index: int) -> bool:
+        return self.page_shard is None or index in self.page_shard
+
+    @property
+    def pdf(self) -> pdfplumber.PDF:
+        if self._pdf is None:
+            with stage("open"):
+                self._pdf = pdfplumber.open(io.BytesIO(self.content))
+        return self._pdf
+
+    @property
+    def pages(self) -> List[DocumentPage]:
+        if self._pages is None:
+            with stage("open"):
+                self._pages = [DocumentPage(self, index) for index in range(len(self.pdf.pages))]
+        return self._pages
+
+    @property
+    def full_text(self) -> str:
+        """Text of every non-empty page, each followed by a newline."""
+        if self._full_text is None:
+            self._full_text = "".join(page.text + "\n" for page in self.pages if page.text)
+        return self._full_text
+
+    @property
+    def lines(self) -> List[str]:
+        """Lines of every non-empty page, in page order. Shared; do not mutate."""
+        if self._lines is None:
+            self._lines = [line for page in self.pages if page.text for line in page.lines]
+        return self._lines
+
+    def close(self) -> None:
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+
+    def __enter__(self) -> "PdfDocument":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+DocumentSource = Union[bytes, PdfDocument]
+
+
+@contextmanager
+def open_document(source: DocumentSource) -> Iterator[PdfDocument]:
+    """
+    Yield a PdfDocument for raw PDF bytes or an existing document.
+    A document passed in by the caller is left open for its next consumer;
+    one created here is closed on exit.
+    """
+    if isinstance(source, PdfDocument):
+        yield source
+        return
+    with PdfDocument(source) as document:
+        yield document
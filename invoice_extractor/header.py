@@ -0,0 +1,109 @@
+"""
+Single-pass scanning of invoice header fields.
+
+Header parsers look for a handful of fields (invoice number, date, customer
+number, ...) and keep the first match of each. Searching every line with
+every field pattern costs fields x lines searches, although almost no line
+carries a header field. A HeaderScanner merges the field patterns into one
+alternation of named groups, so a line that holds no field costs a single
+search, and it stops reading once every field has been found:
+
+    _HEADER = HeaderScanner({
+        'invoice_number': re.compile(r'INVOICE NO\\.\\s*(\\d+)'),
+        ('order_number', 'order_date'): re.compile(r'Order No\\.\\s*(\\d+)\\s*-\\s*(\\S+)'),
+    })
+    invoice_data.update(_HEADER.scan(line.strip() for line in lines))
+
+The result is the same as searching each pattern on its own: every field
+gets the groups of its first match, in the first text where it matches.
+"""
+import functools
+import operator
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, Mapping, Pattern, Tuple, Union
+
+from .timing import timed
+
+# Flags that can be scoped to one alternative with (?flags:...)
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+_SCOPABLE = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE
+
+
+@dataclass(frozen=True)
+class HeaderField:
+    """A header pattern and the output keys of its capture groups, in group order."""
+    keys: Tuple[str, ...]
+    pattern: Pattern[str]
+
+
+def _scoped(pattern: Pattern[str], shared_flags: int) -> str:
+    """The pattern as one alternative, with the flags it does not share with the others scoped to it."""
+    flags = "".join(letter for flag, letter in _SCOPED_FLAGS if pattern.flags & ~shared_flags & flag)
+    return f"(?{flags}:{pattern.pattern})" if flags else f"(?:{pattern.pattern})"
+
+
+class HeaderScanner:
+    """
+    Finds the first match of several header fields in one pass.
+
+    `fields` maps an output key, or a tuple of keys for a pattern with
+    several groups, to the field's compiled pattern. Patterns keep their own
+    flags; they must not use numbered backreferences or named groups, since
+    they are renumbered inside the merged pattern.
+    """
+
+    def __init__(self, fields: Mapping[Union[str, Tuple[str, ...]], Pattern[str]]):
+        self.fields = [HeaderField((keys,) if isinstance(keys, str) else tuple(keys), pattern)
+                       for keys, pattern in fields.items()]
+        # Capturing groups keep sre from scanning ahead for a possible first
+        # character, so lines are searched with a non-capturing alternation and
+        # the named one is only matched where that finds a field.
+        # Flags every field uses are set on the merged pattern; the rest are scoped
+        shared_flags = functools.reduce(operator.and_, (field.pattern.flags for field in self.fields),
+                                        _SCOPABLE)
+        self._any_field = re.compile(
+            "|".join(_scoped(field.pattern, shared_flags) for field in self.fields), shared_flags)
+        self._named_fields = re.compile("|".join(
+            f"(?P<f{number}>{_scoped(field.pattern, shared_flags)})"
+            for number, field in enumerate(self.fields)), shared_flags)
+        # Group name -> (field, slice of match.groups() holding the field's own groups)
+        self._by_group = {}
+        for number, field in enumerate(self.fields):
+            index = self._named_fields.groupindex[f"f{number}"]
+            self._by_group[f"f{number}"] = (field, slice(index, index + field.pattern.groups))
+
+    @timed("header")
+    def scan(self, texts: Iterable[str]) -> Dict[str, str]:
+        """
+        Fill each field from its first match in `texts` (lines, or a whole
+        document as one string). Returns only the keys that were found.
+        """
+        found: Dict[str, str] = {}
+        remaining = list(self.fields)
+        for text in texts:
+            position = 0
+            while True:
+                hit = self._any_field.search(text, position)
+                if hit is None:
+                    break
+                # The named group tells which field matched first here; any other
+                # remaining field that also matches at this position is checked
+                # on its own.
+                start = hit.start()
+                named = self._named_fields.match(text, start)
+                hit_field, hit_groups = self._by_group[named.lastgroup]
+                for field in list(remaining):
+                    if field is hit_field:
+                        groups = named.groups()[hit_groups]
+                    else:
+                        match = field.pattern.match(text, start)
+                        if match is None:
+                            continue
+                        groups = match.groups()
+                    found.update(zip(field.keys, groups))
+                    remaining.remove(field)
+                if not remaining:
+                    return found
+                position = start + 1
+        return found
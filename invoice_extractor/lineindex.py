@@ -0,0 +1,77 @@
+"""
+Per-page keyword index for look-ahead and look-behind.
+
+Some parsers look for a keyword near a given line: the lot number within
+the next few lines of an item, or the nearest "your order no." above it.
+Scanning the neighbouring lines again for every item searches the same
+lines with the same pattern over and over. A LineIndex searches each line
+for a keyword once, on first use, and keeps the sorted positions of the
+lines where it was found, so each later lookup is a binary search:
+
+    index = LineIndex(lines, {'lot': re.compile(r'LOT#\\s*(\\S+)'),
+                              'order': re.compile(r'your order no\\.\\s*(\\d+)')})
+    position = index.next('lot', i, i + 5)      # first lot line in lines[i:i + 5]
+    if position is not None:
+        lot = index.match('lot', position).group(1)
+    position = index.previous('order', i)       # last order line in lines[:i + 1]
+
+Only parsers that search a window of lines around each item need it
+(Avalign, Bumüller). Parsers that merely peek at the next line gain nothing
+from an index, and order context that applies to the items below it is
+carried forward while walking the page, by LineRule(Action.SET, ...) in a
+TableLayout or by the parser's own loop, which is already a single pass.
+"""
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Mapping, Match, Optional, Pattern, Sequence
+
+
+class LineIndex:
+    """
+    Sorted positions of the lines of one page in which each keyword
+    pattern is found. `patterns` maps a key to the compiled pattern; a
+    keyword is indexed the first time it is looked up.
+    """
+
+    def __init__(self, lines: Sequence[str], patterns: Mapping[str, Pattern[str]]):
+        self.lines = lines
+        self.patterns = dict(patterns)
+        self._positions: Dict[str, List[int]] = {}
+        self._matches: Dict[str, Dict[int, Match[str]]] = {}
+
+    def _index(self, key: str) -> List[int]:
+        positions = self._positions.get(key)
+        if positions is None:
+            search = self.patterns[key].search
+            matches = {}
+            for position, line in enumerate(self.lines):
+                match = search(line)
+                if match:
+                    matches[position] = match
+            self._matches[key] = matches
+            positions = self._positions[key] = list(matches)
+        return positions
+
+    def positions(self, key: str) -> List[int]:
+        """Every position where `key` is found, in order."""
+        return self._index(key)
+
+    def match(self, key: str, position: int) -> Optional[Match[str]]:
+        """The match of `key` in the line at `position`, if it is found there."""
+        self._index(key)
+        return self._matches[key].get(position)
+
+    def next(self, key: str, start: int, stop: Optional[int] = None) -> Optional[int]:
+        """The first position at or after `start`, and before `stop` if given, where `key` is found."""
+        positions = self._index(key)
+        found = bisect_left(positions, start)
+        if found == len(positions) or (stop is not None and positions[found] >= stop):
+            return None
+        return positions[found]
+
+    def previous(self, key: str, position: int, start: int = 0) -> Optional[int]:
+        """The last position at or before `position`, and not before `start`, where `key` is found."""
+        positions = self._index(key)
+        found = bisect_right(positions, position)
+        if found == 0 or positions[found - 1] < start:
+            return None
+        return positions[found - 1]
@@ -0,0 +1,308 @@
+"""
+Vendor registry.
+
+Maps every supported vendor display name to its VendorSpec. The registry is
+built once at import time and only holds module names, so importing it does
+not import any vendor parser; a vendor's module is imported the first time
+its extractor is requested.
+"""
+import importlib
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+_GERMAN_DATE = "%d.%m.%Y"
+_US_DATES = ("%m/%d/%Y",)
+# For vendors that print some dates with a two-digit year ("5.3.24")
+_GERMAN_SHORT_DATES = (_GERMAN_DATE, "%d.%m.%y")
+_US_SHORT_DATES = _US_DATES + ("%m/%d/%y",)
+
+
+@dataclass(frozen=True)
+class VendorSpec:
+    """
+    Describes one supported vendor: the name shown in the UI, the module under
+    invoice_extractor.vendors that holds its extractor, the columns its rows
+    carry and the extractor version.
+
+    `page_independent` marks extractors whose rows depend only on their own
+    page (no order or invoice context carried across pages). Only those are
+    split across worker processes page by page; everything else is always
+    extracted as a whole document.
+
+    `column_map` holds (column, canonical column) pairs for columns whose
+    meaning differs from the common aliases of invoice_extractor.schema.
+    `decimal_comma` marks extractors whose numbers keep the German format
+    ("1.086,12"), and `date_formats` are the strptime formats of the dates
+    in the rows, tried in order; schema.canonical_frame() converts whole
+    columns with them.
+    """
+    name: str
+    key: str
+    columns: Tuple[str, ...]
+    version: str = "1"
+    page_independent: bool = False
+    column_map: Tuple[Tuple[str, str], ...] = ()
+    decimal_comma: bool = False
+    date_formats: Tuple[str, ...] = (_GERMAN_DATE,)
+
+    @property
+    def function_name(self) -> str:
+        return f"extract_{self.key}_invoice_data"
+
+    @property
+    def iterator_name(self) -> str:
+        return f"iter_{self.key}_invoice_rows"
+
+    @property
+    def module(self) -> ModuleType:
+        """Import the vendor module on first use."""
+        return importlib.import_module(f"{__package__}.vendors.{self.key}")
+
+    @property
+    def extractor(self) -> Callable[[bytes], List[Dict]]:
+        """The vendor's list-returning extractor."""
+        return getattr(self.module, self.function_name)
+
+    @property
+    def row_iterator(self) -> Callable[[bytes], Iterator[Dict]]:
+        """The vendor's streaming extractor, yielding rows as they are parsed."""
+        return getattr(self.module, self.iterator_name)
+
+
+_NOVO_COLUMNS = (
+    'invoice_date',
+    'invoice_number',
+    'purchase_order',
+    'vendor_item',
+    'novo_item',
+    'lot_number',
+    'quantity',
+    'price_each',
+    'page_number',
+)
+
+_ORDER_COLUMNS = (
+    'invoice_date',
+    'invoice_number',
+    'customer_number',
+    'order_no',
+    'order_date',
+    'delivery_note',
+    'item_code',
+    'description',
+    'quantity',
+    'unit_price',
+    'lot',
+    'page',
+)
+
+_ORDER_TOTAL_COLUMNS = (
+    'invoice_date',
+    'invoice_number',
+    'customer_number',
+    'order_no',
+    'order_date',
+    'delivery_note',
+    'item_code',
+    'description',
+    'quantity',
+    'unit_price',
+    'total_price',
+    'lot',
+    'page',
+)
+
+_ORDER_POSITION_COLUMNS = (
+    'invoice_date',
+    'invoice_number',
+    'customer_number',
+    'order_no',
+    'order_date',
+    'delivery_note',
+    'position',
+    'item_code',
+    'description',
+    'quantity',
+    'unit_price',
+    'total_price',
+    'lot',
+    'page',
+)
+
+_ORDER_LOT_NUMBER_COLUMNS = (
+    'invoice_date',
+    'invoice_number',
+    'customer_number',
+    'order_no',
+    'item_code',
+    'description',
+    'quantity',
+    'unit_price',
+    'lot_number',
+    'page',
+)
+
+VENDOR_REGISTRY: Dict[str, VendorSpec] = {spec.name: spec for spec in (
+    VendorSpec('Bumüller GmbH', 'bumuller', _NOVO_COLUMNS, decimal_comma=True),
+    VendorSpec('Avalign German Specialty Instruments', 'avalign', _NOVO_COLUMNS,
+               version='2', page_independent=True, date_formats=_US_DATES),
+    VendorSpec('A. Milazzo Medizintechnik GmbH', 'amilazzo', _NOVO_COLUMNS, decimal_comma=True),
+    VendorSpec('Ackermann', 'ackermann',
+               ('invoice_date', 'invoice_number', 'position', 'item_no', 'description', 'po_no', 'quantity', 'unit_price', 'discount', 'total', 'order_no', 'lot', 'page'),
+               version='2', decimal_comma=True),
+    VendorSpec('Betzler', 'betzler',
+               ('invoice_date', 'invoice_number', 'order_no', 'order_date', 'description', 'quantity', 'price', 'art_no', 'mdl_reg_no', 'lot_number', 'page'),
+               version='2', decimal_comma=True, date_formats=_GERMAN_SHORT_DATES),
+    VendorSpec('Hipp', 'hipp',
+               ('invoice_date', 'invoice_number', 'confirmation_no', 'order_no', 'order_date', 'description', 'quantity', 'unit_price', 'total_price', 'lot', 'page'),
+               version='2', decimal_comma=True),
+    VendorSpec('Aspen', 'aspen',
+               ('invoice_date', 'invoice_number', 'order_number', 'part_no', 'description', 'quantity', 'unit_price', 'net_amount', 'lot', 'page'),
+               version='2', date_formats=_US_SHORT_DATES),
+    VendorSpec('Bahadir', 'bahadir',
+               ('invoice_date', 'invoice_number', 'po_number', 'lot_number', 'line_no', 'item_code', 'description', 'quantity', 'unit_price', 'total', 'page'),
+               version='2', date_formats=_US_DATES),
+    VendorSpec('Bauer & Haselbarth', 'bauer_hasselbarth',
+               ('invoice_date', 'invoice_number', 'customer_number', 'po_number', 'lot_number', 'line_no', 'item_code', 'description', 'quantity', 'unit_price', 'total', 'page'),
+               version='2', decimal_comma=True),
+    VendorSpec('Biselli', 'biselli',
+               ('invoice_number', 'invoice_date', 'order_number', 'order_date', 'delivery_note', 'delivery_date', 'lot_number', 'lst_number', 'position', 'article_number', 'description', 'quantity', 'unit_price', 'total_price'),
+               version='2', decimal_comma=True),
+    VendorSpec('Blache', 'blache',
+               ('invoice_number', 'invoice_date', 'customer_number', 'vat_number', 'order_number', 'po_number', 'delivery_note', 'delivery_date', 'lot_number', 'position', 'article_number', 'description', 'quantity', 'unit_price', 'total_price'),
+               version='2', decimal_comma=True),
+    VendorSpec('Carl Teufel', 'carl_teufel',
+               ('invoice_number', 'invoice_date', 'order_number', 'article_number', 'product_code', 'description', 'quantity', 'unit_price', 'total_price', 'lot_number', 'mdl_number', 'code'),
+               version='2', decimal_comma=True),
+    VendorSpec('Chirmed', 'chirmed',
+               ('invoice_number', 'invoice_date', 'order_number', 'due_date', 'currency', 'position', 'article_number', 'lot_number', 'product_code', 'description', 'quantity', 'unit_price', 'total_price'),
+               version='2', column_map=(('product_code', 'item_code'), ('article_number', 'article_number')),
+               decimal_comma=True, date_formats=("%Y-%m-%d",)),
+    VendorSpec('CM Instrumente', 'cm_instrumente',
+               ('invoice_number', 'invoice_date', 'customer_number', 'order_number', 'article_number', 'mdl_number', 'lot_number', 'position', 'article_code', 'description', 'quantity', 'unit_price', 'total_price'),
+               version='2', decimal_comma=True),
+    VendorSpec('CMF', 'cmf',
+               ('invoice_number', 'invoice_date', 'po_number', 'description', 'quantity', 'unit_price', 'total_price', 'lot_number'),
+               date_formats=_US_DATES),
+    VendorSpec('Dannoritzer', 'dannoritzer',
+               ('invoice_date', 'invoice_number', 'customer_number', 'order_no', 'order_date', 'delivery_note', 'position', 'item_code', 'description', 'quantity', 'unit_price', 'total_price', 'page'),
+               version='2', page_independent=True, decimal_comma=True),
+    VendorSpec('Dausch', 'dausch', _ORDER_POSITION_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Denzel', 'denzel', _ORDER_POSITION_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Efinger', 'efinger',
+               ('invoice_date', 'invoice_number', 'order_no', 'item_code', 'description', 'quantity', 'unit_price', 'total_price', 'lot', 'page'),
+               version='2', date_formats=_US_DATES),
+    VendorSpec('ELMED', 'elmed',
+               ('invoice_date', 'invoice_number', 'order_no', 'order_date', 'delivery_note', 'item_code', 'description', 'quantity', 'unit_price', 'total_price', 'lot', 'page'),
+               version='2', date_formats=_US_DATES),
+    VendorSpec('Ermis MedTech', 'ermis', _ORDER_TOTAL_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('ESMA', 'esma',
+               ('invoice_date', 'invoice_number', 'order_no', 'delivery_note', 'item_code', 'description', 'quantity', 'unit_price', 'total_price', 'lot', 'page'),
+               version='2', date_formats=_US_DATES),
+    VendorSpec('EUROMED', 'euromed',
+               ('invoice_date', 'invoice_number', 'order_no', 'delivery_note', 'item_code', 'description', 'quantity', 'unit_price', 'total_price', 'lot', 'parcel', 'page'),
+               version='2', date_formats=_US_SHORT_DATES),
+    VendorSpec('Faulhaber', 'faulhaber', _ORDER_TOTAL_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Fetzer', 'fetzer',
+               ('invoice_date', 'invoice_number', 'order_no', 'order_date', 'customer_number', 'item_code', 'description', 'quantity', 'unit_price', 'total_price', 'lot', 'page'),
+               version='2', date_formats=_US_DATES),
+    VendorSpec('Gebrüder', 'gebruder',
+               ('invoice_date', 'invoice_number', 'order_no', 'order_date', 'customer_number', 'item_code', 'description', 'quantity', 'unit_price', 'total_price', 'lot', 'due_date', 'page'),
+               version='2', decimal_comma=True),
+    VendorSpec('Geister', 'geister', _ORDER_TOTAL_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Georg Alber', 'georgalber', _ORDER_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Getsch+Hiller', 'getschhiller', _ORDER_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Gordon Brush', 'gordonbrush',
+               ('invoice_date', 'invoice_number', 'order_no', 'customer_number', 'delivery_note', 'item_code', 'description', 'quantity', 'unit_price', 'lot', 'page'),
+               version='2', date_formats=_US_DATES),
+    VendorSpec('Gunter Bissinger Medizintechnik GmbH', 'bissinger', _ORDER_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Hafner', 'hafner', _ORDER_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Heiss-Medical', 'heissmedical', _ORDER_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Hermann', 'hermann', _ORDER_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('HGR', 'hgr', _ORDER_COLUMNS, version='2', page_independent=True, decimal_comma=True),
+    VendorSpec('Holger', 'holger',
+               ('invoice_date', 'invoice_number', 'customer_number', 'order_no', 'order_date', 'item_code', 'description', 'quantity', 'unit_price', 'lot', 'page'),
+               version='2'),
+    VendorSpec('ILG', 'ilg', _ORDER_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Josef Betzler', 'josef_betzler', _ORDER_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('KAPP', 'kapp', _ORDER_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Kohler', 'kohler', _ORDER_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Medin', 'medin', _ORDER_COLUMNS, version='2'),
+    VendorSpec('Microqore', 'microqore', _ORDER_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Otto Ruttgers', 'otto_ruttgers', _ORDER_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Phoenix Instruments', 'phoenix', _ORDER_COLUMNS),
+    VendorSpec('Precision Medical', 'precision_medical', _ORDER_COLUMNS, version='2'),
+    VendorSpec('Rebstock', 'rebstock', _ORDER_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Rica', 'rica', _ORDER_COLUMNS),
+    VendorSpec('Rudischhauser', 'rudischhauser', _ORDER_LOT_NUMBER_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Rudolf Storz', 'rudolfstorz', _ORDER_LOT_NUMBER_COLUMNS, version='2', decimal_comma=True),
+    VendorSpec('Ruhof', 'ruhof',
+               ('invoice_number', 'invoice_date', 'customer_number', 'po_number', 'quantity', 'item_code', 'description', 'pkgs', 'unit_price', 'page_number'),
+               date_formats=_US_DATES),
+    VendorSpec('S.u.A. Martin', 'sua',
+               ('invoice_number', 'invoice_date', 'customer_number', 'order_number', 'order_date', 'art_number', 'lot_number', 'description', 'quantity', 'unit_price', 'page_number'),
+               decimal_comma=True, date_formats=_GERMAN_SHORT_DATES),
+    VendorSpec('Schmid', 'schmid',
+               ('invoice_number', 'invoice_date', 'customer_number', 'order_number', 'order_date', 'delivery_note', 'art_number', 'lot_number', 'description', 'quantity', 'unit_price', 'page_number'),
+               decimal_comma=True),
+    VendorSpec('SGS North America', 'sgs',
+               ('invoice_number', 'invoice_date', 'client_name', 'account_number', 'our_reference', 'client_reference', 'po_number', 'page', 'description', 'quantity', 'net', 'total'),
+               column_map=(('net', 'unit_price'),),
+               date_formats=("%B %d, %Y",)),
+    VendorSpec('SIBEL', 'sibel',
+               ('invoice_number', 'invoice_date', 'page', 'item_number', 'description', 'quantity', 'unit', 'unit_price', 'article_number', 'lot_number'),
+               page_independent=True, decimal_comma=True, date_formats=("%d/%m/%Y",)),
+    VendorSpec('Siema', 'siema',
+               ('invoice_number', 'invoice_date', 'customer_number', 'order_number', 'order_date', 'lst_number', 'ref_no', 'item_number', 'description', 'quantity', 'unit_price', 'lot_number', 'page'),
+               version='6', page_independent=True, decimal_comma=True),
+    VendorSpec('SignTech', 'sigtech',
+               ('invoice_number', 'invoice_date', 'order_number', 'order_date', 'customer_number', 'customer_po', 'purchase_order_no', 'ship_date', 'ship_via', 'qty_ordered', 'qty_shipped', 'qty_backorder', 'unit', 'item_number', 'description', 'unit_price', 'ext_price', 'lot_number', 'country_of_origin', 'page'),
+               version='2', column_map=(('customer_po', 'po_number'), ('purchase_order_no', 'purchase_order_no'),
+                                        ('qty_shipped', 'quantity')),
+               date_formats=_US_DATES),
+    VendorSpec('SIS', 'sis',
+               ('invoice_number', 'invoice_date', 'po_number', 'order_date', 'ship_date', 'bill_to', 'ship_to', 'description', 'quantity', 'unit_price', 'ext_price', 'page'),
+               version='2', date_formats=_US_SHORT_DATES),
+    VendorSpec('Sitec', 'sitec',
+               ('invoice_number', 'invoice_date', 'item_number', 'description', 'order_number', 'quantity', 'unit_price', 'lst_number', 'page'),
+               version='2', date_formats=_US_SHORT_DATES),
+    VendorSpec('SMT', 'smt',
+               ('invoice_number', 'invoice_date', 'order_number', 'order_date', 'lst_number', 'item_number', 'description', 'quantity', 'unit_price', 'total_price', 'lot_number', 'page'),
+               version='2', decimal_comma=True),
+    VendorSpec('Stengelin', 'stengelin',
+               ('invoice_date', 'invoice_number', 'customer_number', 'dev_no', 'order_no', 'item_code', 'description', 'quantity', 'unit_price', 'total_price', 'lot_number', 'lst_number', 'page'),
+               version='2', decimal_comma=True),
+    VendorSpec('Steris', 'steris',
+               ('invoice_date', 'invoice_number', 'customer_number', 'order_no', 'sales_order_no', 'ship_date', 'tracking_number', 'item_code', 'description', 'quantity', 'unit_price', 'total_price', 'page'),
+               version='2', date_formats=("%d-%b-%y",)),
+    VendorSpec('Stork', 'stork',
+               ('invoice_date', 'invoice_number', 'customer_number', 'order_no', 'lst_no', 'item_code', 'description', 'quantity', 'unit_price', 'serial_number', 'page'),
+               version='2', decimal_comma=True),
+    VendorSpec('Tontarra', 'tontarra',
+               ('invoice_date', 'invoice_number', 'customer_number', 'our_ref', 'dev_no', 'delivery_note', 'delivery_date', 'order_no', 'lst_no', 'hs_code', 'art_no', 'item_code', 'description', 'quantity', 'unit_price', 'lot_number', 'page'),
+               version='2', decimal_comma=True),
+    VendorSpec('Total Titanium', 'total_titanium',
+               ('invoice_date', 'invoice_number', 'order_no', 'item_code', 'description', 'quantity', 'unit_price', 'page')),
+    VendorSpec('Vinzenz Sattler', 'vinzenz_sattler',
+               ('invoice_date', 'invoice_number', 'customer_number', 'dev_no', 'order_no', 'listing_no', 'your_item_no', 'item_code', 'description', 'quantity', 'unit_price', 'lot_number', 'page'),
+               version='2', decimal_comma=True),
+    VendorSpec('Vollrath', 'vollrath',
+               ('invoice_date', 'invoice_number', 'order_no', 'order_date', 'item_code', 'description', 'quantity', 'unit_price', 'page'),
+               version='2', date_formats=("%m/%d/%y",)),
+    VendorSpec('WEBA', 'weba',
+               ('invoice_date', 'invoice_number', 'customer_number', 'dev_no', 'our_sign', 'cred_no', 'order_no', 'lst_no', 'art_no', 'item_code', 'description', 'quantity', 'unit_price', 'lot_number', 'page'),
+               version='2', decimal_comma=True),
+    VendorSpec('Y&W', 'yw',
+               ('invoice_date', 'invoice_number', 'customer', 'po_number', 'lot_no', 'order_no', 'packing_list', 'item_number', 'quantity', 'item_code', 'description', 'unit_price'),
+               version='2', column_map=(('item_number', 'position'),),
+               date_formats=_US_DATES),
+)}
+
+VENDORS_BY_KEY: Dict[str, VendorSpec] = {spec.key: spec for spec in VENDOR_REGISTRY.values()}
+
+
+def get_vendor_spec(vendor: str) -> Optional[VendorSpec]:
+    """Return the registry entry for a vendor display name, or None if unsupported."""
+    return VENDOR_REGISTRY.get(vendor)
@@ -0,0 +1,272 @@
+"""
+Canonical output schema.
+
+Extractors name their columns after the invoice they read: the order
+number is `order_no` in one vendor's rows and `order_number` in another's,
+the page `page` or `page_number`. canonical_frame() renames every vendor's
+columns to one schema and gives each column a compact dtype, so batches of
+several vendors concatenate into a single table the summary and downloads
+can rely on:
+
+- repeated values (invoice, order and customer numbers) are categoricals;
+- prices are exact decimals (Arrow decimal128), quantities Float64 and
+  pages integers;
+- invoice and order dates are datetimes;
+- columns outside the schema are kept, after the canonical ones, as text.
+
+Numbers and dates are read with the vendor's locale hints,
+VendorSpec.decimal_comma and VendorSpec.date_formats, one column at a time
+over the whole batch, so parsers emit the strings as printed on the invoice.
+A number that does not parse, or whose separators do not fit its vendor's
+locale ("48.90" from a decimal_comma vendor, "48,90" from another), is
+counted per vendor and column and logged as a warning.
+
+Decimals keep a fixed scale, so "24.8" is held as 24.8000; text_frame()
+gives the table as it is shown and downloaded, with that padding trimmed.
+
+A vendor column is renamed by the vendor's own VendorSpec.column_map if it
+has an entry, else by COLUMN_ALIASES; an alias is skipped when the vendor
+already has a column of the target name, so no two columns collide.
+"""
+import logging
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # decimal columns fall back to Float64
+    pa = pc = None
+
+from .registry import VendorSpec
+
+# Canonical columns in output order, with the kind of values they hold
+CANONICAL_SCHEMA: Dict[str, str] = {
+    'vendor': 'category',
+    'invoice_number': 'category',
+    'invoice_date': 'date',
+    'customer_number': 'category',
+    'po_number': 'category',
+    'order_number': 'category',
+    'order_date': 'date',
+    'delivery_note': 'category',
+    'lst_number': 'category',
+    'position': 'string',
+    'item_code': 'string',
+    'description': 'string',
+    'lot_number': 'string',
+    'quantity': 'number',
+    'unit_price': 'decimal',
+    'total_price': 'decimal',
+    'page': 'integer',
+}
+
+# Decimal columns are exact to this many places; other number columns are Float64
+_DECIMAL_SCALE = 4
+_DECIMAL_TYPE = pa.decimal128(18, _DECIMAL_SCALE) if pa is not None else None
+_PLAIN_NUMBER_RE = r'-?\d{1,14}(?:\.\d{1,10})?'
+# Numbers as printed in each locale: the grouping separator only between
+# groups of three digits, the decimal separator at most once after them
+_DECIMAL_COMMA_NUMBER_RE = r'-?(?:\d{1,3}(?:\.\d{3})+|\d+)(?:,\d+)?'
+_DECIMAL_POINT_NUMBER_RE = r'-?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?'
+
+# Trailing zeros a printed decimal can drop, keeping two places ("24.8000" -> "24.80")
+_DECIMAL_PADDING_RE = r'(\.\d\d\d*?)0+$'
+
+_logger = logging.getLogger(__name__)
+
+# Vendor column name -> canonical column name, for every vendor
+COLUMN_ALIASES: Dict[str, str] = {
+    'order_no': 'order_number',
+    'purchase_order': 'po_number',
+    'po_no': 'po_number',
+    'purchase_order_no': 'po_number',
+    'lst_no': 'lst_number',
+    'line_no': 'position',
+    'item_no': 'item_code',
+    'item_number': 'item_code',
+    'vendor_item': 'item_code',
+    'part_no': 'item_code',
+    'art_no': 'item_code',
+    'art_number': 'item_code',
+    'article_number': 'item_code',
+    'lot': 'lot_number',
+    'lot_no': 'lot_number',
+    'price': 'unit_price',
+    'price_each': 'unit_price',
+    'total': 'total_price',
+    'ext_price': 'total_price',
+    'net_amount': 'total_price',
+    'page_number': 'page',
+}
+
+
+def column_mapping(spec: VendorSpec, columns: Iterable[str]) -> Dict[str, str]:
+    """The canonical name of each of a vendor's `columns`."""
+    columns = list(columns)
+    own = dict(spec.column_map)
+    taken = set(columns)
+    mapping = {}
+    for column in columns:
+        target = own.get(column) or COLUMN_ALIASES.get(column, column)
+        if target != column and (target in taken or target in mapping.values()) and column not in own:
+            target = column
+        mapping[column] = target
+    return mapping
+
+
+def _is_printed(values: pd.Series) -> pd.Series:
+    """Which `values` are strings, as parsers emit them, rather than numbers already."""
+    if pd.api.types.is_numeric_dtype(values):
+        return pd.Series(False, index=values.index)
+    return values.map(lambda value: isinstance(value, str)).astype(bool)
+
+
+def _number_text(values: pd.Series, decimal_comma: pd.Series) -> pd.Series:
+    """
+    Number strings in plain "1234.56" form. Currency signs and spaces are
+    dropped; "," is the decimal separator on rows whose `decimal_comma` is
+    set ("1.086,12") and groups thousands on the others ("$ 1,234.56").
+    Values that are then not a number are NA.
+    """
+    text = values.astype('string').str.replace(r'[^\d.,\-]', '', regex=True)
+    german = text.str.replace('.', '', regex=False).str.replace(',', '.', regex=False)
+    text = german.where(decimal_comma, text.str.replace(',', '', regex=False))
+    return text.where(text.str.fullmatch(_PLAIN_NUMBER_RE).fillna(False))
+
+
+def _misread_numbers(values: pd.Series, text: pd.Series, decimal_comma: pd.Series) -> pd.Series:
+    """
+    Which non-empty `values` did not become a number in `text`, or have
+    separators that do not fit the row's locale, so were likely read wrong:
+    "48.90" with `decimal_comma` set is 4890, "48,90" without it 4890 too.
+    """
+    printed = values.astype('string').str.replace(r'[^\d.,\-]', '', regex=True)
+    fits = printed.str.fullmatch(_DECIMAL_COMMA_NUMBER_RE).where(
+        decimal_comma, printed.str.fullmatch(_DECIMAL_POINT_NUMBER_RE))
+    present = values.astype('string').str.strip().fillna('') != ''
+    return present & (text.isna() | ~fits.fillna(False).astype(bool))
+
+
+def _warn_misread(values: pd.Series, misread: pd.Series, vendors: pd.Series, problem: str) -> None:
+    """Log how many of each vendor's values of the column are `misread`, with the first as example."""
+    for vendor, count in vendors[misread].value_counts(sort=False).items():
+        if count:
+            example = values[misread & (vendors == vendor)].iloc[0]
+            _logger.warning("%s: %d %s value(s) %s, e.g. %r", vendor, count, values.name, problem, example)
+
+
+def _to_decimal(text: pd.Series) -> pd.Series:
+    """Plain number strings as exact decimals, or Float64 without pyarrow."""
+    if pa is None:
+        return pd.to_numeric(text).astype('Float64')
+    array = pa.array(text.to_numpy(dtype=object, na_value=None), type=pa.string())
+    # Parse at full scale and round, as casting straight to the column's scale rejects longer fractions
+    array = pc.cast(pc.round(pc.cast(array, pa.decimal128(38, 10)), _DECIMAL_SCALE), _DECIMAL_TYPE)
+    return pd.Series(pd.arrays.ArrowExtensionArray(array), index=text.index)
+
+
+def _to_dates(values: pd.Series, formats: Sequence[str]) -> pd.Series:
+    """Each value parsed with the first of `formats` that fits it, NaT where none does."""
+    dates = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+    for date_format in formats:
+        parsed = pd.to_datetime(values.where(dates.isna()), format=date_format, errors='coerce')
+        dates = dates.fillna(parsed)
+    return dates
+
+
+def _with_kind(values: pd.Series, kind: str, specs: Sequence[VendorSpec], vendors: pd.Series) -> pd.Series:
+    """
+    `values` converted to the column kind. Number and date columns are read
+    a whole column at a time, with each row's vendor hints: the decimal
+    separator of its numbers and the formats of its dates.
+    """
+    if kind in ('category', 'string'):
+        values = values.astype('string')
+        return values.astype('category') if kind == 'category' else values
+    if kind == 'date':
+        values = values.astype('string')
+        dates = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+        for formats in dict.fromkeys(spec.date_formats for spec in specs):
+            rows = vendors.isin([spec.name for spec in specs if spec.date_formats == formats])
+            dates[rows] = _to_dates(values[rows], formats)
+        undated = dates.isna() & values.str.strip().fillna('').ne('')
+        if undated.any():
+            _warn_misread(values, undated, vendors, "matching none of the vendor's date formats")
+        return dates
+    # Only printed numbers follow the vendor's locale: a column that pd.concat()
+    # made float, because some vendor lacks it, holds 1.0, which must not read as "10"
+    decimal_comma = vendors.map({spec.name: spec.decimal_comma for spec in specs}).astype(bool)
+    decimal_comma &= _is_printed(values)
+    text = _number_text(values, decimal_comma)
+    misread = _misread_numbers(values, text, decimal_comma)
+    if misread.any():
+        _warn_misread(values, misread, vendors, "not read as numbers or with unexpected separators")
+    if kind == 'decimal':
+        return _to_decimal(text)
+    if kind == 'integer':
+        return pd.to_numeric(text).round().astype('Int32')
+    return pd.to_numeric(text).astype('Float64')
+
+
+def canonical_frame(batches: Sequence[Tuple[VendorSpec, List[Dict]]]) -> pd.DataFrame:
+    """
+    One DataFrame in the canonical schema from (vendor, rows) pairs, in
+    order. Vendors' frames are concatenated before any dtype is applied, so
+    categoricals are built and numbers and dates parsed once over the whole
+    batch.
+    """
+    frames = []
+    for spec, rows in batches:
+        if not rows:
+            continue
+        frame = pd.DataFrame(rows)
+        frame = frame.rename(columns=column_mapping(spec, frame.columns))
+        frame.insert(0, 'vendor', spec.name)
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame()
+
+    df = pd.concat(frames, ignore_index=True, sort=False)
+    canonical = [column for column in CANONICAL_SCHEMA if column in df.columns]
+    extra = [column for column in df.columns if column not in CANONICAL_SCHEMA]
+    df = df[canonical + extra]
+    specs = list({spec.name: spec for spec, rows in batches if rows}.values())
+    vendors = df['vendor']
+    for column in canonical:
+        df[column] = _with_kind(df[column], CANONICAL_SCHEMA[column], specs, vendors)
+    for column in extra:
+        df[column] = df[column].astype('string')
+    return df
+
+
+def text_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    A canonical_frame() result as text, for display and download: decimals
+    with at least two and at most their significant places, whole quantities
+    without ".0" and dates as YYYY-MM-DD.
+    """
+    text = df.copy()
+    for column in df.columns:
+        kind = CANONICAL_SCHEMA.get(column)
+        if kind == 'decimal':
+            text[column] = df[column].astype('string').str.replace(_DECIMAL_PADDING_RE, r'\1', regex=True)
+        elif kind == 'number':
+            text[column] = df[column].astype('string').str.replace(r'\.0+$', '', regex=True)
+        elif kind == 'date':
+            text[column] = df[column].dt.strftime('%Y-%m-%d').astype('string')
+    return text
+
+
+def arrow_schema(columns: Sequence[str]) -> 'pa.Schema':
+    """Arrow schema of a table of `columns`: canonical columns typed by their kind, others strings."""
+    types = {
+        'category': pa.string(),
+        'string': pa.string(),
+        'date': pa.date32(),
+        'number': pa.float64(),
+        'decimal': _DECIMAL_TYPE,
+        'integer': pa.int32(),
+    }
+    return pa.schema([(column, types[CANONICAL_SCHEMA.get(column, 'string')]) for column in columns])
@@ -0,0 +1,198 @@
+"""
+Item block segmentation for table-style invoices.
+
+Most vendors print their line items as a table, often below a header such
+as "POS ARTICLE description qty. each price": an item starts on a line with
+a position number and article code, its description, lot and article
+numbers follow on the next lines, and lines such as "your order no. ..."
+set context for the items below them until totals end the table.
+
+A TableLayout describes one vendor's variant of that layout with a few
+precompiled patterns. iter_item_blocks() walks a page's lines once: each
+line is classified into a LineKind by TableLayout.classify(), which tests
+each pattern at most once, and the kinds are then grouped into blocks:
+
+    _LAYOUT = TableLayout(
+        header=re.compile(r'POS\\s+ARTICLE\\s+description', re.IGNORECASE),
+        item_start=re.compile(r'^\\d+\\s+SM\\b'),
+        rules=(
+            LineRule(Action.STOP, re.compile(r'total net', re.IGNORECASE)),
+            LineRule(Action.SET, re.compile(r'your order no\\.\\s*(\\d+)'), ('order_number',)),
+        ),
+    )
+    for block, context in iter_item_blocks(lines, _LAYOUT, {'order_number': ''}):
+        ...
+"""
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Iterable, Iterator, List, Match, Optional, Pattern, Tuple
+
+from .timing import timed_iter
+
+
+class LineKind(Enum):
+    """The role of a table line."""
+    NOISE = "noise"                # not part of any item
+    ITEM_START = "item_start"      # first line of a new item block
+    CONTINUATION = "continuation"  # further line of the open block
+    CONTEXT = "context"            # context for the items below it
+    STOP = "stop"                  # closes the open block
+
+
+class Action(Enum):
+    """What a LineRule does with a table line its pattern is found in."""
+    SKIP = "skip"            # ignore the line
+    STOP = "stop"            # close the open block and end the table on this page
+    CLOSE = "close"          # close the open block
+    SET = "set"              # set context from the groups
+    CLOSE_SET = "close_set"  # close the open block under the old context, then set context
+    SET_CLOSE = "set_close"  # set context, then close the open block under the new context
+    APPEND = "append"        # add the line to the open block; with none open, keep classifying it
+
+
+_KIND_BY_ACTION = {
+    Action.SKIP: LineKind.NOISE,
+    Action.STOP: LineKind.STOP,
+    Action.CLOSE: LineKind.STOP,
+    Action.SET: LineKind.CONTEXT,
+    Action.CLOSE_SET: LineKind.CONTEXT,
+    Action.SET_CLOSE: LineKind.CONTEXT,
+}
+
+
+@dataclass(frozen=True)
+class LineRule:
+    """
+    An action for table lines in which `pattern` is found. Context actions
+    store the stripped capture groups under `keys`, in group order.
+    """
+    action: Action
+    pattern: Pattern[str]
+    keys: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class TableLayout:
+    """
+    One vendor's item table.
+
+    Lines are stripped unless `strip` is off. Lines above the `header`
+    only feed the `preamble` context rules (all of which are applied);
+    without a header the table spans the whole page. In the table, the
+    `notes` context rules are applied to every line, which is then
+    classified: by the first of `rules` that handles it, else as the start
+    of an item if it matches `item_start` (and does not contain
+    `start_unless`, unless a block is open), else as the end of the open
+    block if it contains the `terminator`, else as a continuation if it
+    passes the `continuation` filter. With `skip_blank`, empty lines are
+    never added to a block.
+
+    `header_words` are words every header line contains, for
+    DocumentPage.may_contain() to skip pages without the table before
+    their text is laid out.
+    """
+    header: Optional[Pattern[str]]
+    item_start: Pattern[str]
+    rules: Tuple[LineRule, ...] = ()
+    notes: Tuple[LineRule, ...] = ()
+    header_words: Tuple[str, ...] = ()
+    preamble: Tuple[LineRule, ...] = ()
+    terminator: Optional[Pattern[str]] = None
+    start_unless: Optional[Pattern[str]] = None
+    continuation: Optional[Pattern[str]] = None
+    skip_blank: bool = False
+    strip: bool = True
+
+    def classify(self, line: str, block_open: bool) -> Tuple[LineKind, Optional[LineRule], Optional[Match[str]]]:
+        """
+        The kind of a table line, and the rule and match that decided it,
+        if any. Whether a block is open matters for lines that can only
+        extend or end a block.
+        """
+        for rule in self.rules:
+            match = rule.pattern.search(line)
+            if match is None:
+                continue
+            if rule.action is Action.APPEND:
+                if block_open:
+                    return LineKind.CONTINUATION, rule, match
+                continue
+            return _KIND_BY_ACTION[rule.action], rule, match
+        if self.skip_blank and not line:
+            return LineKind.NOISE, None, None
+        if self.item_start.match(line):
+            if block_open or not (self.start_unless and self.start_unless.search(line)):
+                return LineKind.ITEM_START, None, None
+            return LineKind.NOISE, None, None
+        if not block_open:
+            return LineKind.NOISE, None, None
+        if self.terminator and self.terminator.search(line):
+            return LineKind.STOP, None, None
+        if self.continuation is None or self.continuation.search(line):
+            return LineKind.CONTINUATION, None, None
+        return LineKind.NOISE, None, None
+
+
+def _set_context(context: Dict[str, str], rule: LineRule, match: Match[str]) -> None:
+    for key, value in zip(rule.keys, match.groups()):
+        context[key] = value.strip()
+
+
+def _iter_item_blocks(lines: Iterable[str], layout: TableLayout,
+                      context: Dict[str, str]) -> Iterator[Tuple[List[str], Dict[str, str]]]:
+    header = layout.header
+    in_table = header is None
+    block: List[str] = []
+    for line in lines:
+        if layout.strip:
+            line = line.strip()
+        if header is not None and header.search(line):
+            in_table = True
+            continue
+        if not in_table:
+            for rule in layout.preamble:
+                match = rule.pattern.search(line)
+                if match:
+                    _set_context(context, rule, match)
+            continue
+        for rule in layout.notes:
+            match = rule.pattern.search(line)
+            if match:
+                _set_context(context, rule, match)
+
+        kind, rule, match = layout.classify(line, bool(block))
+        if kind is LineKind.CONTINUATION:
+            block.append(line)
+        elif kind is LineKind.ITEM_START:
+            if block:
+                yield block, dict(context)
+            block = [line]
+        elif kind is LineKind.STOP:
+            if block:
+                yield block, dict(context)
+                block = []
+            if rule is not None and rule.action is Action.STOP:
+                break
+        elif kind is LineKind.CONTEXT:
+            if block and rule.action is Action.CLOSE_SET:
+                yield block, dict(context)
+                block = []
+            _set_context(context, rule, match)
+            if block and rule.action is Action.SET_CLOSE:
+                yield block, dict(context)
+                block = []
+
+    if block:
+        yield block, dict(context)
+
+
+def iter_item_blocks(lines: Iterable[str], layout: TableLayout,
+                     context: Dict[str, str]) -> Iterator[Tuple[List[str], Dict[str, str]]]:
+    """
+    Yield (block lines, context) for each item block of a page, in order.
+    The context yielded is a copy of `context` as it was when the block
+    closed; `context` itself is updated in place, so passing the same dict
+    for every page carries it over from page to page. The time spent
+    segmenting counts towards the "segment" stage.
+    """
+    return timed_iter("segment", _iter_item_blocks(lines, layout, context))
@@ -0,0 +1,42 @@
+"""
+Per-invoice summary of an extracted batch in the canonical schema.
+
+One groupby pass over the rows instead of filtering the DataFrame once per
+invoice, which costs rows x invoices on large batches; the result is a
+single table with one row per invoice, in order of first appearance.
+"""
+import pandas as pd
+
+# Summary column -> canonical column whose distinct values it lists
+SUMMARY_VALUE_COLUMNS = {'po_numbers': 'po_number', 'order_numbers': 'order_number'}
+
+
+def _joined_values(df: pd.DataFrame, column: str, sort: bool = False) -> pd.Series:
+    """The distinct non-empty values of `column` per invoice, joined with ", "."""
+    values = df[['invoice_number', column]].dropna().drop_duplicates()
+    values = values[values[column].astype(str) != '']
+    if sort:
+        values = values.sort_values(column, kind='stable')
+    # Joined as plain strings: aggregating the categorical column itself gives
+    # back a categorical, which the summary's fillna('') cannot fill
+    return (values[column].astype(str)
+            .groupby(values['invoice_number'], sort=False, observed=True)
+            .agg(", ".join))
+
+
+def summarize_invoices(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per invoice number: its item count, the sorted pages holding
+    its items, and its distinct PO and order numbers where the vendor's
+    rows carry them. Empty when the rows have no invoice number.
+    """
+    if 'invoice_number' not in df.columns or df.empty:
+        return pd.DataFrame(columns=['invoice_number', 'items'])
+
+    summary = df.groupby('invoice_number', sort=False, observed=True).size().to_frame('items')
+    if 'page' in df.columns:
+        summary['pages'] = _joined_values(df, 'page', sort=True)
+    for name, column in SUMMARY_VALUE_COLUMNS.items():
+        if column in df.columns:
+            summary[name] = _joined_values(df, column)
+    return summary.fillna('').reset_index()
@@ -0,0 +1,123 @@
+"""
+Structured debug tracing for the extractors.
+
+Extractors emit named events with keyword fields instead of printing:
+
+    trace = get_tracer("avalign")
+    ...
+    if trace:
+        trace("lot_lookup", novo_item=novo_item, lot_number=lot_number)
+
+Guarding the call with `if trace:` keeps it free when tracing is off: no
+message is formatted and no fields are built. Tracing is off by default and
+is turned on per vendor, through any of:
+
+- the INVOICE_TRACE environment variable, a comma-separated list of vendor
+  keys or "*" for all (inherited by worker processes);
+- enable_trace("avalign"), or the standard logging configuration of the
+  "invoice_extractor.trace.<key>" loggers at DEBUG level;
+- capture_trace("avalign"), which also collects the events into a list.
+
+Events are ordinary log records, so they go wherever logging sends them;
+the event name and fields are attached as `record.trace_event` and
+`record.trace_fields`.
+"""
+import logging
+import os
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List
+
+LOGGER_PREFIX = "invoice_extractor.trace"
+TRACE_ENV = "INVOICE_TRACE"
+
+
+@dataclass
+class TraceEvent:
+    vendor: str
+    event: str
+    fields: Dict[str, Any] = field(default_factory=dict)
+
+
+class Tracer:
+    """Emits trace events for one vendor. Truthy only while tracing is enabled."""
+
+    __slots__ = ("key", "_logger")
+
+    def __init__(self, key: str):
+        self.key = key
+        self._logger = logging.getLogger(f"{LOGGER_PREFIX}.{key}")
+
+    def __bool__(self) -> bool:
+        return self._logger.isEnabledFor(logging.DEBUG)
+
+    def __call__(self, event: str, **fields: Any) -> None:
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
+        message = " ".join([event] + [f"{name}={value!r}" for name, value in fields.items()])
+        self._logger.debug(message, extra={"trace_event": event, "trace_fields": fields})
+
+
+_tracers: Dict[str, Tracer] = {}
+
+
+def get_tracer(key: str) -> Tracer:
+    tracer = _tracers.get(key)
+    if tracer is None:
+        tracer = _tracers[key] = Tracer(key)
+    return tracer
+
+
+def _logger_name(key: str) -> str:
+    return LOGGER_PREFIX if key == "*" else f"{LOGGER_PREFIX}.{key}"
+
+
+def enable_trace(*keys: str) -> None:
+    """Turn tracing on for the given vendor keys ("*" for all), printing to stderr."""
+    root = logging.getLogger(LOGGER_PREFIX)
+    if not root.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("[%(name)s] %(message)s"))
+        root.addHandler(handler)
+        root.propagate = False
+    for key in keys:
+        logging.getLogger(_logger_name(key)).setLevel(logging.DEBUG)
+
+
+def disable_trace(*keys: str) -> None:
+    for key in keys:
+        logging.getLogger(_logger_name(key)).setLevel(logging.NOTSET)
+
+
+class _CaptureHandler(logging.Handler):
+    def __init__(self, events: List[TraceEvent]):
+        super().__init__(logging.DEBUG)
+        self._events = events
+
+    def emit(self, record: logging.LogRecord) -> None:
+        vendor = record.name[len(LOGGER_PREFIX) + 1:]
+        self._events.append(TraceEvent(vendor, record.trace_event, record.trace_fields))
+
+
+@contextmanager
+def capture_trace(*keys: str) -> Iterator[List[TraceEvent]]:
+    """Enable tracing for `keys` ("*" for all) and collect the events emitted inside the block."""
+    events: List[TraceEvent] = []
+    handler = _CaptureHandler(events)
+    loggers = [logging.getLogger(_logger_name(key)) for key in keys]
+    levels = [logger.level for logger in loggers]
+    for logger in loggers:
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(handler)
+    try:
+        yield events
+    finally:
+        for logger, level in zip(loggers, levels):
+            logger.removeHandler(handler)
+            logger.setLevel(level)
+
+
+_env_keys = [key.strip() for key in os.environ.get(TRACE_ENV, "").split(",") if key.strip()]
+if _env_keys:
+    enable_trace(*_env_keys)
@@ -0,0 +1,18 @@
+"""
+One module per supported vendor, each exposing extract_<key>_invoice_data.
+
+Modules are imported on demand by invoice_extractor.registry; nothing here
+should import them eagerly.
+
+Vendors without an extractor yet:
+- Reuchlen: cid encoding issue.
+- E.G. Voerling: scanned copy, can't read.
+- HBH: OCR needed.
+- Max Hauser: OCR needed.
+- MedChain Supply: OCR needed.
+- NDC: OCR needed.
+- Rominger: invoice not available.
+- Simmank: OCR needed.
+- Spiegel (via Simmank): OCR needed.
+- Ulrich Swiss: OCR needed.
+"""
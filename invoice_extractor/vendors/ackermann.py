@@ -0,0 +1,144 @@
+"""Ackermann invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..common import _extract_invoice_info
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_ITEM_NO_RE = re.compile(r'item no\.', re.IGNORECASE)
+_ITEM_FIELD_RE = re.compile(r'\d{6,}')
+_GROSS_SUBTOTAL_TOTAL_RE = re.compile(r'^(Gross|Subtotal|Total)', re.IGNORECASE)
+_POS_RE = re.compile(r'^(\d+)\s+')
+_ITEM_NO_PCS_RE = re.compile(r'^\d+\s+Item No\.\s+([^\s]+)\s+(\d+)\s+(\d+)pcs\.\s+([\d,]+)\s+([\d,]+)\s+([\d,]+)')
+_DESC_RE = re.compile(r'Desc\.', re.IGNORECASE)
+_DESC_TEXT_RE = re.compile(r'Desc\.\s*(.+)', re.IGNORECASE)
+_LST_AUTHORIZATION_YOUR_RE = re.compile(r'LST:|Authorization|Your Order|Lot\.', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'Your Order No\.\s+([^\s-]+)', re.IGNORECASE)
+_LOT_RE = re.compile(r'Lot\.\s+(.+)', re.IGNORECASE)
+
+
+def iter_ackermann_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Ackermann Instrumente GmbH invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_invoice_info(lines)
+            
+            # Find item blocks by looking for lines with item numbers and descriptions
+            item_blocks = []
+            current_block = []
+            
+            for i, line in enumerate(lines):
+                # Look for lines that likely contain item information
+                if (_ITEM_NO_RE.search(line) or 
+                    (_ITEM_FIELD_RE.search(line) and _DESC_RE.search(line))):
+                    if current_block:
+                        item_blocks.append(current_block)
+                    current_block = [line]
+                elif current_block and not _GROSS_SUBTOTAL_TOTAL_RE.search(line):
+                    current_block.append(line)
+                elif current_block and _GROSS_SUBTOTAL_TOTAL_RE.search(line):
+                    item_blocks.append(current_block)
+                    current_block = []
+            
+            if current_block:
+                item_blocks.append(current_block)
+            
+            # Process each item block
+            for block in item_blocks:
+                item_data = _parse_ackermann_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_ackermann_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_ackermann_invoice_rows()."""
+    return list(iter_ackermann_invoice_rows(pdf_content))
+
+@timed("parse")
+def _parse_ackermann_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Ackermann invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'position': '',
+        'item_no': '',
+        'description': '',
+        'po_no': '',
+        'quantity': '',
+        'unit_price': '',
+        'discount': '',
+        'total': '',
+        'order_no': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # Join block for easier parsing
+    block_text = ' '.join(block)
+    
+    # Extract position number from the first line
+    pos_match = _POS_RE.search(block[0])
+    if pos_match:
+        item_data['position'] = pos_match.group(1)
+    
+    # Parse the main item line which contains most of the data
+    # Format: "10 Item No. NS52500-28-01-1 266870 3pcs. 252,12 23,72 576,96"
+    item_line_match = _ITEM_NO_PCS_RE.search(block[0])
+    if item_line_match:
+        item_data['item_no'] = item_line_match.group(1)
+        item_data['po_no'] = item_line_match.group(2)
+        item_data['quantity'] = item_line_match.group(3)
+        item_data['unit_price'] = item_line_match.group(4)
+        item_data['discount'] = item_line_match.group(5)
+        item_data['total'] = item_line_match.group(6)
+    
+    # Extract description from the following lines
+    desc_lines = []
+    for line in block[1:]:
+        if _DESC_RE.search(line):
+            # Remove "Desc." prefix and get the description
+            desc_match = _DESC_TEXT_RE.search(line)
+            if desc_match:
+                desc_lines.append(desc_match.group(1))
+        elif _LST_AUTHORIZATION_YOUR_RE.search(line):
+            # Stop when we hit other metadata
+            break
+        elif desc_lines:
+            # Continue adding to description if we've already started
+            desc_lines.append(line.strip())
+    
+    if desc_lines:
+        item_data['description'] = ' '.join(desc_lines).strip()
+    
+    # Extract other fields from the block
+    for line in block:
+        # Extract order number
+        order_match = _YOUR_ORDER_NO_RE.search(line)
+        if order_match and not item_data['order_no']:
+            item_data['order_no'] = order_match.group(1)
+        
+        # Extract lot information
+        lot_match = _LOT_RE.search(line)
+        if lot_match and not item_data['lot']:
+            item_data['lot'] = lot_match.group(1)
+    
+    # Only return if we have at least some basic item information
+    if item_data['item_no'] or item_data['description']:
+        return item_data
+    
+    return None
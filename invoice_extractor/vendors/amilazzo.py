@@ -0,0 +1,138 @@
+"""A. Milazzo Medizintechnik GmbH invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_INVOICE_NO_RE = re.compile(r'INVOICE NO\.\s*:\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*:\s*(\d{2}\.\d{2}\.\d{4})')
+_YOUR_ART_NO_LABEL_RE = re.compile(r'your art\.-no\.:', re.IGNORECASE)
+_LOT_NUMBER_LABEL_RE = re.compile(r'Lot number', re.IGNORECASE)
+_YOUR_ART_NO_RE = re.compile(r'your art\.-no\.:?\s*([\w-]+)', re.IGNORECASE)
+_PO_RE = re.compile(r'(M\.[A-Z]\.\d{2}-\d{2}/\d+)')
+_LOT_NUMBER_RE = re.compile(r'Lot number\s*([\w\/ -]+)', re.IGNORECASE)
+_QTY_PRICE_RE = re.compile(r'(\d+)\s+(\d+,\d{2})')
+_DESCRIPTION_NOISE_RE = re.compile(r'(your art\.-no\.:.*|Lot number.*|M\.[A-Z]\.\d{2}-\d{2}/\d+|\d+\s+\d+,\d{2})', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def iter_amilazzo_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from A. Milazzo Medizintechnik GmbH invoice format.
+    Works with both single-line and multi-line item layouts.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+
+            # Extract invoice-level info
+            invoice_date = ""
+            invoice_number = ""
+
+            for line in lines:
+                inv_match = _INVOICE_NO_RE.search(line)
+                if inv_match:
+                    invoice_number = inv_match.group(1)
+
+                date_match = _DATE_RE.search(line)
+                if date_match:
+                    invoice_date = date_match.group(1)
+
+            # Scan for items (block-based)
+            current_block = []
+            for line in lines:
+                if _YOUR_ART_NO_LABEL_RE.search(line):
+                    # Start new block
+                    if current_block:
+                        # Process previous block before starting new one
+                        item = _parse_milazzo_item_block(
+                            current_block, invoice_date, invoice_number, page_num
+                        )
+                        if item:
+                            yield item
+                    current_block = [line]
+                elif _LOT_NUMBER_LABEL_RE.search(line):
+                    # End block
+                    current_block.append(line)
+                    item = _parse_milazzo_item_block(
+                        current_block, invoice_date, invoice_number, page_num
+                    )
+                    if item:
+                        yield item
+                    current_block = []
+                elif current_block:
+                    # Collect block lines
+                    current_block.append(line)
+
+            # Handle last block if file ends without "Lot number"
+            if current_block:
+                item = _parse_milazzo_item_block(
+                    current_block, invoice_date, invoice_number, page_num
+                )
+                if item:
+                    yield item
+
+
+def extract_amilazzo_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_amilazzo_invoice_rows()."""
+    return list(iter_amilazzo_invoice_rows(pdf_content))
+
+
+@timed("parse")
+def _parse_milazzo_item_block(block_lines: List[str], invoice_date: str, invoice_number: str, page_num: int) -> Optional[Dict]:
+    """
+    Parse a block of lines corresponding to a single Milazzo invoice item.
+    """
+    block_text = " ".join(block_lines)
+
+    # Vendor item
+    vendor_item = ""
+    art_match = _YOUR_ART_NO_RE.search(block_text)
+    if art_match:
+        vendor_item = art_match.group(1)
+
+    # PO Number (M.* style codes)
+    po_number = ""
+    po_match = _PO_RE.search(block_text)
+    if po_match:
+        po_number = po_match.group(1)
+
+    # Lot number
+    lot_number = ""
+    lot_match = _LOT_NUMBER_RE.search(block_text)
+    if lot_match:
+        lot_number = lot_match.group(1).strip()
+
+    # Quantity and price each (take first match like "3 74,78" or "4 91,52")
+    qty = ""
+    price_each = ""
+    qty_price_match = _QTY_PRICE_RE.search(block_text)
+    if qty_price_match:
+        qty = qty_price_match.group(1)
+        price_each = qty_price_match.group(2)
+
+    # Novo item (description) → remove known fields and keep what’s left
+    description = _DESCRIPTION_NOISE_RE.sub('', block_text)
+    description = _WHITESPACE_RE.sub(' ', description).strip()
+
+    if all([invoice_date, invoice_number, vendor_item, po_number, lot_number, qty, price_each]):
+        return {
+            "invoice_date": invoice_date,
+            "invoice_number": invoice_number,
+            "purchase_order": po_number,
+            "vendor_item": vendor_item,
+            "novo_item": description,
+            "lot_number": lot_number,
+            "quantity": qty,
+            "price_each": price_each,
+            "page_number": page_num + 1,
+        }
+    return None
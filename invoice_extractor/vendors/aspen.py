@@ -0,0 +1,249 @@
+"""Aspen invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_PART_NO_DESCRIPTION_RE = re.compile(r'Part No\s+Description\s+Invoice Qty\s+U of M\s+Unit Price\s+Net Amount', re.IGNORECASE)
+_PART_NO_DESCRIPTION_LOOSE_RE = re.compile(r'Part No.*Description.*Invoice Qty.*Unit Price.*Net Amount', re.IGNORECASE)
+_LINE_NO_LOT_RE = re.compile(r'Line No|Lot Number|USD', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d{6,}[A-Z]*')
+_SUB_TOTAL_TAX_RE = re.compile(r'Sub Total|Total|Tax|Handling', re.IGNORECASE)
+_CALEDONIA_RE = re.compile(r'Caledonia.*\d{5}')
+_HEADER_FIELD_RE = re.compile(r'\d{1,2}/\d{1,2}/\d{2,4}\s+[A-Z]{2}\d{7}')
+_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{2,4})')
+_INV_RE = re.compile(r'([A-Z]{2}\d{7})')
+_PHONE_FAX_RE = re.compile(r'phone.*fax.*\d{1,2}/\d{1,2}/\d{2,4}\s+[A-Z]\d{6,7}', re.IGNORECASE)
+_ORDER_RE = re.compile(r'([A-Z]\d{6,7})')
+_PART_RE = re.compile(r'^(\d+[A-Z]*)')
+_DESC_LINE_RE = re.compile(r'^\d+[A-Z]*\s*')
+_QTY_UOM_PRICES_TAIL_RE = re.compile(r'\s+\d+\s+[A-Z]{2}\s+[\d,\.]+\s+[\d,\.]+$')
+_QTY_RE = re.compile(r'\s+(\d+)\s+[A-Z]{2}\s+[\d,\.]+\s+[\d,\.]+$')
+_PRICES_RE = re.compile(r'[\d,\.]+')
+_LOT_RE = re.compile(r'LOT[:\s]*([0-9][0-9\-\.\*]*)', re.IGNORECASE)
+_LOT_LOOSE_RE = re.compile(r'LOT[^\d]*([\d\-\.\*]+)', re.IGNORECASE)
+_LOT_HTS_COO_RE = re.compile(r'LOT:|HTS:|COO:', re.IGNORECASE)
+_ITEM_LINE_RE = re.compile(r'^\d+[A-Z]*\s+(.+?)\s+(\d+)\s+[A-Z]{2}\s+([\d,\.]+)\s+([\d,\.]+)$')
+_ITEM_FLEX_RE = re.compile(r'(.+?)\s+(\d+)\s+[A-Z]{2}\s+([\d,\.]+)\s+([\d,\.]+)$')
+
+_LAYOUT = TableLayout(
+    # The table is found by hand, see iter_aspen_invoice_rows()
+    header=None,
+    # Part numbers such as 096129BBG
+    item_start=_ITEM_START_RE,
+    # Column captions
+    rules=(LineRule(Action.SKIP, _LINE_NO_LOT_RE),),
+    # Summary lines never start an item, and end one
+    start_unless=_SUB_TOTAL_TAX_RE,
+    terminator=_SUB_TOTAL_TAX_RE,
+    skip_blank=True,
+)
+
+
+def iter_aspen_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Aspen Surgical invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_aspen_invoice_info(lines)
+            
+            # Find the start of the items table
+            start_index = -1
+            for i, line in enumerate(lines):
+                if _PART_NO_DESCRIPTION_RE.search(line):
+                    start_index = i + 2  # Skip header and line numbers
+                    break
+            
+            if start_index == -1:
+                # Alternative pattern for table header
+                for i, line in enumerate(lines):
+                    if _PART_NO_DESCRIPTION_LOOSE_RE.search(line):
+                        start_index = i + 2
+                        break
+            
+            if start_index == -1:
+                # If no table header found, look for item lines directly
+                start_index = 0
+            
+            for block, _ in iter_item_blocks(lines[start_index:], _LAYOUT, {}):
+                item_data = _parse_aspen_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_aspen_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_aspen_invoice_rows()."""
+    return list(iter_aspen_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_aspen_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Aspen invoice with specific patterns"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'order_number': ''
+    }
+    
+    # Look for the specific line patterns
+    for i, line in enumerate(lines):
+        line_clean = line.strip()
+        
+        # Look for the line with address followed by date and invoice number
+        # Pattern: "6945 Southbelt Dr. SE | Caledonia, MI 49316 11/6/23 CD3038894"
+        if _CALEDONIA_RE.search(line_clean) and _HEADER_FIELD_RE.search(line_clean):
+            # Extract invoice date and number
+            date_match = _DATE_RE.search(line_clean)
+            inv_match = _INV_RE.search(line_clean)
+            
+            if date_match and not invoice_data['invoice_date']:
+                invoice_data['invoice_date'] = date_match.group(1)
+            if inv_match and not invoice_data['invoice_number']:
+                invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Look for the line with phone number followed by date and order number
+        # Pattern: "phone: (888) 364-7004 | fax: (616) 698-9281 11/3/23 C1166613"
+        elif _PHONE_FAX_RE.search(line_clean):
+            # Extract order number only (skip the date)
+            order_match = _ORDER_RE.search(line_clean)
+            if order_match and not invoice_data['order_number']:
+                invoice_data['order_number'] = order_match.group(1)
+    
+    # If still not found, try a more direct approach
+    if not all([invoice_data['invoice_number'], invoice_data['invoice_date'], invoice_data['order_number']]):
+        for i, line in enumerate(lines):
+            line_clean = line.strip()
+            
+            # Look for invoice number pattern with date nearby
+            inv_match = _INV_RE.search(line_clean)
+            if inv_match and not invoice_data['invoice_number']:
+                # Check if there's a date on the same line
+                date_match = _DATE_RE.search(line_clean)
+                if date_match:
+                    invoice_data['invoice_number'] = inv_match.group(1)
+                    invoice_data['invoice_date'] = date_match.group(1)
+            
+            # Look for order number pattern
+            order_match = _ORDER_RE.search(line_clean)
+            if order_match and not invoice_data['order_number']:
+                # Make sure it's not the invoice number
+                if not _INV_RE.search(order_match.group(1)):
+                    invoice_data['order_number'] = order_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_aspen_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Aspen invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data.get('invoice_date', ''),
+        'invoice_number': invoice_data.get('invoice_number', ''),
+        'order_number': invoice_data.get('order_number', ''),
+        'part_no': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'net_amount': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract part number (first word in the line)
+    part_match = _PART_RE.match(first_line)
+    if part_match:
+        item_data['part_no'] = part_match.group(1)
+    
+    # Try to extract the main item data using multiple patterns
+    # Pattern: PartNo Description Qty UOM UnitPrice NetAmount
+    match = _ITEM_LINE_RE.search(first_line)
+    
+    if match:
+        item_data['description'] = match.group(1).strip()
+        item_data['quantity'] = match.group(2)
+        item_data['unit_price'] = match.group(3)
+        item_data['net_amount'] = match.group(4)
+    
+    # If the first pattern didn't match, try a more flexible pattern
+    if not item_data['quantity']:
+        # Pattern: Look for number followed by 2-letter UOM followed by prices
+        flex_match = _ITEM_FLEX_RE.search(first_line)
+        if flex_match:
+            # Remove part number from description
+            desc = _DESC_LINE_RE.sub('', flex_match.group(1)).strip()
+            item_data['description'] = desc
+            item_data['quantity'] = flex_match.group(2)
+            item_data['unit_price'] = flex_match.group(3)
+            item_data['net_amount'] = flex_match.group(4)
+    
+    # If description is still empty, try a simpler approach
+    if not item_data['description']:
+        # Remove part number, then take the rest as description (excluding quantity, UOM and prices)
+        desc_line = _DESC_LINE_RE.sub('', first_line)
+        # Remove quantity, UOM, price fields from the end
+        desc_line = _QTY_UOM_PRICES_TAIL_RE.sub('', desc_line)
+        item_data['description'] = desc_line.strip()
+    
+    # Extract quantity from alternative patterns if still missing
+    if not item_data['quantity']:
+        # Look for pattern: number + 2-letter UOM + price + price
+        qty_match = _QTY_RE.search(first_line)
+        if qty_match:
+            item_data['quantity'] = qty_match.group(1)
+    
+    # Extract prices from alternative patterns if still missing
+    if not item_data['unit_price']:
+        # The last two numbers are unit price and net amount
+        prices = _PRICES_RE.findall(first_line)
+        if len(prices) >= 2:
+            item_data['unit_price'] = prices[-2]
+            item_data['net_amount'] = prices[-1]
+    
+    # Extract lot number from the entire block - more thorough search
+    for line in block:
+        # More flexible lot number pattern to handle various formats
+        lot_match = _LOT_RE.search(line)
+        if lot_match:
+            item_data['lot'] = lot_match.group(1).strip()
+            break
+    
+    # If still not found, try even more flexible pattern
+    if not item_data['lot']:
+        for line in block:
+            # Look for any pattern that starts with LOT and has numbers/dashes
+            lot_match = _LOT_LOOSE_RE.search(line)
+            if lot_match:
+                item_data['lot'] = lot_match.group(1).strip()
+                break
+    
+    # For multi-line descriptions, combine them (excluding lot lines)
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Only include lines that don't contain LOT, HTS, COO patterns
+            if not _LOT_HTS_COO_RE.search(line):
+                additional_desc.append(line.strip())
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # Only return if we have at least part number and description
+    if item_data['part_no'] and item_data['description']:
+        return item_data
+    
+    return None
@@ -0,0 +1,93 @@
+"""Avalign German Specialty Instruments invoice extractor."""
+import re
+from typing import Dict, Iterator, List
+
+from ..document import DocumentSource, open_document
+from ..lineindex import LineIndex
+from ..timing import timed
+from ..trace import get_tracer
+
+trace = get_tracer("avalign")
+
+
+# Patterns, compiled once at import time
+_INVOICE_RE = re.compile(r'Invoice:\s*(\d+)')
+_DATE_RE = re.compile(r'Date:\s*(\d{1,2}/\d{1,2}/\d{4})')
+_REFERENCE_PO_RE = re.compile(r'Reference PO:\s*(\d+)')
+_LOT_QTY_RE = re.compile(r'Lot/Qty:\s\s*([\d\-]+(?:[\-/]\d+)*)\s*/\s*\d+')
+_ITEM_RE = re.compile(r'(\d+\.\d+)\s+([A-Z]\d+-\d+)\s+(.*?)\s+(\d+\.\d+)\s+EA\s+\$\s*([\d,]+\.\d+)\s+\$\s*([\d,]+\.\d+)')
+
+_KEYWORDS = {'item': _ITEM_RE, 'lot': _LOT_QTY_RE}
+
+
+def iter_avalign_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Avalign German Specialty Instruments invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        # Get total number of pages
+        num_pages = len(pdf.pages)
+
+        for page_num in range(num_pages):
+            text = pdf.pages[page_num].extract_text()
+            lines = text.split('\n')
+
+            # Extract invoice-level data
+            invoice_data = _extract_avalign_invoice_info(lines)
+
+            # Look for line items
+            index = LineIndex(lines, _KEYWORDS)
+            for i in index.positions('item'):
+                yield _parse_avalign_item(index, i, invoice_data, page_num)
+
+def extract_avalign_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_avalign_invoice_rows()."""
+    return list(iter_avalign_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_avalign_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice-level information from Avalign invoice"""
+    invoice_data = {'invoice_number': '', 'invoice_date': '', 'purchase_order': ''}
+
+    for line in lines:
+        if "Invoice:" in line:
+            invoice_match = _INVOICE_RE.search(line)
+            invoice_data['invoice_number'] = invoice_match.group(1) if invoice_match else ""
+        elif "Date:" in line:
+            date_match = _DATE_RE.search(line)
+            invoice_data['invoice_date'] = date_match.group(1) if date_match else ""
+        elif "Reference PO:" in line:
+            po_match = _REFERENCE_PO_RE.search(line)
+            invoice_data['purchase_order'] = po_match.group(1) if po_match else ""
+
+    return invoice_data
+
+@timed("parse")
+def _parse_avalign_item(index: LineIndex, i: int, invoice_data: Dict, page_num: int) -> Dict:
+    """Parse the item on line `i` of an Avalign page, with the lot number on one of the next 3 lines"""
+    item_match = index.match('item', i)
+    # Extract item details
+    novo_item = item_match.group(2)
+
+    # Look for lot number in subsequent lines
+    lot_number = ""
+    lot_line = index.next('lot', i, i + 3)  # Check next 3 lines
+    if lot_line is not None:
+        lot_number = index.match('lot', lot_line).group(1)
+
+    if trace:
+        trace("lot_lookup", novo_item=novo_item, page=page_num + 1,
+              searched_lines=index.lines[i:i + 3], lot_number=lot_number)
+
+    return {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'purchase_order': invoice_data['purchase_order'],
+        'vendor_item': '',  # Avalign doesn't show vendor item numbers
+        'novo_item': novo_item,
+        'lot_number': lot_number,
+        'quantity': item_match.group(4),
+        'price_each': item_match.group(5),
+        'page_number': page_num + 1
+    }
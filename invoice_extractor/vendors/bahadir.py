@@ -0,0 +1,155 @@
+"""Bahadir invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_PO_RE = re.compile(r'p\.o\.\s*[:#]?\s*(\d+)', re.IGNORECASE)
+_LOT_RE = re.compile(r'lot\s*[:#]?\s*(\d+)', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+[A-Z0-9]')
+_TOTAL_BALANCE_RE = re.compile(r'total|balance', re.IGNORECASE)
+_INV_RE = re.compile(r'Invoice\s*#\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*#\s*(\d{1,2}/\d{1,2}/\d{4})', re.IGNORECASE)
+_INVOICE_NUMBER_LOOSE_RE = re.compile(r'Invoice.*?(\d{3,})', re.IGNORECASE)
+_US_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+_LINE_RE = re.compile(r'^(\d+)\s+')
+_ITEM_RE = re.compile(r'^\d+\s+([A-Z0-9\.]+)\s+(.+?)\s+(\d+)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})$')
+_ALT_RE = re.compile(r'^\d+\s+([A-Z0-9\.]+)\s+(.+?)\s+(\d+)\s+([\d,]+)\s+([\d,]+)$')
+
+_LAYOUT = TableLayout(
+    header=None,
+    # A line number followed by the item code
+    item_start=_ITEM_START_RE,
+    # Summary lines end an item
+    terminator=_TOTAL_BALANCE_RE,
+    strip=False,
+)
+
+
+def iter_bahadir_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Bahadir USA invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract Bahadir-specific invoice info
+            invoice_data = _extract_bahadir_invoice_info(lines)
+            po_number = ""
+            lot_number = ""
+            
+            for line in lines:
+                po_match = _PO_RE.search(line)
+                if po_match:
+                    po_number = po_match.group(1)
+                
+                lot_match = _LOT_RE.search(line)
+                if lot_match:
+                    lot_number = lot_match.group(1)
+            
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_bahadir_item_block(block, invoice_data, po_number, lot_number, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_bahadir_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_bahadir_invoice_rows()."""
+    return list(iter_bahadir_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_bahadir_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Bahadir invoice with specific patterns"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': ''
+    }
+    
+    for line in lines:
+        # Extract invoice number - look for "Invoice # 2664" pattern
+        inv_match = _INV_RE.search(line)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date - look for date pattern
+        date_match = _DATE_RE.search(line)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+    
+    # If not found with specific patterns, try general patterns
+    if not invoice_data['invoice_number']:
+        for line in lines:
+            inv_match = _INVOICE_NUMBER_LOOSE_RE.search(line)
+            if inv_match and not invoice_data['invoice_number']:
+                invoice_data['invoice_number'] = inv_match.group(1)
+    
+    if not invoice_data['invoice_date']:
+        for line in lines:
+            date_match = _US_DATE_RE.search(line)
+            if date_match and not invoice_data['invoice_date']:
+                invoice_data['invoice_date'] = date_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_bahadir_item_block(block: List[str], invoice_data: Dict, po_number: str, lot_number: str, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Bahadir invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data.get('invoice_date', ''),
+        'invoice_number': invoice_data.get('invoice_number', ''),
+        'po_number': po_number,
+        'lot_number': lot_number,
+        'line_no': '',
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'total': '',
+        'page': page_num + 1
+    }
+    
+    # Join block for easier parsing
+    block_text = ' '.join(block)
+    
+    # Extract line number
+    line_match = _LINE_RE.search(block[0])
+    if line_match:
+        item_data['line_no'] = line_match.group(1)
+    
+    # Extract item code, description, quantity, unit price, and total
+    # More flexible pattern to handle variations
+    item_match = _ITEM_RE.search(block[0])
+    if item_match:
+        item_data['item_code'] = item_match.group(1)
+        item_data['description'] = item_match.group(2)
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(4)
+        item_data['total'] = item_match.group(5)
+    
+    # Alternative pattern if the first one doesn't match
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(block[0])
+        if alt_match:
+            item_data['item_code'] = alt_match.group(1)
+            item_data['description'] = alt_match.group(2)
+            item_data['quantity'] = alt_match.group(3)
+            item_data['unit_price'] = alt_match.group(4)
+            item_data['total'] = alt_match.group(5)
+    
+    # Only return if we have at least item code and description
+    if item_data['item_code'] and item_data['description']:
+        return item_data
+    
+    return None
@@ -0,0 +1,204 @@
+"""Bauer & Haselbarth invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_YOUR_ORDER_NUMBER_RE = re.compile(r'Your Order Number\s+(\d+)', re.IGNORECASE)
+_LOT_RE = re.compile(r'LOT:\s*(\d+)', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+[A-Z0-9\-]')
+_LOT_LST_SPECULUM_RE = re.compile(r'LOT:|LST:|Speculum|Sound|marking', re.IGNORECASE)
+_TOTAL_CARRY_OVER_RE = re.compile(r'total|carry-over|page|\d+,\d+', re.IGNORECASE)
+_INVOICE_NUMBER_RE = re.compile(r'Invoice Number\s+(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s+(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUSTOMER_NUMBER_RE = re.compile(r'Customer Number\s+(\d+)', re.IGNORECASE)
+_ITEM_FIELD_RE = re.compile(r'\d+\s+[A-Z0-9\-]+\s+.*\d+\s+[pcs|Stk]\.?\s+\d+,\d+\s+\d+,\d+')
+_LINE_RE = re.compile(r'^(\d+)\s+')
+_LOT_LST_YOUR_RE = re.compile(r'LOT:|LST:|Your Order Number')
+_ITEM_END_RE = re.compile(r'\d+,\d+\s+\d+,\d+$')
+_WHITESPACE_RE = re.compile(r'\s+')
+_ITEM_LINE_PATTERNS = (
+    re.compile(r'^\d+\s+([A-Z0-9\-\.]+(?:\s+[A-Z0-9\-\.]+)?)\s+(.+?)\s+(\d+)\s+[pcs|Stk]\.?\s+([\d,]+)\s+([\d,]+)$'),
+    re.compile(r'^\d+\s+([A-Z0-9\-\.]+)\s+(.+?)\s+(\d+)\s+([\d,]+)\s+([\d,]+)$'),
+)
+
+
+def iter_bauer_hasselbarth_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Bauer und Hasselbarth invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice info
+            invoice_data = _extract_bauer_invoice_info(lines)
+            
+            # Extract PO number and LOT numbers
+            po_number = ""
+            current_lot = ""
+            
+            for line in lines:
+                # Extract PO number
+                po_match = _YOUR_ORDER_NUMBER_RE.search(line)
+                if po_match:
+                    po_number = po_match.group(1)
+                
+                # Extract LOT number
+                lot_match = _LOT_RE.search(line)
+                if lot_match:
+                    current_lot = lot_match.group(1)
+            
+            # Find item blocks - look for lines that start with position numbers
+            item_blocks = []
+            current_block = []
+            in_item_block = False
+            
+            for line in lines:
+                # Check if line starts with a position number (like "1 ", "2 ", etc.)
+                if _ITEM_START_RE.match(line.strip()):
+                    if current_block:
+                        item_blocks.append(current_block)
+                    current_block = [line]
+                    in_item_block = True
+                elif in_item_block:
+                    # Check if this is a continuation line (contains LOT/LST or description)
+                    if _LOT_LST_SPECULUM_RE.search(line) or not _TOTAL_CARRY_OVER_RE.search(line):
+                        current_block.append(line)
+                    else:
+                        # End of item block
+                        if current_block:
+                            item_blocks.append(current_block)
+                        current_block = []
+                        in_item_block = False
+            
+            if current_block:
+                item_blocks.append(current_block)
+            
+            # Process each item block
+            for block in item_blocks:
+                item_data = _parse_bauer_item_block(block, invoice_data, po_number, current_lot, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_bauer_hasselbarth_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_bauer_hasselbarth_invoice_rows()."""
+    return list(iter_bauer_hasselbarth_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_bauer_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Bauer invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': ''
+    }
+    
+    for line in lines:
+        # Extract invoice number
+        inv_match = _INVOICE_NUMBER_RE.search(line)
+        if inv_match:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date
+        date_match = _DATE_RE.search(line)
+        if date_match:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number
+        cust_match = _CUSTOMER_NUMBER_RE.search(line)
+        if cust_match:
+            invoice_data['customer_number'] = cust_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_bauer_item_block(block: List[str], invoice_data: Dict, po_number: str, lot_number: str, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Bauer invoice"""
+    if not block:
+        return None
+    
+    # Join block for analysis
+    block_text = ' '.join(block)
+    
+    # Skip if this doesn't look like an item line
+    if not _ITEM_FIELD_RE.search(block_text):
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data.get('invoice_date', ''),
+        'invoice_number': invoice_data.get('invoice_number', ''),
+        'customer_number': invoice_data.get('customer_number', ''),
+        'po_number': po_number,
+        'lot_number': lot_number,
+        'line_no': '',
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'total': '',
+        'page': page_num + 1
+    }
+    
+    # Extract line number from first line
+    line_match = _LINE_RE.search(block[0])
+    if line_match:
+        item_data['line_no'] = line_match.group(1)
+    
+    # Parse the main item line - Bauer format: "Pos. Art-No. Description Qty. Price Total"
+    
+    # Try different patterns to match the item data
+    for pattern in _ITEM_LINE_PATTERNS:
+        item_match = pattern.search(block[0])
+        if item_match:
+            item_data['item_code'] = item_match.group(1).strip()
+            item_data['description'] = item_match.group(2).strip()
+            item_data['quantity'] = item_match.group(3)
+            item_data['unit_price'] = item_match.group(4)
+            item_data['total'] = item_match.group(5)
+            break
+    
+    # If we couldn't parse with regex, try a more manual approach
+    if not item_data['item_code']:
+        parts = block[0].split()
+        if len(parts) >= 6:
+            try:
+                item_data['item_code'] = parts[1]
+                # Description is everything between item code and quantity
+                qty_index = next((i for i, part in enumerate(parts) if part.isdigit() and i > 1), -1)
+                if qty_index > 2:
+                    item_data['description'] = ' '.join(parts[2:qty_index])
+                    item_data['quantity'] = parts[qty_index]
+                    item_data['unit_price'] = parts[qty_index + 1]
+                    item_data['total'] = parts[qty_index + 2]
+            except (IndexError, ValueError):
+                pass
+    
+    # Add additional description from subsequent lines if available
+    if len(block) > 1:
+        additional_desc = []
+        for line in block[1:]:
+            if _LOT_LST_YOUR_RE.search(line):
+                continue
+            if not _ITEM_END_RE.search(line):  # Skip lines that look like prices
+                additional_desc.append(line.strip())
+        
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # Clean up description
+    item_data['description'] = _WHITESPACE_RE.sub(' ', item_data['description']).strip()
+    
+    # Only return if we have essential data
+    if item_data['item_code'] and item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
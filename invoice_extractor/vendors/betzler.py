@@ -0,0 +1,134 @@
+"""Betzler invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..common import _extract_invoice_info
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_YOUR_ORDER_RE = re.compile(r'your order', re.IGNORECASE)
+_TOTAL_RE = re.compile(r'total', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.?\s*([^\s]+)[^\d]*(\d{1,2}\.\d{1,2}\.\d{2,4})', re.IGNORECASE)
+_ITEM_LINE_RE = re.compile(r'^(\d+)\s+([A-Z]+\s+[A-Z0-9\-]+)\s+(.+?)\s+(\d+)\s+([\d,]+)\s+([\d,]+)$')
+_YOUR_ART_MDL_RE = re.compile(r'your art\.|MDL Reg\.|Lot number|customs', re.IGNORECASE)
+_YOUR_ART_NO_RE = re.compile(r'your art\.-no\.:\s*([^\s]+)', re.IGNORECASE)
+_MDL_REG_NO_RE = re.compile(r'MDL Reg\. No\.:\s*([^\s/]+)', re.IGNORECASE)
+_LOT_NUMBER_RE = re.compile(r'Lot number\s+([^\s]+)', re.IGNORECASE)
+
+
+def iter_betzler_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from A. Betzler GmbH invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_invoice_info(lines)
+            
+            # Find item blocks by looking for order references
+            item_blocks = []
+            current_block = []
+            
+            for line in lines:
+                if _YOUR_ORDER_RE.search(line):
+                    if current_block:
+                        item_blocks.append(current_block)
+                    current_block = [line]
+                elif current_block:
+                    if _YOUR_ORDER_RE.search(line) or _TOTAL_RE.search(line):
+                        item_blocks.append(current_block)
+                        current_block = [line] if _YOUR_ORDER_RE.search(line) else []
+                    else:
+                        current_block.append(line)
+            
+            if current_block:
+                item_blocks.append(current_block)
+            
+            # Process each item block
+            for block in item_blocks:
+                item_data = _parse_betzler_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_betzler_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_betzler_invoice_rows()."""
+    return list(iter_betzler_invoice_rows(pdf_content))
+
+@timed("parse")
+def _parse_betzler_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Betzler invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'order_no': '',
+        'order_date': '',
+        'description': '',
+        'quantity': '',
+        'price': '',
+        'art_no': '',
+        'mdl_reg_no': '',
+        'lot_number': '',
+        'page': page_num + 1
+    }
+    
+    block_text = ' '.join(block)
+    
+    # Extract order information
+    order_match = _YOUR_ORDER_NO_RE.search(block_text)
+    if order_match:
+        item_data['order_no'] = order_match.group(1)
+        item_data['order_date'] = order_match.group(2)
+    
+    # Extract position number and article code from the first line after order number
+    # Format: "1 BA 6001-18 micro-scissor, round handle 10 118,19 1.181,90"
+    item_line_match = _ITEM_LINE_RE.search(block[1] if len(block) > 1 else '')
+    if item_line_match:
+        item_data['quantity'] = item_line_match.group(4)
+        item_data['price'] = item_line_match.group(6)  # Total price
+        
+        # Build description from multiple lines
+        description_parts = [item_line_match.group(3)]  # First part from the item line
+        
+        # Add subsequent description lines until we hit metadata
+        for i in range(2, len(block)):
+            line = block[i]
+            if _YOUR_ART_MDL_RE.search(line):
+                break
+            description_parts.append(line.strip())
+        
+        item_data['description'] = ' '.join(description_parts).strip()
+    
+    # Extract other fields from the block
+    for line in block:
+        # Extract article number
+        art_match = _YOUR_ART_NO_RE.search(line)
+        if art_match and not item_data['art_no']:
+            item_data['art_no'] = art_match.group(1)
+        
+        # Extract MDL registration number
+        mdl_match = _MDL_REG_NO_RE.search(line)
+        if mdl_match and not item_data['mdl_reg_no']:
+            item_data['mdl_reg_no'] = mdl_match.group(1)
+        
+        # Extract lot number
+        lot_match = _LOT_NUMBER_RE.search(line)
+        if lot_match and not item_data['lot_number']:
+            item_data['lot_number'] = lot_match.group(1)
+    
+    # Only return if we have at least quantity and price
+    if item_data['quantity'] and item_data['price']:
+        return item_data
+    
+    return None
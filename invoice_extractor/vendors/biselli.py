@@ -0,0 +1,221 @@
+"""Biselli invoice extractor."""
+import re
+from typing import Dict, Iterator, List
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_INVOICE_NO_RE = re.compile(r'INVOICE NO\.\s*(\d+)')
+_DATE_RE = re.compile(r'Date\s*(\d{2}\.\d{2}\.\d{4})')
+_CUST_NO_RE = re.compile(r'Cust\.-No\.\s*(\d+)')
+_YOUR_ORDER_NO_RE = re.compile(r'Your Order No\.\s*(\d+)\s*-\s*(\d{2}\.\d{2}\.\d{4})')
+_DELIVERY_NOTE_NO_RE = re.compile(r'Delivery Note No\.\s*(\d+)\s*At\s*(\d{2}\.\d{2}\.\d{4})')
+_LOT_NO_RE = re.compile(r'Lot No\.\s*(\d+)', re.IGNORECASE)
+_LST_RE = re.compile(r'LST:\s*([A-Z0-9/ ]+)')
+_WHITESPACE_RE = re.compile(r'\s+')
+_ITEM_START_RE = re.compile(r'^\d+\s+[A-Z]')
+_LOT_NO_LST_RE = re.compile(r'^\d+|Lot No\.|LST:')
+_ITEM_RE = re.compile(r'(\d+)\s+([A-Z0-9\-/]+)\s+(.+?)\s+(\d+)\s+([\d,]+)\s+([\d,]+)', re.DOTALL)
+_PRICE_END_RE = re.compile(r'(\d+)\s+([\d,]+)\s+([\d,]+)$')
+
+
+def iter_biselli_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Biselli Medical Instruments invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        full_text = pdf.full_text
+        
+        # Extract invoice information
+        invoice_data = _extract_biselli_invoice_info(full_text)
+        
+        # Extract items
+        items = _extract_biselli_items(full_text, invoice_data)
+        yield from items
+
+def extract_biselli_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_biselli_invoice_rows()."""
+    return list(iter_biselli_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_biselli_invoice_info(full_text: str) -> Dict[str, str]:
+    """Extract invoice information from Biselli invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_number': '',
+        'order_date': '',
+        'delivery_note': '',
+        'delivery_date': '',
+        'lot_number': '',
+        'lst_number': ''
+    }
+    
+    # Extract invoice number
+    inv_match = _INVOICE_NO_RE.search(full_text)
+    if inv_match:
+        invoice_data['invoice_number'] = inv_match.group(1)
+    
+    # Extract invoice date
+    date_match = _DATE_RE.search(full_text)
+    if date_match:
+        invoice_data['invoice_date'] = date_match.group(1)
+    
+    # Extract customer number
+    cust_match = _CUST_NO_RE.search(full_text)
+    if cust_match:
+        invoice_data['customer_number'] = cust_match.group(1)
+    
+    # Extract order number and date
+    order_match = _YOUR_ORDER_NO_RE.search(full_text)
+    if order_match:
+        invoice_data['order_number'] = order_match.group(1)
+        invoice_data['order_date'] = order_match.group(2)
+    
+    # Extract delivery note and date
+    delivery_match = _DELIVERY_NOTE_NO_RE.search(full_text)
+    if delivery_match:
+        invoice_data['delivery_note'] = delivery_match.group(1)
+        invoice_data['delivery_date'] = delivery_match.group(2)
+    
+    # Extract LOT number
+    lot_match = _LOT_NO_RE.search(full_text)
+    if lot_match:
+        invoice_data['lot_number'] = lot_match.group(1)
+    
+    # Extract LST number
+    lst_match = _LST_RE.search(full_text)
+    if lst_match:
+        invoice_data['lst_number'] = lst_match.group(1).strip()
+    
+    return invoice_data
+
+@timed("parse")
+def _extract_biselli_items(full_text: str, invoice_data: Dict) -> List[Dict]:
+    """Extract items from Biselli invoice text"""
+    items = []
+    
+    # Find the main item section between the record markers
+    record_start = full_text.find('FDA Registration No. DEV 96 11 617')
+    record_end = full_text.find('Total/EUR')
+    
+    if record_start != -1 and record_end != -1:
+        record_section = full_text[record_start:record_end]
+        
+        # Look for the item line pattern: position + product code + description + quantity + price + total
+        matches = _ITEM_RE.finditer(record_section)
+        
+        for match in matches:
+            item_data = {
+                'invoice_number': invoice_data.get('invoice_number', ''),
+                'invoice_date': invoice_data.get('invoice_date', ''),
+                'order_number': invoice_data.get('order_number', ''),
+                'order_date': invoice_data.get('order_date', ''),
+                'delivery_note': invoice_data.get('delivery_note', ''),
+                'delivery_date': invoice_data.get('delivery_date', ''),
+                'lot_number': invoice_data.get('lot_number', ''),
+                'lst_number': invoice_data.get('lst_number', ''),
+                'position': match.group(1),
+                'article_number': '',  # Leave blank as absent
+                'description': match.group(3).strip(),
+                'quantity': match.group(4),
+                'unit_price': match.group(5),
+                'total_price': match.group(6)
+            }
+            
+            # Clean up description
+            item_data['description'] = _WHITESPACE_RE.sub(' ', item_data['description']).strip()
+            items.append(item_data)
+    
+    # If no items found with regex, use manual extraction
+    if not items:
+        items = _extract_biselli_items_manual(full_text, invoice_data)
+    
+    return items
+
+@timed("parse")
+def _extract_biselli_items_manual(full_text: str, invoice_data: Dict) -> List[Dict]:
+    """Manual extraction for Biselli items"""
+    items = []
+    lines = full_text.split('\n')
+    
+    # Find the record section
+    record_start = -1
+    record_end = -1
+    
+    for i, line in enumerate(lines):
+        if 'FDA Registration No. DEV 96 11 617' in line:
+            record_start = i
+        if 'Total/EUR' in line and record_start != -1:
+            record_end = i
+            break
+    
+    if record_start != -1 and record_end != -1:
+        record_lines = lines[record_start:record_end]
+        
+        for i, line in enumerate(record_lines):
+            line = line.strip()
+            
+            # Look for item lines (start with number, contain product description)
+            if _ITEM_START_RE.match(line) and any(keyword in line for keyword in ['Castroviejo', 'Needle', 'Holder']):
+                try:
+                    # Split the line to extract components
+                    parts = line.split()
+                    
+                    # Position is first element
+                    position = parts[0]
+                    
+                    # Product code is second element
+                    product_code = parts[1]
+                    
+                    # Find quantity, unit price, and total price
+                    quantity = None
+                    unit_price = None
+                    total_price = None
+                    
+                    # Look for numeric values at the end of the line
+                    price_match = _PRICE_END_RE.search(line)
+                    
+                    if price_match:
+                        quantity = price_match.group(1)
+                        unit_price = price_match.group(2)
+                        total_price = price_match.group(3)
+                    
+                    if quantity and unit_price and total_price:
+                        # Extract description (everything between product code and prices)
+                        desc_start = line.find(product_code) + len(product_code)
+                        desc_end = line.find(quantity, desc_start)
+                        description = line[desc_start:desc_end].strip()
+                        
+                        # Check if next line continues description
+                        if i + 1 < len(record_lines):
+                            next_line = record_lines[i + 1].strip()
+                            if not _LOT_NO_LST_RE.match(next_line):
+                                description += ' ' + next_line
+                        
+                        item_data = {
+                            'invoice_number': invoice_data.get('invoice_number', ''),
+                            'invoice_date': invoice_data.get('invoice_date', ''),
+                            'order_number': invoice_data.get('order_number', ''),
+                            'order_date': invoice_data.get('order_date', ''),
+                            'delivery_note': invoice_data.get('delivery_note', ''),
+                            'delivery_date': invoice_data.get('delivery_date', ''),
+                            'lot_number': invoice_data.get('lot_number', ''),
+                            'lst_number': invoice_data.get('lst_number', ''),
+                            'position': position,
+                            'article_number': '',  # Leave blank
+                            'description': description,
+                            'quantity': quantity,
+                            'unit_price': unit_price,
+                            'total_price': total_price
+                        }
+                        items.append(item_data)
+                        
+                except (IndexError, ValueError):
+                    continue
+    
+    return items
@@ -0,0 +1,217 @@
+"""Gunter Bissinger Medizintechnik GmbH invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ARTICLE_DESCRIPTION_RE = re.compile(r'POS\s+ARTICLE\s+description\s+qty\.\s+each\s+price', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\d{8}')
+_BLOCK_END_RE = re.compile(r'carry-over|Total/EUR|payment|Terms of delivery|your order no\.', re.IGNORECASE)
+_INVOICE_NO_RE = re.compile(r'INVOICE NO\.?\s*[:#]?\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*[:#]?\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUST_NO_RE = re.compile(r'Cust\.-No\.?\s*[:#]?\s*(\d+)', re.IGNORECASE)
+_DELIVERY_NOTE_NO_RE = re.compile(r'Delivery Note No\.?\s*(\d+)\s*at\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.\s*([^\s-]+)[^\d]*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_POS_RE = re.compile(r'^(\d+)\s+')
+_ITEM_RE = re.compile(r'^(\d{8})\s+(.+?)\s+(\d+)\s+([\d,]+)\s+[\d,\.]+$')
+_ALT_RE = re.compile(r'^(\d{8})\s+(.+?)\s+(\d+)\s+([\d,]+)')
+_LOT_NUMBER_RE = re.compile(r'Lot number\s*([^\s]+)', re.IGNORECASE)
+_YOUR_ART_NO_RE = re.compile(r'your art\.-no\.:\s*([^\s]+)', re.IGNORECASE)
+_DRWG_NO_RE = re.compile(r'Drwg\. No\.\s*([^\s]+)', re.IGNORECASE)
+_LOT_NUMBER_YOUR_RE = re.compile(r'Lot number|your art\.-no\.|Drwg\. No\.|LST:|Customs tariff number|Country of Origin', re.IGNORECASE)
+_PRICES_RE = re.compile(r'[\d,]+')
+
+_LAYOUT = TableLayout(
+    header=_POS_ARTICLE_DESCRIPTION_RE,
+    # e.g. "1 81612601"
+    item_start=_ITEM_START_RE,
+    # Order information may change within the invoice, and is also picked up above the table
+    preamble=(LineRule(Action.SET, _YOUR_ORDER_NO_RE, ('order_no', 'order_date')),),
+    notes=(LineRule(Action.SET, _YOUR_ORDER_NO_RE, ('order_no', 'order_date')),),
+    # Summary lines and the next order end an item
+    terminator=_BLOCK_END_RE,
+)
+
+
+def iter_bissinger_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Günter Bissinger Medizintechnik invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        # First pass: extract all text and invoice-level info
+        all_lines = pdf.lines
+        
+        # Extract invoice-level info from the entire document
+        invoice_data = _extract_bissinger_invoice_info(all_lines)
+        
+        # Second pass: process each page for items
+        # Store the current order info to carry over to subsequent pages
+        current_order_info = {'order_no': invoice_data['order_no'], 'order_date': invoice_data['order_date']}
+        
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            for block, order_info in iter_item_blocks(lines, _LAYOUT, current_order_info):
+                item_data = _parse_bissinger_item_block(block, invoice_data, order_info, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_bissinger_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_bissinger_invoice_rows()."""
+    return list(iter_bissinger_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_bissinger_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Bissinger invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number
+        inv_match = _INVOICE_NO_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number
+        cust_match = _CUST_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract delivery note
+        delivery_match = _DELIVERY_NOTE_NO_RE.search(line_clean)
+        if delivery_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = delivery_match.group(1)
+        
+        # Extract order information
+        order_match = _YOUR_ORDER_NO_RE.search(line_clean)
+        if order_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = order_match.group(1)
+            invoice_data['order_date'] = order_match.group(2)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_bissinger_item_block(block: List[str], invoice_data: Dict, order_info: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Bissinger invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': order_info['order_no'],
+        'order_date': order_info['order_date'],
+        'delivery_note': invoice_data['delivery_note'],
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract position number (remove it since we don't need it)
+    pos_match = _POS_RE.search(first_line)
+    if pos_match:
+        # Remove the position number from the line for easier parsing
+        first_line = first_line[len(pos_match.group(0)):].strip()
+    
+    # Extract item code, description, quantity, unit price
+    # Pattern: "81612601 Bipolar Forceps Adson 120 mm straight 20 73,00 1.387,00"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1).strip()
+        item_data['description'] = item_match.group(2).strip()
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(4)
+    
+    # Alternative pattern for different formatting
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = alt_match.group(1).strip()
+            item_data['description'] = alt_match.group(2).strip()
+            item_data['quantity'] = alt_match.group(3)
+            item_data['unit_price'] = alt_match.group(4)
+    
+    # Extract lot number from the block
+    for line in block:
+        lot_match = _LOT_NUMBER_RE.search(line)
+        if lot_match:
+            item_data['lot'] = lot_match.group(1)
+            break
+    
+    # Extract customer article number from the block
+    customer_art_match = None
+    for line in block:
+        art_match = _YOUR_ART_NO_RE.search(line)
+        if art_match:
+            customer_art_match = art_match.group(1)
+            break
+    
+    # Extract drawing number from the block
+    drawing_match = None
+    for line in block:
+        drwg_match = _DRWG_NO_RE.search(line)
+        if drwg_match:
+            drawing_match = drwg_match.group(1)
+            break
+    
+    # If we have a customer article number, append it to description
+    if customer_art_match and item_data['description']:
+        item_data['description'] += f" (Art-No: {customer_art_match})"
+    
+    # If we have a drawing number, append it to description
+    if drawing_match and item_data['description']:
+        item_data['description'] += f" (Drwg: {drawing_match})"
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Only include lines that don't look like metadata
+            if not _LOT_NUMBER_YOUR_RE.search(line):
+                clean_line = line.strip()
+                if clean_line and not _ITEM_START_RE.match(clean_line):  # Don't include lines that start like new items
+                    additional_desc.append(clean_line)
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # Extract unit price from alternative patterns if still missing
+    if not item_data['unit_price']:
+        prices = _PRICES_RE.findall(first_line)
+        if len(prices) >= 1:
+            item_data['unit_price'] = prices[-1]  # Use the last price found
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
@@ -0,0 +1,197 @@
+"""Blache invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_INVOICE_NO_RE = re.compile(r'Invoice no\.\s*(\d+)', re.IGNORECASE)
+_INVOICE_DATE_RE = re.compile(r'Invoice Date\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_YOUR_CUSTOMER_NO_RE = re.compile(r'Your Customer no\.\s*(\d+)', re.IGNORECASE)
+_YOUR_VAT_RE = re.compile(r'Your VAT\s*([A-Z0-9]+)', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+[A-Z0-9\-]')
+_TOTAL_NET_STEUERFREIE_RE = re.compile(r'Total / net|Steuerfreie Ausfuhrlieferung')
+_YOUR_ORDER_NO_RE = re.compile(r'Your Order No\.\s*(\d+)', re.IGNORECASE)
+_PO_NO_RE = re.compile(r'PO-No\.\s*([A-Z0-9/ ]+)', re.IGNORECASE)
+_DELIVERED_WITH_DELIVERY_RE = re.compile(r'delivered with Delivery Note no\.\s*([A-Z0-9/ ]+)\s*Date:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_YOUR_ORDER_PO_RE = re.compile(r'Your Order|PO-No\.|delivered with|MDL no\.|\d+ x \d+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_ITEM_LINE_RE = re.compile(r'^(\d+)\s+([A-Z0-9\-]+)\s+(.+?)\s+(\d+)\s+pcs\.\s+([\d,]+)\s+([\d,]+)$')
+_ITEM_LINE_ALT_RE = re.compile(r'^(\d+)\s+([A-Z0-9\-]+)\s+(.+?)\s+(\d+)\s+pcs\.\s+([\d,]+)')
+
+
+def iter_blache_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Blache Medical invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        full_text = pdf.full_text
+        
+        # Extract invoice information
+        invoice_data = _extract_blache_invoice_info(full_text)
+        
+        # Extract items by finding item blocks
+        items = _extract_blache_item_blocks(full_text, invoice_data)
+        yield from items
+
+def extract_blache_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_blache_invoice_rows()."""
+    return list(iter_blache_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_blache_invoice_info(full_text: str) -> Dict[str, str]:
+    """Extract invoice information from Blache invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'vat_number': ''
+    }
+    
+    # Extract invoice number
+    inv_match = _INVOICE_NO_RE.search(full_text)
+    if inv_match:
+        invoice_data['invoice_number'] = inv_match.group(1)
+    
+    # Extract invoice date
+    date_match = _INVOICE_DATE_RE.search(full_text)
+    if date_match:
+        invoice_data['invoice_date'] = date_match.group(1)
+    
+    # Extract customer number
+    cust_match = _YOUR_CUSTOMER_NO_RE.search(full_text)
+    if cust_match:
+        invoice_data['customer_number'] = cust_match.group(1)
+    
+    # Extract VAT number
+    vat_match = _YOUR_VAT_RE.search(full_text)
+    if vat_match:
+        invoice_data['vat_number'] = vat_match.group(1)
+    
+    return invoice_data
+
+def _extract_blache_item_blocks(full_text: str, invoice_data: Dict) -> List[Dict]:
+    """Extract complete item blocks from Blache invoice text"""
+    items = []
+    lines = full_text.split('\n')
+    
+    current_block = []
+    in_item_block = False
+    
+    for i, line in enumerate(lines):
+        line = line.strip()
+        
+        # Look for the start of an item block (line starting with number + article number)
+        if _ITEM_START_RE.match(line) and any(x in line for x in ['pcs.', 'BSI-', 'N6971', 'N9126']):
+            if current_block and in_item_block:
+                # Process the completed block
+                item = _parse_blache_item_block(current_block, invoice_data)
+                if item:
+                    items.append(item)
+                current_block = []
+            
+            current_block.append(line)
+            in_item_block = True
+        
+        # Continue collecting lines for the current item block
+        elif in_item_block:
+            # Check if this is the start of a new item block or the end of current block
+            if (_ITEM_START_RE.match(line) or 
+                _TOTAL_NET_STEUERFREIE_RE.search(line) or
+                (i + 1 < len(lines) and _ITEM_START_RE.match(lines[i + 1].strip()))):
+                # Process the completed block
+                item = _parse_blache_item_block(current_block, invoice_data)
+                if item:
+                    items.append(item)
+                current_block = []
+                in_item_block = False
+                
+                # If this is a new item block, start collecting it
+                if _ITEM_START_RE.match(line):
+                    current_block.append(line)
+                    in_item_block = True
+            else:
+                current_block.append(line)
+    
+    # Process the last block if exists
+    if current_block and in_item_block:
+        item = _parse_blache_item_block(current_block, invoice_data)
+        if item:
+            items.append(item)
+    
+    return items
+
+@timed("parse")
+def _parse_blache_item_block(block: List[str], invoice_data: Dict) -> Optional[Dict]:
+    """Parse a complete item block from Blache invoice"""
+    if not block:
+        return None
+    
+    # Join the block for easier parsing
+    block_text = ' '.join(block)
+    
+    # Extract order information from the block
+    order_match = _YOUR_ORDER_NO_RE.search(block_text)
+    order_number = order_match.group(1) if order_match else ""
+    
+    po_match = _PO_NO_RE.search(block_text)
+    po_number = po_match.group(1).strip() if po_match else ""
+    
+    delivery_match = _DELIVERED_WITH_DELIVERY_RE.search(block_text)
+    delivery_note = delivery_match.group(1).strip() if delivery_match else ""
+    delivery_date = delivery_match.group(2) if delivery_match else ""
+    
+    # Extract the main item line (first line of the block)
+    first_line = block[0]
+    
+    # Pattern for the main item line: position + article number + description + quantity + price + total
+    item_match = _ITEM_LINE_RE.search(first_line)
+    
+    if not item_match:
+        # Try alternative pattern if first pattern doesn't match
+        item_match = _ITEM_LINE_ALT_RE.search(first_line)
+    
+    if item_match:
+        position = item_match.group(1)
+        article_number = item_match.group(2)
+        description = item_match.group(3).strip()
+        quantity = item_match.group(4)
+        unit_price = item_match.group(5)
+        total_price = item_match.group(6) if len(item_match.groups()) >= 6 else ""
+        
+        # Add additional description from subsequent lines
+        if len(block) > 1:
+            additional_desc = []
+            for line in block[1:]:
+                # Skip lines that contain order/delivery information
+                if not _YOUR_ORDER_PO_RE.search(line):
+                    additional_desc.append(line.strip())
+            
+            if additional_desc:
+                description += ' ' + ' '.join(additional_desc)
+        
+        # Clean up description
+        description = _WHITESPACE_RE.sub(' ', description).strip()
+        
+        return {
+            'invoice_number': invoice_data.get('invoice_number', ''),
+            'invoice_date': invoice_data.get('invoice_date', ''),
+            'customer_number': invoice_data.get('customer_number', ''),
+            'vat_number': invoice_data.get('vat_number', ''),
+            'order_number': order_number,
+            'po_number': po_number,
+            'delivery_note': delivery_note,
+            'delivery_date': delivery_date,
+            'lot_number': '',  # LOT number is missing
+            'position': position,
+            'article_number': article_number,
+            'description': description,
+            'quantity': quantity,
+            'unit_price': unit_price,
+            'total_price': total_price
+        }
+    
+    return None
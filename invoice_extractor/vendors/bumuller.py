@@ -0,0 +1,107 @@
+"""Bumüller GmbH invoice extractor."""
+import re
+from typing import Dict, Iterator, List
+
+from ..document import DocumentSource, open_document
+from ..lineindex import LineIndex
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_INVOICE_NUMBER_RE = re.compile(r'No\.\s*(\d+)')
+_INVOICE_DATE_RE = re.compile(r'from\s+(\d{2}\.\d{2}\.\d{4})')
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.\s*(\d+)')
+_YOUR_ITEM_NO_RE = re.compile(r'Your Item No\.\s*(\w+[-]\d+)')
+_LOT_RE = re.compile(r'LOT#\s*([\w-]+)')
+_VENDOR_RE = re.compile(r'(\d+-\d+-\d+)')
+_QTY_PRICE_RE = re.compile(r'(\d+)pcs\s+(\d+,\d+)\s+(\d+,\d+)')
+
+_KEYWORDS = {
+    'po': _YOUR_ORDER_NO_RE,
+    'novo_item': _YOUR_ITEM_NO_RE,
+    'lot': _LOT_RE,
+    'vendor_item': _VENDOR_RE,
+    'qty_price': _QTY_PRICE_RE,
+}
+
+
+def iter_bumuller_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Bumüller GmbH invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        # Get total number of pages
+        num_pages = len(pdf.pages)
+
+        # Extract invoice-level data from first page
+        invoice_data = _extract_bumuller_invoice_info(pdf.pages[0].extract_text())
+
+        # Process all pages
+        for page_num in range(num_pages):
+            # Extract text from current page
+            text = pdf.pages[page_num].extract_text()
+
+            # Split text into lines for processing
+            lines = text.split('\n')
+
+            # Item fields are the nearest ones above each quantity line on the page
+            index = LineIndex(lines, _KEYWORDS)
+            item_start = 0
+            for i in index.positions('qty_price'):
+                yield _parse_bumuller_item(index, item_start, i, invoice_data, page_num)
+
+                # The lot number belongs to this item only
+                item_start = i + 1
+
+
+@timed("header")
+def _extract_bumuller_invoice_info(first_page_text: str) -> Dict[str, str]:
+    """Extract invoice number and date from the first page of a Bumüller invoice"""
+    invoice_number_match = _INVOICE_NUMBER_RE.search(first_page_text)
+    invoice_date_match = _INVOICE_DATE_RE.search(first_page_text)
+    return {
+        'invoice_number': invoice_number_match.group(1) if invoice_number_match else "",
+        'invoice_date': invoice_date_match.group(1) if invoice_date_match else "",
+    }
+
+
+@timed("parse")
+def _parse_bumuller_item(index: LineIndex, item_start: int, i: int, invoice_data: Dict, page_num: int) -> Dict:
+    """Parse the item whose quantity line is `i`; its fields are the nearest ones above it"""
+    qty_price_match = index.match('qty_price', i)
+    return {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'purchase_order': _last_value(index, 'po', i),
+        'vendor_item': _last_value(index, 'vendor_item', i),
+        'novo_item': _last_value(index, 'novo_item', i),
+        'lot_number': _item_lot(index, item_start, i),
+        'quantity': qty_price_match.group(1),
+        'price_each': qty_price_match.group(2),
+        'page_number': page_num + 1  # Add page number for reference
+    }
+
+
+def _last_value(index: LineIndex, key: str, position: int) -> str:
+    """First group of the last match of `key` at or above `position`."""
+    found = index.previous(key, position)
+    return index.match(key, found).group(1) if found is not None else ""
+
+
+def _item_lot(index: LineIndex, start: int, position: int) -> str:
+    """
+    Lot number of an item: the first LOT# within five lines of the last
+    "Your Item No." line between `start` and `position` that has one.
+    """
+    novo_line = index.previous('novo_item', position, start)
+    while novo_line is not None:
+        lot_line = index.next('lot', novo_line, novo_line + 5)
+        if lot_line is not None:
+            return index.match('lot', lot_line).group(1)
+        novo_line = index.previous('novo_item', novo_line - 1, start)
+    return ""
+
+def extract_bumuller_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_bumuller_invoice_rows()."""
+    return list(iter_bumuller_invoice_rows(pdf_content))
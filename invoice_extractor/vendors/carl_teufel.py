@@ -0,0 +1,258 @@
+"""Carl Teufel invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_INVOICE_NO_RE = re.compile(r'INVOICE NO\.\s*([\d\s]+)\s*\d+', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_PAGE_RE = re.compile(r'([A-Z]{1,2})\s+Page\s+(\d+)')
+_ITEM_LINE_RE = re.compile(r'^([A-Z0-9\-]+)\s+(\d+)\s+(.+?)\s+([\d,]+)\s+([\d,]+)$')
+_LOT_RE = re.compile(r'LOT\s+([A-Z0-9\-]+)', re.IGNORECASE)
+_MDL_NO_RE = re.compile(r'MDL-No\.\s*([A-Z0-9]+)', re.IGNORECASE)
+_CODE_RE = re.compile(r'CODE?\s*([A-Z0-9]+)', re.IGNORECASE)
+_YOUR_ORDER_ART_RE = re.compile(r'^(Your order|Your art\.-no|LOT|MDL-No|CODE|Total)')
+_ITEM_FIELD_RE = re.compile(r'\d+,\d+')
+_YOUR_ORDER_NO_LINE_RE = re.compile(r'Your order no\.\s*\d+', re.IGNORECASE)
+_TOTAL_NET_EUR_RE = re.compile(r'Total net|Total/EUR')
+_YOUR_ORDER_NO_RE = re.compile(r'Your order no\.\s*(\d+)\s*-\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_YOUR_ART_NO_RE = re.compile(r'Your art\.-no\.:\s*([A-Z0-9\-]+)', re.IGNORECASE)
+_ITEM_RE = re.compile(r'([A-Z0-9\-]+)\s+(\d+)\s+(.+?)\s+([\d,]+)\s+([\d,]+)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def iter_carl_teufel_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Carl Teufel invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        full_text = pdf.full_text
+        
+        # Extract invoice information
+        invoice_data = _extract_carl_teufel_invoice_info(full_text)
+        
+        # Extract items
+        items = _extract_carl_teufel_items(full_text, invoice_data)
+        yield from items
+
+def extract_carl_teufel_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_carl_teufel_invoice_rows()."""
+    return list(iter_carl_teufel_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_carl_teufel_invoice_info(full_text: str) -> Dict[str, str]:
+    """Extract invoice information from Carl Teufel invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'page_info': ''
+    }
+    
+    # Extract invoice number - handle space in number like "41 402"
+    inv_match = _INVOICE_NO_RE.search(full_text)
+    if inv_match:
+        invoice_data['invoice_number'] = inv_match.group(1).replace(' ', '')
+    
+    # Extract invoice date
+    date_match = _DATE_RE.search(full_text)
+    if date_match:
+        invoice_data['invoice_date'] = date_match.group(1)
+    
+    # Extract page info (like "JS Page 1")
+    page_match = _PAGE_RE.search(full_text)
+    if page_match:
+        invoice_data['page_info'] = f"{page_match.group(1)} Page {page_match.group(2)}"
+    
+    return invoice_data
+
+@timed("parse")
+def _extract_carl_teufel_items(full_text: str, invoice_data: Dict) -> List[Dict]:
+    """Extract items from Carl Teufel invoice text"""
+    items = []
+    
+    # Split into lines for processing
+    lines = full_text.split('\n')
+    
+    current_order_no = ""
+    current_art_no = ""
+    current_item = None
+    collecting_description = False
+    
+    for i, line in enumerate(lines):
+        line = line.strip()
+        
+        # Extract order number and date
+        order_match = _YOUR_ORDER_NO_RE.search(line)
+        if order_match:
+            current_order_no = order_match.group(1)
+        
+        # Extract article number
+        art_match = _YOUR_ART_NO_RE.search(line)
+        if art_match:
+            current_art_no = art_match.group(1)
+        
+        # Look for item lines (product code + quantity + description + price + total)
+        # Pattern: product_code + quantity + description + price + total
+        item_match = _ITEM_LINE_RE.match(line)
+        if item_match:
+            if current_item:
+                items.append(current_item)
+            
+            product_code = item_match.group(1)
+            quantity = item_match.group(2)
+            description = item_match.group(3).strip()
+            unit_price = item_match.group(4)
+            total_price = item_match.group(5)
+            
+            current_item = {
+                'invoice_number': invoice_data.get('invoice_number', ''),
+                'invoice_date': invoice_data.get('invoice_date', ''),
+                'order_number': current_order_no,
+                'article_number': current_art_no,
+                'product_code': product_code,
+                'description': description,
+                'quantity': quantity,
+                'unit_price': unit_price,
+                'total_price': total_price,
+                'lot_number': '',
+                'mdl_number': '',
+                'code': ''
+            }
+            collecting_description = False
+        
+        # Extract LOT number
+        lot_match = _LOT_RE.search(line)
+        if lot_match and current_item:
+            current_item['lot_number'] = lot_match.group(1)
+        
+        # Extract MDL number
+        mdl_match = _MDL_NO_RE.search(line)
+        if mdl_match and current_item:
+            current_item['mdl_number'] = mdl_match.group(1)
+        
+        # Extract CODE
+        code_match = _CODE_RE.search(line)
+        if code_match and current_item:
+            current_item['code'] = code_match.group(1)
+        
+        # Continue description for multi-line items if the next line doesn't contain metadata
+        elif (current_item and not collecting_description and 
+              not _YOUR_ORDER_ART_RE.match(line) and
+              len(line) > 3 and not _ITEM_FIELD_RE.search(line)):
+            current_item['description'] += ' ' + line
+    
+    # Add the last item if exists
+    if current_item:
+        items.append(current_item)
+    
+    return items
+# Alternative block-based approach for better accuracy
+def _extract_carl_teufel_item_blocks(full_text: str, invoice_data: Dict) -> List[Dict]:
+    """Extract complete item blocks from Carl Teufel invoice"""
+    items = []
+    lines = full_text.split('\n')
+    
+    current_block = []
+    in_item_block = False
+    
+    for i, line in enumerate(lines):
+        line = line.strip()
+        
+        # Look for start of item block (order number line)
+        if _YOUR_ORDER_NO_LINE_RE.search(line):
+            if current_block and in_item_block:
+                item = _parse_carl_teufel_block(current_block, invoice_data)
+                if item:
+                    items.append(item)
+                current_block = []
+            
+            current_block.append(line)
+            in_item_block = True
+        
+        # Continue collecting lines for current block
+        elif in_item_block:
+            # Check if this is the start of a new block or end of current block
+            if (_YOUR_ORDER_NO_LINE_RE.search(line) or
+                _TOTAL_NET_EUR_RE.search(line) or
+                (i + 1 < len(lines) and _YOUR_ORDER_NO_LINE_RE.search(lines[i + 1].strip()))):
+                
+                # Process completed block
+                item = _parse_carl_teufel_block(current_block, invoice_data)
+                if item:
+                    items.append(item)
+                current_block = []
+                
+                # If this is a new block, start collecting it
+                if _YOUR_ORDER_NO_LINE_RE.search(line):
+                    current_block.append(line)
+            else:
+                current_block.append(line)
+    
+    # Process the last block
+    if current_block:
+        item = _parse_carl_teufel_block(current_block, invoice_data)
+        if item:
+            items.append(item)
+    
+    return items
+
+@timed("parse")
+def _parse_carl_teufel_block(block: List[str], invoice_data: Dict) -> Optional[Dict]:
+    """Parse a complete item block from Carl Teufel invoice"""
+    if not block:
+        return None
+    
+    block_text = ' '.join(block)
+    
+    # Extract order information
+    order_match = _YOUR_ORDER_NO_RE.search(block_text)
+    order_number = order_match.group(1) if order_match else ""
+    order_date = order_match.group(2) if order_match else ""
+    
+    # Extract article number
+    art_match = _YOUR_ART_NO_RE.search(block_text)
+    article_number = art_match.group(1) if art_match else ""
+    
+    # Extract item line (product code + quantity + description + price + total)
+    item_match = _ITEM_RE.search(block_text)
+    if item_match:
+        product_code = item_match.group(1)
+        quantity = item_match.group(2)
+        description = item_match.group(3).strip()
+        unit_price = item_match.group(4)
+        total_price = item_match.group(5)
+        
+        # Extract LOT, MDL, and CODE
+        lot_match = _LOT_RE.search(block_text)
+        lot_number = lot_match.group(1) if lot_match else ""
+        
+        mdl_match = _MDL_NO_RE.search(block_text)
+        mdl_number = mdl_match.group(1) if mdl_match else ""
+        
+        code_match = _CODE_RE.search(block_text)
+        code = code_match.group(1) if code_match else ""
+        
+        # Clean up description
+        description = _WHITESPACE_RE.sub(' ', description).strip()
+        
+        return {
+            'invoice_number': invoice_data.get('invoice_number', ''),
+            'invoice_date': invoice_data.get('invoice_date', ''),
+            'order_number': order_number,
+            'order_date': order_date,
+            'article_number': article_number,
+            'product_code': product_code,
+            'description': description,
+            'quantity': quantity,
+            'unit_price': unit_price,
+            'total_price': total_price,
+            'lot_number': lot_number,
+            'mdl_number': mdl_number,
+            'code': code
+        }
+    
+    return None
@@ -0,0 +1,184 @@
+"""Chirmed invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_INV_RE = re.compile(r'No\.\s*([A-Z]+/\d+/\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Invoice\s+(\d{4}-\d{2}-\d{2})', re.IGNORECASE)
+_ORDER_NO_RE = re.compile(r'Order no\.\s*(\d+)', re.IGNORECASE)
+_DATE_OF_DUE_RE = re.compile(r'Date of due:\s*(\d{4}-\d{2}-\d{2})', re.IGNORECASE)
+_CURRENCY_RE = re.compile(r'Currency:\s*([A-Z]+)', re.IGNORECASE)
+_NO_DESCRIPTION_CODE_RE = re.compile(r'No\.\s+Description\s+Code\s+Quantity\s+Unit', re.IGNORECASE)
+_TOTAL_RE = re.compile(r'TOTAL\s+[\d,]+')
+_CONTAIN_RE = re.compile(r'Contain\s+[\d,]+')
+_LEADING_POSITION_RE = re.compile(r'^\d+\s+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_ITEM_LINE_PATTERNS = (
+    # With code, space in "szt": "3 szt"
+    re.compile(r'^(\d+)\s+(.+?)\s+([A-Z0-9\-/]+(?:\s+[A-Z0-9\-/]+)*?)\s+(\d+)\s+szt\s+([\d,]+)\s+([\d,]+)'),
+    # With code, no space in "szt": "6szt"
+    re.compile(r'^(\d+)\s+(.+?)\s+([A-Z0-9\-/]+(?:\s+[A-Z0-9\-/]+)*?)\s+(\d+)szt\s+([\d,]+)\s+([\d,]+)'),
+    # Without code, space in "szt": "3 szt"
+    re.compile(r'^(\d+)\s+(.+?)\s+(\d+)\s+szt\s+([\d,]+)\s+([\d,]+)'),
+    # Without code, no space in "szt": "6szt"
+    re.compile(r'^(\d+)\s+(.+?)\s+(\d+)szt\s+([\d,]+)\s+([\d,]+)'),
+)
+
+
+def iter_chirmed_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Chirmed invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        full_text = pdf.full_text
+        
+        # Extract invoice information
+        invoice_data = _extract_chirmed_invoice_info(full_text)
+        
+        # Extract items
+        items = _extract_chirmed_items(full_text, invoice_data)
+        yield from items
+
+def extract_chirmed_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_chirmed_invoice_rows()."""
+    return list(iter_chirmed_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_chirmed_invoice_info(full_text: str) -> Dict[str, str]:
+    """Extract invoice information from Chirmed invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'order_number': '',
+        'due_date': '',
+        'currency': ''
+    }
+    
+    # Extract invoice number (format: "No. DEX/26/2024")
+    inv_match = _INV_RE.search(full_text)
+    if inv_match:
+        invoice_data['invoice_number'] = inv_match.group(1)
+    
+    # Extract invoice date (format: "2024-03-27")
+    date_match = _DATE_RE.search(full_text)
+    if date_match:
+        invoice_data['invoice_date'] = date_match.group(1)
+    
+    # Extract order number
+    order_match = _ORDER_NO_RE.search(full_text)
+    if order_match:
+        invoice_data['order_number'] = order_match.group(1)
+    
+    # Extract due date
+    due_match = _DATE_OF_DUE_RE.search(full_text)
+    if due_match:
+        invoice_data['due_date'] = due_match.group(1)
+    
+    # Extract currency
+    currency_match = _CURRENCY_RE.search(full_text)
+    if currency_match:
+        invoice_data['currency'] = currency_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _extract_chirmed_items(full_text: str, invoice_data: Dict) -> List[Dict]:
+    """Extract items from Chirmed invoice text"""
+    items = []
+    
+    # Find the item table section
+    lines = full_text.split('\n')
+    in_item_section = False
+    current_item_lines = []
+    
+    for i, line in enumerate(lines):
+        line = line.strip()
+        
+        # Look for the start of item section (after column headers)
+        if _NO_DESCRIPTION_CODE_RE.search(line):
+            in_item_section = True
+            continue
+        
+        # Look for the end of item section
+        if in_item_section and (_TOTAL_RE.search(line) or _CONTAIN_RE.search(line)):
+            in_item_section = False
+            # Process collected item lines
+            if current_item_lines:
+                item = _parse_chirmed_item_line(' '.join(current_item_lines), invoice_data)
+                if item:
+                    items.append(item)
+                current_item_lines = []
+            continue
+        
+        # Collect item lines
+        if in_item_section and line:
+            # Check if this is a new item line (starts with number)
+            if _LEADING_POSITION_RE.match(line) and current_item_lines:
+                # Process previous item
+                item = _parse_chirmed_item_line(' '.join(current_item_lines), invoice_data)
+                if item:
+                    items.append(item)
+                current_item_lines = [line]
+            else:
+                current_item_lines.append(line)
+    
+    # Process the last item if any
+    if current_item_lines:
+        item = _parse_chirmed_item_line(' '.join(current_item_lines), invoice_data)
+        if item:
+            items.append(item)
+    
+    return items
+
+@timed("parse")
+def _parse_chirmed_item_line(line_text: str, invoice_data: Dict) -> Optional[Dict]:
+    """Parse a single item line from Chirmed invoice with flexible pattern matching"""
+    # Flexible pattern that handles both "szt" formats and optional code
+    # Pattern: position + description + (optional code) + quantity + unit_price + total_price
+    
+    # Try pattern with code first
+    for pattern in _ITEM_LINE_PATTERNS:
+        item_match = pattern.search(line_text)
+        if item_match:
+            position = item_match.group(1)
+            
+            if len(item_match.groups()) == 6:
+                # Pattern with code
+                description = item_match.group(2)
+                product_code = item_match.group(3)
+                quantity = item_match.group(4)
+                unit_price = item_match.group(5)
+                total_price = item_match.group(6)
+            else:
+                # Pattern without code
+                description = item_match.group(2)
+                product_code = ""
+                quantity = item_match.group(3)
+                unit_price = item_match.group(4)
+                total_price = item_match.group(5)
+            
+            # Clean up description
+            description = _WHITESPACE_RE.sub(' ', description).strip()
+            
+            return {
+                'invoice_number': invoice_data.get('invoice_number', ''),
+                'invoice_date': invoice_data.get('invoice_date', ''),
+                'order_number': invoice_data.get('order_number', ''),
+                'due_date': invoice_data.get('due_date', ''),
+                'currency': invoice_data.get('currency', ''),
+                'position': position,
+                'article_number': '',
+                'lot_number': '',
+                'product_code': product_code,
+                'description': description,
+                'quantity': quantity,
+                'unit_price': unit_price,
+                'total_price': total_price
+            }
+    
+    return None
@@ -0,0 +1,252 @@
+"""CM Instrumente invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_INVOICE_NO_RE = re.compile(r'INVOICE NO\.\s*:\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUST_NO_RE = re.compile(r'Cust\.-No\.\s*:\s*(\d+)', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.\s*(\d+)', re.IGNORECASE)
+_ITEM_LINE_RE = re.compile(r'^(\d+)\s+([A-Z0-9\-]+)\s+(.+?)\s+(\d+)\s+([\d,]+)\s+([\d,]+)$')
+_YOUR_ORDER_ART_RE = re.compile(r'^(your order|your art\.-no|MDL Reg\. No|carry-over|total)', re.IGNORECASE)
+_ITEM_END_RE = re.compile(r'\d+\s+[\d,]+$')
+_YOUR_ORDER_NO_LINE_RE = re.compile(r'your order no\.\s*\d+', re.IGNORECASE)
+_CARRY_OVER_TOTAL_RE = re.compile(r'carry-over|total net')
+_YOUR_ART_NO_RE = re.compile(r'your art\.-no\.:\s*([A-Z0-9\-]+)', re.IGNORECASE)
+_MDL_REG_NO_RE = re.compile(r'MDL Reg\. No\.:\s*([A-Z0-9\s]+)', re.IGNORECASE)
+_ITEM_RE = re.compile(r'(\d+)\s+([A-Z0-9\-]+)\s+(.+?)\s+(\d+)\s+([\d,]+)\s+([\d,]+)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def iter_cm_instrumente_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from CM Instrumente invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        full_text = pdf.full_text
+        
+        # Extract invoice information
+        invoice_data = _extract_cm_instrumente_invoice_info(full_text)
+        
+        # Extract items
+        items = _extract_cm_instrumente_items(full_text, invoice_data)
+        yield from items
+
+def extract_cm_instrumente_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_cm_instrumente_invoice_rows()."""
+    return list(iter_cm_instrumente_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_cm_instrumente_invoice_info(full_text: str) -> Dict[str, str]:
+    """Extract invoice information from CM Instrumente invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': ''
+    }
+    
+    # Extract invoice number
+    inv_match = _INVOICE_NO_RE.search(full_text)
+    if inv_match:
+        invoice_data['invoice_number'] = inv_match.group(1)
+    
+    # Extract invoice date
+    date_match = _DATE_RE.search(full_text)
+    if date_match:
+        invoice_data['invoice_date'] = date_match.group(1)
+    
+    # Extract customer number
+    cust_match = _CUST_NO_RE.search(full_text)
+    if cust_match:
+        invoice_data['customer_number'] = cust_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _extract_cm_instrumente_items(full_text: str, invoice_data: Dict) -> List[Dict]:
+    """Extract items from CM Instrumente invoice text"""
+    items = []
+    
+    # Split into lines for processing
+    lines = full_text.split('\n')
+    
+    current_order_no = ""
+    current_art_no = ""
+    current_mdl_no = ""
+    current_item = None
+    current_block = []
+    in_item_block = False
+    
+    for i, line in enumerate(lines):
+        line = line.strip()
+        
+        # Extract order number
+        order_match = _YOUR_ORDER_NO_RE.search(line)
+        if order_match:
+            current_order_no = order_match.group(1)
+        
+        # Extract article number
+        art_match = _YOUR_ART_NO_RE.search(line)
+        if art_match:
+            current_art_no = art_match.group(1)
+        
+        # Extract MDL registration number
+        mdl_match = _MDL_REG_NO_RE.search(line)
+        if mdl_match:
+            current_mdl_no = mdl_match.group(1).strip()
+        
+        # Look for item lines (POS + ARTICLE + description + qty + each + price)
+        item_match = _ITEM_LINE_RE.match(line)
+        if item_match:
+            if current_item:
+                items.append(current_item)
+            
+            position = item_match.group(1)
+            article_code = item_match.group(2)
+            description = item_match.group(3).strip()
+            quantity = item_match.group(4)
+            unit_price = item_match.group(5)
+            total_price = item_match.group(6)
+            
+            current_item = {
+                'invoice_number': invoice_data.get('invoice_number', ''),
+                'invoice_date': invoice_data.get('invoice_date', ''),
+                'customer_number': invoice_data.get('customer_number', ''),
+                'order_number': current_order_no,
+                'article_number': current_art_no,
+                'mdl_number': current_mdl_no,
+                'lot_number': '',  # Missing in this format
+                'position': position,
+                'article_code': article_code,
+                'description': description,
+                'quantity': quantity,
+                'unit_price': unit_price,
+                'total_price': total_price
+            }
+            
+            # Reset for next item
+            current_art_no = ""
+            current_mdl_no = ""
+        
+        # Continue description for multi-line items
+        elif current_item and not _YOUR_ORDER_ART_RE.match(line):
+            # Check if this line contains additional description (not metadata)
+            if not _ITEM_END_RE.search(line) and len(line) > 3:
+                current_item['description'] += ' ' + line
+    
+    # Add the last item if exists
+    if current_item:
+        items.append(current_item)
+    
+    return items
+
+# Alternative block-based approach for better accuracy
+def _extract_cm_instrumente_item_blocks(full_text: str, invoice_data: Dict) -> List[Dict]:
+    """Extract complete item blocks from CM Instrumente invoice"""
+    items = []
+    lines = full_text.split('\n')
+    
+    current_block = []
+    in_item_block = False
+    current_order_no = ""
+    
+    for i, line in enumerate(lines):
+        line = line.strip()
+        
+        # Look for start of item block (order number line)
+        if _YOUR_ORDER_NO_LINE_RE.search(line):
+            if current_block and in_item_block:
+                item = _parse_cm_instrumente_block(current_block, invoice_data, current_order_no)
+                if item:
+                    items.append(item)
+                current_block = []
+            
+            # Extract order number from this line
+            order_match = _YOUR_ORDER_NO_RE.search(line)
+            if order_match:
+                current_order_no = order_match.group(1)
+            
+            current_block.append(line)
+            in_item_block = True
+        
+        # Continue collecting lines for current block
+        elif in_item_block:
+            # Check if this is the start of a new block or end of current block
+            if (_YOUR_ORDER_NO_LINE_RE.search(line) or
+                _CARRY_OVER_TOTAL_RE.search(line) or
+                (i + 1 < len(lines) and _YOUR_ORDER_NO_LINE_RE.search(lines[i + 1].strip()))):
+                
+                # Process completed block
+                item = _parse_cm_instrumente_block(current_block, invoice_data, current_order_no)
+                if item:
+                    items.append(item)
+                current_block = []
+                
+                # If this is a new block, start collecting it
+                if _YOUR_ORDER_NO_LINE_RE.search(line):
+                    order_match = _YOUR_ORDER_NO_RE.search(line)
+                    if order_match:
+                        current_order_no = order_match.group(1)
+                    current_block.append(line)
+            else:
+                current_block.append(line)
+    
+    # Process the last block
+    if current_block:
+        item = _parse_cm_instrumente_block(current_block, invoice_data, current_order_no)
+        if item:
+            items.append(item)
+    
+    return items
+
+@timed("parse")
+def _parse_cm_instrumente_block(block: List[str], invoice_data: Dict, order_number: str) -> Optional[Dict]:
+    """Parse a complete item block from CM Instrumente invoice"""
+    if not block:
+        return None
+    
+    block_text = ' '.join(block)
+    
+    # Extract article number
+    art_match = _YOUR_ART_NO_RE.search(block_text)
+    article_number = art_match.group(1) if art_match else ""
+    
+    # Extract MDL registration number
+    mdl_match = _MDL_REG_NO_RE.search(block_text)
+    mdl_number = mdl_match.group(1).strip() if mdl_match else ""
+    
+    # Extract item line (POS + ARTICLE + description + qty + each + price)
+    item_match = _ITEM_RE.search(block_text)
+    if item_match:
+        position = item_match.group(1)
+        article_code = item_match.group(2)
+        description = item_match.group(3).strip()
+        quantity = item_match.group(4)
+        unit_price = item_match.group(5)
+        total_price = item_match.group(6)
+        
+        # Clean up description
+        description = _WHITESPACE_RE.sub(' ', description).strip()
+        
+        return {
+            'invoice_number': invoice_data.get('invoice_number', ''),
+            'invoice_date': invoice_data.get('invoice_date', ''),
+            'customer_number': invoice_data.get('customer_number', ''),
+            'order_number': order_number,
+            'article_number': article_number,
+            'mdl_number': mdl_number,
+            'lot_number': '',  # Missing
+            'position': position,
+            'article_code': article_code,
+            'description': description,
+            'quantity': quantity,
+            'unit_price': unit_price,
+            'total_price': total_price
+        }
+    
+    return None
@@ -0,0 +1,165 @@
+"""CMF invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_DATE_INVOICE_RE = re.compile(r'Date Invoice #\s*(\d{1,2}/\d{1,2}/\d{4})\s+(\d+)')
+_DATE_INVOICE_AFTER_PHONE_RE = re.compile(r'Date Invoice #\s*\d{3}-\d{3}-\d{4}\s*(\d{1,2}/\d{1,2}/\d{4})\s+(\d+)')
+_PO_RE = re.compile(r'P\.O\. No\.\s*\n.*?(\d{7})', re.IGNORECASE)
+_FB_SALES_ORDER_RE = re.compile(r'FB - Sales Order #\s*[\w\-]+\s+(\d{7})', re.IGNORECASE)
+_TERMS_ROW_PO_RE = re.compile(r'Net \d+\s+[\d/]+\s+[\w\-]+\s+(\d{7})')
+_DESCRIPTION_QTY_RATE_RE = re.compile(r'Description\s+Qty\s+Rate\s+Amount', re.IGNORECASE)
+_SUBTOTAL_SALES_TAX_RE = re.compile(r'Subtotal|Sales Tax|Total|Beginning September', re.IGNORECASE)
+_TKG_RE = re.compile(r'^TKG', re.IGNORECASE)
+_PROCESSING_AND_HANDLING_RE = re.compile(r'P & H|Processing and Handling', re.IGNORECASE)
+_ITEM_END_RE = re.compile(r'\d+\s+[\d\.]+\s+[\d\.]+$')
+_ITEM_START_RE = re.compile(r'^[A-Z]{3}:')
+_WHITESPACE_RE = re.compile(r'\s+')
+_ITEM_WITH_LOT_RE = re.compile(r'(.+?)\s+Lot#:\s*([A-Z0-9\-]+)\s+(\d+)\s+([\d\.]+)\s+([\d\.]+)$')
+_ITEM_WITHOUT_LOT_RE = re.compile(r'(.+?)\s+(\d+)\s+([\d\.]+)\s+([\d\.]+)$')
+
+
+def iter_cmf_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from CMF Medicon Surgical invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        full_text = pdf.full_text
+        
+        # Extract invoice information
+        invoice_data = _extract_cmf_invoice_info(full_text)
+        
+        # Extract items
+        items = _extract_cmf_items(full_text, invoice_data)
+        yield from items
+
+def extract_cmf_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_cmf_invoice_rows()."""
+    return list(iter_cmf_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_cmf_invoice_info(full_text: str) -> Dict[str, str]:
+    """Extract invoice information from CMF invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'po_number': ''
+    }
+    
+    # Extract invoice number and date - they are on the same line after "Date Invoice #"
+    # Pattern: "Date Invoice #\n2/26/2024 27319"
+    inv_match = _DATE_INVOICE_RE.search(full_text)
+    if inv_match:
+        invoice_data['invoice_date'] = inv_match.group(1)
+        invoice_data['invoice_number'] = inv_match.group(2)
+    else:
+        # Try alternative pattern for the second file format
+        inv_match = _DATE_INVOICE_AFTER_PHONE_RE.search(full_text)
+        if inv_match:
+            invoice_data['invoice_date'] = inv_match.group(1)
+            invoice_data['invoice_number'] = inv_match.group(2)
+    
+    # Extract PO number - it's on the line after "P.O. No." in the terms section
+    # Look for the line that contains the PO number (after the header line)
+    po_match = _PO_RE.search(full_text)
+    if not po_match:
+        # Try another pattern - look for the numbers after the sales order number
+        po_match = _FB_SALES_ORDER_RE.search(full_text)
+    if not po_match:
+        # Try looking for the PO number in the terms line
+        po_match = _TERMS_ROW_PO_RE.search(full_text)
+    
+    if po_match:
+        invoice_data['po_number'] = po_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _extract_cmf_items(full_text: str, invoice_data: Dict) -> List[Dict]:
+    """Extract items from CMF invoice text - ignore TKG records"""
+    items = []
+    
+    # Split into lines for processing
+    lines = full_text.split('\n')
+    
+    # Find the item section (after "Description Qty Rate Amount")
+    in_item_section = False
+    
+    for i, line in enumerate(lines):
+        line = line.strip()
+        
+        # Look for the start of item section
+        if _DESCRIPTION_QTY_RATE_RE.search(line):
+            in_item_section = True
+            continue
+        
+        # Look for the end of item section
+        if in_item_section and (_SUBTOTAL_SALES_TAX_RE.search(line)):
+            in_item_section = False
+            continue
+        
+        # Process item lines
+        if in_item_section and line:
+            # Skip TKG records (shipping/tracking information)
+            if _TKG_RE.match(line):
+                continue
+                
+            # Skip processing/handling fees
+            if _PROCESSING_AND_HANDLING_RE.search(line):
+                continue
+                
+            # Look for product items with quantity and price
+            # Use a more specific pattern to avoid false positives
+            if _ITEM_END_RE.search(line) and not _ITEM_START_RE.search(line):
+                item = _parse_cmf_item_line(line, invoice_data)
+                if item:
+                    items.append(item)
+    
+    return items
+
+@timed("parse")
+def _parse_cmf_item_line(line_text: str, invoice_data: Dict) -> Optional[Dict]:
+    """Parse a single item line from CMF invoice"""
+    # Pattern for CMF product items: Description + Qty + Rate + Amount
+    # Handle items with and without lot numbers
+    
+    # Pattern for items with lot number
+    match = _ITEM_WITH_LOT_RE.search(line_text)
+    
+    if match:
+        description = match.group(1).strip()
+        lot_number = match.group(2)
+        quantity = match.group(3)
+        unit_price = match.group(4)
+        total_price = match.group(5)
+    else:
+        # Pattern for items without lot number
+        match = _ITEM_WITHOUT_LOT_RE.search(line_text)
+        if match:
+            description = match.group(1).strip()
+            lot_number = ""
+            quantity = match.group(2)
+            unit_price = match.group(3)
+            total_price = match.group(4)
+        else:
+            return None
+    
+    # Clean up description
+    description = _WHITESPACE_RE.sub(' ', description).strip()
+    
+    # Ensure all invoice data is properly included
+    return {
+        'invoice_number': invoice_data.get('invoice_number', ''),
+        'invoice_date': invoice_data.get('invoice_date', ''),
+        'po_number': invoice_data.get('po_number', ''),
+        'description': description,
+        'quantity': quantity,
+        'unit_price': unit_price,
+        'total_price': total_price,
+        'lot_number': lot_number
+    }
@@ -0,0 +1,263 @@
+"""Dannoritzer invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..header import HeaderScanner
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_YOUR_ORDER_NO_OR_PO_LABEL_RE = re.compile(r'Your order no\.|PO#', re.IGNORECASE)
+# A position and code ("1 REP-N6933-92...", "2 D-4410 ...") or a bare repair code line
+_ITEM_START_RE = re.compile(r'^(?:\d+\s+[A-Z]|REP-)')
+_TOTAL_NET_PACKAGE_RE = re.compile(r'Total net|Package|Total/EUR|Payment|Terms of delivery', re.IGNORECASE)
+_YOUR_ORDER_PO_WITH_DATE_RE = re.compile(r'Your order no\.?\s*PO#\s*([A-Z0-9\s\-]+?)\s+-\s+(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_YOUR_ORDER_NO_WITH_DATE_RE = re.compile(r'Your order no\.?\s*([A-Z0-9\s\-]+?)\s+-\s+(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_YOUR_ORDER_NO_LABEL_RE = re.compile(r'Your order no\.', re.IGNORECASE)
+_GERMAN_DATE_RE = re.compile(r'(\d{2}\.\d{2}\.\d{4})')
+_YOUR_ORDER_PO_RE = re.compile(r'Your order no\.?\s*PO#\s*([A-Z0-9\s\-]+?|[A-Z0-9\s\-]+?)(?:\s+-\s+|$)', re.IGNORECASE)
+_POS_RE = re.compile(r'^(\d+)\s+')
+_ITEM_RE = re.compile(r'^\d+\s+([A-Z0-9\-]+)(.+?)\s+(\d+)\s+pcs?\.\s*([\d,]+)\s*([\d,]+)$')
+_ALT_RE = re.compile(r'^\d+\s+([A-Z0-9\-]+)(.+?)\s+(\d+)\s+([\d,]+)\s*([\d,]+)$')
+_ITEM_END_RE = re.compile(r'[\d,]+$')
+_LEADING_DIGIT_RE = re.compile(r'^\d')
+_QTY_RE = re.compile(r'\s+(\d+)\s+pcs?\.\s*[\d,]+\s*[\d,]+$')
+_PRICE_RE = re.compile(r'\s+([\d,]+)\s+([\d,]+)$')
+
+_HEADER = HeaderScanner({
+    'invoice_number': re.compile(r'INVOICE NO\.?\s*[:#]?\s*(\d+)', re.IGNORECASE),
+    'invoice_date': re.compile(r'Date\s*[:#]?\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE),
+    'customer_number': re.compile(r'Cust\.-No\.?\s*[:#]?\s*(\d+)', re.IGNORECASE),
+    # Only the note number is kept, not its date
+    'delivery_note': re.compile(r'Delivery Note[#\s]*(\d+)\s*at\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE),
+})
+
+
+def iter_dannoritzer_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Dannoritzer Medizintechnik invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_dannoritzer_invoice_info(lines)
+            
+            # Find item blocks and their associated order information
+            item_blocks = []
+            current_block = []
+            current_order_info = {'order_no': invoice_data['order_no'], 'order_date': invoice_data['order_date']}
+            in_item_block = False
+            
+            for i, line in enumerate(lines):
+                line_clean = line.strip()
+                
+                # Look for order information that might change within the invoice
+                if _YOUR_ORDER_NO_OR_PO_LABEL_RE.search(line_clean):
+                    # Extract order info from this line - CAPTURE ONLY THE NUMBER AFTER PO#
+                    # Pattern: "Your order no. PO# 07102020 - 07.10.2020" or "Your order no. PO# 02-2500097 - 07.10.2020"
+                    order_match = _YOUR_ORDER_PO_WITH_DATE_RE.search(line_clean)
+                    if order_match:
+                        current_order_info['order_no'] = order_match.group(1).strip()  # Only the number part
+                        current_order_info['order_date'] = order_match.group(2)
+                    else:
+                        # Alternative pattern for orders without PO# prefix
+                        order_match2 = _YOUR_ORDER_NO_WITH_DATE_RE.search(line_clean)
+                        if order_match2:
+                            current_order_info['order_no'] = order_match2.group(1).strip()
+                            current_order_info['order_date'] = order_match2.group(2)
+                        else:
+                            # Fallback: extract just the order number before any dash
+                            order_num_match = _YOUR_ORDER_PO_RE.search(line_clean)
+                            if order_num_match:
+                                current_order_info['order_no'] = order_num_match.group(1).strip()
+                            
+                            # Check for date separately
+                            date_match = _GERMAN_DATE_RE.search(line_clean)
+                            if date_match:
+                                current_order_info['order_date'] = date_match.group(1)
+                            elif i + 1 < len(lines):
+                                next_line = lines[i + 1].strip()
+                                date_match = _GERMAN_DATE_RE.search(next_line)
+                                if date_match:
+                                    current_order_info['order_date'] = date_match.group(1)
+                
+                # Look for lines that start with item patterns
+                if _ITEM_START_RE.match(line_clean):
+                    if current_block and in_item_block:
+                        item_blocks.append((current_block, current_order_info.copy()))
+                    current_block = [line_clean]
+                    in_item_block = True
+                elif in_item_block:
+                    # Stop when we hit summary lines or next section
+                    if _TOTAL_NET_PACKAGE_RE.search(line_clean):
+                        item_blocks.append((current_block, current_order_info.copy()))
+                        current_block = []
+                        in_item_block = False
+                    else:
+                        current_block.append(line_clean)
+            
+            if current_block and in_item_block:
+                item_blocks.append((current_block, current_order_info.copy()))
+            
+            # Process each item block with its associated order info
+            for block, order_info in item_blocks:
+                item_data = _parse_dannoritzer_item_block(block, invoice_data, order_info, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_dannoritzer_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_dannoritzer_invoice_rows()."""
+    return list(iter_dannoritzer_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_dannoritzer_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Dannoritzer invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    # Join lines for better pattern matching
+    full_text = ' '.join(lines)
+    
+    invoice_data.update(_HEADER.scan(line.strip() for line in lines))
+    
+    # Extract order information with updated patterns (capture only the number after PO#)
+    # Look for order information in the full text
+    order_match = _YOUR_ORDER_PO_WITH_DATE_RE.search(full_text)
+    if order_match and not invoice_data['order_no']:
+        invoice_data['order_no'] = order_match.group(1).strip()  # Only the number part
+        invoice_data['order_date'] = order_match.group(2)
+    
+    # Alternative pattern for order extraction (without PO# but with dash)
+    if not invoice_data['order_no']:
+        order_match2 = _YOUR_ORDER_NO_WITH_DATE_RE.search(full_text)
+        if order_match2:
+            invoice_data['order_no'] = order_match2.group(1).strip()
+            invoice_data['order_date'] = order_match2.group(2)
+    
+    # If still not found, try line-by-line extraction for complex cases
+    if not invoice_data['order_no']:
+        for i, line in enumerate(lines):
+            line_clean = line.strip()
+            
+            # Look for order number patterns with specific format
+            if _YOUR_ORDER_NO_LABEL_RE.search(line_clean):
+                # Specific pattern for "Your order no. PO# 07102020 - 07.10.2020"
+                order_match = _YOUR_ORDER_PO_WITH_DATE_RE.search(line_clean)
+                if order_match:
+                    invoice_data['order_no'] = order_match.group(1).strip()
+                    invoice_data['order_date'] = order_match.group(2)
+                    break
+                
+                # Alternative pattern without PO# but with dash
+                order_match2 = _YOUR_ORDER_NO_WITH_DATE_RE.search(line_clean)
+                if order_match2:
+                    invoice_data['order_no'] = order_match2.group(1).strip()
+                    invoice_data['order_date'] = order_match2.group(2)
+                    break
+                
+                # If date is not on the same line, check next line
+                if not invoice_data['order_date'] and i + 1 < len(lines):
+                    next_line = lines[i + 1].strip()
+                    date_match = _GERMAN_DATE_RE.search(next_line)
+                    if date_match:
+                        invoice_data['order_date'] = date_match.group(1)
+                
+                # Extract order number from this line (more specific pattern)
+                order_num_match = _YOUR_ORDER_PO_RE.search(line_clean)
+                if order_num_match and not invoice_data['order_no']:
+                    invoice_data['order_no'] = order_num_match.group(1).strip()
+                    break
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_dannoritzer_item_block(block: List[str], invoice_data: Dict, order_info: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Dannoritzer invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': order_info['order_no'],
+        'order_date': order_info['order_date'],
+        'delivery_note': invoice_data['delivery_note'],
+        'position': '',
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'total_price': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract position number
+    pos_match = _POS_RE.search(first_line)
+    if pos_match:
+        item_data['position'] = pos_match.group(1)
+    
+    # Extract item code, description, quantity, unit price, and total price
+    # Pattern: "1 REP-N6933-92Repair Novo Surgical N6933-92ECC 1 pcs. 30,00 30,00"
+    item_match = _ITEM_RE.search(first_line)
+    if item_match:
+        item_data['item_code'] = item_match.group(1).strip()
+        item_data['description'] = item_match.group(2).strip()
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(4)
+        item_data['total_price'] = item_match.group(5)
+    
+    # Alternative pattern for items without "pcs."
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = alt_match.group(1).strip()
+            item_data['description'] = alt_match.group(2).strip()
+            item_data['quantity'] = alt_match.group(3)
+            item_data['unit_price'] = alt_match.group(4)
+            item_data['total_price'] = alt_match.group(5)
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Only include lines that don't look like metadata or prices
+            if not _ITEM_END_RE.search(line) and not _LEADING_DIGIT_RE.match(line):
+                additional_desc.append(line.strip())
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # Extract quantity and price from alternative patterns if still missing
+    if not item_data['quantity']:
+        qty_match = _QTY_RE.search(first_line)
+        if qty_match:
+            item_data['quantity'] = qty_match.group(1)
+    
+    if not item_data['unit_price']:
+        price_match = _PRICE_RE.search(first_line)
+        if price_match:
+            item_data['unit_price'] = price_match.group(1)
+            item_data['total_price'] = price_match.group(2)
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
@@ -0,0 +1,204 @@
+"""Dausch invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_ITEM_START_RE = re.compile(r'^\d+\s+(?:[A-Z0-9]+\d*[A-Z]*\/|[A-Z0-9]+\d+[A-Z]*|[A-Z]+\d+)')
+_TOTAL_NET_PACKAGE_RE = re.compile(r'total net|package|total/EUR|payment|delivery', re.IGNORECASE)
+_INV_RE = re.compile(r'INVOICE\s*N?O\.?\s*[:#]?\s*(\d+)', re.IGNORECASE)
+_INV_MATCH_ALT_RE = re.compile(r'INVOICEN\s*O\.?\s*[:#]?\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*[:#]?\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUST_NO_RE = re.compile(r'Cust\.-No\.?\s*[:#]?\s*(\d+)', re.IGNORECASE)
+_DELIVERY_NOTE_NO_RE = re.compile(r'Delivery Note No\.?\s*(\d+)\s*at\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.\s*([^\s-]+)[^\d]*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_POS_RE = re.compile(r'^(\d+)\s+')
+_ITEM_RE = re.compile(r'^\d+\s+([A-Z0-9\/]+)\s+(.+?)\s+(\d+[\.,]?\d*)\s+([\d,]+)\s+([\d,]+)$')
+_ITEM_WHOLE_QTY_RE = re.compile(r'^\d+\s+([A-Z0-9\/]+)\s+(.+?)\s+(\d+)\s+([\d,]+)\s+([\d,]+)$')
+_ALT_RE = re.compile(r'^\d+\s+([A-Z0-9\/]+)\s+(.+?)\s+([\d,]+)\s+([\d,]+)$')
+_QTY_RE = re.compile(r'\s+(\d+[\.,]?\d*)\s+[\d,]+\s+[\d,]+$')
+_PRICES_RE = re.compile(r'[\d,]+')
+_LOT_RE = re.compile(r'Lot:\s*([^\s]+)', re.IGNORECASE)
+_LOT_LST_NO_RE = re.compile(r'Lot:|LST No\.|your art\.-no\.', re.IGNORECASE)
+
+_LAYOUT = TableLayout(
+    header=None,
+    # e.g. "10 75D876/6/28", "10 70D726/23" or "10 ABC123"
+    item_start=_ITEM_START_RE,
+    # Order information may change within the invoice
+    notes=(LineRule(Action.SET, _YOUR_ORDER_NO_RE, ('order_no', 'order_date')),),
+    # Summary lines end an item
+    terminator=_TOTAL_NET_PACKAGE_RE,
+)
+
+
+def iter_dausch_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Dausch Medizintechnik invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_dausch_invoice_info(lines)
+            
+            context = {'order_no': invoice_data['order_no'], 'order_date': invoice_data['order_date']}
+            for block, order_info in iter_item_blocks(lines, _LAYOUT, context):
+                item_data = _parse_dausch_item_block(block, invoice_data, order_info, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_dausch_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_dausch_invoice_rows()."""
+    return list(iter_dausch_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_dausch_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Dausch invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number - handle various formats including "INVOICEN O." issue
+        inv_match = _INV_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Alternative pattern for the specific "INVOICEN O." format
+        if not invoice_data['invoice_number']:
+            inv_match_alt = _INV_MATCH_ALT_RE.search(line_clean)
+            if inv_match_alt:
+                invoice_data['invoice_number'] = inv_match_alt.group(1)
+        
+        # Extract invoice date
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number
+        cust_match = _CUST_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract delivery note
+        delivery_match = _DELIVERY_NOTE_NO_RE.search(line_clean)
+        if delivery_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = delivery_match.group(1)
+        
+        # Extract order information
+        order_match = _YOUR_ORDER_NO_RE.search(line_clean)
+        if order_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = order_match.group(1)
+            invoice_data['order_date'] = order_match.group(2)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_dausch_item_block(block: List[str], invoice_data: Dict, order_info: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Dausch invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': order_info['order_no'],
+        'order_date': order_info['order_date'],
+        'delivery_note': invoice_data['delivery_note'],
+        'position': '',
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'total_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract position number
+    pos_match = _POS_RE.search(first_line)
+    if pos_match:
+        item_data['position'] = pos_match.group(1)
+    
+    # Extract item code, description, quantity, unit price, and total price
+    # Pattern for Dausch format: "10 75D876/6/28 Cup shaped Forceps 6mm 146,08 292,16"
+    item_match = _ITEM_RE.search(first_line)
+    if not item_match:
+        # Alternative pattern: "10 70D726/23 KLEINSASSER Alligator Forceps 1 108,41 108,41"
+        item_match = _ITEM_WHOLE_QTY_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1).strip()
+        item_data['description'] = item_match.group(2).strip()
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(4)
+        item_data['total_price'] = item_match.group(5)
+    
+    # Alternative pattern for different formatting
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = alt_match.group(1).strip()
+            item_data['description'] = alt_match.group(2).strip()
+            # Assume quantity is 1 if not specified
+            item_data['quantity'] = '1'
+            item_data['unit_price'] = alt_match.group(3)
+            item_data['total_price'] = alt_match.group(4)
+    
+    # Extract quantity from alternative patterns if still missing
+    if not item_data['quantity']:
+        qty_match = _QTY_RE.search(first_line)
+        if qty_match:
+            item_data['quantity'] = qty_match.group(1)
+    
+    # Extract prices from alternative patterns if still missing
+    if not item_data['unit_price']:
+        prices = _PRICES_RE.findall(first_line)
+        if len(prices) >= 2:
+            item_data['unit_price'] = prices[-2]
+            item_data['total_price'] = prices[-1]
+    
+    # Extract lot number from the block
+    for line in block:
+        lot_match = _LOT_RE.search(line)
+        if lot_match:
+            item_data['lot'] = lot_match.group(1)
+            break
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Only include lines that don't look like metadata
+            if not _LOT_LST_NO_RE.search(line):
+                additional_desc.append(line.strip())
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
@@ -0,0 +1,209 @@
+"""Efinger invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_DESCRIPTION_QUANTITY_PRICE_RE = re.compile(r'Description\s+Quantity\s+Price\s+Total EUR', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+[A-Z]')
+_CARRY_OVER_NET_RE = re.compile(r'Carry-over|Net Amount|Total EUR', re.IGNORECASE)
+_CARRY_OVER_NET_CLOSING_RE = re.compile(r'Carry-over|Net Amount|Total EUR|Based on delivery|Thank you for', re.IGNORECASE)
+_INVOICE_RE = re.compile(r'A/R Invoice', re.IGNORECASE)
+_DOCUMENT_NO_DATE_RE = re.compile(r'Document No\.|Date|Page', re.IGNORECASE)
+_DOC_RE = re.compile(r'^(\d+)\s+([\d/]+)\s+\d+\s*/\s*\d+$')
+_BASED_ON_DELIVERY_RE = re.compile(r'Based on delivery\s+(\d+)\s+from', re.IGNORECASE)
+_ORDER_RE = re.compile(r'Ref\.\s+.+?(\d{5,})')
+_ITEM_RE = re.compile(r'^\d+\s+([A-Z][^0-9]+?)\s+(\d+\.\d+)\s+Stck\s+([\d,]+\.\d+)\s+([\d,]+\.\d+)', re.IGNORECASE)
+_ALT_RE = re.compile(r'^\d+\s+([A-Z].+?)\s+([\d,]+\.\d+)\s+([\d,]+\.\d+)\s+([\d,]+\.\d+)', re.IGNORECASE)
+_ITEM_CODE_RE = re.compile(r'Item Code:\s*([^\s]+)', re.IGNORECASE)
+_BATCH_NR_RE = re.compile(r'Batch-Nr\.\s*([^\s]+)', re.IGNORECASE)
+_BASED_ON_YOUR_RE = re.compile(r'Based on your Purchase Order\s+([^\s.,;]+)', re.IGNORECASE)
+_ITEM_CODE_BATCH_RE = re.compile(r'Item Code:|Batch-Nr\.|Based on your Purchase Order|Product Information', re.IGNORECASE)
+_CLEAN_LINE_RE = re.compile(r'^\d+\s+')
+_BLANK_RE = re.compile(r'^\s*$')
+_QTY_RE = re.compile(r'\s+(\d+\.\d+)\s+Stck\s+', re.IGNORECASE)
+_PRICES_RE = re.compile(r'[\d,]+\.\d+')
+
+_LAYOUT = TableLayout(
+    header=_DESCRIPTION_QUANTITY_PRICE_RE,
+    header_words=('Description', 'Quantity', 'Price'),
+    # A number followed by the product name
+    item_start=_ITEM_START_RE,
+    # The purchase order may change within the invoice
+    notes=(LineRule(Action.SET, _BASED_ON_YOUR_RE, ('order_no',)),),
+    # Summary lines never start an item, and end one
+    start_unless=_CARRY_OVER_NET_RE,
+    terminator=_CARRY_OVER_NET_CLOSING_RE,
+)
+
+
+def iter_efinger_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Efinger Instruments invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_efinger_invoice_info(lines)
+            
+            for block, order_info in iter_item_blocks(lines, _LAYOUT, {'order_no': invoice_data['order_no']}):
+                item_data = _parse_efinger_item_block(block, invoice_data, order_info, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_efinger_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_efinger_invoice_rows()."""
+    return list(iter_efinger_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_efinger_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Efinger invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'order_no': '',
+        'delivery_note': ''
+    }
+    
+    # Look for the specific header line pattern
+    header_found = False
+    for i, line in enumerate(lines):
+        line_clean = line.strip()
+        
+        # Look for the "A/R Invoice" line to identify the start of the header
+        if _INVOICE_RE.search(line_clean):
+            header_found = True
+            continue
+        
+        # After finding "A/R Invoice", look for the next line with document details
+        if header_found and _DOCUMENT_NO_DATE_RE.search(line_clean):
+            # The next line should contain the actual values
+            if i + 1 < len(lines):
+                values_line = lines[i + 1].strip()
+                # Extract invoice number, date, and page from values line
+                # Pattern: "102400312 4/17/2024 1 / 5"
+                doc_match = _DOC_RE.search(values_line)
+                if doc_match:
+                    invoice_data['invoice_number'] = doc_match.group(1)
+                    invoice_data['invoice_date'] = doc_match.group(2)
+                    break
+        
+        # Extract delivery note information
+        delivery_match = _BASED_ON_DELIVERY_RE.search(line_clean)
+        if delivery_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = delivery_match.group(1)
+        
+        # Extract order information from reference line
+        order_match = _ORDER_RE.search(line_clean)
+        if order_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = order_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_efinger_item_block(block: List[str], invoice_data: Dict, order_info: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Efinger invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'order_no': order_info['order_no'],
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'total_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract item code, description, quantity, unit price, and total price
+    # Pattern for Efinger format: "1 BELLUCCI MICRO SCISSORS 1.00 Stck 109.90 109.90"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['description'] = item_match.group(1).strip()
+        item_data['quantity'] = item_match.group(2)
+        item_data['unit_price'] = item_match.group(3)
+        item_data['total_price'] = item_match.group(4)
+    
+    # Alternative pattern for different formatting
+    if not item_data['description']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['description'] = alt_match.group(1).strip()
+            item_data['quantity'] = alt_match.group(2)
+            item_data['unit_price'] = alt_match.group(3)
+            item_data['total_price'] = alt_match.group(4)
+    
+    # Extract item code from the block
+    for line in block:
+        code_match = _ITEM_CODE_RE.search(line)
+        if code_match:
+            item_data['item_code'] = code_match.group(1)
+            break
+    
+    # Extract batch number from the block
+    for line in block:
+        batch_match = _BATCH_NR_RE.search(line)
+        if batch_match:
+            item_data['lot'] = batch_match.group(1)
+            break
+    
+    # Extract purchase order from the block if not already set
+    if not item_data['order_no']:
+        for line in block:
+            po_match = _BASED_ON_YOUR_RE.search(line)
+            if po_match:
+                item_data['order_no'] = po_match.group(1)
+                break
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Only include lines that don't look like metadata
+            if not _ITEM_CODE_BATCH_RE.search(line):
+                clean_line = _CLEAN_LINE_RE.sub('', line.strip())  # Remove position numbers from continuation lines
+                if clean_line and not _BLANK_RE.match(clean_line):
+                    additional_desc.append(clean_line)
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # Extract quantity from alternative patterns if still missing
+    if not item_data['quantity']:
+        qty_match = _QTY_RE.search(first_line)
+        if qty_match:
+            item_data['quantity'] = qty_match.group(1)
+    
+    # Extract prices from alternative patterns if still missing
+    if not item_data['unit_price']:
+        prices = _PRICES_RE.findall(first_line)
+        if len(prices) >= 2:
+            item_data['unit_price'] = prices[-2]
+            item_data['total_price'] = prices[-1]
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
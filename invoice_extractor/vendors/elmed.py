@@ -0,0 +1,193 @@
+"""ELMED invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_ORDER_SHIP_ITEM_RE = re.compile(r'Order\s+Ship\s+B/O\s+Item No\.\s+Description\s+Price Each\s+Amount', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\d+\s+\d*\s*[A-Z0-9]')
+_SUBTOTAL_TOTAL_THANK_RE = re.compile(r'Subtotal|Total|Thank you', re.IGNORECASE)
+_SUBTOTAL_TOTAL_THANK_TRACKING_RE = re.compile(r'Subtotal|Total|Thank you|UPS TRACKING', re.IGNORECASE)
+_DATE_INV_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})\s+(\d+)')
+_NUMBER_DATE_TERMS_RE = re.compile(r'P\.O\. Number\s+P\.O\. Date\s+Terms', re.IGNORECASE)
+_PO_RE = re.compile(r'^(\d+)\s+(\d{1,2}/\d{1,2}/\d{4})')
+_UPS_TRACKING_RE = re.compile(r'UPS TRACKING #:\s*([^\s]+)', re.IGNORECASE)
+_ITEM_RE = re.compile(r'^(\d+)\s+(\d+)\s+\d*\s*([A-Z0-9-]+)\s+(.+?)\s+([\d,]+\.\d+)\s+([\d,]+\.\d+)$')
+_ALT_RE = re.compile(r'^(\d+)\s+(\d+)\s+([A-Z0-9-]+)\s+(.+?)\s+([\d,]+\.\d+)\s+([\d,]+\.\d+)$')
+_HNDL_PACKING_AND_RE = re.compile(r'HNDL PACKING AND HANDLING', re.IGNORECASE)
+_HANDLING_CHARGE_LINE_RE = re.compile(r'^(\d+)\s+(\d+)\s+(HNDL)\s+(PACKING AND HANDLING)\s+([\d,]+\.\d+)\s+([\d,]+\.\d+)$', re.IGNORECASE)
+_UDI_THANK_YOU_RE = re.compile(r'UDI#|Thank you|Subtotal|Total', re.IGNORECASE)
+_ITEM_START_LOOSE_RE = re.compile(r'^\d+\s+\d+')
+_UDI_RE = re.compile(r'UDI#:\s*([^\s]+)', re.IGNORECASE)
+_PRICES_RE = re.compile(r'[\d,]+\.\d+')
+
+_LAYOUT = TableLayout(
+    header=_ORDER_SHIP_ITEM_RE,
+    header_words=('Order', 'Ship', 'B/O'),
+    # Order and shipped quantities followed by the item number
+    item_start=_ITEM_START_RE,
+    # Summary lines never start an item
+    start_unless=_SUBTOTAL_TOTAL_THANK_RE,
+    # Summary lines end an item
+    terminator=_SUBTOTAL_TOTAL_THANK_TRACKING_RE,
+)
+
+
+def iter_elmed_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from ELMED Incorporated invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_elmed_invoice_info(lines)
+            
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_elmed_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_elmed_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_elmed_invoice_rows()."""
+    return list(iter_elmed_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_elmed_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from ELMED invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for i, line in enumerate(lines):
+        line_clean = line.strip()
+        
+        # Extract invoice number and date from the header section
+        # Pattern: "9/11/2024 2409221" or "2/26/2025 2502692"
+        date_inv_match = _DATE_INV_RE.search(line_clean)
+        if date_inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_date'] = date_inv_match.group(1)
+            invoice_data['invoice_number'] = date_inv_match.group(2)
+        
+        # Extract PO number and date - look for the header line first
+        if _NUMBER_DATE_TERMS_RE.search(line_clean):
+            # The next line should contain the actual values
+            if i + 1 < len(lines):
+                values_line = lines[i + 1].strip()
+                # Pattern: "0016332 06/17/2024 Net 30 10/11/2024 SS 9/11/2024 UPS GROUND"
+                po_match = _PO_RE.search(values_line)
+                if po_match:
+                    invoice_data['order_no'] = po_match.group(1)
+                    invoice_data['order_date'] = po_match.group(2)
+        
+        # Extract tracking number as delivery note
+        tracking_match = _UPS_TRACKING_RE.search(line_clean)
+        if tracking_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = tracking_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_elmed_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from ELMED invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'order_no': invoice_data['order_no'],
+        'order_date': invoice_data['order_date'],
+        'delivery_note': invoice_data['delivery_note'],
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'total_price': '',
+        'lot': '',  # ELMED doesn't seem to show lot numbers
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract order quantity, ship quantity, item code, description, prices
+    # Pattern: "6 6 G1911-68 TITANIUM JEWELER BIPOLAR FORCEPS, 162.00 972.00"
+    # or "1 1 9014-4054FDI 5MM, 45CM, CLEAR FLUSH, WAVE 646.75 646.75"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['quantity'] = item_match.group(2)  # Use ship quantity
+        item_data['item_code'] = item_match.group(3).strip()
+        item_data['description'] = item_match.group(4).strip()
+        item_data['unit_price'] = item_match.group(5)
+        item_data['total_price'] = item_match.group(6)
+    
+    # Alternative pattern for handling items without B/O column
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['quantity'] = alt_match.group(2)
+            item_data['item_code'] = alt_match.group(3).strip()
+            item_data['description'] = alt_match.group(4).strip()
+            item_data['unit_price'] = alt_match.group(5)
+            item_data['total_price'] = alt_match.group(6)
+    
+    # Handle packing/handling items
+    if not item_data['item_code'] and _HNDL_PACKING_AND_RE.search(first_line):
+        hndl_match = _HANDLING_CHARGE_LINE_RE.search(first_line)
+        if hndl_match:
+            item_data['quantity'] = hndl_match.group(2)
+            item_data['item_code'] = hndl_match.group(3).strip()
+            item_data['description'] = hndl_match.group(4).strip()
+            item_data['unit_price'] = hndl_match.group(5)
+            item_data['total_price'] = hndl_match.group(6)
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Skip lines that look like metadata or continuation of other items
+            if not _UDI_THANK_YOU_RE.search(line):
+                clean_line = line.strip()
+                if clean_line and not _ITEM_START_LOOSE_RE.match(clean_line):  # Don't include lines that start like new items
+                    additional_desc.append(clean_line)
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # Extract UDI number if present (as lot number equivalent)
+    for line in block:
+        udi_match = _UDI_RE.search(line)
+        if udi_match:
+            item_data['lot'] = udi_match.group(1)
+            break
+    
+    # Extract prices from alternative patterns if still missing
+    if not item_data['unit_price']:
+        prices = _PRICES_RE.findall(first_line)
+        if len(prices) >= 2:
+            item_data['unit_price'] = prices[-2]
+            item_data['total_price'] = prices[-1]
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
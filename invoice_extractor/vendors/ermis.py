@@ -0,0 +1,202 @@
+"""Ermis MedTech invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ARTICLE_DESCRIPTION_RE = re.compile(r'POS\s+article\s+description\s+qty\.\s+each\s+price', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+[^0-9]')
+_TOTAL_NET_PACKAGE_RE = re.compile(r'total net|package|freight|Total/EUR', re.IGNORECASE)
+_TOTAL_NET_PAYMENT_DELIVERY_RE = re.compile(r'total net|package|freight|Total/EUR|payment|delivery', re.IGNORECASE)
+_PROFORMA_INVOICE_RE = re.compile(r'PROFORMA-INVOICE\s*[:#]?\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*[:#]?\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUST_NO_RE = re.compile(r'Cust\.-No\.?\s*[:#]?\s*(\d+)', re.IGNORECASE)
+_YOUR_INQ_NO_RE = re.compile(r'Your inq\. No\.\s*([^\s-]+)[^\d]*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_REF_NO_RE = re.compile(r'Ref-No\.:\s*([^\s]+)', re.IGNORECASE)
+_DELIVERY_RE = re.compile(r'Delivery\s*:\s*([^\n]+)', re.IGNORECASE)
+_LEADING_POSITION_RE = re.compile(r'^\d+\s+')
+_ITEM_RE = re.compile(r'^([A-Z0-9\.-]+)\s+(.+?)\s+(\d+)pcs\s+([\d,]+)\s+([\d,]+)$', re.IGNORECASE)
+_ALT_RE = re.compile(r'^([A-Z]+)\s+(.+?)\s+(\d+)pcs\.?\s+([\d,]+)\s+([\d,]+)$', re.IGNORECASE)
+_REF_NO_TOTAL_RE = re.compile(r'Ref-No\.|total net|package|freight', re.IGNORECASE)
+_PRICES_RE = re.compile(r'[\d,]+')
+_QTY_RE = re.compile(r'\s+(\d+)pcs', re.IGNORECASE)
+
+_LAYOUT = TableLayout(
+    header=_POS_ARTICLE_DESCRIPTION_RE,
+    header_words=('POS', 'article', 'description'),
+    # A position number followed by the article
+    item_start=_ITEM_START_RE,
+    preamble=(LineRule(Action.SET, _REF_NO_RE, ('ref_no',)),),
+    # Order information may change within the invoice
+    notes=(LineRule(Action.SET, _YOUR_INQ_NO_RE, ('order_no', 'order_date')),),
+    start_unless=_TOTAL_NET_PACKAGE_RE,
+    # Summary lines end an item
+    terminator=_TOTAL_NET_PAYMENT_DELIVERY_RE,
+)
+
+
+def iter_ermis_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Ermis MedTech invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_ermis_invoice_info(lines)
+            
+            context = {'order_no': invoice_data['order_no'], 'order_date': invoice_data['order_date'],
+                       'ref_no': invoice_data.get('ref_no', '')}
+            for block, order_info in iter_item_blocks(lines, _LAYOUT, context):
+                item_data = _parse_ermis_item_block(block, invoice_data, order_info, order_info['ref_no'], page_num)
+                if item_data:
+                    yield item_data
+
+def extract_ermis_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_ermis_invoice_rows()."""
+    return list(iter_ermis_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_ermis_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Ermis invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': '',
+        'ref_no': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number (PROFORMA-INVOICE)
+        inv_match = _PROFORMA_INVOICE_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number
+        cust_match = _CUST_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract order information
+        order_match = _YOUR_INQ_NO_RE.search(line_clean)
+        if order_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = order_match.group(1)
+            invoice_data['order_date'] = order_match.group(2)
+        
+        # Extract Ref-No.
+        ref_match = _REF_NO_RE.search(line_clean)
+        if ref_match and not invoice_data['ref_no']:
+            invoice_data['ref_no'] = ref_match.group(1)
+        
+        # Extract delivery method
+        delivery_match = _DELIVERY_RE.search(line_clean)
+        if delivery_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = delivery_match.group(1).strip()
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_ermis_item_block(block: List[str], invoice_data: Dict, order_info: Dict, ref_no: str, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Ermis invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': order_info['order_no'],
+        'order_date': order_info['order_date'],
+        'delivery_note': invoice_data['delivery_note'],
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'total_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # Use Ref-No. as item code if available
+    if ref_no:
+        item_data['item_code'] = ref_no
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Remove position number from the beginning
+    first_line = _LEADING_POSITION_RE.sub('', first_line).strip()
+    
+    # Extract item code, description, quantity, unit price, and total price
+    # Pattern: "ER290.100 3/4 Wire Basket 4pcs 92,93 371,72"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1).strip()  # Override Ref-No with actual item code
+        item_data['description'] = item_match.group(2).strip()
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(4)
+        item_data['total_price'] = item_match.group(5)
+    
+    # Alternative pattern for service items without proper item codes
+    if not item_data['quantity']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = alt_match.group(1).strip()
+            item_data['description'] = alt_match.group(2).strip()
+            item_data['quantity'] = alt_match.group(3)
+            item_data['unit_price'] = alt_match.group(4)
+            item_data['total_price'] = alt_match.group(5)
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Only include lines that don't look like metadata or new items
+            if not _REF_NO_TOTAL_RE.search(line):
+                clean_line = line.strip()
+                if clean_line and not _LEADING_POSITION_RE.match(clean_line):  # Don't include lines that start like new items
+                    additional_desc.append(clean_line)
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # Extract prices from alternative patterns if still missing
+    if not item_data['unit_price']:
+        prices = _PRICES_RE.findall(first_line)
+        if len(prices) >= 2:
+            item_data['unit_price'] = prices[-2]
+            item_data['total_price'] = prices[-1]
+            # Try to extract quantity if still missing
+            if not item_data['quantity']:
+                qty_match = _QTY_RE.search(first_line)
+                if qty_match:
+                    item_data['quantity'] = qty_match.group(1)
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
@@ -0,0 +1,169 @@
+"""ESMA invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_QTY_UNITS_DESCRIPTION_RE = re.compile(r'QTY\s+UNITS\s+DESCRIPTION\s+ITEM\s+RATE\s+AMOUNT', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+[A-Za-z]')
+_TOTAL_SHIPPING_CHARGES_RE = re.compile(r'Total|Shipping Charges|Shipped', re.IGNORECASE)
+_TOTAL_SHIPPING_OR_PAY_FROM_RE = re.compile(r'Total|Shipping Charges|Shipped|PAY FROM INVOICE', re.IGNORECASE)
+_DATE_INV_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})\s+(\d+)')
+_TRACKING_RE = re.compile(r'Trk#\s*([^\s]+)', re.IGNORECASE)
+_ITEM_RE = re.compile(r'^(\d+)\s+(.+?)\s+([\d,]+\.\d+)\s+([\d,]+\.\d+)$')
+_ITEM_LINE_RE = re.compile(r'^[A-Z0-9]+$')
+_SHIPPING_CHARGES_RE = re.compile(r'Shipping Charges', re.IGNORECASE)
+_SHIPPING_CHARGES_LINE_RE = re.compile(r'^(\d+)\s+Shipping Charges\s+([\d,]+\.\d+)\s+([\d,]+\.\d+)$', re.IGNORECASE)
+_SHIPPED_TRK_TOTAL_RE = re.compile(r'Shipped|Trk#|Total', re.IGNORECASE)
+_LEADING_POSITION_RE = re.compile(r'^\d+\s+')
+_SHIPPED_RE = re.compile(r'Shipped\s+([\d/]+)', re.IGNORECASE)
+
+_LAYOUT = TableLayout(
+    header=_QTY_UNITS_DESCRIPTION_RE,
+    header_words=('QTY', 'UNITS', 'DESCRIPTION'),
+    # A quantity followed by the description
+    item_start=_ITEM_START_RE,
+    # Summary lines never start an item
+    start_unless=_TOTAL_SHIPPING_CHARGES_RE,
+    # Summary lines end an item
+    terminator=_TOTAL_SHIPPING_OR_PAY_FROM_RE,
+)
+
+
+def iter_esma_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from ESMA invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_esma_invoice_info(lines)
+            
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_esma_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_esma_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_esma_invoice_rows()."""
+    return list(iter_esma_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_esma_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from ESMA invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'order_no': '',  # PO number not shown in the extract
+        'delivery_note': ''
+    }
+    
+    for i, line in enumerate(lines):
+        line_clean = line.strip()
+        
+        # Extract invoice number and date from the combined line
+        # Pattern: "7/6/2023 53155"
+        date_inv_match = _DATE_INV_RE.search(line_clean)
+        if date_inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_date'] = date_inv_match.group(1)
+            invoice_data['invoice_number'] = date_inv_match.group(2)
+        
+        # Extract tracking number as delivery note
+        tracking_match = _TRACKING_RE.search(line_clean)
+        if tracking_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = tracking_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_esma_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from ESMA invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'order_no': invoice_data['order_no'],
+        'delivery_note': invoice_data['delivery_note'],
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'total_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract quantity, description, and prices
+    # Pattern: "1 Relay 3PDT, 15A, 24VDC Coil 080X 27.00 27.00"
+    # But looking at the extract, it seems like "080X" might be part of description
+    
+    # First try to extract the basic pattern with quantity, description, prices
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['quantity'] = item_match.group(1)
+        item_data['description'] = item_match.group(2).strip()
+        item_data['unit_price'] = item_match.group(3)
+        item_data['total_price'] = item_match.group(4)
+        
+        # Try to extract item code from description (last word that looks like a code)
+        words = item_data['description'].split()
+        if words:
+            last_word = words[-1]
+            if _ITEM_LINE_RE.match(last_word) and len(last_word) >= 3:
+                item_data['item_code'] = last_word
+                item_data['description'] = ' '.join(words[:-1]).strip()
+    
+    # Handle shipping charges separately
+    if not item_data['quantity'] and _SHIPPING_CHARGES_RE.search(first_line):
+        shipping_match = _SHIPPING_CHARGES_LINE_RE.search(first_line)
+        if shipping_match:
+            item_data['quantity'] = shipping_match.group(1)
+            item_data['description'] = 'Shipping Charges'
+            item_data['item_code'] = 'SHIPPING'
+            item_data['unit_price'] = shipping_match.group(2)
+            item_data['total_price'] = shipping_match.group(3)
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Skip lines that look like metadata or shipping info
+            if not _SHIPPED_TRK_TOTAL_RE.search(line):
+                clean_line = line.strip()
+                if clean_line and not _LEADING_POSITION_RE.match(clean_line):  # Don't include lines that start like new items
+                    additional_desc.append(clean_line)
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # Extract shipped date if available
+    for line in block:
+        shipped_match = _SHIPPED_RE.search(line)
+        if shipped_match:
+            item_data['shipped_date'] = shipped_match.group(1)
+            break
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
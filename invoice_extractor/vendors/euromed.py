@@ -0,0 +1,276 @@
+"""EUROMED invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_QUANTITY_DESCRIPTION_OF_RE = re.compile(r'QUANTITY & DESCRIPTION OF GOODS', re.IGNORECASE)
+_PARCEL_RE = re.compile(r'PARCEL\s+(\d+)', re.IGNORECASE)
+_PO_RE = re.compile(r'^(\d+)\s+([A-Z]\d+-\d+)')
+_EXCESS_QTY_RE = re.compile(r'^Excess Qty\s+([A-Z]\d+-\d+)', re.IGNORECASE)
+_TOTAL_USD_CERTIFIED_RE = re.compile(r'Total USD:|CERTIFIED TO BE CORRECT', re.IGNORECASE)
+_INVOICE_NO_DATED_RE = re.compile(r'Invoice No\s*:\s*([^\s]+)\s+Dated\s*:\s*([\d/]+)', re.IGNORECASE)
+_AWB_NO_RE = re.compile(r'AWB No\s*:\s*([^\s]+)', re.IGNORECASE)
+_PO_NO_ITEM_RE = re.compile(r'PO No\s+Item Description', re.IGNORECASE)
+_ITEM_RE = re.compile(r'^(\d+)\s+([A-Z]\d+-\d+)\s+(.+?)\s+(\d+)\s+PCS\s+([\d,]+\.\d+)\s+([\d,]+\.\d+)$', re.IGNORECASE)
+_EXCESS_QTY_PCS_RE = re.compile(r'^Excess Qty\s+([A-Z]\d+-\d+)\s+(.+?)\s+(\d+)\s+PCS\s+([\d,]+\.\d+)\s+([\d,]+\.\d+)$', re.IGNORECASE)
+_ALT_RE = re.compile(r'^(\d+)\s+([A-Z]\d+-\d+)\s+(.+?)\s+(\d+)\s+([\d,]+\.\d+)\s+([\d,]+\.\d+)$')
+_GTN_NUMBER_RE = re.compile(r'GTN\s*#\s*([A-Z0-9]{8,})', re.IGNORECASE)
+_GTIN_NUMBER_RE = re.compile(r'GTIN\s*#\s*([A-Z0-9]{8,})', re.IGNORECASE)
+_ITEM_END_RE = re.compile(r'[\d,]+\.\d+\s+[\d,]+\.\d+$')
+_BARE_GTIN_RE = re.compile(r'^([A-Z0-9]{8,})$')
+_TRAILING_GTN_LABEL_RE = re.compile(r'GTN\s*#\s*$', re.IGNORECASE)
+_TRAILING_GTIN_LABEL_RE = re.compile(r'GTIN\s*#\s*$', re.IGNORECASE)
+_ITEM_LINE_RE = re.compile(r'^[A-Z0-9]{8,}$')
+_TOTAL_USD_PARCEL_RE = re.compile(r'Total USD|PARCEL', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+[A-Z]')
+_EXCESS_QTY_LABEL_RE = re.compile(r'^Excess Qty', re.IGNORECASE)
+
+
+def iter_euromed_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Euromed invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_euromed_invoice_info(lines)
+            
+            # Find item blocks by looking for product lines
+            item_blocks = []
+            current_block = []
+            current_po_info = {'order_no': invoice_data['order_no']}
+            current_parcel = ''
+            in_item_block = False
+            in_items_section = False
+            
+            for i, line in enumerate(lines):
+                line_clean = line.strip()
+                
+                # Look for the start of the items section
+                if _QUANTITY_DESCRIPTION_OF_RE.search(line_clean):
+                    in_items_section = True
+                    continue
+                
+                if not in_items_section:
+                    continue
+                
+                # Look for parcel sections
+                parcel_match = _PARCEL_RE.search(line_clean)
+                if parcel_match:
+                    current_parcel = parcel_match.group(1)
+                    continue
+                
+                # Look for PO number lines
+                po_match = _PO_RE.search(line_clean)
+                if po_match:
+                    current_po_info['order_no'] = po_match.group(1)
+                    if current_block and in_item_block:
+                        item_blocks.append((current_block, current_po_info.copy(), current_parcel))
+                    current_block = [line_clean]
+                    in_item_block = True
+                    continue
+                
+                # Look for excess quantity lines (start with "Excess Qty")
+                excess_match = _EXCESS_QTY_RE.search(line_clean)
+                if excess_match:
+                    if current_block and in_item_block:
+                        item_blocks.append((current_block, current_po_info.copy(), current_parcel))
+                    current_block = [line_clean]
+                    in_item_block = True
+                    continue
+                
+                # Continue current item block
+                if in_item_block:
+                    # Stop when we hit summary lines
+                    if (_PO_RE.search(line_clean) or
+                        _TOTAL_USD_CERTIFIED_RE.search(line_clean) or
+                        _PARCEL_RE.search(line_clean)):
+                        
+                        item_blocks.append((current_block, current_po_info.copy(), current_parcel))
+                        current_block = [line_clean] if _PO_RE.search(line_clean) else []
+                        in_item_block = bool(_PO_RE.search(line_clean))
+                    else:
+                        current_block.append(line_clean)
+            
+            if current_block and in_item_block:
+                item_blocks.append((current_block, current_po_info.copy(), current_parcel))
+            
+            # Process each item block
+            for block, po_info, parcel in item_blocks:
+                item_data = _parse_euromed_item_block(block, invoice_data, po_info, parcel, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_euromed_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_euromed_invoice_rows()."""
+    return list(iter_euromed_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_euromed_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Euromed invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'order_no': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number and date
+        inv_match = _INVOICE_NO_DATED_RE.search(line_clean)
+        if inv_match:
+            invoice_data['invoice_number'] = inv_match.group(1)
+            invoice_data['invoice_date'] = inv_match.group(2)
+        
+        # Extract AWB number as delivery note
+        awb_match = _AWB_NO_RE.search(line_clean)
+        if awb_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = awb_match.group(1)
+        
+        # Extract PO number from the items section header (fallback)
+        po_match = _PO_NO_ITEM_RE.search(line_clean)
+        if po_match and not invoice_data['order_no']:
+            # PO numbers are extracted per item in the parsing function
+            pass
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_euromed_item_block(block: List[str], invoice_data: Dict, po_info: Dict, parcel: str, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Euromed invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'order_no': po_info['order_no'],
+        'delivery_note': invoice_data['delivery_note'],
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'total_price': '',
+        'lot': '',
+        'parcel': parcel,
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Pattern 1: Regular items "0017240 G6561-65 harrington forceps... 18 PCS 25.00 450.00"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['order_no'] = item_match.group(1)
+        item_data['item_code'] = item_match.group(2)
+        item_data['description'] = item_match.group(3).strip()
+        item_data['quantity'] = item_match.group(4)
+        item_data['unit_price'] = item_match.group(5)
+        item_data['total_price'] = item_match.group(6)
+    
+    # Pattern 2: Excess quantity items "Excess Qty G6561-65 harrington forceps... 6 PCS 25.00 150.00"
+    if not item_data['item_code']:
+        excess_match = _EXCESS_QTY_PCS_RE.search(first_line)
+        if excess_match:
+            item_data['item_code'] = excess_match.group(1)
+            item_data['description'] = excess_match.group(2).strip()
+            item_data['quantity'] = excess_match.group(3)
+            item_data['unit_price'] = excess_match.group(4)
+            item_data['total_price'] = excess_match.group(5)
+    
+    # Pattern 3: Alternative format without PCS abbreviation
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['order_no'] = alt_match.group(1)
+            item_data['item_code'] = alt_match.group(2)
+            item_data['description'] = alt_match.group(3).strip()
+            item_data['quantity'] = alt_match.group(4)
+            item_data['unit_price'] = alt_match.group(5)
+            item_data['total_price'] = alt_match.group(6)
+    
+    # Extract GTIN number with improved logic for alphanumeric GTINs
+    gtin_found = False
+    
+    # First, check if there's a proper GTIN number after "GTN #" or "GTIN #"
+    for i, line in enumerate(block):
+        # Look for "GTN #" or "GTIN #" followed by alphanumeric GTIN (not the quantity)
+        # GTIN can be alphanumeric like "G586G6561650"
+        gtin_match = _GTN_NUMBER_RE.search(line)
+        if not gtin_match:
+            gtin_match = _GTIN_NUMBER_RE.search(line)
+        
+        if gtin_match:
+            item_data['lot'] = gtin_match.group(1)
+            gtin_found = True
+            break
+    
+    # If no GTIN found after "GTN #", check the next line after prices for a GTIN
+    if not gtin_found and len(block) > 1:
+        for i in range(len(block)):
+            current_line = block[i].strip()
+            
+            # Check if this line has prices (indicating it's the main item line)
+            if _ITEM_END_RE.search(current_line):
+                # Check the next line for a GTIN sequence
+                if i + 1 < len(block):
+                    next_line = block[i + 1].strip()
+                    gtin_match = _BARE_GTIN_RE.search(next_line)
+                    if gtin_match:
+                        item_data['lot'] = gtin_match.group(1)
+                        gtin_found = True
+                        break
+    
+    # Clean up description - remove GTN # reference if no GTIN was captured after it
+    if not gtin_found:
+        # Remove "GTN #" or "GTIN #" and any trailing spaces from description
+        item_data['description'] = _TRAILING_GTN_LABEL_RE.sub('', item_data['description']).strip()
+        item_data['description'] = _TRAILING_GTIN_LABEL_RE.sub('', item_data['description']).strip()
+    else:
+        # If GTIN was found, remove the GTIN reference and the GTIN itself from description
+        item_data['description'] = _GTN_NUMBER_RE.sub('', item_data['description']).strip()
+        item_data['description'] = _GTIN_NUMBER_RE.sub('', item_data['description']).strip()
+    
+    # For multi-line descriptions, combine them (excluding GTIN lines)
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for i, line in enumerate(block[1:]):
+            clean_line = line.strip()
+            
+            # Skip lines that are just GTIN numbers or empty
+            if (_ITEM_LINE_RE.match(clean_line) or  # Lines with just GTINs
+                _TOTAL_USD_PARCEL_RE.search(clean_line) or
+                not clean_line):
+                continue
+                
+            # Don't include lines that start like new items
+            if not _ITEM_START_RE.match(clean_line) and not _EXCESS_QTY_LABEL_RE.match(clean_line):
+                # Also remove GTIN references from continuation lines
+                clean_line = _GTN_NUMBER_RE.sub('', clean_line).strip()
+                clean_line = _GTIN_NUMBER_RE.sub('', clean_line).strip()
+                if clean_line:
+                    additional_desc.append(clean_line)
+        
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
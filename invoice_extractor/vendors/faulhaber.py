@@ -0,0 +1,200 @@
+"""Faulhaber invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_ITEM_START_RE = re.compile(r'^\d+\s+\d{2}/\d{4}')
+_CARRY_OVER_TOTAL_RE = re.compile(r'carry-over|total net|freight and package|total/EUR|payment', re.IGNORECASE)
+_INVOICE_NO_RE = re.compile(r'INVOICE NO\.?\s*[:#]?\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*[:#]?\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUST_NO_RE = re.compile(r'Cust\.-No\.?\s*[:#]?\s*(\d+)', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.\s*([^\s-]+)[^\d]*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_DEB_NR_RE = re.compile(r'Deb\.-Nr\.:\s*(\d+)', re.IGNORECASE)
+_POS_RE = re.compile(r'^(\d+)\s+')
+_ITEM_RE = re.compile(r'^(\d{2}/\d{4})\s+(.+?)\s+(\d+)\s+([\d,]+)\s+30\s*%\s+([\d,]+)$')
+_ALT_RE = re.compile(r'^(\d{2}/\d{4})\s+(.+?)\s+(\d+)\s+([\d,]+)\s+([\d,]+)$')
+_LOT_NUMBER_RE = re.compile(r'Lot number\s*([^\s]+)', re.IGNORECASE)
+_YOUR_ART_NO_RE = re.compile(r'your art\.-no\.:\s*([^\s]+)', re.IGNORECASE)
+_LOT_NUMBER_LST_RE = re.compile(r'Lot number|LST:|your art\.-no\.', re.IGNORECASE)
+_PRICES_RE = re.compile(r'[\d,]+')
+
+_LAYOUT = TableLayout(
+    header=None,
+    # e.g. "1 01/2718"
+    item_start=_ITEM_START_RE,
+    # Order information may change within the invoice
+    notes=(LineRule(Action.SET, _YOUR_ORDER_NO_RE, ('order_no', 'order_date')),),
+    # Summary lines end an item
+    terminator=_CARRY_OVER_TOTAL_RE,
+)
+
+
+def iter_faulhaber_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Faulhaber Pinzetten invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_faulhaber_invoice_info(lines)
+            
+            context = {'order_no': invoice_data['order_no'], 'order_date': invoice_data['order_date']}
+            for block, order_info in iter_item_blocks(lines, _LAYOUT, context):
+                item_data = _parse_faulhaber_item_block(block, invoice_data, order_info, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_faulhaber_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_faulhaber_invoice_rows()."""
+    return list(iter_faulhaber_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_faulhaber_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Faulhaber invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number
+        inv_match = _INVOICE_NO_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number
+        cust_match = _CUST_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract order information
+        order_match = _YOUR_ORDER_NO_RE.search(line_clean)
+        if order_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = order_match.group(1)
+            invoice_data['order_date'] = order_match.group(2)
+        
+        # Extract delivery note (Debit number)
+        delivery_match = _DEB_NR_RE.search(line_clean)
+        if delivery_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = delivery_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_faulhaber_item_block(block: List[str], invoice_data: Dict, order_info: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Faulhaber invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': order_info['order_no'],
+        'order_date': order_info['order_date'],
+        'delivery_note': invoice_data['delivery_note'],
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'total_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract position number (remove it since we don't need it)
+    pos_match = _POS_RE.search(first_line)
+    if pos_match:
+        # Remove the position number from the line for easier parsing
+        first_line = first_line[len(pos_match.group(0)):].strip()
+    
+    # Extract item code, description, quantity, unit price, and total price
+    # Pattern: "01/2718 Micro Fcps. 1x2tth. with round handle 2 114,40 30 % 160,16"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1).strip()
+        item_data['description'] = item_match.group(2).strip()
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(4)
+        item_data['total_price'] = item_match.group(5)
+    
+    # Alternative pattern without the 30% discount notation
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = alt_match.group(1).strip()
+            item_data['description'] = alt_match.group(2).strip()
+            item_data['quantity'] = alt_match.group(3)
+            item_data['unit_price'] = alt_match.group(4)
+            item_data['total_price'] = alt_match.group(5)
+    
+    # Extract lot number from the block
+    for line in block:
+        lot_match = _LOT_NUMBER_RE.search(line)
+        if lot_match:
+            item_data['lot'] = lot_match.group(1)
+            break
+    
+    # Extract customer article number from the block
+    customer_art_match = None
+    for line in block:
+        art_match = _YOUR_ART_NO_RE.search(line)
+        if art_match:
+            customer_art_match = art_match.group(1)
+            break
+    
+    # If we have a customer article number, append it to description
+    if customer_art_match and item_data['description']:
+        item_data['description'] += f" (Art-No: {customer_art_match})"
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Only include lines that don't look like metadata
+            if not _LOT_NUMBER_LST_RE.search(line):
+                clean_line = line.strip()
+                if clean_line and not _ITEM_START_RE.match(clean_line):  # Don't include lines that start like new items
+                    additional_desc.append(clean_line)
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # Extract prices from alternative patterns if still missing
+    if not item_data['unit_price']:
+        prices = _PRICES_RE.findall(first_line)
+        if len(prices) >= 2:
+            item_data['unit_price'] = prices[-2]
+            item_data['total_price'] = prices[-1]
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
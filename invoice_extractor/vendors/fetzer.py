@@ -0,0 +1,191 @@
+"""Fetzer invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_QTY_ORD_SHIP_RE = re.compile(r'qty\. ord\s+qty\. ship\.\s+qty\. B/O\s+unit\s+item no\.\s+description\s+each\s+ext\. price', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\d+\s+\d+\s+[a-z]+\.[\s]*[A-Z]')
+_SALES_AMT_TOTAL_RE = re.compile(r'Sales Amt\.|Total/\$|backordered', re.IGNORECASE)
+_DATE_INV_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})\s+(\d+)\s+\d+')
+_ORDER_NO_DATE_RE = re.compile(r'ORDER NO\.\s+ORDER DATE\s+CUSTOMER NO\.\s+CUSTOMER P\.O\.', re.IGNORECASE)
+_ORDER_RE = re.compile(r'^(\d+)\s+([\d/]+)\s+(\d+)\s+(\d+)\s+(\d+)\s+([\d/]+)\s+([^\n]+)$')
+_ITEM_RE = re.compile(r'^(\d+)\s+(\d+)\s+\d+\s+[a-z]+\.\s*([A-Za-z0-9-]+)\s+(.+?)\s+([\d,]+\.\d+)\s+([\d,]+\.\d+)$', re.IGNORECASE)
+_ALT_RE = re.compile(r'^(\d+)\s+(\d+)\s+\d+\s+[a-z]+\.\s*([A-Za-z0-9-]+)\s+(.+?)\s+([\d,]+\.\d+)\s+([\d,]+\.\d+)$')
+_LOT_NO_RE = re.compile(r'Lot No\.\s*([^\s]+)', re.IGNORECASE)
+_COUNTRY_OF_ORIGIN_RE = re.compile(r'Country of origin:\s*([^\n]+)', re.IGNORECASE)
+_LOT_NO_COUNTRY_RE = re.compile(r'Lot No\.|Country of origin|Sales Amt|Total/\$', re.IGNORECASE)
+_ITEM_PREFIX_RE = re.compile(r'^\d+\s+\d+\s+\d+\s+[a-z]+\.')
+_PRICES_RE = re.compile(r'[\d,]+\.\d+')
+
+_LAYOUT = TableLayout(
+    header=_QTY_ORD_SHIP_RE,
+    header_words=('qty.', 'ord', 'B/O'),
+    # Ordered, shipped and back-ordered quantities, unit and item number
+    item_start=_ITEM_START_RE,
+    # Summary lines never start an item
+    start_unless=_SALES_AMT_TOTAL_RE,
+    # Summary lines end an item
+    terminator=_SALES_AMT_TOTAL_RE,
+)
+
+
+def iter_fetzer_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Fetzer invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_fetzer_invoice_info(lines)
+            
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_fetzer_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_fetzer_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_fetzer_invoice_rows()."""
+    return list(iter_fetzer_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_fetzer_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Fetzer invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'order_no': '',
+        'order_date': '',
+        'customer_number': ''
+    }
+    
+    # Look for the ORDER NO. header line first
+    header_found = False
+    for i, line in enumerate(lines):
+        line_clean = line.strip()
+        
+        # Extract invoice number and date from header
+        date_inv_match = _DATE_INV_RE.search(line_clean)
+        if date_inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_date'] = date_inv_match.group(1)
+            invoice_data['invoice_number'] = date_inv_match.group(2)
+        
+        # Look for the ORDER NO. header
+        if _ORDER_NO_DATE_RE.search(line_clean):
+            header_found = True
+            # The next line should contain the actual values
+            if i + 1 < len(lines):
+                values_line = lines[i + 1].strip()
+                # Pattern: "4233755 3/15/2024 40026 0016278 0016278 3/19/2024 FedEx Ground"
+                order_match = _ORDER_RE.search(values_line)
+                if order_match:
+                    invoice_data['order_no'] = order_match.group(1)  # ORDER NO. (4233755)
+                    invoice_data['order_date'] = order_match.group(2)  # ORDER DATE (3/15/2024)
+                    invoice_data['customer_number'] = order_match.group(3)  # CUSTOMER NO. (40026)
+            break
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_fetzer_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Fetzer invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'order_no': invoice_data['order_no'],
+        'order_date': invoice_data['order_date'],
+        'customer_number': invoice_data['customer_number'],
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'total_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract quantities, item code, description, prices
+    # Pattern: "1 1 0 ea. E6957-31 micro cup forceps, shaft 5" (125.0mm), 275.00 275.00"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['quantity'] = item_match.group(2)  # Use shipped quantity
+        item_data['item_code'] = item_match.group(3).strip()
+        item_data['description'] = item_match.group(4).strip()
+        item_data['unit_price'] = item_match.group(5)
+        item_data['total_price'] = item_match.group(6)
+    
+    # Alternative pattern for different formatting
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['quantity'] = alt_match.group(2)
+            item_data['item_code'] = alt_match.group(3).strip()
+            item_data['description'] = alt_match.group(4).strip()
+            item_data['unit_price'] = alt_match.group(5)
+            item_data['total_price'] = alt_match.group(6)
+    
+    # Extract lot number from the block
+    for line in block:
+        lot_match = _LOT_NO_RE.search(line)
+        if lot_match:
+            item_data['lot'] = lot_match.group(1)
+            break
+    
+    # Extract country of origin if available
+    country_origin = ''
+    for line in block:
+        country_match = _COUNTRY_OF_ORIGIN_RE.search(line)
+        if country_match:
+            country_origin = country_match.group(1).strip()
+            break
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Skip lines that look like metadata
+            if not _LOT_NO_COUNTRY_RE.search(line):
+                clean_line = line.strip()
+                if clean_line and not _ITEM_PREFIX_RE.match(clean_line):  # Don't include lines that start like new items
+                    additional_desc.append(clean_line)
+        
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # Add country of origin to description if found
+    if country_origin and item_data['description']:
+        item_data['description'] += f" (Origin: {country_origin})"
+    
+    # Extract prices from alternative patterns if still missing
+    if not item_data['unit_price']:
+        prices = _PRICES_RE.findall(first_line)
+        if len(prices) >= 2:
+            item_data['unit_price'] = prices[-2]
+            item_data['total_price'] = prices[-1]
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
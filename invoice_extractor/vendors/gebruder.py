@@ -0,0 +1,135 @@
+"""Gebrüder invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_RECHNR_RECHDAT_NETTO_RE = re.compile(r'RECHNR\.\s+RECHDAT\.\s+NETTO\s+MWST\s+BRUTTO', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d{5}\s+\d{2}\.\d{2}\.\d{4}')
+_SUMME_TOTAL_RE = re.compile(r'SUMME|TOTAL', re.IGNORECASE)
+_DATE_RE = re.compile(r'Stand:\s*(\d{2}\.\d{2}\.\d{4})')
+_OFFENE_POSTEN_KUNDE_RE = re.compile(r'OFFENE POSTEN FÜR KUNDE:\s*(\d+)\s*-\s*([^;]+);\s*WÄHRUNG:\s*([A-Z]+)')
+_INVOICE_RE = re.compile(r'^(\d+)\s+(\d{2}\.\d{2}\.\d{4})\s+([\d,]+)\s+([\d,]+)\s+([\d,]+)')
+_DUE_DATE_RE = re.compile(r'(\d{2}\.\d{2}\.\d{4})\s+\d+\s+\d+\s+-?\d+\s+[A-Z]+')
+
+
+def iter_gebruder_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Gebrüder invoice/statement format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract header information
+            header_data = _extract_gebruder_header_info(lines)
+            
+            # Find invoice lines
+            invoice_lines = []
+            in_invoice_section = False
+            
+            for line in lines:
+                line_clean = line.strip()
+                
+                # Look for the start of the invoice section
+                if _RECHNR_RECHDAT_NETTO_RE.search(line_clean):
+                    in_invoice_section = True
+                    continue
+                
+                if not in_invoice_section:
+                    continue
+                
+                # Look for invoice lines (starting with invoice numbers)
+                if _ITEM_START_RE.match(line_clean) and not _SUMME_TOTAL_RE.search(line_clean):
+                    invoice_lines.append(line_clean)
+            
+            # Process each invoice line
+            for line in invoice_lines:
+                item_data = _parse_gebruder_invoice_line(line, header_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_gebruder_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_gebruder_invoice_rows()."""
+    return list(iter_gebruder_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_gebruder_header_info(lines: List[str]) -> Dict[str, str]:
+    """Extract header information from Gebrüder statement"""
+    header_data = {
+        'customer_number': '',
+        'customer_name': '',
+        'currency': '',
+        'statement_date': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract statement date
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not header_data['statement_date']:
+            header_data['statement_date'] = date_match.group(1)
+        
+        # Extract customer information
+        customer_match = _OFFENE_POSTEN_KUNDE_RE.search(line_clean)
+        if customer_match:
+            header_data['customer_number'] = customer_match.group(1)
+            header_data['customer_name'] = customer_match.group(2).strip()
+            header_data['currency'] = customer_match.group(3)
+    
+    return header_data
+
+@timed("parse")
+def _parse_gebruder_invoice_line(line: str, header_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual invoice line from Gebrüder statement"""
+    if not line.strip():
+        return None
+    
+    item_data = {
+        'invoice_date': '',
+        'invoice_number': '',
+        'order_no': '',
+        'order_date': '',
+        'customer_number': header_data['customer_number'],
+        'item_code': '',
+        'description': 'Invoice Amount',
+        'quantity': '1',
+        'unit_price': '',
+        'total_price': '',
+        'lot': '',
+        'due_date': '',
+        'page': page_num + 1
+    }
+    
+    # Pattern for invoice line: "43542 13.02.2024 432,34 0,00 432,34 . . 0,00 432,34"
+    invoice_match = _INVOICE_RE.search(line)
+    
+    if invoice_match:
+        item_data['invoice_number'] = invoice_match.group(1)
+        item_data['invoice_date'] = invoice_match.group(2)
+        item_data['unit_price'] = invoice_match.group(5)  # Using Brutto amount
+        item_data['total_price'] = item_data['unit_price']  # Same as unit price for invoice amounts
+        
+        # The due date should be on the next line in the actual PDF structure
+        # Since we're processing line by line, we'll handle this separately
+        item_data['due_date'] = ''  # Will be populated from context
+    
+    # Look for due date in the next part of the line or subsequent processing
+    due_date_match = _DUE_DATE_RE.search(line)
+    if due_date_match:
+        item_data['due_date'] = due_date_match.group(1)
+    
+    # Only return if we have at least invoice number and amount
+    if item_data['invoice_number'] and item_data['total_price']:
+        return item_data
+    
+    return None
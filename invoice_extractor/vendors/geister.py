@@ -0,0 +1,181 @@
+"""Geister invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_REF_TEXT_RE = re.compile(r'POS\s+REF\s+TEXT\s+QTY\s+EACH\s+€\s+TOTAL\s+€', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d{3}\s+\d{2}-\d{4}')
+_TURNOVER_VALUE_OF_RE = re.compile(r'Turnover|Value of goods|Packing|Insurance|TOTAL/EUR', re.IGNORECASE)
+_INV_RE = re.compile(r'INVOICE\s*#\s*(\d+)', re.IGNORECASE)
+_DATE_CUSTOMER_ID_RE = re.compile(r'Date:\s*(\d{2}\.\d{2}\.\d{4})\s+Customer ID:\s*(\d+)', re.IGNORECASE)
+_DELIVERY_NOTE_NO_RE = re.compile(r'Delivery Note No\.\s*(\d+)\s*dated\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_YOUR_ORDER_RE = re.compile(r'Your Order\s*#\s*([^\s-]+)[^\d]*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_POS_RE = re.compile(r'^(\d{3})\s+')
+_ITEM_RE = re.compile(r'^(\d{2}-\d{4})\s+(.+?)\s+(\d+)\s+([\d,]+)\s+([\d,]+)$')
+_LOT_RE = re.compile(r'LOT#\s*([^\s]+)', re.IGNORECASE)
+_ART_RE = re.compile(r'\[([^\]]+)\]')
+_LOT_LST_CCT_RE = re.compile(r'LOT#|LST|CCT|\[.*\]')
+
+_LAYOUT = TableLayout(
+    header=_POS_REF_TEXT_RE,
+    # e.g. "001 21-0102"
+    item_start=_ITEM_START_RE,
+    # Order information may change within the invoice, and is also picked up above the table
+    preamble=(LineRule(Action.SET, _YOUR_ORDER_RE, ('order_no', 'order_date')),),
+    notes=(LineRule(Action.SET, _YOUR_ORDER_RE, ('order_no', 'order_date')),),
+    # Summary lines end an item
+    terminator=_TURNOVER_VALUE_OF_RE,
+)
+
+
+def iter_geister_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Geister Medizintechnik invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        # Extract invoice-level info from the entire document
+        invoice_data = _extract_geister_invoice_info(pdf.lines)
+        
+        # Second pass: process each page for items
+        # Store the current order info to carry over to subsequent pages
+        current_order_info = {'order_no': invoice_data['order_no'], 'order_date': invoice_data['order_date']}
+        
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            for block, order_info in iter_item_blocks(lines, _LAYOUT, current_order_info):
+                item_data = _parse_geister_item_block(block, invoice_data, order_info, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_geister_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_geister_invoice_rows()."""
+    return list(iter_geister_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_geister_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Geister invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number
+        inv_match = _INV_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date and customer ID
+        date_match = _DATE_CUSTOMER_ID_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+            invoice_data['customer_number'] = date_match.group(2)
+        
+        # Extract delivery note
+        delivery_match = _DELIVERY_NOTE_NO_RE.search(line_clean)
+        if delivery_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = delivery_match.group(1)
+        
+        # Extract order information (from first occurrence)
+        order_match = _YOUR_ORDER_RE.search(line_clean)
+        if order_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = order_match.group(1)
+            invoice_data['order_date'] = order_match.group(2)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_geister_item_block(block: List[str], invoice_data: Dict, order_info: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Geister invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': order_info['order_no'],  # Use the order info passed from current page context
+        'order_date': order_info['order_date'],  # Use the order info passed from current page context
+        'delivery_note': invoice_data['delivery_note'],
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'total_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract position number (remove it since we don't need it)
+    pos_match = _POS_RE.search(first_line)
+    if pos_match:
+        # Remove the position number from the line for easier parsing
+        first_line = first_line[len(pos_match.group(0)):].strip()
+    
+    # Extract item code, description, quantity, unit price, and total price
+    # Pattern: "21-0102 Dilator, Vascular, acc. Garrett 1 38,50 38,50"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1).strip()
+        item_data['description'] = item_match.group(2).strip()
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(4)
+        item_data['total_price'] = item_match.group(5)
+    
+    # Extract lot number from the block
+    for line in block:
+        lot_match = _LOT_RE.search(line)
+        if lot_match:
+            item_data['lot'] = lot_match.group(1)
+            break
+    
+    # Extract customer article number from the block
+    customer_art_match = None
+    for line in block:
+        art_match = _ART_RE.search(line)
+        if art_match:
+            customer_art_match = art_match.group(1)
+            break
+    
+    # If we have a customer article number, append it to description
+    if customer_art_match and item_data['description']:
+        item_data['description'] += f" [{customer_art_match}]"
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Only include lines that don't look like metadata
+            if not _LOT_LST_CCT_RE.search(line):
+                clean_line = line.strip()
+                if clean_line and not _ITEM_START_RE.match(clean_line):  # Don't include lines that start like new items
+                    additional_desc.append(clean_line)
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
@@ -0,0 +1,227 @@
+"""Georg Alber invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_ITEM_SHIPMENT_QTY_RE = re.compile(r'#\s+Item\s+Shipment\s+Qty\.\s+Unit\s+Each\s+Total', re.IGNORECASE)
+_ITEM_NO_RE = re.compile(r'^\d+\s+Item No\.')
+_BLOCK_END_RE = re.compile(r'gross|weight|Preference|Payment|Delivery Terms|Your Order No\.', re.IGNORECASE)
+_INVOICE_NO_RE = re.compile(r'Invoice No\.\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'dated\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUSTOMER_NO_RE = re.compile(r'Customer No\.\s*(\d+)', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'Your Order No\.\s*([^\s-]+)[^\d]*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_POS_RE = re.compile(r'^(\d+)\s+')
+_ITEM_NO_DATED_RE = re.compile(r'Item No\.\s*([^\s]+)\s+(\d+)\s*/\s*\d+\s+dated\s+\d{2}\.\d{2}\.\d{4}\s+(\d+)\s+pcs\.\s+([\d,]+)', re.IGNORECASE)
+_ITEM_NO_PCS_RE = re.compile(r'Item No\.\s*([^\s]+)\s+(\d+)\s*/\s*\d+\s+(\d+)\s+pcs\.\s+([\d,]+)', re.IGNORECASE)
+_YOUR_ITEM_NO_RE = re.compile(r'Your Item No\.\s*([^\s]+)', re.IGNORECASE)
+_DESC_RE = re.compile(r'Desc\.', re.IGNORECASE)
+_DESC_TEXT_RE = re.compile(r'Desc\.\s*(.+)', re.IGNORECASE)
+_LOT_RE = re.compile(r'Lot\s*(\d+\s*x\s*[A-Z]+)', re.IGNORECASE)
+_MARK_RE = re.compile(r'Mark\s*([^\s]+)', re.IGNORECASE)
+_ITEM_NO_YOUR_RE = re.compile(r'Item No\.|Your Item No\.|Desc\.|Lot|Mark|LST', re.IGNORECASE)
+_PRICES_RE = re.compile(r'[\d,]+')
+
+_LAYOUT = TableLayout(
+    header=_ITEM_SHIPMENT_QTY_RE,
+    # e.g. "10 Item No. 917018-P"
+    item_start=_ITEM_NO_RE,
+    # Order information may change within the invoice, and is also picked up above the table
+    preamble=(LineRule(Action.SET, _YOUR_ORDER_NO_RE, ('order_no', 'order_date')),),
+    notes=(LineRule(Action.SET, _YOUR_ORDER_NO_RE, ('order_no', 'order_date')),),
+    # Summary lines and the next order end an item
+    terminator=_BLOCK_END_RE,
+)
+
+
+def iter_georgalber_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Georg Alber invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        # First pass: extract all text and invoice-level info
+        all_lines = pdf.lines
+        
+        # Extract invoice-level info from the entire document
+        invoice_data = _extract_georgalber_invoice_info(all_lines)
+        
+        # Second pass: process each page for items
+        # Store the current order info to carry over to subsequent pages
+        current_order_info = {'order_no': invoice_data['order_no'], 'order_date': invoice_data['order_date']}
+        
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            for block, order_info in iter_item_blocks(lines, _LAYOUT, current_order_info):
+                item_data = _parse_georgalber_item_block(block, invoice_data, order_info, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_georgalber_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_georgalber_invoice_rows()."""
+    return list(iter_georgalber_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_georgalber_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Georg Alber invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number and date
+        inv_match = _INVOICE_NO_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number
+        cust_match = _CUSTOMER_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract delivery note (shipment number from items)
+        # This will be extracted from individual items since it's per item
+        
+        # Extract order information (from first occurrence)
+        order_match = _YOUR_ORDER_NO_RE.search(line_clean)
+        if order_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = order_match.group(1)
+            invoice_data['order_date'] = order_match.group(2)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_georgalber_item_block(block: List[str], invoice_data: Dict, order_info: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Georg Alber invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': order_info['order_no'],
+        'order_date': order_info['order_date'],
+        'delivery_note': '',
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract position number (remove it since we don't need it)
+    pos_match = _POS_RE.search(first_line)
+    if pos_match:
+        # Remove the position number from the line for easier parsing
+        first_line = first_line[len(pos_match.group(0)):].strip()
+    
+    # Extract item code, shipment, quantity, unit price (total price removed)
+    # Pattern: "Item No. 917018-P 2240614 / 10 dated 05.09.2024 5 pcs. 153,65 768,25"
+    item_match = _ITEM_NO_DATED_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1).strip()
+        item_data['delivery_note'] = item_match.group(2)  # Shipment number as delivery note
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(4)
+    
+    # Alternative pattern for items without "dated" part
+    if not item_data['item_code']:
+        alt_match = _ITEM_NO_PCS_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = item_match.group(1).strip()
+            item_data['delivery_note'] = item_match.group(2)
+            item_data['quantity'] = item_match.group(3)
+            item_data['unit_price'] = item_match.group(4)
+    
+    # Extract customer item number from the block
+    customer_item_match = None
+    for line in block:
+        art_match = _YOUR_ITEM_NO_RE.search(line)
+        if art_match:
+            customer_item_match = art_match.group(1)
+            break
+    
+    # Extract description
+    desc_found = False
+    for line in block:
+        if _DESC_RE.search(line):
+            # Extract everything after "Desc."
+            desc_match = _DESC_TEXT_RE.search(line)
+            if desc_match:
+                item_data['description'] = desc_match.group(1).strip()
+                desc_found = True
+                break
+    
+    # If we have a customer item number, prepend it to description
+    if customer_item_match and item_data['description']:
+        item_data['description'] = f"{customer_item_match} - {item_data['description']}"
+    
+    # Extract lot number from the block
+    for line in block:
+        lot_match = _LOT_RE.search(line)
+        if lot_match:
+            item_data['lot'] = lot_match.group(1)
+            break
+    
+    # Extract mark information
+    mark_info = None
+    for line in block:
+        mark_match = _MARK_RE.search(line)
+        if mark_match:
+            mark_info = mark_match.group(1)
+            break
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Only include lines that don't look like metadata
+            if not _ITEM_NO_YOUR_RE.search(line):
+                clean_line = line.strip()
+                if clean_line and not _ITEM_NO_RE.match(clean_line):  # Don't include lines that start like new items
+                    additional_desc.append(clean_line)
+        
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # Add mark information to description if found
+    if mark_info and item_data['description']:
+        item_data['description'] += f" (Mark: {mark_info})"
+    
+    # Extract unit price from alternative patterns if still missing
+    if not item_data['unit_price']:
+        prices = _PRICES_RE.findall(first_line)
+        if len(prices) >= 1:
+            item_data['unit_price'] = prices[-1]  # Use the last price found
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
@@ -0,0 +1,184 @@
+"""Gordon Brush invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_LINE_PART_ID_RE = re.compile(r'LINE\s+PART ID\s+DESCRIPTION\s+YOU\s+WE\s+UNIT\s+EXTENDED', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+[A-Z0-9]')
+_SUBTOTAL_TAX_AMT_RE = re.compile(r'SUBTOTAL|TAX AMT|FREIGHT|INVOICE TOTAL', re.IGNORECASE)
+_SUBTOTAL_OR_PAYMENT_RE = re.compile(r'SUBTOTAL|TAX AMT|FREIGHT|INVOICE TOTAL|Make Payment To', re.IGNORECASE)
+_DATE_INV_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})\s+(\d+)\s+(\d+)\s+')
+_SALES_ORDER_RE = re.compile(r'Sales Order:\s*(\d+)', re.IGNORECASE)
+_SHIP_VIA_RE = re.compile(r'Ship Via:\s*([^\n]+)', re.IGNORECASE)
+_ITEM_RE = re.compile(r'^(\d+)\s+([A-Z0-9-]+)\s+(.+?)\s+(\d+)\s+(\d+)\s+([\d,]+\.\d+)EA\s+\$[\d,]+\.\d+')
+_ALT_RE = re.compile(r'^(\d+)\s+([A-Z0-9-]+)\s+(.+?)\s+(\d+)\s+(\d+)\s+([\d,]+\.\d+)EA')
+_CUST_RE = re.compile(r'^([A-Z0-9-]+)\s+EA\s+[\d/]+')
+_EA_RE = re.compile(r'^[A-Z0-9-]+\s+EA\s+[\d/]+')
+_ITEM_START_HYPHEN_RE = re.compile(r'^\d+\s+[A-Z0-9-]')
+_PRICE_RE = re.compile(r'([\d,]+\.\d+)EA')
+_QTY_RE = re.compile(r'\s+(\d+)\s+(\d+)\s+')
+
+_LAYOUT = TableLayout(
+    header=_LINE_PART_ID_RE,
+    header_words=('PART', 'DESCRIPTION', 'EXTENDED'),
+    # A line number followed by the part ID
+    item_start=_ITEM_START_RE,
+    # Summary lines never start an item
+    start_unless=_SUBTOTAL_TAX_AMT_RE,
+    # Summary lines end an item
+    terminator=_SUBTOTAL_OR_PAYMENT_RE,
+)
+
+
+def iter_gordonbrush_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Gordon Brush invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_gordonbrush_invoice_info(lines)
+            
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_gordonbrush_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_gordonbrush_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_gordonbrush_invoice_rows()."""
+    return list(iter_gordonbrush_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_gordonbrush_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Gordon Brush invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'order_no': '',
+        'customer_number': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number and date from header
+        # Pattern: "3/25/2025 312388 0018065 CREDIT CARD"
+        date_inv_match = _DATE_INV_RE.search(line_clean)
+        if date_inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_date'] = date_inv_match.group(1)
+            invoice_data['invoice_number'] = date_inv_match.group(2)
+            invoice_data['order_no'] = date_inv_match.group(3)  # Customer PO
+        
+        # Extract sales order number
+        so_match = _SALES_ORDER_RE.search(line_clean)
+        if so_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = so_match.group(1)
+        
+        # Extract shipping method as delivery note
+        ship_match = _SHIP_VIA_RE.search(line_clean)
+        if ship_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = ship_match.group(1).strip()
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_gordonbrush_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Gordon Brush invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'order_no': invoice_data['order_no'],
+        'customer_number': invoice_data['customer_number'],
+        'delivery_note': invoice_data['delivery_note'],
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract line number, part ID, description, quantities, unit price
+    # Pattern: "1 221SSN-12 DBL SIDED UTIL SS.006/NY.016 GORDON PK12 24 24 2.78EA $66.72"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(2).strip()
+        item_data['description'] = item_match.group(3).strip()
+        item_data['quantity'] = item_match.group(5)  # Use SHIPPED quantity (second quantity)
+        item_data['unit_price'] = item_match.group(6)
+    
+    # Alternative pattern for different formatting
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = alt_match.group(2).strip()
+            item_data['description'] = alt_match.group(3).strip()
+            item_data['quantity'] = alt_match.group(5)
+            item_data['unit_price'] = alt_match.group(6)
+    
+    # Extract customer part ID from the block (second line)
+    customer_part_match = None
+    for line in block:
+        # Look for customer part ID pattern: "9212-03 EA 3/25/2025"
+        cust_match = _CUST_RE.search(line)
+        if cust_match:
+            customer_part_match = cust_match.group(1)
+            break
+    
+    # If we have a customer part ID, append it to description
+    if customer_part_match and item_data['description']:
+        item_data['description'] += f" (Cust-Part: {customer_part_match})"
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Skip lines that look like customer part IDs or metadata
+            if not _EA_RE.match(line):
+                clean_line = line.strip()
+                if clean_line and not _ITEM_START_HYPHEN_RE.match(clean_line):  # Don't include lines that start like new items
+                    additional_desc.append(clean_line)
+        
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # Extract unit price from alternative patterns if still missing
+    if not item_data['unit_price']:
+        price_match = _PRICE_RE.search(first_line)
+        if price_match:
+            item_data['unit_price'] = price_match.group(1)
+    
+    # Extract quantity from alternative patterns if still missing
+    if not item_data['quantity']:
+        qty_match = _QTY_RE.search(first_line)
+        if qty_match:
+            item_data['quantity'] = qty_match.group(2)  # Use shipped quantity
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
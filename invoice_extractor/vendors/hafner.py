@@ -0,0 +1,231 @@
+"""Hafner invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_ITEM_SHIPMENT_QTY_RE = re.compile(r'#\s+Item\s+Shipment\s+Qty\.\s+Unit\s+Price\s+\(€\)\s+Amount\s+\(€\)', re.IGNORECASE)
+_ITEM_NO_RE = re.compile(r'^\d+\s+Item No\.')
+_SUBTOTAL_PACKAGING_TOTAL_RE = re.compile(r'Subtotal|Packaging|Total Amount Due|Steuerfreie|Weight|Payment|Shipment', re.IGNORECASE)
+_INVOICE_NO_RE = re.compile(r'Invoice No\.\s*([^\s]+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUSTOMER_NO_RE = re.compile(r'Customer No\.\s*(\d+)', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'Your Order No\.\s*([^\s]+)\s+from\s+(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_SHIPMENT_RE = re.compile(r'Shipment\s+(\d+)\s*/\s*\d+', re.IGNORECASE)
+_POS_RE = re.compile(r'^(\d+)\s+')
+_ITEM_NO_FROM_RE = re.compile(r'Item No\.\s*([^\s]+)\s+(\d+)\s*/\s*\d+\s+from\s+\d{2}\.\d{2}\.\d{4}\s+(\d+)pcs\.\s+([\d,]+)/', re.IGNORECASE)
+_ITEM_NO_PCS_RE = re.compile(r'Item No\.\s*([^\s]+)\s+(\d+)\s*/\s*\d+\s+(\d+)pcs\.\s+([\d,]+)', re.IGNORECASE)
+_YOUR_ITEM_RE = re.compile(r'Your Item N\s*([^\s]+)', re.IGNORECASE)
+_LOT_DESC_RE = re.compile(r'Lot Desc\.', re.IGNORECASE)
+_LOT_DESC_TEXT_RE = re.compile(r'Lot Desc\.\s*(.+)', re.IGNORECASE)
+_LOT_RE = re.compile(r'Lot\s*(\d+\s*x\s*\d+)', re.IGNORECASE)
+_MANUFACTURED_DATE_RE = re.compile(r'manufactured\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_ITEM_NO_YOUR_RE = re.compile(r'Item No\.|Your Item N|Lot Desc\.|Lot|LST|manufactured', re.IGNORECASE)
+_PRICE_RE = re.compile(r'([\d,]+)/')
+_QTY_RE = re.compile(r'(\d+)pcs\.', re.IGNORECASE)
+
+_LAYOUT = TableLayout(
+    header=_ITEM_SHIPMENT_QTY_RE,
+    header_words=('Item', 'Shipment', 'Amount'),
+    # e.g. "10 Item No. 1100-10"
+    item_start=_ITEM_NO_RE,
+    # Summary lines end an item
+    terminator=_SUBTOTAL_PACKAGING_TOTAL_RE,
+)
+
+
+def iter_hafner_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Hafner invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_hafner_invoice_info(lines)
+            
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_hafner_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_hafner_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_hafner_invoice_rows()."""
+    return list(iter_hafner_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_hafner_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Hafner invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number and date
+        inv_match = _INVOICE_NO_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number
+        cust_match = _CUSTOMER_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract order information
+        order_match = _YOUR_ORDER_NO_RE.search(line_clean)
+        if order_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = order_match.group(1)
+            invoice_data['order_date'] = order_match.group(2)
+        
+        # Extract shipment number as delivery note
+        shipment_match = _SHIPMENT_RE.search(line_clean)
+        if shipment_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = shipment_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_hafner_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Hafner invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': invoice_data['order_no'],
+        'order_date': invoice_data['order_date'],
+        'delivery_note': invoice_data['delivery_note'],
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract position number (remove it since we don't need it)
+    pos_match = _POS_RE.search(first_line)
+    if pos_match:
+        # Remove the position number from the line for easier parsing
+        first_line = first_line[len(pos_match.group(0)):].strip()
+    
+    # Extract item code, shipment, quantity, unit price
+    # Pattern: "Item No. 1100-10 3250382 / 10 from 25.04.2025 10pcs. 18,56/ 1 185,60"
+    item_match = _ITEM_NO_FROM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1).strip()
+        item_data['delivery_note'] = item_match.group(2)  # Shipment number as delivery note
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(4)
+    
+    # Alternative pattern for different formatting
+    if not item_data['item_code']:
+        alt_match = _ITEM_NO_PCS_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = alt_match.group(1).strip()
+            item_data['delivery_note'] = item_match.group(2)
+            item_data['quantity'] = item_match.group(3)
+            item_data['unit_price'] = item_match.group(4)
+    
+    # Extract customer item number from the block
+    customer_item_match = None
+    for line in block:
+        art_match = _YOUR_ITEM_RE.search(line)
+        if art_match:
+            customer_item_match = art_match.group(1)
+            break
+    
+    # Extract description
+    desc_found = False
+    for line in block:
+        if _LOT_DESC_RE.search(line):
+            # Extract everything after "Lot Desc."
+            desc_match = _LOT_DESC_TEXT_RE.search(line)
+            if desc_match:
+                item_data['description'] = desc_match.group(1).strip()
+                desc_found = True
+                break
+    
+    # If we have a customer item number, prepend it to description
+    if customer_item_match and item_data['description']:
+        item_data['description'] = f"{customer_item_match} - {item_data['description']}"
+    
+    # Extract lot number from the block
+    for line in block:
+        lot_match = _LOT_RE.search(line)
+        if lot_match:
+            item_data['lot'] = lot_match.group(1)
+            break
+    
+    # Extract manufacturing date if available
+    manuf_date = None
+    for line in block:
+        date_match = _MANUFACTURED_DATE_RE.search(line)
+        if date_match:
+            manuf_date = date_match.group(1)
+            break
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Only include lines that don't look like metadata
+            if not _ITEM_NO_YOUR_RE.search(line):
+                clean_line = line.strip()
+                if clean_line and not _ITEM_NO_RE.match(clean_line):  # Don't include lines that start like new items
+                    additional_desc.append(clean_line)
+        
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # Add manufacturing date to description if found
+    if manuf_date and item_data['description']:
+        item_data['description'] += f" (Manufactured: {manuf_date})"
+    
+    # Extract unit price from alternative patterns if still missing
+    if not item_data['unit_price']:
+        price_match = _PRICE_RE.search(first_line)
+        if price_match:
+            item_data['unit_price'] = price_match.group(1)
+    
+    # Extract quantity from alternative patterns if still missing
+    if not item_data['quantity']:
+        qty_match = _QTY_RE.search(first_line)
+        if qty_match:
+            item_data['quantity'] = qty_match.group(1)
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
@@ -0,0 +1,295 @@
+"""Heiss-Medical invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+from ..trace import get_tracer
+
+trace = get_tracer("heissmedical")
+
+
+# Patterns, compiled once at import time
+_POS_ARTICLE_DESCRIPTION_RE = re.compile(r'POS\.\s+ARTICLE\s+description\s+qty\.\s+each\s+price', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.\s*([^\s-]+)[^\d]*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\d{5}')
+_BLOCK_END_RE = re.compile(r'carry-over|total net|total/EUR|payment|Terms of delivery|your order no\.', re.IGNORECASE)
+_INVOICE_NO_RE = re.compile(r'INVOICE NO\.?\s*[:]?\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*[:]?\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUST_NO_RE = re.compile(r'Cust\.?-?No\.?\s*[:]?\s*(\d+)', re.IGNORECASE)
+_DELIVERY_NOTE_NO_RE = re.compile(r'Delivery Note No\.?\s*(\d+)\s*at\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_POS_RE = re.compile(r'^(\d+)\s+')
+_ITEM_LINE_RE = re.compile(r'^\d{5,6}$')
+_DIGITS_ONLY_RE = re.compile(r'^\d+$')
+_NUMBER_ONLY_RE = re.compile(r'^[\d,]+$')
+_LOT_NUMBER_RE = re.compile(r'Lot number\s*([^\s/]+)', re.IGNORECASE)
+_YOUR_ART_NO_RE = re.compile(r'your art\.?-?no\.?:\s*([^\s]+)', re.IGNORECASE)
+_MDL_REG_NO_RE = re.compile(r'MDL Reg\.? No\.?:\s*([^\s]+)', re.IGNORECASE)
+_PRICES_RE = re.compile(r'\b(\d+[,.]\d{2})\b')
+_ORDER_PATTERNS = (
+    re.compile(r'your order no\.?\s*([^\s-]+)[^\d]*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE),
+    re.compile(r'order no\.?\s*([^\s-]+)\s*[-]?\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE),
+    re.compile(r'your order\s*([^\s-]+)\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE),
+)
+_ITEM_PATTERNS = (
+    re.compile(r'^(\d{5,6})\s+([A-Za-z].+?)\s+(\d+)\s+([\d,]+\.?\d*)\s+[\d,]+\.?\d*$'),
+    re.compile(r'^(\d{5,6})\s+([A-Za-z].+?)\s+(\d+)\s+([\d,]+\.?\d*)'),
+    re.compile(r'^(\d{5,6})\s+(.+?)\s+(\d+)\s+([\d,]+\.?\d*)'),
+)
+
+_LAYOUT = TableLayout(
+    header=_POS_ARTICLE_DESCRIPTION_RE,
+    # e.g. "1 52482"
+    item_start=_ITEM_START_RE,
+    # Order information may change within the invoice, and is also picked up above the table
+    preamble=(LineRule(Action.SET, _YOUR_ORDER_NO_RE, ('order_no', 'order_date')),),
+    notes=(LineRule(Action.SET, _YOUR_ORDER_NO_RE, ('order_no', 'order_date')),),
+    # Summary lines and the next order end an item
+    terminator=_BLOCK_END_RE,
+)
+
+
+def iter_heissmedical_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Heiss Medical invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        # First pass: extract all text and invoice-level info
+        all_lines = pdf.lines
+        
+        # Extract invoice-level info from the entire document
+        invoice_data = _extract_heissmedical_invoice_info(all_lines)
+        
+        # Second pass: process each page for items
+        # Store the current order info to carry over to subsequent pages
+        current_order_info = {'order_no': invoice_data['order_no'], 'order_date': invoice_data['order_date']}
+        
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            for block, order_info in iter_item_blocks(lines, _LAYOUT, current_order_info):
+                item_data = _parse_heissmedical_item_block(block, invoice_data, order_info, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_heissmedical_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_heissmedical_invoice_rows()."""
+    return list(iter_heissmedical_invoice_rows(pdf_content))
+
+def _normalize_heiss_text(text: str) -> str:
+    """Normalize Heiss Medical text by handling complex duplicate character patterns"""
+    if not text:
+        return text
+    
+    # Handle the specific pattern in Heiss Medical files
+    # Pattern: characters are often duplicated, but not always consistently
+    normalized = []
+    i = 0
+    while i < len(text):
+        current_char = text[i]
+        normalized.append(current_char)
+        
+        # Skip duplicate characters but be careful with numbers and special patterns
+        if current_char.isalpha():
+            # Skip consecutive duplicate alphabetic characters
+            j = i + 1
+            while j < len(text) and text[j] == current_char:
+                j += 1
+            i = j
+        else:
+            # For non-alphabetic characters, don't skip duplicates
+            # (numbers, punctuation, spaces should be preserved)
+            i += 1
+    
+    result = ''.join(normalized)
+    
+    # Fix specific known patterns that don't follow the general rule
+    replacements = {
+        'J.obseef': 'J.',
+        'GmbbH': 'GmbH',
+        'GmbbHH': 'GmbH',
+        'Incc.': 'Inc.',
+        'IInncc..': 'Inc.',
+        'NNoo..': 'No.',
+        'NNOO..': 'NO.',
+    }
+    
+    for wrong, correct in replacements.items():
+        result = result.replace(wrong, correct)
+    
+    return result
+
+@timed("header")
+def _extract_heissmedical_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Heiss Medical invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    # First, let's normalize the entire text and look for patterns
+    normalized_lines = [_normalize_heiss_text(line.strip()) for line in lines]
+    
+    if trace:
+        # First 10 lines, to see what the normalization produced
+        trace("normalized_lines", lines=[line for line in normalized_lines[:10] if line])
+    
+    for line in normalized_lines:
+        if not line:
+            continue
+        
+        # Extract invoice number - more flexible pattern
+        inv_match = _INVOICE_NO_RE.search(line)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+            if trace:
+                trace("invoice_number", value=invoice_data['invoice_number'], line=line)
+        
+        # Extract invoice date - look for "Date" pattern
+        date_match = _DATE_RE.search(line)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+            if trace:
+                trace("invoice_date", value=invoice_data['invoice_date'], line=line)
+        
+        # Extract customer number
+        cust_match = _CUST_NO_RE.search(line)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+            if trace:
+                trace("customer_number", value=invoice_data['customer_number'], line=line)
+        
+        # Extract delivery note - more flexible pattern
+        delivery_match = _DELIVERY_NOTE_NO_RE.search(line)
+        if delivery_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = delivery_match.group(1)
+            if trace:
+                trace("delivery_note", value=invoice_data['delivery_note'], line=line)
+        
+        # Extract order information - multiple possible patterns
+        for pattern in _ORDER_PATTERNS:
+            order_match = pattern.search(line)
+            if order_match and not invoice_data['order_no']:
+                invoice_data['order_no'] = order_match.group(1).strip()
+                invoice_data['order_date'] = order_match.group(2)
+                if trace:
+                    trace("order", order_no=invoice_data['order_no'], order_date=invoice_data['order_date'], line=line)
+                break
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_heissmedical_item_block(block: List[str], invoice_data: Dict, order_info: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Heiss Medical invoice"""
+    if not block:
+        return None
+    
+    # Normalize the entire block first
+    normalized_block = [_normalize_heiss_text(line.strip()) for line in block if line.strip()]
+    
+    if trace:
+        trace("item_block", page=page_num + 1, first_line=normalized_block[0] if normalized_block else '')
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': order_info.get('order_no', ''),
+        'order_date': order_info.get('order_date', ''),
+        'delivery_note': invoice_data.get('delivery_note', ''),
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    if not normalized_block:
+        return None
+    
+    # The first line should contain the main item data
+    first_line = normalized_block[0]
+    
+    # Extract position number (remove it)
+    pos_match = _POS_RE.search(first_line)
+    if pos_match:
+        first_line = first_line[len(pos_match.group(0)):].strip()
+    
+    # Pattern for item lines like: "58609 RHOTON-TYPE DISS 7 1/2\" 2M 1 20,30 20,30"
+    # More flexible pattern that handles various spacings
+    for pattern in _ITEM_PATTERNS:
+        item_match = pattern.search(first_line)
+        if item_match:
+            item_data['item_code'] = item_match.group(1).strip()
+            item_data['description'] = item_match.group(2).strip()
+            item_data['quantity'] = item_match.group(3)
+            item_data['unit_price'] = item_match.group(4)
+            if trace:
+                trace("item", item_code=item_data['item_code'], description=item_data['description'], pattern=pattern.pattern)
+            break
+    
+    # If still no match, try a more basic approach - split and analyze
+    if not item_data['item_code']:
+        parts = first_line.split()
+        if len(parts) >= 4:
+            # Look for a 5-6 digit number at the start
+            if _ITEM_LINE_RE.match(parts[0]):
+                item_data['item_code'] = parts[0]
+                # Try to find quantity and price
+                for i in range(len(parts)-1, 0, -1):
+                    if _DIGITS_ONLY_RE.match(parts[i]):  # Quantity
+                        item_data['quantity'] = parts[i]
+                        # Description is everything between code and quantity
+                        item_data['description'] = ' '.join(parts[1:i])
+                        # Look for price before quantity
+                        if i > 0 and _NUMBER_ONLY_RE.match(parts[i-1]):
+                            item_data['unit_price'] = parts[i-1]
+                        break
+    
+    # Extract metadata from the entire block
+    for line in normalized_block:
+        # Lot number
+        lot_match = _LOT_NUMBER_RE.search(line)
+        if lot_match and not item_data['lot']:
+            item_data['lot'] = lot_match.group(1)
+        
+        # Customer article number
+        art_match = _YOUR_ART_NO_RE.search(line)
+        if art_match:
+            art_no = art_match.group(1)
+            if art_no and item_data['description']:
+                item_data['description'] += f" (Art-No: {art_no})"
+        
+        # MDL registration number
+        mdl_match = _MDL_REG_NO_RE.search(line)
+        if mdl_match:
+            mdl_no = mdl_match.group(1)
+            if mdl_no and item_data['description']:
+                item_data['description'] += f" (MDL: {mdl_no})"
+    
+    # If we still don't have a unit price, try to extract it from any line
+    if not item_data['unit_price']:
+        for line in normalized_block:
+            prices = _PRICES_RE.findall(line)
+            if prices:
+                item_data['unit_price'] = prices[0]
+                break
+    
+    # Only return if we have essential data
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    if trace:
+        trace("item_block_unparsed", page=page_num + 1, block=normalized_block)
+    return None
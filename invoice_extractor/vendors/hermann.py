@@ -0,0 +1,278 @@
+"""Hermann invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ARTICLE_DESCRIPTION_RE = re.compile(r'POS\s+ARTICLE\s+description', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+H\d+-\d+')
+_TOTAL_NET_PACKAGE_RE = re.compile(r'total net|package|total/EUR|payment|delivery|Delivery|Goods remain|Complaints', re.IGNORECASE)
+_PROFORMA_COMMERCIAL_INVOICE_RE = re.compile(r'(?:PROFORMA|COMMERCIAL)\s+INVOICE\s*:?\s*(\d+)', re.IGNORECASE)
+_ALT_INV_RE = re.compile(r'INVOICE\s+(\d+)', re.IGNORECASE)
+_CUST_NO_DATE_RE = re.compile(r'Cust\.-No\.\s+Date\s+Our sign\s+Your inq\. No\.\s+Your inq\. date', re.IGNORECASE)
+_DATA_RE = re.compile(r'^(\d+)\s+(\d{2}\.\d{2}\.\d{4})\s+\w+\s+(\d+)\s+(\d{2}\.\d{2}\.\d{4})$')
+_CUST_NO_DATE_VALUES_RE = re.compile(r'Cust\.-No\.\s*:\s*(\d+).*Date\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUST_NO_RE = re.compile(r'Cust\.?-?No\.?\s*:\s*(\d+)', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.?\s*([^\s-]+)\s*-\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_OC_NO_RE = re.compile(r'OC No\.?\s*:\s*(\d+)', re.IGNORECASE)
+_YOUR_INQ_NO_RE = re.compile(r'Your inq\. No\.\s*(\d+)\s*Your inq\. date\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_POS_RE = re.compile(r'^(\d+)\s+')
+_ITEM_RE = re.compile(r'^(H\d+-\d+)\s+(.+?)\s+(\d+)\s+([\d,]+)\s+[\d,]+$')
+_ALT_RE = re.compile(r'^(H\d+-\d+)\s+(.+?)\s+([A-Z0-9/-]+)\s+(\d+)\s+([\d,]+)\s+[\d,]+$')
+_FLEX_RE = re.compile(r'^(H\d+-\d+)\s+(.+?)\s+(\d+)\s+([\d,]+)')
+_LOT_NUMBER_RE = re.compile(r'lot number:\s*([A-Z0-9/-]+)', re.IGNORECASE)
+_YOUR_ART_NO_RE = re.compile(r'your art\.?-?no\.?:\s*([^\s]+)', re.IGNORECASE)
+_MDL_LST_REG_RE = re.compile(r'(?:MDL|LST)\s+Reg\.?\s+No\.?:\s*([^\s]+)', re.IGNORECASE)
+_ITEM_DETAIL_LABEL_RE = re.compile(r'your art\.?-?no\.?|MDL Reg|LST Reg|lot number', re.IGNORECASE)
+_LEADING_LETTER_RE = re.compile(r'^[a-zA-Z]')
+_PRICES_RE = re.compile(r'\b(\d+[,.]\d{2})\b')
+_NUMBERS_RE = re.compile(r'\b(\d+)\b')
+_PRICE_RE = re.compile(r'\d+[,.]\d{2}')
+
+_LAYOUT = TableLayout(
+    header=_POS_ARTICLE_DESCRIPTION_RE,
+    header_words=('POS', 'ARTICLE', 'description'),
+    # e.g. "1 H118-25438"
+    item_start=_ITEM_START_RE,
+    # Summary lines end an item
+    terminator=_TOTAL_NET_PACKAGE_RE,
+)
+
+
+def iter_hermann_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Hermann invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_hermann_invoice_info(lines)
+            
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_hermann_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_hermann_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_hermann_invoice_rows()."""
+    return list(iter_hermann_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_hermann_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Hermann invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for i, line in enumerate(lines):
+        line_clean = line.strip()
+        
+        # Extract invoice number (both PROFORMA INVOICE and COMMERCIAL INVOICE)
+        inv_match = _PROFORMA_COMMERCIAL_INVOICE_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Alternative invoice number pattern
+        if not invoice_data['invoice_number']:
+            alt_inv_match = _ALT_INV_RE.search(line_clean)
+            if alt_inv_match:
+                invoice_data['invoice_number'] = alt_inv_match.group(1)
+        
+        # Extract customer number and date from the specific format:
+        # "Cust.-No. Date Our sign Your inq. No. Your inq. date"
+        # "11444 15.02.2018 sb 0006821 15.02.2018"
+        if _CUST_NO_DATE_RE.search(line_clean):
+            # The next line should contain the actual data
+            if i + 1 < len(lines):
+                data_line = lines[i + 1].strip()
+                # Pattern: "11444 15.02.2018 sb 0006821 15.02.2018"
+                data_match = _DATA_RE.search(data_line)
+                if data_match:
+                    if not invoice_data['customer_number']:
+                        invoice_data['customer_number'] = data_match.group(1)
+                    if not invoice_data['invoice_date']:
+                        invoice_data['invoice_date'] = data_match.group(2)
+                    if not invoice_data['order_no']:
+                        invoice_data['order_no'] = data_match.group(3)
+                    if not invoice_data['order_date']:
+                        invoice_data['order_date'] = data_match.group(4)
+        
+        # Alternative pattern for customer number and date (when not in the header table format)
+        cust_date_match = _CUST_NO_DATE_VALUES_RE.search(line_clean)
+        if cust_date_match:
+            if not invoice_data['customer_number']:
+                invoice_data['customer_number'] = cust_date_match.group(1)
+            if not invoice_data['invoice_date']:
+                invoice_data['invoice_date'] = cust_date_match.group(2)
+        
+        # Extract invoice date separately if still missing
+        if not invoice_data['invoice_date']:
+            date_match = _DATE_RE.search(line_clean)
+            if date_match:
+                invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number separately if still missing
+        if not invoice_data['customer_number']:
+            cust_match = _CUST_NO_RE.search(line_clean)
+            if cust_match:
+                invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract order information
+        order_match = _YOUR_ORDER_NO_RE.search(line_clean)
+        if order_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = order_match.group(1)
+            invoice_data['order_date'] = order_match.group(2)
+        
+        # Extract OC number (order confirmation) as alternative order reference
+        if not invoice_data['order_no']:
+            oc_match = _OC_NO_RE.search(line_clean)
+            if oc_match:
+                invoice_data['order_no'] = oc_match.group(1)
+        
+        # Extract your inquiry information as alternative (for the specific header format)
+        if not invoice_data['order_no']:
+            inq_match = _YOUR_INQ_NO_RE.search(line_clean)
+            if inq_match:
+                invoice_data['order_no'] = inq_match.group(1)
+                invoice_data['order_date'] = inq_match.group(2)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_hermann_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Hermann invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': invoice_data['order_no'],
+        'order_date': invoice_data['order_date'],
+        'delivery_note': invoice_data.get('delivery_note', ''),
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract position number (remove it since we don't need it)
+    pos_match = _POS_RE.search(first_line)
+    if pos_match:
+        # Remove the position number from the line for easier parsing
+        first_line = first_line[len(pos_match.group(0)):].strip()
+    
+    # Extract item code, description, quantity, unit price
+    # Pattern: "H118-25438 GORNEY RAKE retractor 7,5 cm 5 42,74 213,70"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1).strip()
+        item_data['description'] = item_match.group(2).strip()
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(4)
+    
+    # Alternative pattern for different formatting (with lot numbers)
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = alt_match.group(1).strip()
+            item_data['description'] = alt_match.group(2).strip()
+            item_data['lot'] = alt_match.group(3).strip()  # Lot number from main line
+            item_data['quantity'] = alt_match.group(4)
+            item_data['unit_price'] = alt_match.group(5)
+    
+    # More flexible pattern if above patterns fail
+    if not item_data['item_code']:
+        flex_match = _FLEX_RE.search(first_line)
+        if flex_match:
+            item_data['item_code'] = flex_match.group(1).strip()
+            item_data['description'] = flex_match.group(2).strip()
+            item_data['quantity'] = flex_match.group(3)
+            item_data['unit_price'] = flex_match.group(4)
+    
+    # Extract metadata from the entire block
+    for line in block:
+        # Lot number (if not already extracted from main line)
+        if not item_data['lot']:
+            lot_match = _LOT_NUMBER_RE.search(line)
+            if lot_match:
+                item_data['lot'] = lot_match.group(1).strip()
+        
+        # Customer article number
+        art_match = _YOUR_ART_NO_RE.search(line)
+        if art_match:
+            art_no = art_match.group(1)
+            if art_no and item_data['description']:
+                item_data['description'] += f" (Art-No: {art_no})"
+        
+        # MDL/LST registration number
+        mdl_match = _MDL_LST_REG_RE.search(line)
+        if mdl_match:
+            mdl_no = mdl_match.group(1)
+            if mdl_no and item_data['description']:
+                item_data['description'] += f" (Reg: {mdl_no})"
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Only include lines that don't look like metadata
+            if not _ITEM_DETAIL_LABEL_RE.search(line):
+                clean_line = line.strip()
+                if clean_line and not _ITEM_START_RE.match(clean_line):  # Don't include lines that start like new items
+                    # Check if this line contains additional description (like "with spring, 38mm wide")
+                    if _LEADING_LETTER_RE.match(clean_line):  # Starts with a letter
+                        additional_desc.append(clean_line)
+        
+        if additional_desc:
+            item_data['description'] += ' - ' + ' '.join(additional_desc)
+    
+    # Extract unit price from alternative patterns if still missing
+    if not item_data['unit_price']:
+        prices = _PRICES_RE.findall(first_line)
+        if len(prices) >= 2:  # Usually there are two prices: unit price and total
+            item_data['unit_price'] = prices[0]  # First price is unit price
+    
+    # Extract quantity from alternative patterns if still missing
+    if not item_data['quantity']:
+        # Look for numbers that are likely quantities (not prices)
+        numbers = _NUMBERS_RE.findall(first_line)
+        if len(numbers) >= 2:
+            # The number before the prices is likely the quantity
+            for i, num in enumerate(numbers):
+                if i < len(numbers) - 1 and _PRICE_RE.search(first_line.split(num)[-1]):
+                    item_data['quantity'] = num
+                    break
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
@@ -0,0 +1,293 @@
+"""HGR invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ARTICLE_DESCRIPTION_RE = re.compile(r'POS\s+ARTICLE\s+description\s+qty\.', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\d+-\d+')
+_TOTAL_NET_PACKAGE_RE = re.compile(r'total net|package|freight|total/EUR|payment|Terms of', re.IGNORECASE)
+_INVOICE_NO_RE = re.compile(r'INVOICE NO\.?\s*:\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUST_NO_RE = re.compile(r'Cust\.-No\.?\s*:\s*(\d+)', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.?\s*([^\s-]+)\s*-\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_INVOICE_NO_DATE_RE = re.compile(r'Invoice No\.\s+Invoice Date\s+due since\s+falling since\s+gross amount', re.IGNORECASE)
+_DATA_RE = re.compile(r'^(\d+)\s+(\d{2}\.\d{2}\.\d{4})\s+(\d{2}\.\d{2}\.\d{4})\s+(\d+)\s+Tage\s+([\d,]+)')
+_POS_RE = re.compile(r'^(\d+)\s+')
+_ITEM_RE = re.compile(r'^(\S+?-\d+/\d+)\s+(.+?)\s+(\d+)\s+([\d,]+)\s+[\d,]+$')
+_ALT_RE = re.compile(r'^(\S+)\s+(.+?)\s+(\d+)\s+([\d,]+)\s+[\d,]+$')
+_LOT_NUMBER_RE = re.compile(r'Lot number\s*([^\s]+)', re.IGNORECASE)
+_YOUR_ART_NO_RE = re.compile(r'your art\.?-?no\.?:\s*([^\s]+)', re.IGNORECASE)
+_LST_RE = re.compile(r'LST\s*#?:\s*([^\s]+)', re.IGNORECASE)
+_LOT_NUMBER_YOUR_RE = re.compile(r'Lot number|your art\.?-?no\.?|LST\s*#?', re.IGNORECASE)
+_ITEM_START_ANY_CODE_RE = re.compile(r'^\d+\s+\S+-\d+')
+_PRICES_RE = re.compile(r'\b(\d+[,.]\d{2})\b')
+
+_LAYOUT = TableLayout(
+    header=_POS_ARTICLE_DESCRIPTION_RE,
+    # e.g. "1 6-1215/07"
+    item_start=_ITEM_START_RE,
+    # Summary lines end an item
+    terminator=_TOTAL_NET_PACKAGE_RE,
+)
+
+
+def iter_hgr_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from HGR invoice format (both Rechnung and Mahnung).
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # First, determine if this is a Rechnung (invoice) or Mahnung (reminder)
+            is_reminder = any('reminder' in line.lower() or 'mahnung' in line.lower() for line in lines)
+            
+            if is_reminder:
+                # Process as payment reminder
+                invoice_data = _extract_hgr_reminder_info(lines)
+                # For reminders, we create a single item representing the overdue invoice
+                item_data = _parse_hgr_reminder_block(lines, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+            else:
+                # Process as regular invoice
+                invoice_data = _extract_hgr_invoice_info(lines)
+                
+                for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                    item_data = _parse_hgr_item_block(block, invoice_data, page_num)
+                    if item_data:
+                        yield item_data
+
+def extract_hgr_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_hgr_invoice_rows()."""
+    return list(iter_hgr_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_hgr_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from HGR regular invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number
+        inv_match = _INVOICE_NO_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number
+        cust_match = _CUST_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract order information
+        order_match = _YOUR_ORDER_NO_RE.search(line_clean)
+        if order_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = order_match.group(1)
+            invoice_data['order_date'] = order_match.group(2)
+    
+    return invoice_data
+
+@timed("header")
+def _extract_hgr_reminder_info(lines: List[str]) -> Dict[str, str]:
+    """Extract information from HGR payment reminder"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': '',
+        'reminder_type': '',
+        'due_date': '',
+        'days_overdue': '',
+        'gross_amount': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract reminder type
+        if '2nd reminder' in line_clean:
+            invoice_data['reminder_type'] = '2nd reminder'
+        elif 'reminder' in line_clean.lower() and not invoice_data['reminder_type']:
+            invoice_data['reminder_type'] = '1st reminder'
+        
+        # Extract customer number
+        cust_match = _CUST_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract reminder date
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)  # Using reminder date as invoice date
+    
+    # Extract invoice table data
+    for i, line in enumerate(lines):
+        line_clean = line.strip()
+        
+        # Look for the invoice table header
+        if _INVOICE_NO_DATE_RE.search(line_clean):
+            # The next line should contain the invoice data
+            if i + 1 < len(lines):
+                data_line = lines[i + 1].strip()
+                # Pattern: "22461738 20.11.2024 19.01.2025 17 Tage 163,00 EUR 0,00"
+                data_match = _DATA_RE.search(data_line)
+                if data_match:
+                    if not invoice_data['invoice_number']:
+                        invoice_data['invoice_number'] = data_match.group(1)
+                    if not invoice_data['order_date']:  # Using invoice date as order date
+                        invoice_data['order_date'] = data_match.group(2)
+                    invoice_data['due_date'] = data_match.group(3)
+                    invoice_data['days_overdue'] = data_match.group(4)
+                    invoice_data['gross_amount'] = data_match.group(5)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_hgr_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from HGR regular invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': invoice_data['order_no'],
+        'order_date': invoice_data['order_date'],
+        'delivery_note': invoice_data.get('delivery_note', ''),
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract position number (remove it since we don't need it)
+    pos_match = _POS_RE.search(first_line)
+    if pos_match:
+        # Remove the position number from the line for easier parsing
+        first_line = first_line[len(pos_match.group(0)):].strip()
+    
+    # Extract item code, description, quantity, unit price
+    # Pattern: "6-1215/07 Alms skin retractor, blunt,7cm 10 27,75 277,50"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1).strip()
+        item_data['description'] = item_data['item_code'] + ' ' + item_match.group(2).strip()
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(4)
+    
+    # Alternative pattern for different item code formats
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match and len(alt_match.group(1)) > 3:  # Ensure it's a reasonable item code
+            item_data['item_code'] = alt_match.group(1).strip()
+            item_data['description'] = alt_match.group(2).strip()
+            item_data['quantity'] = alt_match.group(3)
+            item_data['unit_price'] = alt_match.group(4)
+    
+    # Extract metadata from the entire block
+    for line in block:
+        # Lot number
+        lot_match = _LOT_NUMBER_RE.search(line)
+        if lot_match and not item_data['lot']:
+            item_data['lot'] = lot_match.group(1)
+        
+        # Customer article number
+        art_match = _YOUR_ART_NO_RE.search(line)
+        if art_match:
+            art_no = art_match.group(1)
+            if art_no and item_data['description']:
+                item_data['description'] += f" (Art-No: {art_no})"
+        
+        # LST number
+        lst_match = _LST_RE.search(line)
+        if lst_match:
+            lst_no = lst_match.group(1)
+            if lst_no and item_data['description']:
+                item_data['description'] += f" (LST: {lst_no})"
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Only include lines that don't look like metadata
+            if not _LOT_NUMBER_YOUR_RE.search(line):
+                clean_line = line.strip()
+                if clean_line and not _ITEM_START_ANY_CODE_RE.match(clean_line):  # Don't include lines that start like new items
+                    additional_desc.append(clean_line)
+        
+        if additional_desc:
+            item_data['description'] += ' - ' + ' '.join(additional_desc)
+    
+    # Extract unit price from alternative patterns if still missing
+    if not item_data['unit_price']:
+        prices = _PRICES_RE.findall(first_line)
+        if len(prices) >= 2:  # Usually there are two prices: unit price and total
+            item_data['unit_price'] = prices[0]  # First price is unit price
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
+
+@timed("parse")
+def _parse_hgr_reminder_block(lines: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse HGR payment reminder as a single item"""
+    # Build description with reminder details
+    description = f"Payment Reminder - {invoice_data.get('reminder_type', 'Reminder')}"
+    
+    # Add overdue information to description
+    if invoice_data.get('days_overdue'):
+        description += f" - {invoice_data['days_overdue']} days overdue"
+    
+    if invoice_data.get('due_date'):
+        description += f" - Due since {invoice_data['due_date']}"
+    
+    item_data = {
+        'invoice_date': invoice_data.get('order_date', ''),  # Use original invoice date
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': invoice_data['invoice_number'],  # Use invoice number as order number for reminders
+        'order_date': invoice_data.get('order_date', invoice_data['invoice_date']),
+        'delivery_note': '',
+        'item_code': 'REMINDER',
+        'description': description,
+        'quantity': '1',
+        'unit_price': invoice_data.get('gross_amount', '0'),
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    return item_data
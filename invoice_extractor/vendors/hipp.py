@@ -0,0 +1,234 @@
+"""Hipp invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..common import _extract_invoice_info
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_TO_BE_CARRIED_RE = re.compile(r'to be carried over|total|Value of goods|Page', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d{7}\s+[A-Z]\d{6}\s+[A-Z]{3}')
+_REF_NO_RE = re.compile(r'Ref\.-No\.')
+_POSITION_START_RE = re.compile(r'^\d+\s+\(\d+\)\s+[A-Z0-9\.]+\s+[A-Z]')
+_CARRIED_OVER_RE = re.compile(r'to be carried over', re.IGNORECASE)
+_ORDER_CONFIRMATION_RE = re.compile(r'Order confirmation\s+(\d+)', re.IGNORECASE)
+_YOUR_ORDER_RE = re.compile(r'Your order\s+([^\s]+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'dtd\.?\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_PCS_STCK_RE = re.compile(r'^\d+\s+\(\d+\)\s+[A-Z0-9\.]+\s+(.+?)\s+(\d+,\d+)\s*(?:pcs|Stck|stck)\s*([\d,]+)\s*([\d,]+)')
+_ITEM_FIELD_RE = re.compile(r'[A-Z][a-z]+\s+[A-Z][a-z]+\s+')
+_REF_NO_LOT_RE = re.compile(r'^\d{7}|Ref\.-No\.|Lot:|Quantity:|Order|Page')
+_QTY_RE = re.compile(r'Quantity:\s*(\d+)', re.IGNORECASE)
+_LOT_RE = re.compile(r'Lot:\s*(\d+)', re.IGNORECASE)
+_QTY_PRICES_RE = re.compile(r'(\d+,\d+)\s*(?:pcs|Stck|stck)\s*([\d,]+)\s*([\d,]+)')
+
+
+def iter_hipp_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Anton Hipp GmbH invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_invoice_info(lines)
+            
+            # Find order confirmation sections
+            order_blocks = []
+            current_order_block = []
+            in_order_block = False
+            
+            for line in lines:
+                line_clean = line.strip()
+                
+                # Start of order confirmation block
+                if _ORDER_CONFIRMATION_RE.search(line_clean):
+                    if current_order_block and in_order_block:
+                        order_blocks.append(current_order_block)
+                    current_order_block = [line_clean]
+                    in_order_block = True
+                
+                # Continue adding to current order block
+                elif in_order_block:
+                    if (_ORDER_CONFIRMATION_RE.search(line_clean) or
+                        _TO_BE_CARRIED_RE.search(line_clean)):
+                        order_blocks.append(current_order_block)
+                        current_order_block = [line_clean] if _ORDER_CONFIRMATION_RE.search(line_clean) else []
+                        in_order_block = bool(current_order_block)
+                    else:
+                        current_order_block.append(line_clean)
+            
+            if current_order_block and in_order_block:
+                order_blocks.append(current_order_block)
+            
+            # Process each order confirmation block to find individual items
+            for order_block in order_blocks:
+                # Extract order info from the order block header
+                order_info = _extract_hipp_order_info(order_block)
+                
+                # Find individual items within this order block
+                item_blocks = []
+                current_item_block = []
+                in_item_block = False
+                
+                for line in order_block:
+                    line_clean = line.strip()
+                    
+                    # Start of item block (article number or product line)
+                    if (_ITEM_START_RE.search(line_clean) or  # 8010528 A915928 LRW
+                        _REF_NO_RE.search(line_clean) or  # Ref.-No.E7862-25
+                        _POSITION_START_RE.search(line_clean)):  # 3 (1) 1.045.14 AUFRICHT
+                        
+                        if current_item_block and in_item_block:
+                            item_blocks.append(current_item_block)
+                        current_item_block = [line_clean]
+                        in_item_block = True
+                    
+                    # Continue adding to current item block (include lot and quantity lines)
+                    elif in_item_block:
+                        if (_ITEM_START_RE.search(line_clean) or
+                            _REF_NO_RE.search(line_clean) or
+                            _POSITION_START_RE.search(line_clean) or
+                            _CARRIED_OVER_RE.search(line_clean)):
+                            
+                            item_blocks.append(current_item_block)
+                            current_item_block = [line_clean] if not _CARRIED_OVER_RE.search(line_clean) else []
+                            in_item_block = bool(current_item_block)
+                        else:
+                            # Include lot and quantity lines in the item block
+                            current_item_block.append(line_clean)
+                
+                if current_item_block and in_item_block:
+                    item_blocks.append(current_item_block)
+                
+                # Process each item block with the order info
+                for item_block in item_blocks:
+                    # Combine order info with item details
+                    full_block = order_block[:2] + item_block  # First 2 lines contain order info
+                    item_data = _parse_hipp_item_block(full_block, invoice_data, page_num)
+                    if item_data:
+                        yield item_data
+
+def extract_hipp_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_hipp_invoice_rows()."""
+    return list(iter_hipp_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_hipp_order_info(order_block: List[str]) -> Dict[str, str]:
+    """Extract order information from order confirmation block"""
+    order_info = {
+        'confirmation_no': '',
+        'order_no': '',
+        'order_date': ''
+    }
+    
+    # Check first two lines for order information
+    for i, line in enumerate(order_block[:2]):
+        line_clean = line.strip()
+        
+        # Extract confirmation number from first line
+        if i == 0:
+            conf_match = _ORDER_CONFIRMATION_RE.search(line_clean)
+            if conf_match:
+                order_info['confirmation_no'] = conf_match.group(1)
+        
+        # Extract order number and date from second line
+        if i == 1:
+            order_match = _YOUR_ORDER_RE.search(line_clean)
+            if order_match:
+                order_info['order_no'] = order_match.group(1)
+            
+            date_match = _DATE_RE.search(line_clean)
+            if date_match:
+                order_info['order_date'] = date_match.group(1)
+    
+    return order_info
+
+@timed("parse")
+def _parse_hipp_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Hipp invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'confirmation_no': '',
+        'order_no': '',
+        'order_date': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'total_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # Extract order information from the first two lines of the block
+    order_info = _extract_hipp_order_info(block)
+    item_data['confirmation_no'] = order_info['confirmation_no']
+    item_data['order_no'] = order_info['order_no']
+    item_data['order_date'] = order_info['order_date']
+    
+    block_text = ' '.join(block)
+    
+    # Extract description - look for the product name line
+    # Format: "3 (1) 1.045.14 AUFRICHT Scissor 14.5 cm curved 3,00pcs 20,14 60,42"
+    desc_match = _PCS_STCK_RE.search(block_text)
+    if desc_match:
+        item_data['description'] = desc_match.group(1).strip()
+        item_data['quantity'] = desc_match.group(2)
+        item_data['unit_price'] = desc_match.group(3)
+        item_data['total_price'] = desc_match.group(4)
+    
+    # Alternative approach: extract from individual lines
+    if not item_data['description']:
+        desc_lines = []
+        for line in block:
+            # Look for lines that contain product descriptions
+            if (_ITEM_FIELD_RE.search(line) and  # Multiple words with capitalization
+                not _REF_NO_LOT_RE.search(line)):  # Exclude metadata lines
+                desc_lines.append(line.strip())
+        
+        if desc_lines:
+            item_data['description'] = ' '.join(desc_lines).strip()
+    
+    # Extract quantity from alternative format
+    if not item_data['quantity']:
+        qty_match = _QTY_RE.search(block_text)
+        if qty_match:
+            item_data['quantity'] = qty_match.group(1)
+    
+    # Extract lot number - look for "Lot:XXXXX" pattern (more flexible pattern)
+    lot_match = _LOT_RE.search(block_text)
+    if lot_match:
+        item_data['lot'] = lot_match.group(1)
+    
+    # If lot still not found, try a more specific search in individual lines
+    if not item_data['lot']:
+        for line in block:
+            lot_line_match = _LOT_RE.search(line)
+            if lot_line_match:
+                item_data['lot'] = lot_line_match.group(1)
+                break
+    
+    # Extract unit price and total from alternative formats
+    if not item_data['unit_price']:
+        price_match = _QTY_PRICES_RE.search(block_text)
+        if price_match:
+            item_data['quantity'] = price_match.group(1)
+            item_data['unit_price'] = price_match.group(2)
+            item_data['total_price'] = price_match.group(3)
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
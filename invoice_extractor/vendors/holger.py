@@ -0,0 +1,213 @@
+"""Holger invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_ITEM_START_RE = re.compile(r'^\d+\s+\d+\s+[A-Z]\d')
+_ITEM_CONTINUATION_RE = re.compile(r'^\d{4,}\s+[\dA-Z-]')
+_CERTIFICATE_NET_AMOUNT_RE = re.compile(r'Certificate:|Net amount|Shipping|Tax|Packing Slip')
+_INVOICE_NO_RE = re.compile(r'Invoice No\.\s*(\d+)', re.IGNORECASE)
+_DATE_CUST_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})\s+([A-Z]\d+)')
+_PACKING_SLIP_RE = re.compile(r'Packing Slip', re.IGNORECASE)
+_SLIP_RE = re.compile(r'(\d+)')
+_LEADING_DIGIT_RE = re.compile(r'^\d')
+_PRICE_RE = re.compile(r'\$([\d,]+\.\d{2})')
+
+
+def iter_holger_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Holger invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_holger_invoice_info(lines)
+            
+            # Find item blocks - Holger items span multiple lines
+            item_blocks = []
+            current_block = []
+            collecting_item = False
+            
+            for i, line in enumerate(lines):
+                line_clean = line.strip()
+                
+                # Look for lines that start with position numbers (e.g., "1 2 G91094-21")
+                if _ITEM_START_RE.match(line_clean):
+                    if current_block and collecting_item:
+                        item_blocks.append((current_block, invoice_data.copy()))
+                    current_block = [line_clean]
+                    collecting_item = True
+                
+                # Look for the second line of item data (e.g., "16739 0-27-3924 D094127 JZF 3617 778826221436 $15.40 $30.80")
+                elif collecting_item and _ITEM_CONTINUATION_RE.match(line_clean):
+                    current_block.append(line_clean)
+                    # After getting the second line, this item is complete
+                    item_blocks.append((current_block, invoice_data.copy()))
+                    current_block = []
+                    collecting_item = False
+                
+                # Continue collecting description lines if we're in an item block
+                elif collecting_item and current_block:
+                    # Stop if we hit a line that looks like the start of a new section
+                    if (_LEADING_DIGIT_RE.match(line_clean) or 
+                        _CERTIFICATE_NET_AMOUNT_RE.search(line_clean)):
+                        item_blocks.append((current_block, invoice_data.copy()))
+                        current_block = []
+                        collecting_item = False
+                    else:
+                        current_block.append(line_clean)
+            
+            if current_block and collecting_item:
+                item_blocks.append((current_block, invoice_data.copy()))
+            
+            # Process each item block
+            for block, inv_data in item_blocks:
+                item_data = _parse_holger_item_block(block, inv_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_holger_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_holger_invoice_rows()."""
+    return list(iter_holger_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_holger_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Holger invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'packing_slip': ''
+    }
+    
+    for i, line in enumerate(lines):
+        line_clean = line.strip()
+        
+        # Extract invoice number - look for "Invoice No. 3617" pattern
+        inv_match = _INVOICE_NO_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date and customer number from the same line
+        # Pattern: "9/26/2024 N5533" or similar
+        date_cust_match = _DATE_CUST_RE.search(line_clean)
+        if date_cust_match:
+            if not invoice_data['invoice_date']:
+                # Convert to DD.MM.YYYY format
+                us_date = date_cust_match.group(1)
+                parts = us_date.split('/')
+                if len(parts) == 3:
+                    invoice_data['invoice_date'] = f"{parts[1]}.{parts[0]}.{parts[2]}"
+            
+            if not invoice_data['customer_number']:
+                invoice_data['customer_number'] = date_cust_match.group(2)
+        
+        # Extract packing slip number
+        if _PACKING_SLIP_RE.search(line_clean):
+            # Look for number in the same line or next line
+            slip_match = _SLIP_RE.search(line_clean)
+            if slip_match:
+                invoice_data['packing_slip'] = slip_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_holger_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Holger invoice"""
+    if not block or len(block) < 2:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': invoice_data.get('order_no', ''),
+        'order_date': invoice_data.get('order_date', ''),
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # First line: "1 2 G91094-21 Zenith frazier suction tube, angled, w/ finger cut-off..."
+    first_line = block[0].strip()
+    
+    # Second line: "16739 0-27-3924 D094127 JZF 3617 778826221436 $15.40 $30.80"
+    second_line = block[1].strip() if len(block) > 1 else ""
+    
+    # Parse first line: position, quantity, item code, and description
+    first_parts = first_line.split()
+    if len(first_parts) >= 3:
+        # Position is first_parts[0], quantity is first_parts[1], item code is first_parts[2]
+        item_data['quantity'] = first_parts[1]
+        item_data['item_code'] = first_parts[2]
+        
+        # Description is everything after the item code
+        desc_start = len(first_parts[0]) + len(first_parts[1]) + len(first_parts[2]) + 3
+        item_data['description'] = first_line[desc_start:].strip()
+    
+    # Parse second line: PO number, lot number, MDL number, prices, etc.
+    second_parts = second_line.split()
+    if len(second_parts) >= 8:
+        # PO number: second_parts[0] (e.g., "16739")
+        if not item_data['order_no']:
+            item_data['order_no'] = second_parts[0]
+        
+        # Lot number: second_parts[1] (e.g., "0-27-3924")
+        item_data['lot'] = second_parts[1]
+        
+        # MDL number: second_parts[2] (e.g., "D094127")
+        mdl_number = second_parts[2]
+        
+        # Unit price: look for $15.40 pattern (usually second to last)
+        for part in second_parts:
+            if part.startswith('$'):
+                price = part[1:]  # Without the $
+                if '.' in price:  # Verify it's a decimal price
+                    item_data['unit_price'] = price
+                    break
+        
+        # Add MDL number to description
+        if mdl_number and item_data['description']:
+            item_data['description'] += f" (MDL: {mdl_number})"
+    
+    # Handle multi-line descriptions (lines beyond the first two)
+    if len(block) > 2:
+        additional_desc = []
+        for line in block[2:]:
+            clean_line = line.strip()
+            if clean_line and not _LEADING_DIGIT_RE.match(clean_line):  # Not starting with number
+                additional_desc.append(clean_line)
+        
+        if additional_desc:
+            item_data['description'] += ' ' + ' '.join(additional_desc)
+    
+    # If we didn't find unit price in second line, try to find it anywhere in the block
+    if not item_data['unit_price']:
+        for line in block:
+            price_match = _PRICE_RE.search(line)
+            if price_match:
+                # Take the first price found as unit price
+                item_data['unit_price'] = price_match.group(1)
+                break
+    
+    # Only return if we have essential data
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
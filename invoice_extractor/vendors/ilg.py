@@ -0,0 +1,226 @@
+"""ILG invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POARTICLE_DESCRIPTION_QTY_RE = re.compile(r'POARTICLE\s+description\s+qty\.', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\d+-\w+-\d+-\d+')
+_TOTAL_NET_PACKAGE_RE = re.compile(r'total net|package|total/EUR|payment|delivery|Country of Origin', re.IGNORECASE)
+_INVOICE_NO_RE = re.compile(r'INVOICE NO\.?\s*:\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUST_NO_RE = re.compile(r'Cust\.-No\.?\s*:\s*(\d+)', re.IGNORECASE)
+_DELIVERY_NOTE_NO_RE = re.compile(r'Delivery Note No\.?\s*(\d+)\s*at\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.?\s*([^\s-]+)\s*-\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_POS_RE = re.compile(r'^(\d+)\s+')
+_ITEM_RE = re.compile(r'^(\d+-\w+-\d+-\d+)\s+(.+?)\s+(\d+)\s+([\d,]+)\s+[\d,]+$')
+_ALT_RE = re.compile(r'^(\d+-\w+-\d+-\d+)\s+(.+?)\s+(\d+)\s+([\d,]+)')
+_LOT_NUMBER_RE = re.compile(r'lot number:\s*([^\s]+)', re.IGNORECASE)
+_LST_RE = re.compile(r'LST:\s*([^\s]+)', re.IGNORECASE)
+_DRAWING_NO_RE = re.compile(r'Drawing no\.:\s*([^\s]+)', re.IGNORECASE)
+_INDEX_RE = re.compile(r'Index:\s*([^\s]+)', re.IGNORECASE)
+_LOT_NUMBER_LST_RE = re.compile(r'lot number:|LST:|Drawing no\.:|Index:', re.IGNORECASE)
+_LEADING_LETTER_RE = re.compile(r'^[a-zA-Z]')
+_PRICES_RE = re.compile(r'\b(\d+[,.]\d{2})\b')
+_NUMBERS_RE = re.compile(r'\b(\d+)\b')
+_PRICE_RE = re.compile(r'\d+[,.]\d{2}')
+
+_LAYOUT = TableLayout(
+    header=_POARTICLE_DESCRIPTION_QTY_RE,
+    header_words=('POARTICLE', 'description', 'qty.'),
+    # e.g. "1 69-MC-12-130"
+    item_start=_ITEM_START_RE,
+    # Summary lines end an item
+    terminator=_TOTAL_NET_PACKAGE_RE,
+)
+
+
+def iter_ilg_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from ILG invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_ilg_invoice_info(lines)
+            
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_ilg_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_ilg_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_ilg_invoice_rows()."""
+    return list(iter_ilg_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_ilg_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from ILG invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number
+        inv_match = _INVOICE_NO_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number
+        cust_match = _CUST_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract delivery note
+        delivery_match = _DELIVERY_NOTE_NO_RE.search(line_clean)
+        if delivery_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = delivery_match.group(1)
+        
+        # Extract order information
+        order_match = _YOUR_ORDER_NO_RE.search(line_clean)
+        if order_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = order_match.group(1)
+            invoice_data['order_date'] = order_match.group(2)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_ilg_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from ILG invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': invoice_data['order_no'],
+        'order_date': invoice_data['order_date'],
+        'delivery_note': invoice_data['delivery_note'],
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract position number (remove it since we don't need it)
+    pos_match = _POS_RE.search(first_line)
+    if pos_match:
+        # Remove the position number from the line for easier parsing
+        first_line = first_line[len(pos_match.group(0)):].strip()
+    
+    # Extract item code, description, quantity, unit price
+    # Pattern: "69-MC-12-130 McGulloch Suction tube 12 FR. 10 27,50 275,00"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1).strip()
+        item_data['description'] = item_match.group(2).strip()
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(4)
+    
+    # Alternative pattern for different formatting
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = alt_match.group(1).strip()
+            item_data['description'] = item_match.group(2).strip()
+            item_data['quantity'] = item_match.group(3)
+            item_data['unit_price'] = item_match.group(4)
+    
+    # Extract metadata from the entire block
+    for line in block:
+        # Lot number
+        lot_match = _LOT_NUMBER_RE.search(line)
+        if lot_match and not item_data['lot']:
+            item_data['lot'] = lot_match.group(1)
+        
+        # LST number
+        lst_match = _LST_RE.search(line)
+        if lst_match:
+            lst_no = lst_match.group(1)
+            if lst_no and item_data['description']:
+                item_data['description'] += f" (LST: {lst_no})"
+        
+        # Drawing number
+        drawing_match = _DRAWING_NO_RE.search(line)
+        if drawing_match:
+            drawing_no = drawing_match.group(1)
+            if drawing_no and item_data['description']:
+                item_data['description'] += f" (Drawing: {drawing_no})"
+        
+        # Index
+        index_match = _INDEX_RE.search(line)
+        if index_match:
+            index_no = index_match.group(1)
+            if index_no and item_data['description']:
+                item_data['description'] += f" (Index: {index_no})"
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Only include lines that don't look like metadata
+            if not _LOT_NUMBER_LST_RE.search(line):
+                clean_line = line.strip()
+                if clean_line and not _ITEM_START_RE.match(clean_line):  # Don't include lines that start like new items
+                    # Check if this line contains additional description (like "WL 130 mm")
+                    if _LEADING_LETTER_RE.match(clean_line):  # Starts with a letter
+                        additional_desc.append(clean_line)
+        
+        if additional_desc:
+            item_data['description'] += ' - ' + ' '.join(additional_desc)
+    
+    # Extract unit price from alternative patterns if still missing
+    if not item_data['unit_price']:
+        prices = _PRICES_RE.findall(first_line)
+        if len(prices) >= 2:  # Usually there are two prices: unit price and total
+            item_data['unit_price'] = prices[0]  # First price is unit price
+    
+    # Extract quantity from alternative patterns if still missing
+    if not item_data['quantity']:
+        # Look for numbers that are likely quantities (not prices)
+        numbers = _NUMBERS_RE.findall(first_line)
+        if len(numbers) >= 2:
+            # The number before the prices is likely the quantity
+            for i, num in enumerate(numbers):
+                if i < len(numbers) - 1 and _PRICE_RE.search(first_line.split(num)[-1]):
+                    item_data['quantity'] = num
+                    break
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
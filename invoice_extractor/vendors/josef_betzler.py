@@ -0,0 +1,273 @@
+"""Josef Betzler invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_YOUR_ORDER_DTD_RE = re.compile(r'Your order\s+([^\s]+)\s+dtd\.\s+(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_YOUR_REF_ANY_CASE_RE = re.compile(r'your Ref\.:\s*([^\s]+)', re.IGNORECASE)
+_ITEM_LINE_RE = re.compile(r'^\d+,?\d*$')
+_LST_RE = re.compile(r'LST\s*([A-Z]\d+)', re.IGNORECASE)
+_CHARGE_RE = re.compile(r'Charge:\s*([^\s]+)', re.IGNORECASE)
+_CLASS_RE = re.compile(r'Classification:\s*([^\s]+)', re.IGNORECASE)
+_QTY_RE = re.compile(r'Quantity:\s*(\d+)', re.IGNORECASE)
+_LST_CHARGE_CLASSIFICATION_RE = re.compile(r'LST|Charge:|Classification:|Quantity:', re.IGNORECASE)
+_LEADING_LETTER_RE = re.compile(r'^[a-zA-Z]')
+_INV_RE = re.compile(r'No\.:\s*(\d+)')
+_DATE_RE = re.compile(r'Date:\s*(\d{2}\.\d{2}\.\d{4})')
+_ACC_NO_RE = re.compile(r'acc\.no\.:\s*([^\s]+)')
+_YOUR_REF_RE = re.compile(r'your ref\.:\s*([^\s]+)')
+_REF_DATE_RE = re.compile(r'dtd\.:\s*(\d{2}\.\d{2}\.\d{4})')
+_ITEM_PATTERNS = (
+    re.compile(r'(\d+)\s+(JB-\d+-\d+)\s+(.+?)\s+(\d+)\s+ea\s+([\d,]+)\s+[\d,]+'),
+    re.compile(r'(JB-\d+-\d+)\s+(.+?)\s+(\d+)\s+ea\s+([\d,]+)\s+[\d,]+'),
+    re.compile(r'(\d+)\s+(JB-\d+-\d+)\s+(.+?)\s+(\d+)\s+ea\s+([\d,]+)'),
+    re.compile(r'(JB-\d+-\d+)\s+(.+?)\s+(\d+)\s+ea\s+([\d,]+)'),
+)
+
+
+def iter_josef_betzler_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Josef Betzler invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_josef_betzler_invoice_info(lines)
+            
+            # Use a simpler approach - find items directly
+            item_blocks = _find_josef_betzler_items_directly(lines, invoice_data, page_num)
+            
+            for item_data in item_blocks:
+                if item_data:
+                    yield item_data
+
+def extract_josef_betzler_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_josef_betzler_invoice_rows()."""
+    return list(iter_josef_betzler_invoice_rows(pdf_content))
+
+def _find_josef_betzler_items_directly(lines: List[str], invoice_data: Dict, page_num: int) -> List[Dict]:
+    """Find items directly by scanning for JB- patterns"""
+    items = []
+    current_order_info = {'order_no': invoice_data.get('order_no', ''), 
+                         'order_date': invoice_data.get('order_date', '')}
+    
+    i = 0
+    while i < len(lines):
+        line = lines[i].strip()
+        
+        # Look for Orderconfirmation to update order info
+        if 'Orderconfirmation' in line and i + 1 < len(lines):
+            next_line = lines[i + 1].strip()
+            order_match = _YOUR_ORDER_DTD_RE.search(next_line)
+            if order_match:
+                current_order_info = {
+                    'order_no': order_match.group(1),
+                    'order_date': order_match.group(2)
+                }
+                i += 2  # Skip both lines
+                continue
+        
+        # Look for your Ref.: lines followed by JB- items
+        if 'your Ref.:' in line and i + 1 < len(lines):
+            # Extract customer reference
+            ref_match = _YOUR_REF_ANY_CASE_RE.search(line)
+            customer_ref = ref_match.group(1) if ref_match else None
+            
+            # Check next line for JB- pattern
+            next_line = lines[i + 1].strip()
+            if 'JB-' in next_line:
+                # This is an item - collect the item block
+                item_block = [line, next_line]
+                
+                # Collect subsequent lines that belong to this item
+                j = i + 2
+                while j < len(lines):
+                    next_line_text = lines[j].strip()
+                    # Stop if we hit another item marker or end of section
+                    if (not next_line_text or 
+                        'your Ref.:' in next_line_text or 
+                        'Orderconfirmation' in next_line_text or
+                        'Value of goods' in next_line_text or
+                        'page' in next_line_text):
+                        break
+                    item_block.append(next_line_text)
+                    j += 1
+                
+                # Parse the item block
+                item_data = _parse_josef_betzler_item_simple(item_block, invoice_data, current_order_info, customer_ref, page_num)
+                if item_data:
+                    items.append(item_data)
+                
+                i = j  # Move to the next position
+                continue
+        
+        i += 1
+    
+    return items
+
+@timed("parse")
+def _parse_josef_betzler_item_simple(block: List[str], invoice_data: Dict, order_info: Dict, customer_ref: str, page_num: int) -> Optional[Dict]:
+    """Simple parsing of Josef Betzler item"""
+    if len(block) < 2:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': order_info.get('order_no', ''),
+        'order_date': order_info.get('order_date', ''),
+        'delivery_note': invoice_data.get('delivery_note', ''),
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The second line should contain the item data
+    item_line = block[1].strip()
+    
+    # Parse item line: "2 JB-4665-30 Henly Cartoid Retractor, 16 cm, 6 1/2´´, 2 ea 129,90 259,80"
+    # Try multiple patterns
+    for pattern in _ITEM_PATTERNS:
+        match = pattern.search(item_line)
+        if match:
+            groups = match.groups()
+            if len(groups) == 5:  # With position number
+                item_data['item_code'] = groups[1]
+                item_data['description'] = groups[2].strip()
+                item_data['quantity'] = groups[3]
+                item_data['unit_price'] = groups[4]
+            elif len(groups) == 4:  # Without position number
+                item_data['item_code'] = groups[0]
+                item_data['description'] = groups[1].strip()
+                item_data['quantity'] = groups[2]
+                item_data['unit_price'] = groups[3]
+            break
+    
+    # If regex failed, try simple string parsing
+    if not item_data['item_code'] and 'JB-' in item_line:
+        parts = item_line.split()
+        for j, part in enumerate(parts):
+            if part.startswith('JB-'):
+                item_data['item_code'] = part
+                # Try to find quantity and price
+                for k in range(j+1, len(parts)):
+                    if parts[k] == 'ea' and k > 0 and k + 1 < len(parts):
+                        item_data['quantity'] = parts[k-1]
+                        # Get price
+                        price_str = parts[k+1]
+                        if _ITEM_LINE_RE.match(price_str):
+                            item_data['unit_price'] = price_str
+                        # Description is everything between JB- code and quantity
+                        desc_start = item_line.find(part) + len(part)
+                        desc_end = item_line.find(parts[k-1])
+                        item_data['description'] = item_line[desc_start:desc_end].strip()
+                        break
+                break
+    
+    # Extract metadata from the block
+    for line in block:
+        # LST number
+        lst_match = _LST_RE.search(line)
+        if lst_match:
+            lst_no = lst_match.group(1)
+            if lst_no and item_data['description']:
+                item_data['description'] += f" (LST: {lst_no})"
+        
+        # Charge (lot number)
+        charge_match = _CHARGE_RE.search(line)
+        if charge_match and not item_data['lot']:
+            item_data['lot'] = charge_match.group(1)
+        
+        # Classification
+        class_match = _CLASS_RE.search(line)
+        if class_match:
+            class_no = class_match.group(1)
+            if class_no and item_data['description']:
+                item_data['description'] += f" (Class: {class_no})"
+        
+        # Quantity from Charge line
+        qty_match = _QTY_RE.search(line)
+        if qty_match:
+            item_data['quantity'] = qty_match.group(1)
+    
+    # Add customer reference to description
+    if customer_ref and item_data['description']:
+        item_data['description'] = f"{customer_ref} - {item_data['description']}"
+    
+    # Add description continuation (lines after the item line that don't contain metadata)
+    desc_lines = []
+    for k in range(2, len(block)):
+        line_text = block[k].strip()
+        if (line_text and 
+            not _LST_CHARGE_CLASSIFICATION_RE.search(line_text) and
+            len(line_text) > 3 and
+            _LEADING_LETTER_RE.match(line_text)):
+            desc_lines.append(line_text)
+    
+    if desc_lines:
+        continuation = ' '.join(desc_lines)
+        if continuation and item_data['description']:
+            item_data['description'] += ' - ' + continuation
+    
+    # Only return if we have essential data
+    if item_data['item_code'] and item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
+
+@timed("header")
+def _extract_josef_betzler_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Josef Betzler invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number (after "No.:")
+        inv_match = _INV_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date (after "Date:")
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number (account number after "acc.no.:")
+        cust_match = _ACC_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract your reference (main order reference)
+        ref_match = _YOUR_REF_RE.search(line_clean)
+        if ref_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = ref_match.group(1)
+        
+        # Extract your reference date
+        ref_date_match = _REF_DATE_RE.search(line_clean)
+        if ref_date_match and not invoice_data['order_date']:
+            invoice_data['order_date'] = ref_date_match.group(1)
+    
+    return invoice_data
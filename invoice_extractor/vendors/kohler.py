@@ -0,0 +1,230 @@
+"""Kohler invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_REF_DESCRIPTION_RE = re.compile(r'Pos\.\s+Ref\.\s+Description\s+(?:Kat\.\s+)?Qty\.\s+Unit\s+Price\s+Total', re.IGNORECASE)
+_QTY_UNIT_PRICE_RE = re.compile(r'^(?:Kat\. )?Qty\. Unit Price Total$')
+_POS_REF_TOTAL_RE = re.compile(r'Pos\.\s+Ref\.|total net|package|Total/EUR|Payment|Delivery|Terms of delivery', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.\s*([^\s-]+)\s*-\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\d+')
+_PROFORMA_INVOICE_NO_RE = re.compile(r'(?:PROFORMA\s+INVOICE|INVOICE)\s+NO\.?\s*:\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUSTOMER_NO_RE = re.compile(r'Customer No\.?\s*:\s*(\d+)', re.IGNORECASE)
+_DELIVERY_NOTE_NO_RE = re.compile(r'Delivery Note No\.?\s*(\d+)\s*of\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_VALID_UNTIL_RE = re.compile(r'Valid until\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_POS_RE = re.compile(r'^(\d+)\s+(\d+)\s+')
+_ITEM_RE = re.compile(r'^(.+?)\s+(\d+)\s+([\d,]+)\s+[\d,]+$')
+_ALT_RE = re.compile(r'^(.+?)\s+(\d+)\s+([\d,]+)')
+_REF_NO_RE = re.compile(r'Ref-No\.:\s*([^\s]+)', re.IGNORECASE)
+_LST_RE = re.compile(r'LST:\s*([^\s]+)', re.IGNORECASE)
+_LOT_NUMBER_RE = re.compile(r'Lot number\s*(\d+)', re.IGNORECASE)
+_REF_NO_LST_RE = re.compile(r'Ref-No\.:|LST:|Lot number', re.IGNORECASE)
+_TEXT_START_RE = re.compile(r'^[a-zA-Z\-]')
+_PRICES_RE = re.compile(r'\b(\d+[,.]\d{2})\b')
+_NUMBERS_RE = re.compile(r'\b(\d+)\b')
+_PRICE_RE = re.compile(r'\d+[,.]\d{2}')
+
+_LAYOUT = TableLayout(
+    # Proforma invoices have no "Kat." column
+    header=_POS_REF_DESCRIPTION_RE,
+    header_words=('Pos.', 'Ref.', 'Description'),
+    # e.g. "1 8131" or "1 8179"
+    item_start=_ITEM_START_RE,
+    rules=(
+        # Repeated headers and summary lines
+        LineRule(Action.SKIP, _POS_REF_TOTAL_RE),
+        LineRule(Action.SKIP, _QTY_UNIT_PRICE_RE),
+        LineRule(Action.SET, _YOUR_ORDER_NO_RE, ('order_no', 'order_date')),
+    ),
+)
+
+
+def iter_kohler_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Kohler invoice format (both Proforma and regular invoices).
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_kohler_invoice_info(lines)
+            
+            context = {'order_no': '', 'order_date': ''}
+            for block, order_info in iter_item_blocks(lines, _LAYOUT, context):
+                item_data = _parse_kohler_item_block(block, invoice_data, order_info, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_kohler_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_kohler_invoice_rows()."""
+    return list(iter_kohler_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_kohler_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Kohler invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number (both PROFORMA INVOICE and regular INVOICE)
+        inv_match = _PROFORMA_INVOICE_NO_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number
+        cust_match = _CUSTOMER_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract delivery note
+        delivery_match = _DELIVERY_NOTE_NO_RE.search(line_clean)
+        if delivery_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = delivery_match.group(1)
+        
+        # Extract valid until date for Proforma invoices
+        valid_match = _VALID_UNTIL_RE.search(line_clean)
+        if valid_match:
+            # Use valid until date as order date for Proforma invoices if no other date is found
+            if not invoice_data['order_date']:
+                invoice_data['order_date'] = valid_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_kohler_item_block(block: List[str], invoice_data: Dict, order_info: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Kohler invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': order_info.get('order_no', ''),
+        'order_date': order_info.get('order_date', ''),
+        'delivery_note': invoice_data.get('delivery_note', ''),
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract position number and reference (remove them since we don't need them)
+    pos_match = _POS_RE.search(first_line)
+    if pos_match:
+        # Remove the position number and reference from the line for easier parsing
+        first_line = first_line[len(pos_match.group(0)):].strip()
+    
+    # Extract description, quantity, unit price
+    # Pattern: "Mouth prop MCKESSON, for adults, large 5 20,49 102,45"
+    # or: "ERICH Arch Bar 20 26,00 520,00"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['description'] = item_match.group(1).strip()
+        item_data['quantity'] = item_match.group(2)
+        item_data['unit_price'] = item_match.group(3)
+    
+    # Alternative pattern for different formatting
+    if not item_data['description']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['description'] = alt_match.group(1).strip()
+            item_data['quantity'] = alt_match.group(2)
+            item_data['unit_price'] = alt_match.group(3)
+    
+    # Extract metadata from the entire block
+    ref_no = None
+    for line in block:
+        # Reference number
+        ref_match = _REF_NO_RE.search(line)
+        if ref_match:
+            ref_no = ref_match.group(1)
+        
+        # LST number
+        lst_match = _LST_RE.search(line)
+        if lst_match:
+            lst_no = lst_match.group(1)
+            if lst_no and item_data['description']:
+                item_data['description'] += f" (LST: {lst_no})"
+        
+        # Lot number
+        lot_match = _LOT_NUMBER_RE.search(line)
+        if lot_match and not item_data['lot']:
+            item_data['lot'] = lot_match.group(1)
+    
+    # Add reference number to description if found
+    if ref_no and item_data['description']:
+        item_data['description'] = f"{ref_no} - {item_data['description']}"
+        item_data['item_code'] = ref_no  # Use Ref-No as item code
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Only include lines that don't look like metadata
+            if not _REF_NO_LST_RE.search(line):
+                clean_line = line.strip()
+                if clean_line and not _ITEM_START_RE.match(clean_line):  # Don't include lines that start like new items
+                    # Check if this line contains additional description (like "- by pairs - black")
+                    if _TEXT_START_RE.match(clean_line):  # Starts with a letter or hyphen
+                        additional_desc.append(clean_line)
+        
+        if additional_desc:
+            item_data['description'] += ' - ' + ' '.join(additional_desc)
+    
+    # Extract unit price from alternative patterns if still missing
+    if not item_data['unit_price']:
+        prices = _PRICES_RE.findall(first_line)
+        if len(prices) >= 2:  # Usually there are two prices: unit price and total
+            item_data['unit_price'] = prices[0]  # First price is unit price
+    
+    # Extract quantity from alternative patterns if still missing
+    if not item_data['quantity']:
+        # Look for numbers that are likely quantities (not prices)
+        numbers = _NUMBERS_RE.findall(first_line)
+        if len(numbers) >= 2:
+            # The number before the prices is likely the quantity
+            for i, num in enumerate(numbers):
+                if i < len(numbers) - 1 and _PRICE_RE.search(first_line.split(num)[-1]):
+                    item_data['quantity'] = num
+                    break
+    
+    # Only return if we have at least description and quantity
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
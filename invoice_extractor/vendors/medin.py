@@ -0,0 +1,235 @@
+"""Medin invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_ITEM_START_RE = re.compile(r'^\d+\s+\d+\s+[\w-]+\s+-\s+')
+_CUSTOMER_ORDER_PO_RE = re.compile(r'Customer Order|Customer PO|Customer Part ID')
+_TERMS_SUMMARY_SUB_RE = re.compile(r'Terms Summary|Sub Total|Returned Goods Policy')
+_INVOICE_DATE_RE = re.compile(r'Invoice Date\s+(\d{1,2}/\d{1,2}/\d{4})')
+_CUSTOMER_PART_ID_CASED_RE = re.compile(r'Customer Part ID:\s*([^\s]+)')
+_CUSTOMER_ORDER_RE = re.compile(r'Customer Order\s+([^\s]+)')
+_CUSTOMER_PO_CASED_RE = re.compile(r'Customer PO\s+([^\s]+)')
+_PACKING_SLIP_RE = re.compile(r'Packing Slip\s+([^\s]+)')
+_ITEM_RE = re.compile(r'^(\d+)\s+(\d+)\s+([\w-]+)\s+-\s+(.+?)\s+([\d,]+\.\d{4})\s+([\d,]+\.\d{2})$')
+_CUSTOMER_PART_ID_ANY_CASE_RE = re.compile(r'Customer Part ID:\s*([^\s]+)', re.IGNORECASE)
+_CUSTOMER_ORDER_ANY_CASE_RE = re.compile(r'Customer Order\s+([^\s]+)', re.IGNORECASE)
+_CUSTOMER_PO_ANY_CASE_RE = re.compile(r'Customer PO\s+([^\s]+)', re.IGNORECASE)
+
+
+def iter_medin_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Medin invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_medin_invoice_info(lines)
+            
+            # Find item blocks
+            item_blocks = []
+            current_block = []
+            in_items_section = False
+            
+            for i, line in enumerate(lines):
+                line_clean = line.strip()
+                
+                # Look for the start of the items section
+                if 'Ordered Shipped Description Tax Unit Price Amount' in line_clean:
+                    in_items_section = True
+                    continue
+                
+                if not in_items_section:
+                    continue
+                
+                # Skip empty lines and header repetitions
+                if not line_clean or 'Ordered Shipped' in line_clean:
+                    continue
+                
+                # Look for item lines (they start with numbers for ordered/shipped quantities)
+                if _ITEM_START_RE.match(line_clean):
+                    if current_block:
+                        item_blocks.append((current_block, invoice_data.copy()))
+                    current_block = [line_clean]
+                # Look for customer information lines that belong to the current item
+                elif current_block and _CUSTOMER_ORDER_PO_RE.search(line_clean):
+                    current_block.append(line_clean)
+                # Stop when we hit summary sections
+                elif _TERMS_SUMMARY_SUB_RE.search(line_clean):
+                    if current_block:
+                        item_blocks.append((current_block, invoice_data.copy()))
+                    current_block = []
+                    break
+            
+            if current_block:
+                item_blocks.append((current_block, invoice_data.copy()))
+            
+            # Process each item block
+            for block, inv_data in item_blocks:
+                item_data = _parse_medin_item_block(block, inv_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_medin_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_medin_invoice_rows()."""
+    return list(iter_medin_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_medin_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Medin invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',  # This will be extracted from Customer Part ID
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for i, line in enumerate(lines):
+        line_clean = line.strip()
+        
+        # Extract invoice number - it's on the line after "Invoice"
+        if line_clean == 'Invoice' and i + 1 < len(lines):
+            next_line = lines[i + 1].strip()
+            if next_line.isdigit():  # Invoice number is just digits
+                invoice_data['invoice_number'] = next_line
+        
+        # Extract invoice date - US format M/D/YYYY
+        date_match = _INVOICE_DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            us_date = date_match.group(1)
+            parts = us_date.split('/')
+            if len(parts) == 3:
+                invoice_data['invoice_date'] = f"{parts[1]}.{parts[0]}.{parts[2]}"
+        
+        # Extract customer number from Customer Part ID (e.g., "9394-11")
+        part_id_match = _CUSTOMER_PART_ID_CASED_RE.search(line_clean)
+        if part_id_match:
+            invoice_data['customer_number'] = part_id_match.group(1)
+        
+        # Extract order information
+        if 'Customer Order' in line_clean:
+            # Pattern: "Customer Order SO-126507 Order Date OrderDate"
+            order_match = _CUSTOMER_ORDER_RE.search(line_clean)
+            if order_match and not invoice_data['order_no']:
+                invoice_data['order_no'] = order_match.group(1)
+        
+        # Extract customer PO
+        po_match = _CUSTOMER_PO_CASED_RE.search(line_clean)
+        if po_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = po_match.group(1)
+        
+        # Extract packing slip (delivery note)
+        packing_match = _PACKING_SLIP_RE.search(line_clean)
+        if packing_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = packing_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_medin_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Medin invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],  # From Customer Part ID
+        'order_no': invoice_data.get('order_no', ''),
+        'order_date': invoice_data.get('order_date', ''),
+        'delivery_note': invoice_data.get('delivery_note', ''),
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line contains the main item data
+    first_line = block[0].strip()
+    
+    # Parse: "1 5 20-1321 - 20.25X13X3.5 UNLIDDED STER TRY 133.0000 665.00"
+    # This means: Ordered=1, Shipped=5, ItemCode=20-1321, Description=20.25X13X3.5 UNLIDDED STER TRY, UnitPrice=133.0000, Amount=665.00
+    
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        ordered_qty = item_match.group(1)  # Ordered quantity
+        shipped_qty = item_match.group(2)  # Shipped quantity (this is what we use)
+        item_data['item_code'] = item_match.group(3)
+        item_data['description'] = item_match.group(4).strip()
+        item_data['unit_price'] = item_match.group(5).replace(',', '')  # Remove commas
+        item_data['quantity'] = shipped_qty  # Use shipped quantity as the actual quantity
+        
+        # Add ordered quantity to description for reference
+        item_data['description'] += f" (Ordered: {ordered_qty}, Shipped: {shipped_qty})"
+    
+    # If the detailed pattern fails, try a simpler approach
+    if not item_data['item_code']:
+        # Split by spaces and try to identify components
+        parts = first_line.split()
+        if len(parts) >= 7:
+            # Look for the pattern: number number code-with-dash dash description price price
+            for i in range(len(parts) - 3):
+                if (parts[i].isdigit() and 
+                    parts[i+1].isdigit() and 
+                    '-' in parts[i+2] and 
+                    parts[i+3] == '-'):
+                    # Found the pattern structure
+                    item_data['quantity'] = parts[i+1]  # Shipped quantity
+                    item_data['item_code'] = parts[i+2]
+                    # Description is everything between the dash and the prices
+                    desc_start = first_line.find(parts[i+3]) + len(parts[i+3]) + 1
+                    # Find where prices start (look for decimal numbers)
+                    for j in range(i+4, len(parts)):
+                        if '.' in parts[j]:
+                            desc_end = first_line.find(parts[j])
+                            item_data['description'] = first_line[desc_start:desc_end].strip()
+                            # The first price is unit price
+                            item_data['unit_price'] = parts[j].replace(',', '')
+                            break
+                    break
+    
+    # Extract additional metadata from the block
+    customer_part_id = None
+    for line in block:
+        # Customer Part ID (this is actually the customer number for Medin)
+        part_match = _CUSTOMER_PART_ID_ANY_CASE_RE.search(line)
+        if part_match:
+            customer_part_id = part_match.group(1)
+            # Update customer number if not already set
+            if not item_data['customer_number']:
+                item_data['customer_number'] = customer_part_id
+        
+        # Additional order information if not already captured
+        order_match = _CUSTOMER_ORDER_ANY_CASE_RE.search(line)
+        if order_match and not item_data['order_no']:
+            item_data['order_no'] = order_match.group(1)
+        
+        po_match = _CUSTOMER_PO_ANY_CASE_RE.search(line)
+        if po_match and not item_data['order_no']:
+            item_data['order_no'] = po_match.group(1)
+    
+    # Add Customer Part ID to description if different from customer number
+    if customer_part_id and item_data['description'] and customer_part_id != item_data['customer_number']:
+        item_data['description'] += f" (Part ID: {customer_part_id})"
+    
+    # Only return if we have essential data
+    if item_data['item_code'] and item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
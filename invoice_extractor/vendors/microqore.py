@@ -0,0 +1,286 @@
+"""Microqore invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_TABLE_HEADER_RE = re.compile(r'POS\s+Item\s+No\.\s+Desc\.\s+Quantity\s+each\s+Total', re.IGNORECASE)
+_TABLE_HEADER_LINE_RE = re.compile(r'POS\s+Item\s+No\.|EUR\s+EUR', re.IGNORECASE)
+_DELIVERY_FROM_RE = re.compile(r'Delivery(\d+)\s*/\s*\d+\s+from\s+(\d{2}\.\d{2}\.\d{4})')
+_YOUR_ORDER_NO_RE = re.compile(r'Your Order No\.\s*([^\s]+)', re.IGNORECASE)
+_MQ_RE = re.compile(r'^\d+\s+MQ4-')
+_DELIVERY_RE = re.compile(r'Delivery\d+')
+_LINE_VALUE_PACKING_RE = re.compile(r'Line Value|Packing costs|Gross|Steuerfreie', re.IGNORECASE)
+_HEADER_RE = re.compile(r'^(\d+)\s+(\d{2}\.\d{2}\.\d{4})\s+\w+\s+(\d+)\s+\d+$')
+_INV_RE = re.compile(r'INVOICE\s+(\d+)\s+(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUSTOMER_NO_RE = re.compile(r'Customer No\.\s*(\d+)', re.IGNORECASE)
+_MQ_PIECES_RE = re.compile(r'^(\d+)\s+(MQ4-\S+)\s+(.+?)\s+(\d+)pieces$')
+_QTY_RE = re.compile(r'(\d+)pieces')
+_PRICE_RE = re.compile(r'^([\d,]+)\s+[\d,\.]+$')
+_PIECES_PRICE_RE = re.compile(r'(\d+)pieces\s+([\d,]+)\s+[\d,\.]+')
+_DRAWING_RE = re.compile(r'Drawing\s+([^\s]+)', re.IGNORECASE)
+_LOT_CODE_RE = re.compile(r'Lot(\d+)\s+Lot-Code(\w+)', re.IGNORECASE)
+_QTY_LOT_CODE_RE = re.compile(r'(\d+)\s+x\s+Lot(\d+)\s+Lot-Code(\w+)', re.IGNORECASE)
+_REF_RE = re.compile(r'\(([A-Z]\d+-\d+)\)')
+_ITEM_LINE_RE = re.compile(r'^\d+[,.]\d+\s+[\d,\.]+$')
+_DRAWING_LOT_DELIVERY_RE = re.compile(r'Drawing|Lot|Delivery|Line Value', re.IGNORECASE)
+_LEADING_LETTER_RE = re.compile(r'^[a-zA-Z]')
+
+
+def iter_microqore_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Microqore invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_microqore_invoice_info(lines)
+            
+            # Find item blocks
+            item_blocks = []
+            current_block = []
+            in_items_section = False
+            current_delivery_info = {'order_no': '', 'order_date': '', 'delivery_note': ''}
+            
+            for i, line in enumerate(lines):
+                line_clean = line.strip()
+                
+                # Look for the start of the items section
+                if _TABLE_HEADER_RE.search(line_clean):
+                    in_items_section = True
+                    continue
+                
+                if not in_items_section:
+                    continue
+                
+                # Skip header lines and empty lines
+                if not line_clean or _TABLE_HEADER_LINE_RE.search(line_clean):
+                    continue
+                
+                # Look for delivery information - this contains order number and date
+                delivery_match = _DELIVERY_FROM_RE.search(line_clean)
+                if delivery_match:
+                    current_delivery_info['order_no'] = delivery_match.group(1)  # 303861
+                    current_delivery_info['order_date'] = delivery_match.group(2)  # 17.09.2024
+                    current_delivery_info['delivery_note'] = delivery_match.group(1)  # Use as delivery note too
+                    continue
+                
+                # Look for order information (alternative)
+                order_match = _YOUR_ORDER_NO_RE.search(line_clean)
+                if order_match:
+                    current_delivery_info['order_no'] = order_match.group(1)
+                    continue
+                
+                # Look for item lines (start with numbers followed by MQ4- codes)
+                if _MQ_RE.match(line_clean):  # e.g., "10 MQ4-4060-21TC-C"
+                    if current_block:
+                        item_blocks.append((current_block, invoice_data.copy(), current_delivery_info.copy()))
+                    current_block = [line_clean]
+                
+                # Continue collecting lines for the current item
+                elif current_block:
+                    # Stop if we hit a new item, delivery info, or summary section
+                    if (_MQ_RE.match(line_clean) or
+                        _DELIVERY_RE.search(line_clean) or
+                        _LINE_VALUE_PACKING_RE.search(line_clean)):
+                        item_blocks.append((current_block, invoice_data.copy(), current_delivery_info.copy()))
+                        current_block = [line_clean] if _MQ_RE.match(line_clean) else []
+                    else:
+                        current_block.append(line_clean)
+            
+            if current_block:
+                item_blocks.append((current_block, invoice_data.copy(), current_delivery_info.copy()))
+            
+            # Process each item block
+            for block, inv_data, delivery_info in item_blocks:
+                item_data = _parse_microqore_item_block(block, inv_data, delivery_info, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_microqore_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_microqore_invoice_rows()."""
+    return list(iter_microqore_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_microqore_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Microqore invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number and date from the header line
+        # Pattern: "20240666 17.09.2024 MW 50103 1"
+        header_match = _HEADER_RE.search(line_clean)
+        if header_match:
+            if not invoice_data['invoice_number']:
+                invoice_data['invoice_number'] = header_match.group(1)
+            if not invoice_data['invoice_date']:
+                invoice_data['invoice_date'] = header_match.group(2)
+            if not invoice_data['customer_number']:
+                invoice_data['customer_number'] = header_match.group(3)
+        
+        # Alternative pattern for invoice number and date
+        if not invoice_data['invoice_number']:
+            inv_match = _INV_RE.search(line_clean)
+            if inv_match:
+                invoice_data['invoice_number'] = inv_match.group(1)
+                invoice_data['invoice_date'] = inv_match.group(2)
+        
+        # Extract customer number
+        cust_match = _CUSTOMER_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_microqore_item_block(block: List[str], invoice_data: Dict, delivery_info: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Microqore invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': delivery_info.get('order_no', invoice_data.get('order_no', '')),
+        'order_date': delivery_info.get('order_date', invoice_data.get('order_date', '')),
+        'delivery_note': delivery_info.get('delivery_note', invoice_data.get('delivery_note', '')),
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Parse the item line: "10 MQ4-4060-21TC-C castroviejo needle holder, tungsten carbide 15pieces"
+    # The unit price is on the next line: "110,75 1.661,25"
+    item_match = _MQ_PIECES_RE.search(first_line)
+    
+    if item_match:
+        item_data['quantity'] = item_match.group(4)  # Quantity from "15pieces"
+        item_data['item_code'] = item_match.group(2)
+        item_data['description'] = item_match.group(3).strip()
+    
+    # If the first pattern fails, try a more flexible approach
+    if not item_data['item_code']:
+        parts = first_line.split()
+        if len(parts) >= 3:
+            # Look for MQ4- pattern
+            for i, part in enumerate(parts):
+                if part.startswith('MQ4-') and i > 0 and i + 1 < len(parts):
+                    # Previous part should be the first number, look for "pieces"
+                    if parts[i-1].isdigit():
+                        # Find where "pieces" appears
+                        for j in range(i+1, len(parts)):
+                            if 'pieces' in parts[j]:
+                                # Extract quantity from the pieces word
+                                qty_match = _QTY_RE.search(parts[j])
+                                if qty_match:
+                                    item_data['quantity'] = qty_match.group(1)
+                                # Description is everything between MQ4 code and pieces
+                                desc_start = first_line.find(part) + len(part) + 1
+                                desc_end = first_line.find(parts[j])
+                                item_data['description'] = first_line[desc_start:desc_end].strip()
+                                item_data['item_code'] = part
+                                break
+                        break
+    
+    # Look for unit price in the next line(s)
+    for i in range(1, len(block)):
+        line = block[i].strip()
+        # Look for price pattern: "110,75 1.661,25"
+        price_match = _PRICE_RE.search(line)
+        if price_match:
+            item_data['unit_price'] = price_match.group(1)
+            break
+    
+    # If still no unit price found, check the first line again
+    if not item_data['unit_price']:
+        # Maybe the prices are on the same line
+        price_match = _PIECES_PRICE_RE.search(first_line)
+        if price_match:
+            item_data['quantity'] = price_match.group(1)
+            item_data['unit_price'] = price_match.group(2)
+    
+    # Extract metadata from the entire block
+    drawing_no = None
+    for line in block:
+        # Drawing number
+        drawing_match = _DRAWING_RE.search(line)
+        if drawing_match:
+            drawing_no = drawing_match.group(1)
+        
+        # Lot information
+        lot_match = _LOT_CODE_RE.search(line)
+        if lot_match:
+            lot_number = lot_match.group(1)
+            lot_code = lot_match.group(2)
+            item_data['lot'] = f"{lot_number}-{lot_code}"
+        
+        # Alternative lot pattern
+        if not item_data['lot']:
+            alt_lot_match = _QTY_LOT_CODE_RE.search(line)
+            if alt_lot_match:
+                lot_qty = alt_lot_match.group(1)
+                lot_number = alt_lot_match.group(2)
+                lot_code = alt_lot_match.group(3)
+                item_data['lot'] = f"{lot_number}-{lot_code}"
+                # Add lot quantity to description
+                if item_data['description']:
+                    item_data['description'] += f" (Lot Qty: {lot_qty})"
+        
+        # Customer reference numbers (like G4355-31, C6638-39)
+        ref_match = _REF_RE.search(line)
+        if ref_match:
+            ref_no = ref_match.group(1)
+            if ref_no and item_data['description']:
+                item_data['description'] += f" (Ref: {ref_no})"
+    
+    # Add drawing number to description if found
+    if drawing_no and item_data['description']:
+        item_data['description'] += f" (Drawing: {drawing_no})"
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for i in range(1, len(block)):
+            line = block[i].strip()
+            # Skip lines that contain prices or metadata
+            if (line and 
+                not _ITEM_LINE_RE.search(line) and  # Not a price line
+                not _DRAWING_LOT_DELIVERY_RE.search(line) and
+                not _MQ_RE.match(line) and
+                _LEADING_LETTER_RE.match(line)):  # Starts with a letter
+                additional_desc.append(line)
+        
+        if additional_desc:
+            item_data['description'] += ' - ' + ' '.join(additional_desc)
+    
+    # Only return if we have essential data
+    if item_data['description'] and item_data['quantity'] and item_data['unit_price']:
+        return item_data
+    
+    return None
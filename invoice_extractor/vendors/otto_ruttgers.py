@@ -0,0 +1,272 @@
+"""Otto Ruttgers invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ARTICLE_DESCRIPTION_RE = re.compile(r'POS\.ARTICLE\s+description\s+your order no\.\s+qty\.\s+each\s+price', re.IGNORECASE)
+_POS_ARTICLE_CARRY_RE = re.compile(r'POS\.ARTICLE|carry-over|total net|package|freight|total/EUR', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.\s*([^\s-]+)\s*-\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+[A-Z]')
+_HEADER_CONTINUATION_RE = re.compile(r'^description your order no\. qty\. each price$')
+_CODE_CONTINUATION_RE = re.compile(r'^[A-Z][\w/-]+\s+')
+_CARRY_OVER_TOTAL_RE = re.compile(r'carry-over|total net|package|freight|total/EUR', re.IGNORECASE)
+_CONTINUATION_RE = re.compile(r'^[a-zA-Z]|LOT\s*\d+|your art\.-no\.:', re.IGNORECASE)
+_POS_RE = re.compile(r'^(\d+)\s+')
+_ITEM_RE = re.compile(r'^([A-Z][\w/-]+)\s+(.+?)\s+(\d+)\s+([^\s]+)\s+([\d,]+)\s+([\d,\.]+)$')
+_ALT_RE = re.compile(r'^([A-Z][\w/-]+)\s+(.+?)\s+No\.\s*\d+\s+(\d+)\s+([^\s]+)\s+([\d,]+)\s+([\d,\.]+)$')
+_FLEX_RE = re.compile(r'^([A-Z][\w/-]+)\s+(.+?)\s+(\d+)\s+([^\s]+)\s+([\d,]+)')
+_CODE_RE = re.compile(r'([A-Z][\w/-]+)')
+_AMOUNT_RE = re.compile(r'([\d,]+\.?\d{0,2})')
+_YOUR_ART_NO_RE = re.compile(r'your art\.-no\.:\s*([^\s;]+)', re.IGNORECASE)
+_LOT_RE = re.compile(r'LOT\s*([^;]+);', re.IGNORECASE)
+_ART_NO_OR_LOT_RE = re.compile(r'your art\.-no\.:|LOT\s*[^;]+;', re.IGNORECASE)
+_TEXT_START_RE = re.compile(r'^[a-zA-Z\d]')
+_PRICES_RE = re.compile(r'\b(\d+[,.]\d{2})\b')
+_PCS_ST_RE = re.compile(r'(\d+)\s+(pcs\.|St\.)', re.IGNORECASE)
+_NUMBERS_RE = re.compile(r'\b(\d+)\b')
+_HEADER_RE = re.compile(r'^(\d+)\s+(\d+)\s+(\d{2}\.\d{2}\.\d{4})\s+\d+$')
+_INVOICE_NO_RE = re.compile(r'INVOICE NO\.\s*(\d+)', re.IGNORECASE)
+_CUST_NO_RE = re.compile(r'Cust\.-No\.\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_DELIVERY_NOTE_NO_RE = re.compile(r'Delivery Note No\.\s*(\d+)\s*at\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+
+_LAYOUT = TableLayout(
+    header=_POS_ARTICLE_DESCRIPTION_RE,
+    header_words=('POS.ARTICLE', 'description'),
+    # e.g. "1 HMIMCU-3K" or "1 HBPMCU-1015/3LRSurg"
+    item_start=_ITEM_START_RE,
+    rules=(
+        # Repeated headers and summary lines
+        LineRule(Action.SKIP, _POS_ARTICLE_CARRY_RE),
+        LineRule(Action.SKIP, _HEADER_CONTINUATION_RE),
+        # Each order starts a new block
+        LineRule(Action.SET_CLOSE, _YOUR_ORDER_NO_RE, ('order_no', 'order_date')),
+        # Customer article numbers and lines starting with an item code continue the item
+        LineRule(Action.APPEND, _YOUR_ART_NO_RE),
+        LineRule(Action.APPEND, _CODE_CONTINUATION_RE),
+    ),
+    terminator=_CARRY_OVER_TOTAL_RE,
+    # Only description continuations and metadata are kept
+    continuation=_CONTINUATION_RE,
+    skip_blank=True,
+)
+
+
+def iter_otto_ruttgers_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Otto Ruttgers invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_otto_ruttgers_invoice_info(lines)
+            
+            for block, order_info in iter_item_blocks(lines, _LAYOUT, {'order_no': '', 'order_date': ''}):
+                item_data = _parse_otto_ruttgers_item_block(block, invoice_data, order_info, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_otto_ruttgers_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_otto_ruttgers_invoice_rows()."""
+    return list(iter_otto_ruttgers_invoice_rows(pdf_content))
+
+@timed("parse")
+def _parse_otto_ruttgers_item_block(block: List[str], invoice_data: Dict, order_info: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Otto Ruttgers invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': order_info.get('order_no', invoice_data.get('order_no', '')),
+        'order_date': order_info.get('order_date', invoice_data.get('order_date', '')),
+        'delivery_note': invoice_data.get('delivery_note', ''),
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract position number (remove it since we don't need it)
+    pos_match = _POS_RE.search(first_line)
+    if pos_match:
+        first_line = first_line[len(pos_match.group(0)):].strip()
+    
+    # Try multiple patterns to handle different formats
+    
+    # Pattern 1: Standard format "HMIMCU-3K Surgical Scalpelhandle for mini 16186 200 St. 7,12 1.424,00"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1).strip()
+        item_data['description'] = item_match.group(2).strip()
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(5)
+    
+    # Pattern 2: Format with order number in description "HBPMCU-1015/3LRSurg. Scalpel handle EN 27740 No. 4200987135 300 pcs. 7,44 2.232,00"
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = alt_match.group(1).strip()
+            item_data['description'] = alt_match.group(2).strip()
+            item_data['quantity'] = alt_match.group(3)
+            item_data['unit_price'] = alt_match.group(5)
+    
+    # Pattern 3: More flexible pattern
+    if not item_data['item_code']:
+        flex_match = _FLEX_RE.search(first_line)
+        if flex_match:
+            item_data['item_code'] = flex_match.group(1).strip()
+            item_data['description'] = flex_match.group(2).strip()
+            item_data['quantity'] = flex_match.group(3)
+            item_data['unit_price'] = flex_match.group(5)
+    
+    # Pattern 4: Even more flexible - just look for item code and prices
+    if not item_data['item_code']:
+        # Find the item code (starts with capital letter, contains letters/numbers/dashes/slashes)
+        code_match = _CODE_RE.search(first_line)
+        if code_match:
+            item_data['item_code'] = code_match.group(1)
+            # Try to find quantity and price
+            prices = _AMOUNT_RE.findall(first_line)
+            if len(prices) >= 2:
+                item_data['unit_price'] = prices[-2]  # Second last is unit price
+            # Find quantity (number before pcs., St., etc.)
+            qty_match = _PCS_ST_RE.search(first_line)
+            if qty_match:
+                item_data['quantity'] = qty_match.group(1)
+            # Description is everything between item code and quantity/price
+            code_pos = first_line.find(item_data['item_code']) + len(item_data['item_code'])
+            if item_data['quantity']:
+                qty_pos = first_line.find(item_data['quantity'])
+                item_data['description'] = first_line[code_pos:qty_pos].strip()
+            else:
+                # If no quantity found, take everything after code until prices
+                price_pos = first_line.find(prices[0]) if prices else len(first_line)
+                item_data['description'] = first_line[code_pos:price_pos].strip()
+    
+    # Extract metadata from the entire block
+    customer_art_no = None
+    for line in block:
+        # Customer article number
+        art_match = _YOUR_ART_NO_RE.search(line)
+        if art_match:
+            customer_art_no = art_match.group(1)
+        
+        # Lot number
+        lot_match = _LOT_RE.search(line)
+        if lot_match and not item_data['lot']:
+            item_data['lot'] = lot_match.group(1).strip()
+    
+    # Add customer article number to description if found
+    if customer_art_no and item_data['description']:
+        item_data['description'] += f" (Art-No: {customer_art_no})"
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for i in range(1, len(block)):
+            line = block[i].strip()
+            # Only include lines that don't look like metadata or new items
+            if (line and 
+                not _ART_NO_OR_LOT_RE.search(line) and
+                not _ITEM_START_RE.match(line) and
+                _TEXT_START_RE.match(line)):  # Starts with letter or number
+                additional_desc.append(line)
+        
+        if additional_desc:
+            item_data['description'] += ' - ' + ' '.join(additional_desc)
+    
+    # Extract unit price from alternative patterns if still missing
+    if not item_data['unit_price']:
+        prices = _PRICES_RE.findall(' '.join(block))
+        if len(prices) >= 2:  # Usually there are two prices: unit price and total
+            item_data['unit_price'] = prices[0]  # First price is unit price
+    
+    # Extract quantity from alternative patterns if still missing
+    if not item_data['quantity']:
+        # Look for quantity pattern with unit (St., pcs., etc.)
+        qty_match = _PCS_ST_RE.search(' '.join(block))
+        if qty_match:
+            item_data['quantity'] = qty_match.group(1)
+        else:
+            # Just look for a number that could be quantity
+            numbers = _NUMBERS_RE.findall(first_line)
+            if len(numbers) >= 2:
+                item_data['quantity'] = numbers[1]  # Second number is often quantity
+    
+    # Only return if we have essential data
+    if item_data['item_code'] and item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
+
+@timed("header")
+def _extract_otto_ruttgers_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Otto Ruttgers invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number, customer number, and date from header line
+        # Pattern: "240268 48515 26.03.2024 1"
+        header_match = _HEADER_RE.search(line_clean)
+        if header_match:
+            if not invoice_data['invoice_number']:
+                invoice_data['invoice_number'] = header_match.group(1)
+            if not invoice_data['customer_number']:
+                invoice_data['customer_number'] = header_match.group(2)
+            if not invoice_data['invoice_date']:
+                invoice_data['invoice_date'] = header_match.group(3)
+        
+        # Alternative pattern for invoice number
+        inv_match = _INVOICE_NO_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Alternative pattern for customer number
+        cust_match = _CUST_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Alternative pattern for date
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract delivery note
+        delivery_match = _DELIVERY_NOTE_NO_RE.search(line_clean)
+        if delivery_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = delivery_match.group(1)
+    
+    return invoice_data
@@ -0,0 +1,210 @@
+"""Phoenix Instruments invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_ITEM_NUMBER_NET_RE = re.compile(r'Item Number|Net Invoice|Less Discount|Freight|Tax|Tracking number|Invoice Total', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^(\d+-\d+|[A-Z]\d+-\d+)')
+_NET_INVOICE_LESS_RE = re.compile(r'Net Invoice|Less Discount|Freight|Tax|Tracking number|Invoice Total', re.IGNORECASE)
+_INVOICE_NUMBER_RE = re.compile(r'Invoice Number:\s*([^\s]+)')
+_INVOICE_DATE_RE = re.compile(r'Invoice Date:\s*(\d{1,2}/\d{1,2}/\d{4})')
+_CUSTOMER_NUMBER_RE = re.compile(r'Customer Number:\s*([^\s]+)')
+_ORDER_NUMBER_RE = re.compile(r'Order Number:\s*([^\s]+)')
+_ORDER_DATE_RE = re.compile(r'Order Date\s*(\d{1,2}/\d{1,2}/\d{4})')
+_PO_RE = re.compile(r'Customer P\.O\.\s*(\d+)')
+_WHSE_RE = re.compile(r'Whse:\s*(\d+)')
+
+
+def iter_phoenix_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Phoenix Instruments invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_phoenix_invoice_info(lines)
+            
+            # Find item blocks - Phoenix has a specific 2-line per item structure
+            item_blocks = []
+            current_item_lines = []
+            in_items_section = False
+            
+            for i, line in enumerate(lines):
+                line_clean = line.strip()
+                
+                # Look for the start of the items section
+                if 'Item Number Alias item Description Ordered Shipped Back Ordered Price Amount' in line_clean:
+                    in_items_section = True
+                    continue
+                
+                if not in_items_section:
+                    continue
+                
+                # Skip header lines and summary lines
+                if (_ITEM_NUMBER_NET_RE.search(line_clean) or
+                    'Continued' in line_clean):
+                    continue
+                
+                # Look for item number lines (start with numbers or P followed by numbers-dash-numbers)
+                if _ITEM_START_RE.match(line_clean) and not _WHSE_RE.search(line_clean):
+                    # If we have a complete item (2 lines), save it
+                    if len(current_item_lines) == 2:
+                        item_blocks.append((current_item_lines, invoice_data.copy()))
+                    current_item_lines = [line_clean]
+                # Look for alias item lines (they contain Whse: information)
+                elif current_item_lines and _WHSE_RE.search(line_clean):
+                    current_item_lines.append(line_clean)
+                    # This completes the item block
+                    item_blocks.append((current_item_lines, invoice_data.copy()))
+                    current_item_lines = []
+                # Stop if we hit summary section
+                elif _NET_INVOICE_LESS_RE.search(line_clean):
+                    if current_item_lines:
+                        item_blocks.append((current_item_lines, invoice_data.copy()))
+                    break
+            
+            # Process each item block
+            for block, inv_data in item_blocks:
+                item_data = _parse_phoenix_item_block(block, inv_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_phoenix_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_phoenix_invoice_rows()."""
+    return list(iter_phoenix_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_phoenix_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Phoenix Instruments invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number (remove -IN suffix)
+        inv_match = _INVOICE_NUMBER_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1).replace('-IN', '')
+        
+        # Extract invoice date (US format: M/D/YYYY)
+        date_match = _INVOICE_DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            us_date = date_match.group(1)
+            parts = us_date.split('/')
+            if len(parts) == 3:
+                invoice_data['invoice_date'] = f"{parts[1]}.{parts[0]}.{parts[2]}"
+        
+        # Extract customer number
+        cust_match = _CUSTOMER_NUMBER_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract order number
+        order_match = _ORDER_NUMBER_RE.search(line_clean)
+        if order_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = order_match.group(1)
+        
+        # Extract order date (US format: M/D/YYYY)
+        order_date_match = _ORDER_DATE_RE.search(line_clean)
+        if order_date_match and not invoice_data['order_date']:
+            us_date = order_date_match.group(1)
+            parts = us_date.split('/')
+            if len(parts) == 3:
+                invoice_data['order_date'] = f"{parts[1]}.{parts[0]}.{parts[2]}"
+        
+        # Extract customer PO (delivery note)
+        po_match = _PO_RE.search(line_clean)
+        if po_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = po_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_phoenix_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Phoenix Instruments invoice"""
+    if not block or len(block) < 2:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': invoice_data.get('order_no', ''),
+        'order_date': invoice_data.get('order_date', ''),
+        'delivery_note': invoice_data.get('delivery_note', ''),
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # Line 1: "106-5324 5.00 0.00 5.00 18.69 0.00"
+    first_line = block[0].strip()
+    
+    # Line 2: "G1764-35 Whse: 000"
+    second_line = block[1].strip()
+    
+    # Parse first line - extract item number, quantities, and prices
+    first_parts = first_line.split()
+    if len(first_parts) >= 6:
+        item_data['item_code'] = first_parts[0]  # e.g., "106-5324"
+        
+        # Use Shipped quantity (second number) - this is what was actually sent
+        shipped_qty = first_parts[1]  # "0.00" or "1.00" etc.
+        ordered_qty = first_parts[0] if first_parts[0].replace('-', '').isdigit() else first_parts[2]
+        back_ordered_qty = first_parts[3] if len(first_parts) > 3 else "0.00"
+        
+        # Use shipped quantity if available, otherwise use ordered quantity
+        if shipped_qty != '0.00':
+            item_data['quantity'] = shipped_qty
+        else:
+            item_data['quantity'] = ordered_qty
+        
+        item_data['unit_price'] = first_parts[4]  # e.g., "18.69"
+    
+    # Parse second line - extract alias item and warehouse
+    second_parts = second_line.split()
+    if second_parts:
+        alias_item = second_parts[0]  # e.g., "G1764-35"
+        
+        # Use alias item as the description
+        item_data['description'] = alias_item
+        
+        # Extract warehouse as lot number
+        whse_match = _WHSE_RE.search(second_line)
+        if whse_match:
+            item_data['lot'] = f"Whse:{whse_match.group(1)}"
+    
+    # For items with additional description in the second line
+    if len(second_parts) > 2:
+        # There might be additional description text before "Whse:"
+        desc_text = ' '.join(second_parts[1:-2])  # Skip first (alias) and last parts (Whse: 000)
+        if desc_text and desc_text != 'Whse:':
+            item_data['description'] = f"{alias_item} - {desc_text}"
+    
+    # Only return items with non-zero quantities
+    if (item_data['item_code'] and item_data['description'] and 
+        item_data['quantity'] and item_data['quantity'] != '0.00'):
+        return item_data
+    
+    return None
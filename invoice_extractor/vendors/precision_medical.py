@@ -0,0 +1,230 @@
+"""Precision Medical invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_QTY_BACK_PMM_RE = re.compile(r'QTY\s+QTY\s+BACK\s+PMM PN\s*/\s*DESCRIPTION\s+UNIT\s+TOTAL', re.IGNORECASE)
+_ORDERED_SHIPPED_ORDER_RE = re.compile(r'Ordered\s+Shipped\s+Order\s+Customer PN\s+PRICE', re.IGNORECASE)
+_QTY_BACK_ORDERED_RE = re.compile(r'QTY\s+QTY\s+BACK|Ordered\s+Shipped|SUBTOTAL|EXCISE TAX|HANDLING FEE|TOTAL', re.IGNORECASE)
+_EA_RE = re.compile(r'^\d+\s+EA\s+\d+\s+-\s+')
+_SUBTOTAL_EXCISE_TAX_RE = re.compile(r'SUBTOTAL|EXCISE TAX|HANDLING FEE|TOTAL', re.IGNORECASE)
+_INVOICE_NUMBER_RE = re.compile(r'INVOICE Number:\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date:\s*([A-Za-z]+\s+\d{1,2},\s+\d{4})', re.IGNORECASE)
+_ORDER_NO_RE = re.compile(r'ORDER NO\.\s*(\d+)', re.IGNORECASE)
+_SHIP_DATE_RE = re.compile(r'SHIP DATE\s*(\d{1,2}/\d{1,2}/\d{4})', re.IGNORECASE)
+_CUST_RE = re.compile(r'^\d{3}-\d{3}-\d{3}$')
+_ITEM_RE = re.compile(r'^(\d+)\s+EA\s+(\d+)\s+-\s+([^\s]+)\s+(.+?)\$([\d,]+\.\d{2})\s+\$([\d,]+\.\d{2})$')
+_PRICES_RE = re.compile(r'\$([\d,]+\.\d{2})')
+_DATE_CODE_RE = re.compile(r'DATE CODE:\s*([^\s]+)', re.IGNORECASE)
+
+
+def iter_precision_medical_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Precision Medical invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_precision_medical_invoice_info(lines)
+            
+            # Find item blocks
+            item_blocks = []
+            current_block = []
+            in_items_section = False
+            
+            for i, line in enumerate(lines):
+                line_clean = line.strip()
+                
+                # Look for the start of the items section (table header)
+                if _QTY_BACK_PMM_RE.search(line_clean):
+                    in_items_section = True
+                    continue
+                if _ORDERED_SHIPPED_ORDER_RE.search(line_clean):
+                    in_items_section = True
+                    continue
+                
+                if not in_items_section:
+                    continue
+                
+                # Skip header lines and summary lines
+                if (_QTY_BACK_ORDERED_RE.search(line_clean) or
+                    'THANK YOU FOR YOUR ORDER!' in line_clean):
+                    continue
+                
+                # Look for item lines (they contain quantities and prices)
+                if _EA_RE.match(line_clean):  # e.g., "2 EA 2 - 5096-10/UR6107-21"
+                    if current_block:
+                        item_blocks.append((current_block, invoice_data.copy()))
+                    current_block = [line_clean]
+                # Look for DATE CODE lines that belong to the current item
+                elif current_block and _DATE_CODE_RE.match(line_clean):
+                    current_block.append(line_clean)
+                # Stop if we hit summary section
+                elif _SUBTOTAL_EXCISE_TAX_RE.search(line_clean):
+                    if current_block:
+                        item_blocks.append((current_block, invoice_data.copy()))
+                    current_block = []
+                    break
+            
+            if current_block:
+                item_blocks.append((current_block, invoice_data.copy()))
+            
+            # Process each item block
+            for block, inv_data in item_blocks:
+                item_data = _parse_precision_medical_item_block(block, inv_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_precision_medical_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_precision_medical_invoice_rows()."""
+    return list(iter_precision_medical_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_precision_medical_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Precision Medical invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number
+        inv_match = _INVOICE_NUMBER_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date (Month DD, YYYY format)
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            # Convert "October 29, 2024" to "29.10.2024"
+            us_date = date_match.group(1)
+            try:
+                from datetime import datetime
+                dt = datetime.strptime(us_date, '%B %d, %Y')
+                invoice_data['invoice_date'] = dt.strftime('%d.%m.%Y')
+            except ValueError:
+                # Fallback: try different format
+                try:
+                    dt = datetime.strptime(us_date, '%b %d, %Y')
+                    invoice_data['invoice_date'] = dt.strftime('%d.%m.%Y')
+                except ValueError:
+                    # Keep original format if conversion fails
+                    invoice_data['invoice_date'] = us_date
+        
+        # Extract order number
+        order_match = _ORDER_NO_RE.search(line_clean)
+        if order_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = order_match.group(1)
+            invoice_data['delivery_note'] = order_match.group(1)  # Use order number as delivery note
+        
+        # Extract ship date (US format: MM/DD/YYYY)
+        ship_date_match = _SHIP_DATE_RE.search(line_clean)
+        if ship_date_match and not invoice_data['order_date']:
+            us_date = ship_date_match.group(1)
+            parts = us_date.split('/')
+            if len(parts) == 3:
+                invoice_data['order_date'] = f"{parts[1]}.{parts[0]}.{parts[2]}"
+        
+        # Extract customer number (from the number below ORDER NO.)
+        # Pattern: "340-070-917" appears below the order information
+        cust_match = _CUST_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(0)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_precision_medical_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Precision Medical invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': invoice_data.get('order_no', ''),
+        'order_date': invoice_data.get('order_date', ''),
+        'delivery_note': invoice_data.get('delivery_note', ''),
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line contains the main item data
+    first_line = block[0].strip()
+    
+    # Parse: "2 EA 2 - 5096-10/UR6107-21 Fansler Operating Speculum, Slotted Tube, 1-3/8" DIA, 2-3/8" LONG $110.00 $220.00"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        ordered_qty = item_match.group(1)  # Ordered quantity
+        shipped_qty = item_match.group(2)  # Shipped quantity
+        item_data['item_code'] = item_match.group(3)  # e.g., "5096-10/UR6107-21"
+        item_data['description'] = item_match.group(4).strip()  # Description
+        item_data['unit_price'] = item_match.group(5)  # Unit price
+        item_data['quantity'] = shipped_qty  # Use shipped quantity
+        
+        # Add ordered quantity to description for reference
+        item_data['description'] = f"{item_data['item_code']} - {item_data['description']} (Ordered: {ordered_qty}, Shipped: {shipped_qty})"
+    
+    # Alternative pattern if the first one fails
+    if not item_data['item_code']:
+        # Try a simpler approach - split and analyze
+        parts = first_line.split()
+        if len(parts) >= 7:
+            # Look for the pattern: number EA number - code description $price $total
+            for i in range(len(parts) - 4):
+                if (parts[i].isdigit() and 
+                    parts[i+1] == 'EA' and 
+                    parts[i+2].isdigit() and 
+                    parts[i+3] == '-'):
+                    item_data['quantity'] = parts[i+2]  # Shipped quantity
+                    item_data['item_code'] = parts[i+4]  # Item code
+                    
+                    # Find the description (everything between code and $)
+                    desc_start = first_line.find(parts[i+4]) + len(parts[i+4]) + 1
+                    # Find where prices start
+                    dollar_pos = first_line.find('$', desc_start)
+                    if dollar_pos != -1:
+                        item_data['description'] = first_line[desc_start:dollar_pos].strip()
+                    
+                    # Find prices
+                    prices = _PRICES_RE.findall(first_line)
+                    if prices:
+                        item_data['unit_price'] = prices[0]
+                    
+                    break
+    
+    # Extract date code from the block
+    for line in block:
+        date_code_match = _DATE_CODE_RE.search(line)
+        if date_code_match:
+            item_data['lot'] = f"DateCode:{date_code_match.group(1)}"
+            break
+    
+    # Only return if we have essential data
+    if item_data['item_code'] and item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
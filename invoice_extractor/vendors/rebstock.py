@@ -0,0 +1,218 @@
+"""Rebstock invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ARTICLE_DESCRIPTION_RE = re.compile(r'POS\s+ARTICLE\s+DESCRIPTION\s+QTY\.\s+UNIT\s+TOTAL', re.IGNORECASE)
+_POS_ARTICLE_TOTAL_RE = re.compile(r'POS\s+ARTICLE|TOTAL/EUR|Payment terms|Delivery terms|Shipment', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'Your order no\.\s*([^\s-]+)\s*-\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\d{2}-\d{2}-\d{3}')
+_TOTAL_EUR_PAYMENT_RE = re.compile(r'TOTAL/EUR|Payment terms|Delivery terms', re.IGNORECASE)
+_HEADER_CONTINUATION_RE = re.compile(r'^DESCRIPTION QTY\. UNIT TOTAL$')
+_COMMERCIAL_INVOICE_RE = re.compile(r'COMMERCIAL INVOICE\s*:\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'DATE\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUST_NO_RE = re.compile(r'CUST\.-NO\.\s*:\s*(\d+)', re.IGNORECASE)
+_DELIVERY_NOTE_NO_RE = re.compile(r'Delivery Note No\.\s*(\d+)\s*of\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_POS_RE = re.compile(r'^(\d+)\s+')
+_ITEM_RE = re.compile(r'^(\d{2}-\d{2}-\d{3})\s+(.+?)\s+(\d+)\s+pcs\.\s+([\d,]+)\s+[\d,]+$')
+_ALT_RE = re.compile(r'^(\d{2}-\d{2}-\d{3})\s+(.+?)\s+(\d+)\s+pcs\.\s+([\d,]+)')
+_YOUR_ART_NO_RE = re.compile(r'your art\.-no\.:\s*([^\s]+)', re.IGNORECASE)
+_LST_NO_RE = re.compile(r'LST No\.:\s*([^\s]+)', re.IGNORECASE)
+_LOT_NO_RE = re.compile(r'Lot No\.\s*([^\s]+)', re.IGNORECASE)
+_ITEM_DETAIL_LABEL_RE = re.compile(r'your art\.-no\.:|LST No\.:|Lot No\.', re.IGNORECASE)
+_LEADING_LETTER_RE = re.compile(r'^[a-zA-Z]')
+_PRICES_RE = re.compile(r'\b(\d+[,.]\d{2})\b')
+_QTY_RE = re.compile(r'(\d+)\s+pcs\.', re.IGNORECASE)
+
+_LAYOUT = TableLayout(
+    header=_POS_ARTICLE_DESCRIPTION_RE,
+    header_words=('POS', 'ARTICLE', 'DESCRIPTION'),
+    # e.g. "1 06-06-917"
+    item_start=_ITEM_START_RE,
+    rules=(
+        # Repeated headers and summary lines
+        LineRule(Action.SKIP, _POS_ARTICLE_TOTAL_RE),
+        LineRule(Action.SKIP, _HEADER_CONTINUATION_RE),
+        LineRule(Action.SET, _YOUR_ORDER_NO_RE, ('order_no', 'order_date')),
+    ),
+    terminator=_TOTAL_EUR_PAYMENT_RE,
+)
+
+
+def iter_rebstock_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Rebstock invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_rebstock_invoice_info(lines)
+            
+            for block, order_info in iter_item_blocks(lines, _LAYOUT, {'order_no': '', 'order_date': ''}):
+                item_data = _parse_rebstock_item_block(block, invoice_data, order_info, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_rebstock_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_rebstock_invoice_rows()."""
+    return list(iter_rebstock_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_rebstock_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Rebstock invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number
+        inv_match = _COMMERCIAL_INVOICE_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number
+        cust_match = _CUST_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract delivery note
+        delivery_match = _DELIVERY_NOTE_NO_RE.search(line_clean)
+        if delivery_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = delivery_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_rebstock_item_block(block: List[str], invoice_data: Dict, order_info: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Rebstock invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': order_info.get('order_no', invoice_data.get('order_no', '')),
+        'order_date': order_info.get('order_date', invoice_data.get('order_date', '')),
+        'delivery_note': invoice_data.get('delivery_note', ''),
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line should contain the main item data
+    first_line = block[0].strip()
+    
+    # Extract position number (remove it since we don't need it)
+    pos_match = _POS_RE.search(first_line)
+    if pos_match:
+        first_line = first_line[len(pos_match.group(0)):].strip()
+    
+    # Parse the item line: "06-06-917 CASPAR vertebral body dissector 205 mm 1 pcs. 89,90 89,90"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1).strip()
+        item_data['description'] = item_match.group(2).strip()
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(4)
+    
+    # Alternative pattern for different formatting
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = alt_match.group(1).strip()
+            item_data['description'] = alt_match.group(2).strip()
+            item_data['quantity'] = alt_match.group(3)
+            item_data['unit_price'] = alt_match.group(4)
+    
+    # Extract metadata from the entire block
+    customer_art_no = None
+    lst_no = None
+    for line in block:
+        # Customer article number
+        art_match = _YOUR_ART_NO_RE.search(line)
+        if art_match:
+            customer_art_no = art_match.group(1)
+        
+        # LST number
+        lst_match = _LST_NO_RE.search(line)
+        if lst_match:
+            lst_no = lst_match.group(1)
+        
+        # Lot number
+        lot_match = _LOT_NO_RE.search(line)
+        if lot_match and not item_data['lot']:
+            item_data['lot'] = lot_match.group(1)
+    
+    # Add customer article number to description if found
+    if customer_art_no and item_data['description']:
+        item_data['description'] += f" (Art-No: {customer_art_no})"
+    
+    # Add LST number to description if found
+    if lst_no and item_data['description']:
+        item_data['description'] += f" (LST: {lst_no})"
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for line in block[1:]:
+            # Only include lines that don't look like metadata
+            if not _ITEM_DETAIL_LABEL_RE.search(line):
+                clean_line = line.strip()
+                if clean_line and not _ITEM_START_RE.match(clean_line):  # Don't include lines that start like new items
+                    # Check if this line contains additional description
+                    if _LEADING_LETTER_RE.match(clean_line):  # Starts with a letter
+                        additional_desc.append(clean_line)
+        
+        if additional_desc:
+            item_data['description'] += ' - ' + ' '.join(additional_desc)
+    
+    # Extract unit price from alternative patterns if still missing
+    if not item_data['unit_price']:
+        prices = _PRICES_RE.findall(first_line)
+        if len(prices) >= 2:  # Usually there are two prices: unit price and total
+            item_data['unit_price'] = prices[0]  # First price is unit price
+    
+    # Extract quantity from alternative patterns if still missing
+    if not item_data['quantity']:
+        # Look for quantity pattern with "pcs."
+        qty_match = _QTY_RE.search(first_line)
+        if qty_match:
+            item_data['quantity'] = qty_match.group(1)
+    
+    # Only return if we have essential data
+    if item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
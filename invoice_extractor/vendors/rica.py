@@ -0,0 +1,243 @@
+"""Rica invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_QUANTITY_ITEM_CODE_RE = re.compile(r'Quantity\s+B/O\s+Item Code\s+Description\s+Price Each\s+Amount', re.IGNORECASE)
+_QUANTITY_UPS_PACKAGE_RE = re.compile(r'Quantity\s+B/O|UPS Package|Sales Tax|Total USD', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\d+\s+[A-Z]')
+_LEADING_DIGIT_RE = re.compile(r'^\d')
+_HEADER_RE = re.compile(r'(\d{2}/\d{2}/\d{4})\s+(\d+)')
+_ORD_NUMBER_RE = re.compile(r'Ord Number\s+(\d+)', re.IGNORECASE)
+_PO_RE = re.compile(r'P\.O\. Number\s+([^\s]+)', re.IGNORECASE)
+_TRACKING_RE = re.compile(r'Tracking #:\s*([^\s]+)', re.IGNORECASE)
+_ITEM_RE = re.compile(r'^(\d+)\s+\d+\s+([^\s]+)\s+(.+?)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})$')
+_ALT_RE = re.compile(r'^(\d+)\s+\d+\s+([^\s]+)\s+(.+?)\s+([\d,]+\.\d{2})')
+_LETTER_DASH_CODE_RE = re.compile(r'^[A-Z]-')
+_LETTER_CODE_RE = re.compile(r'^[A-Z]{2,}')
+_ITEM_LINE_RE = re.compile(r'^\d+\.\d{2}$')
+_LOT_RE = re.compile(r'LOT#\s*([^\s]+)', re.IGNORECASE)
+_UPS_PACKAGE_SALES_RE = re.compile(r'UPS Package|Sales Tax|Total USD', re.IGNORECASE)
+_PRICES_RE = re.compile(r'\b(\d+\.\d{2})\b')
+
+
+def iter_rica_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Rica Surgical invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_rica_invoice_info(lines)
+            
+            # Find item blocks
+            item_blocks = []
+            current_block = []
+            in_items_section = False
+            
+            for i, line in enumerate(lines):
+                line_clean = line.strip()
+                
+                # Look for the start of the items section (table header)
+                if _QUANTITY_ITEM_CODE_RE.search(line_clean):
+                    in_items_section = True
+                    continue
+                
+                if not in_items_section:
+                    continue
+                
+                # Skip header lines and summary lines
+                if (_QUANTITY_UPS_PACKAGE_RE.search(line_clean) or
+                    'Phone # Fax # Web Site' in line_clean):
+                    continue
+                
+                # Look for item lines (they contain quantities and item codes)
+                if _ITEM_START_RE.match(line_clean):  # e.g., "20 0 WSR-6"
+                    if current_block:
+                        item_blocks.append((current_block, invoice_data.copy()))
+                    current_block = [line_clean]
+                # Continue collecting description lines for the current item
+                elif current_block and line_clean and not _LEADING_DIGIT_RE.match(line_clean):
+                    # Stop if we hit a new section
+                    if _UPS_PACKAGE_SALES_RE.search(line_clean):
+                        item_blocks.append((current_block, invoice_data.copy()))
+                        current_block = []
+                        break
+                    else:
+                        current_block.append(line_clean)
+                # Stop if we hit summary section
+                elif _UPS_PACKAGE_SALES_RE.search(line_clean):
+                    if current_block:
+                        item_blocks.append((current_block, invoice_data.copy()))
+                    current_block = []
+                    break
+            
+            if current_block:
+                item_blocks.append((current_block, invoice_data.copy()))
+            
+            # Process each item block
+            for block, inv_data in item_blocks:
+                item_data = _parse_rica_item_block(block, inv_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_rica_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_rica_invoice_rows()."""
+    return list(iter_rica_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_rica_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Rica Surgical invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'order_date': '',
+        'delivery_note': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number and date from header
+        # Pattern: "09/20/2024 110669"
+        header_match = _HEADER_RE.search(line_clean)
+        if header_match:
+            if not invoice_data['invoice_date']:
+                # Convert US date format to European format DD.MM.YYYY
+                us_date = header_match.group(1)
+                parts = us_date.split('/')
+                if len(parts) == 3:
+                    invoice_data['invoice_date'] = f"{parts[1]}.{parts[0]}.{parts[2]}"
+            if not invoice_data['invoice_number']:
+                invoice_data['invoice_number'] = header_match.group(2)
+        
+        # Extract order number
+        ord_match = _ORD_NUMBER_RE.search(line_clean)
+        if ord_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = ord_match.group(1)
+        
+        # Extract P.O. Number (delivery note)
+        po_match = _PO_RE.search(line_clean)
+        if po_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = po_match.group(1)
+            invoice_data['order_no'] = po_match.group(1)  # Also use as order number
+        
+        # Extract tracking number as alternative delivery note
+        tracking_match = _TRACKING_RE.search(line_clean)
+        if tracking_match and not invoice_data['delivery_note']:
+            invoice_data['delivery_note'] = tracking_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_rica_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Rica Surgical invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': invoice_data.get('order_no', ''),
+        'order_date': invoice_data.get('order_date', ''),
+        'delivery_note': invoice_data.get('delivery_note', ''),
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot': '',
+        'page': page_num + 1
+    }
+    
+    # The first line contains the main item data
+    first_line = block[0].strip()
+    
+    # Parse: "20 0 WSR-6 WEINSTEIN RACK STRINGER 6" LONG 2.75" WIDE 10.32 206.40"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['quantity'] = item_match.group(1)
+        item_data['item_code'] = item_match.group(2)  # e.g., "WSR-6"
+        item_data['description'] = item_match.group(3).strip()
+        item_data['unit_price'] = item_match.group(4)  # e.g., "10.32"
+    
+    # Alternative pattern for different formatting
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['quantity'] = alt_match.group(1)
+            item_data['item_code'] = alt_match.group(2)
+            item_data['description'] = alt_match.group(3).strip()
+            item_data['unit_price'] = alt_match.group(4)
+    
+    # If still no match, try a more flexible approach
+    if not item_data['item_code']:
+        parts = first_line.split()
+        if len(parts) >= 5:
+            # Look for the pattern: number number code description price price
+            for i in range(2, len(parts) - 2):
+                if _LETTER_DASH_CODE_RE.match(parts[i]) or _LETTER_CODE_RE.match(parts[i]):  # Item code pattern
+                    item_data['quantity'] = parts[0]
+                    item_data['item_code'] = parts[i]
+                    
+                    # Description is everything between code and prices
+                    code_pos = first_line.find(parts[i]) + len(parts[i])
+                    # Find prices (look for decimal numbers)
+                    prices = []
+                    for j in range(i+1, len(parts)):
+                        if _ITEM_LINE_RE.match(parts[j]):
+                            prices.append(parts[j])
+                    
+                    if prices:
+                        price_pos = first_line.find(prices[0])
+                        item_data['description'] = first_line[code_pos:price_pos].strip()
+                        item_data['unit_price'] = prices[0]
+                    break
+    
+    # Extract lot number from the block
+    for line in block:
+        lot_match = _LOT_RE.search(line)
+        if lot_match and not item_data['lot']:
+            item_data['lot'] = lot_match.group(1)
+    
+    # For multi-line descriptions, combine them
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for i in range(1, len(block)):
+            line = block[i].strip()
+            # Skip lines that contain lot numbers or look like new items
+            if (line and 
+                not _LOT_RE.search(line) and
+                not _ITEM_START_RE.match(line) and
+                not _UPS_PACKAGE_SALES_RE.search(line)):
+                additional_desc.append(line)
+        
+        if additional_desc:
+            item_data['description'] += ' - ' + ' '.join(additional_desc)
+    
+    # Extract unit price from alternative patterns if still missing
+    if not item_data['unit_price']:
+        prices = _PRICES_RE.findall(first_line)
+        if prices:
+            item_data['unit_price'] = prices[0]  # First price is unit price
+    
+    # Only return if we have essential data and non-zero quantity
+    if (item_data['item_code'] and item_data['description'] and 
+        item_data['quantity'] and item_data['quantity'] != '0'):
+        return item_data
+    
+    return None
@@ -0,0 +1,190 @@
+"""Rudischhauser invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ITEM_DESCRIPTION_RE = re.compile(r'pos\s+item\s+description\s+quantity.*€.*each.*€.*total', re.IGNORECASE)
+_POS_ITEM_TOTAL_RE = re.compile(r'pos\s+item|Total net|Total amount|Packaging|Carry-over', re.IGNORECASE)
+_RUDISCHHAUSER_SURGICAL_RE = re.compile(r'Rudischhauser Surgical')
+_YOUR_NO_RE = re.compile(r'Your P\.O\. no\.\s+([^\s-]+)', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+[A-Z]+.*\d')
+_DESC_RE = re.compile(r'(.+?)\s+(\d+)\s+pcs\.\s+([\d,]+)\s*€')
+_ITEM_LINE_RE = re.compile(r'^\d+,\d{2}$')
+_LOT_NUMBER_RE = re.compile(r'Lot number\s*([^/\n]+)', re.IGNORECASE)
+_PCS_LOT_NUMBER_RE = re.compile(r'pcs\.|[\d,]+\s*€|Lot number|^\d+\s+[A-Z]')
+_INV_RE = re.compile(r'INVOICE\s*:\s*(\d+)', re.IGNORECASE)
+_CUSTOMER_NO_RE = re.compile(r'Customer No\.\s*:\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_SUPPLIER_NO_RE = re.compile(r'supplier no\.\s*:\s*([^\s]+)', re.IGNORECASE)
+_DEV_RE = re.compile(r'DEV:\s*([^\s]+)', re.IGNORECASE)
+_OUR_REFERENCE_RE = re.compile(r'Our reference\s*:\s*([^\s]+)', re.IGNORECASE)
+
+_LAYOUT = TableLayout(
+    header=_POS_ITEM_DESCRIPTION_RE,
+    header_words=('pos', 'item', 'description'),
+    # A position number and item code
+    item_start=_ITEM_START_RE,
+    rules=(
+        # Repeated headers, page footers and summary lines end an item
+        LineRule(Action.CLOSE, _POS_ITEM_TOTAL_RE),
+        LineRule(Action.CLOSE, _RUDISCHHAUSER_SURGICAL_RE),
+        LineRule(Action.CLOSE_SET, _YOUR_NO_RE, ('po',)),
+    ),
+    skip_blank=True,
+)
+
+
+def iter_rudischhauser_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Rudischhauser invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_rudischhauser_invoice_info(lines)
+            
+            for block, po_info in iter_item_blocks(lines, _LAYOUT, {'po': ''}):
+                item_data = _parse_rudischhauser_item_block(block, invoice_data, po_info['po'], page_num)
+                if item_data:
+                    yield item_data
+
+def extract_rudischhauser_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_rudischhauser_invoice_rows()."""
+    return list(iter_rudischhauser_invoice_rows(pdf_content))
+
+@timed("parse")
+def _parse_rudischhauser_item_block(block: List[str], invoice_data: Dict, po_no: str, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Rudischhauser invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': po_no,
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot_number': '',
+        'page': page_num + 1
+    }
+    
+    # Parse first line for item code
+    first_line = block[0].strip()
+    first_parts = first_line.split()
+    if len(first_parts) >= 3:
+        item_data['item_code'] = " ".join(first_parts[1:])
+    
+    # Look for description + pcs + €
+    for line in block:
+        line_clean = line.strip()
+        desc_match = _DESC_RE.search(line_clean)
+        if desc_match:
+            item_data['description'] = desc_match.group(1).strip()
+            item_data['quantity'] = desc_match.group(2)
+            item_data['unit_price'] = desc_match.group(3)
+            break
+    
+    # If still missing description, try fallback
+    if not item_data['description']:
+        for line in block:
+            if 'pcs.' in line:
+                parts = line.split()
+                for j, part in enumerate(parts):
+                    if part == 'pcs.' and j >= 2:
+                        item_data['description'] = ' '.join(parts[:j-1])
+                        item_data['quantity'] = parts[j-1]
+                        price_parts = parts[j+1:]
+                        prices = [p for p in price_parts if _ITEM_LINE_RE.match(p)]
+                        if prices:
+                            item_data['unit_price'] = prices[0]
+                        break
+    
+    # Extract lot number
+    for line in block:
+        lot_match = _LOT_NUMBER_RE.search(line)
+        if lot_match:
+            item_data['lot_number'] = lot_match.group(1).strip()
+            break
+    
+    # Additional description lines
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for i in range(1, len(block)):
+            line = block[i].strip()
+            if (line and 
+                not _PCS_LOT_NUMBER_RE.search(line) and
+                line != item_data['description']):
+                additional_desc.append(line)
+        if additional_desc:
+            item_data['description'] += ' - ' + ' '.join(additional_desc)
+    
+    if (item_data['item_code'] and item_data['description'] and 
+        item_data['quantity'] and item_data['quantity'] != '0'):
+        return item_data
+    
+    return None
+
+@timed("header")
+def _extract_rudischhauser_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Rudischhauser invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'supplier_no': '',
+        'dev_no': '',
+        'our_reference': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number: "Novo Surgical Inc. INVOICE : 9240991"
+        inv_match = _INV_RE.search(line_clean)
+        if inv_match:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract customer number: "Customer No. : 11406"
+        cust_match = _CUSTOMER_NO_RE.search(line_clean)
+        if cust_match:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract invoice date: "Date : 18.09.2024"
+        date_match = _DATE_RE.search(line_clean)
+        if date_match:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract supplier number: "supplier no. : 02-2500029"
+        supp_match = _SUPPLIER_NO_RE.search(line_clean)
+        if supp_match:
+            invoice_data['supplier_no'] = supp_match.group(1)
+        
+        # Extract DEV number: "DEV: 8010300"
+        dev_match = _DEV_RE.search(line_clean)
+        if dev_match:
+            invoice_data['dev_no'] = dev_match.group(1)
+        
+        # Extract our reference: "Our reference : WT"
+        ref_match = _OUR_REFERENCE_RE.search(line_clean)
+        if ref_match:
+            invoice_data['our_reference'] = ref_match.group(1)
+    
+    return invoice_data
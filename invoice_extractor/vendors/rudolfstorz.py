@@ -0,0 +1,133 @@
+"""Rudolf Storz invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ARTICLE_DESCRIPTION_RE = re.compile(r'POS\s+ARTICLE\s+description\s+qty.*EUR', re.IGNORECASE)
+_CARRY_OVER_TOTAL_RE = re.compile(r'carry-over|total net|total/EUR|package', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.\s*([^\s-]+)', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\S+')
+_INVOICE_DATE_RE = re.compile(r'INVOICE\s+(\d+)\s+Date\s+(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUST_RE = re.compile(r'PM\s+(\d+)', re.IGNORECASE)
+_FALLBACK_RE = re.compile(r'(\d+)(?=\s*page:)', re.IGNORECASE)
+_CHARGEN_LOT_NR_RE = re.compile(r'Chargen-/Lot-Nr\.\s*(.+)', re.IGNORECASE)
+
+_LAYOUT = TableLayout(
+    header=_POS_ARTICLE_DESCRIPTION_RE,
+    header_words=('POS', 'ARTICLE', 'description'),
+    item_start=_ITEM_START_RE,
+    rules=(
+        LineRule(Action.CLOSE, _CARRY_OVER_TOTAL_RE),
+        # Each order starts a new block
+        LineRule(Action.CLOSE_SET, _YOUR_ORDER_NO_RE, ('po',)),
+    ),
+    skip_blank=True,
+)
+
+
+def iter_rudolfstorz_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Rudolf Storz invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+            
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_rudolfstorz_invoice_info(lines)
+            
+            for block, order_info in iter_item_blocks(lines, _LAYOUT, {'po': ''}):
+                item_data = _parse_rudolfstorz_item_block(block, invoice_data, order_info['po'], page_num)
+                if item_data:
+                    yield item_data
+
+def extract_rudolfstorz_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_rudolfstorz_invoice_rows()."""
+    return list(iter_rudolfstorz_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_rudolfstorz_invoice_info(lines: List[str]) -> Dict:
+    """Extract invoice-level metadata from Rudolf Storz invoice."""
+    invoice_data = {
+        'invoice_date': '',
+        'invoice_number': '',
+        'customer_number': ''
+    }
+    
+    for i, line in enumerate(lines):
+        # Invoice number + date
+        inv_match = _INVOICE_DATE_RE.search(line)
+        if inv_match:
+            invoice_data['invoice_number'] = inv_match.group(1)
+            invoice_data['invoice_date'] = inv_match.group(2)
+        
+        # Customer number may be on the following line after "Cust.-No."
+        if "Cust.-No." in line and i + 1 < len(lines):
+            next_line = lines[i + 1]
+            # Preferred pattern: "PM 12214"
+            cust_match = _CUST_RE.search(next_line)
+            if cust_match:
+                invoice_data['customer_number'] = cust_match.group(1)
+            else:
+                # Fallback: last number on the line
+                fallback_match = _FALLBACK_RE.search(next_line)
+                if fallback_match:
+                    invoice_data['customer_number'] = fallback_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_rudolfstorz_item_block(block: List[str], invoice_data: Dict, po_no: str, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Rudolf Storz invoice."""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': po_no,
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot_number': '',
+        'page': page_num + 1
+    }
+    
+    first_line = block[0].strip()
+    parts = first_line.split()
+    if len(parts) >= 6:
+        # Example: "1 558001 Cooley Atrial Valve Retractors 1 pcs. 80,55 80,55"
+        item_data['item_code'] = parts[1]
+        item_data['description'] = " ".join(parts[2:-4])  # everything until qty
+        item_data['quantity'] = parts[-4]  # numeric qty (e.g., "1")
+        item_data['unit_price'] = parts[-2]  # "80,55"
+    
+    # Look for additional description + lot number
+    for line in block[1:]:
+        if _CHARGEN_LOT_NR_RE.search(line):
+            lot_match = _CHARGEN_LOT_NR_RE.search(line)
+            if lot_match:
+                item_data['lot_number'] = lot_match.group(1).strip()
+        else:
+            if line and not _ITEM_START_RE.match(line):
+                item_data['description'] += " " + line.strip()
+    
+    if item_data['item_code'] and item_data['description'] and item_data['quantity']:
+        return item_data
+    
+    return None
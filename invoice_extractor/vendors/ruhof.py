@@ -0,0 +1,119 @@
+"""Ruhof invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_UNITS_UOM_ITEM_RE = re.compile(r'UNITS\s+UOM\s+ITEM\s+CODE\s+DESCRIPTION', re.IGNORECASE)
+_NET_INVOICE_TOTAL_RE = re.compile(r'Net Invoice:|Invoice Total:', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\S+\s+\S+')
+_INV_RE = re.compile(r'(\d{7,}-IN)\s+(\d{1,2}/\d{1,2}/\d{4})\s+(\d+)\s+(\d{1,2}/\d{1,2}/\d{4})\s+(\S+)\s+(\d+)')
+_ITEM_LINE_RE = re.compile(r'^(\d+)\s+(\w+)\s+([\w-]+)\s+(.+?)\s+(\d+)\s+([\d.]+)\s+([\d.]+)$')
+
+_LAYOUT = TableLayout(
+    header=_UNITS_UOM_ITEM_RE,
+    header_words=('UNITS', 'UOM', 'DESCRIPTION'),
+    # A quantity, unit of measure and item code
+    item_start=_ITEM_START_RE,
+    # Totals end the table
+    rules=(
+        LineRule(Action.STOP, _NET_INVOICE_TOTAL_RE),
+    ),
+    skip_blank=True,
+)
+
+
+def iter_ruhof_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Ruhof invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+            
+            lines = text.split("\n")
+            invoice_data = _extract_ruhof_invoice_info(lines)
+            
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_ruhof_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_ruhof_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_ruhof_invoice_rows()."""
+    return list(iter_ruhof_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_ruhof_invoice_info(lines: List[str]) -> Dict:
+    """Extract invoice-level metadata from Ruhof invoice."""
+    invoice_data = {
+        'invoice_date': '',
+        'invoice_number': '',
+        'customer_number': '',
+        'order_no': '',
+        'po_number': ''
+    }
+    
+    for line in lines:
+        # Invoice header line
+        inv_match = _INV_RE.search(line)
+        if inv_match:
+            invoice_data['invoice_number'] = inv_match.group(1)      # e.g. 4969153-IN
+            invoice_data['invoice_date'] = inv_match.group(2)        # e.g. 4/29/2024
+            invoice_data['order_no'] = inv_match.group(3)            # e.g. 0890258
+            invoice_data['customer_number'] = inv_match.group(5)     # e.g. 00-0031456
+            invoice_data['po_number'] = inv_match.group(6)           # e.g. 0016494
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_ruhof_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """
+    Parse a Ruhof invoice item block (may span multiple lines).
+    Example block:
+    [
+        '2 EACH 34560-21 PREPZYME w/BIOCLEAN TECH 2 16.91 33.82',
+        '(32oz/946ml with foam sprayer)'
+    ]
+    """
+    if not block:
+        return None
+
+    # First line contains structured fields
+    first_line = block[0]
+
+    match = _ITEM_LINE_RE.match(first_line)
+    if not match:
+        return None
+
+    qty, _, item_code, description, pkgs, unit_price, _ = match.groups()
+
+    # If there are continuation lines, append them to description
+    if len(block) > 1:
+        continuation = " ".join(block[1:]).strip()
+        description = f"{description} {continuation}"
+
+    return {
+        "invoice_number": invoice_data.get("invoice_number", ""),
+        "invoice_date": invoice_data.get("invoice_date", ""),
+        "customer_number": invoice_data.get("customer_number", ""),
+        "po_number": invoice_data.get("po_number", ""),
+        "quantity": qty,
+        "item_code": item_code,
+        "description": description.strip(),
+        "pkgs": pkgs,
+        "unit_price": unit_price,
+        "page_number": page_num + 1  # optional
+        # uom removed
+        # amount removed
+    }
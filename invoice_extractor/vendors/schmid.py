@@ -0,0 +1,164 @@
+"""Schmid invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ARTICLE_DESCRIPTION_RE = re.compile(r'POS\s+article\s+description\s+qty', re.IGNORECASE)
+_TOTAL_NET_EUR_RE = re.compile(r'total\s+net|total/EUR|payment|delivery|package', re.IGNORECASE)
+_ITEM_LINE_START_RE = re.compile(r'^\d+\s+[A-Za-z0-9-]+.*\d+[\.,]\d+\s+\d+[\.,]\d+$')
+_INVOICE_NO_RE = re.compile(r'INVOICE NO\.\s*:\s*(\d+)', re.I)
+_DATE_RE = re.compile(r'Date\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.I)
+_CUST_NO_RE = re.compile(r'Cust\.-No\.\s*:\s*(\d+)', re.I)
+_DELIVERY_NOTE_NO_RE = re.compile(r'Delivery Note No\.\s*(\d+)', re.I)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.\s*(\d+)\s*-\s*(\d{2}\.\d{2}\.\d{4})', re.I)
+_ITEM_LINE_RE = re.compile(r'^\d+\s+[A-Z0-9/-]+\s+(.+?)\s+(\d+)\s+([\d,.]+)\s+[\d,.]+$')
+_YOUR_ART_NO_RE = re.compile(r'your art\.-no\.\s*:\s*([A-Za-z0-9-]+)', re.I)
+_LOT_NUMBER_RE = re.compile(r'lot number[:\s]+([A-Za-z0-9/-]+)', re.I)
+_ITEM_START_RE = re.compile(r'^\d+\s+[A-Z0-9/-]+')
+
+_LAYOUT = TableLayout(
+    header=_POS_ARTICLE_DESCRIPTION_RE,
+    header_words=('POS', 'article', 'description'),
+    # A position number, the article and the quantity and prices
+    item_start=_ITEM_LINE_START_RE,
+    # Totals end the table
+    rules=(LineRule(Action.STOP, _TOTAL_NET_EUR_RE),),
+    skip_blank=True,
+)
+
+
+def iter_schmid_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Schmid invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+
+            # Extract invoice-level info
+            invoice_data = _extract_schmid_invoice_info(lines)
+
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_schmid_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_schmid_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_schmid_invoice_rows()."""
+    return list(iter_schmid_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_schmid_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice-level information from Schmid invoice"""
+    invoice_data = {
+        "invoice_number": "",
+        "invoice_date": "",
+        "customer_number": "",
+        "order_no": "",
+        "order_date": "",
+        "delivery_note": ""
+    }
+
+    for line in lines:
+        line_clean = line.strip()
+
+        inv_match = _INVOICE_NO_RE.search(line_clean)
+        if inv_match and not invoice_data["invoice_number"]:
+            invoice_data["invoice_number"] = inv_match.group(1)
+
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data["invoice_date"]:
+            invoice_data["invoice_date"] = date_match.group(1)
+
+        cust_match = _CUST_NO_RE.search(line_clean)
+        if cust_match and not invoice_data["customer_number"]:
+            invoice_data["customer_number"] = cust_match.group(1)
+
+        dn_match = _DELIVERY_NOTE_NO_RE.search(line_clean)
+        if dn_match and not invoice_data["delivery_note"]:
+            invoice_data["delivery_note"] = dn_match.group(1)
+
+        ord_match = _YOUR_ORDER_NO_RE.search(line_clean)
+        if ord_match and not invoice_data["order_no"]:
+            invoice_data["order_no"], invoice_data["order_date"] = ord_match.groups()
+
+    return invoice_data
+
+@timed("parse")
+def _parse_schmid_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """
+    Parse an individual item block from Schmid invoices.
+    """
+    if not block:
+        return None
+
+    quantity = ""
+    description_lines = []
+    unit_price = ""
+    art_number = ""
+    lot_number = ""
+    order_number = ""
+    order_date = ""
+
+    # First line with qty + description + unit price + line total
+    first_line = block[0].strip()
+    match = _ITEM_LINE_RE.match(first_line)
+    if match:
+        description_lines.append(match.group(1).strip())
+        quantity = match.group(2)
+        unit_price = match.group(3)
+
+    for line in block[1:]:
+        line = line.strip()
+
+        # Extract order number & date
+        order_match = _YOUR_ORDER_NO_RE.search(line)
+        if order_match:
+            order_number, order_date = order_match.groups()
+            continue
+
+        # Extract art number
+        art_match = _YOUR_ART_NO_RE.search(line)
+        if art_match:
+            art_number = art_match.group(1)
+            continue
+
+        # Extract lot number
+        lot_match = _LOT_NUMBER_RE.search(line)
+        if lot_match:
+            lot_number = lot_match.group(1)
+            continue
+
+        # Otherwise treat as description continuation
+        if line and not _ITEM_START_RE.match(line):
+            description_lines.append(line)
+
+    description = " ".join(description_lines).strip()
+
+    return {
+        "invoice_number": invoice_data.get("invoice_number", ""),
+        "invoice_date": invoice_data.get("invoice_date", ""),
+        "customer_number": invoice_data.get("customer_number", ""),
+        "order_number": order_number,
+        "order_date": order_date,
+        "delivery_note": invoice_data.get("delivery_note", ""),
+        "art_number": art_number,
+        "lot_number": lot_number,
+        "description": description,
+        "quantity": quantity,
+        "unit_price": unit_price,
+        "page_number": page_num + 1
+    }
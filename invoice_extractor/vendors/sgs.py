@@ -0,0 +1,162 @@
+"""SGS North America invoice extractor."""
+import re
+from typing import Dict, Iterator, List
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_QUANTITY_NET_AMOUNT_RE = re.compile(r'Quantity\s+Net Amount\s+Amount', re.I)
+_SUB_TOTAL_NET_RE = re.compile(r'Sub-Total|Net \$|Total', re.I)
+_INVOICE_NO_RE = re.compile(r'INVOICE No[:\s]+(\d+)', re.I)
+_ISSUE_DATE_RE = re.compile(r'Issue Date\s*:\s*(.+)', re.I)
+_CLIENT_RE = re.compile(r'Client\s+(.+)', re.I)
+_ACCOUNT_NO_RE = re.compile(r'Account No\.\s*:\s*([^\s]+)', re.I)
+_OUR_REFER_NO_RE = re.compile(r'Our Refer\. No\.\s*:\s*(.+)', re.I)
+_CLIENT_REF_NO_RE = re.compile(r'Client Ref No\.\s*:\s*(.+)', re.I)
+_PO_NO_RE = re.compile(r'PO No\.\s*:\s*(.+)', re.I)
+_ITEM_END_RE = re.compile(r"(.+?)\s+([\d.,]+)\s+([\d.,]+)\s+([\d.,]+)$")
+_TAXI_MEAL_HOTEL_RE = re.compile(r"(Taxi|Meal|Hotel|Rental Car|Flights)\s+([\d.,]+)\s+([\d.,]+)$", re.I)
+_PROCESSING_FEE_REPORTING_RE = re.compile(r"(Processing Fee.*?|Reporting.*?)\s+([\d.,]+)\s+([\d.,]+)$", re.I)
+
+
+def iter_sgs_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from SGS North America invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            invoice_data = _extract_sgs_invoice_info(lines)
+
+            in_items_section = False
+            item_blocks = []
+
+            for line in lines:
+                line_clean = line.strip()
+
+                # Start when we hit the column headers
+                if _QUANTITY_NET_AMOUNT_RE.search(line_clean):
+                    in_items_section = True
+                    continue
+                if not in_items_section:
+                    continue
+
+                # Stop when we reach summary section
+                if _SUB_TOTAL_NET_RE.search(line_clean):
+                    break
+
+                # Skip empty or irrelevant lines
+                if not line_clean or "Alternative Currency" in line_clean:
+                    continue
+
+                item_blocks.append((line_clean, invoice_data.copy()))
+
+            # Parse item lines
+            for block, inv_data in item_blocks:
+                item_data = _parse_sgs_item_block(block, inv_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_sgs_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_sgs_invoice_rows()."""
+    return list(iter_sgs_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_sgs_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice-level info from SGS North America invoices."""
+    invoice_data = {
+        "invoice_number": "",
+        "invoice_date": "",
+        "client_name": "",
+        "account_number": "",
+        "our_reference": "",
+        "client_reference": "",
+        "po_number": ""
+    }
+
+    for line in lines:
+        line_clean = line.strip()
+
+        inv_match = _INVOICE_NO_RE.search(line_clean)
+        if inv_match:
+            invoice_data["invoice_number"] = inv_match.group(1)
+
+        date_match = _ISSUE_DATE_RE.search(line_clean)
+        if date_match:
+            invoice_data["invoice_date"] = date_match.group(1).strip()
+
+        client_match = _CLIENT_RE.search(line_clean)
+        if client_match and not invoice_data["client_name"]:
+            invoice_data["client_name"] = client_match.group(1).strip()
+
+        acct_match = _ACCOUNT_NO_RE.search(line_clean)
+        if acct_match:
+            invoice_data["account_number"] = acct_match.group(1)
+
+        ref_match = _OUR_REFER_NO_RE.search(line_clean)
+        if ref_match:
+            invoice_data["our_reference"] = ref_match.group(1).strip()
+
+        client_ref_match = _CLIENT_REF_NO_RE.search(line_clean)
+        if client_ref_match:
+            invoice_data["client_reference"] = client_ref_match.group(1).strip()
+
+        po_match = _PO_NO_RE.search(line_clean)
+        if po_match:
+            invoice_data["po_number"] = po_match.group(1).strip()
+
+    return invoice_data
+
+@timed("parse")
+def _parse_sgs_item_block(line: str, invoice_data: Dict, page_num: int) -> Dict:
+    """
+    Parse a single SGS invoice item line into structured data.
+    """
+    item_data = invoice_data.copy()
+    item_data["page"] = page_num + 1
+
+    # Example line:
+    # "Aug 16, 2022 - Surveillance Audit (10) 1.50 3,150.00 3,150.00"
+    match = _ITEM_END_RE.match(line)
+    if match:
+        desc, qty, net, total = match.groups()
+        item_data.update({
+            "description": desc.strip(),
+            "quantity": qty.strip(),
+            "net": net.strip(),
+            "total": total.strip(),
+        })
+        return item_data
+
+    # Expenses like "Taxi 112.28 112.28"
+    match = _TAXI_MEAL_HOTEL_RE.match(line)
+    if match:
+        desc, net, total = match.groups()
+        item_data.update({
+            "description": desc.strip(),
+            "quantity": "1",  # implied
+            "net": net.strip(),
+            "total": total.strip(),
+        })
+        return item_data
+
+    # Page 2 extras: "Processing Fee 7.5% 123.82 123.82"
+    match = _PROCESSING_FEE_REPORTING_RE.match(line)
+    if match:
+        desc, net, total = match.groups()
+        item_data.update({
+            "description": desc.strip(),
+            "quantity": "1",  # implied
+            "net": net.strip(),
+            "total": total.strip(),
+        })
+        return item_data
+
+    return None
@@ -0,0 +1,120 @@
+"""SIBEL invoice extractor."""
+import re
+from typing import Dict, Iterator, List
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ITEM_DESCRIPTION_RE = re.compile(r'Pos\.\s+Item N°\s+Description', re.I)
+_TOTAL_EXVAT_VAT_RE = re.compile(r'Total ExVAT|VAT|Total InVAT', re.I)
+_INV_RE = re.compile(r'N°\s+(\d+)', re.I)
+_DATE_RE = re.compile(r'Date\s+(\d{2}/\d{2}/\d{4})', re.I)
+_ITEM_END_RE = re.compile(r"(\d+)\s+([\w\-]+)\s+(.+?)\s+(\d+)\s+([\w]+)\s+([\d,]+)\s+([\d,]+)$")
+_YOUR_ARTICLE_REF_RE = re.compile(r"Your article ref\.\s*:\s*([A-Za-z0-9\-\/]+)", re.I)
+_LOT_RE = re.compile(r"LOT\s*:\s*([A-Za-z0-9\-\/]+)", re.I)
+
+
+def iter_sibel_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from SIBEL invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            invoice_data = _extract_sibel_invoice_info(lines)
+
+            in_items_section = False
+            item_blocks = []
+
+            for line in lines:
+                line_clean = line.strip()
+
+                # Start when we hit the column headers
+                if _POS_ITEM_DESCRIPTION_RE.search(line_clean):
+                    in_items_section = True
+                    continue
+                if not in_items_section:
+                    continue
+
+                # Stop when we reach totals
+                if _TOTAL_EXVAT_VAT_RE.search(line_clean):
+                    break
+
+                if not line_clean:
+                    continue
+
+                item_blocks.append((line_clean, invoice_data.copy()))
+
+            # Parse each item block
+            for block, inv_data in item_blocks:
+                item_data = _parse_sibel_item_block(block, inv_data, page_num, text)
+                if item_data:
+                    yield item_data
+
+def extract_sibel_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_sibel_invoice_rows()."""
+    return list(iter_sibel_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_sibel_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice-level info from SIBEL invoices."""
+    invoice_data = {
+        "invoice_number": "",
+        "invoice_date": ""
+    }
+
+    for line in lines:
+        line_clean = line.strip()
+
+        inv_match = _INV_RE.search(line_clean)
+        if inv_match:
+            invoice_data["invoice_number"] = inv_match.group(1)
+
+        date_match = _DATE_RE.search(line_clean)
+        if date_match:
+            invoice_data["invoice_date"] = date_match.group(1)
+
+    return invoice_data
+
+@timed("parse")
+def _parse_sibel_item_block(line: str, invoice_data: Dict, page_num: int, full_text: str) -> Dict:
+    """
+    Parse a single SIBEL invoice item line.
+    Example:
+    "1 18-2-0176-0010 DEBAKEY MICRO CLAMP... 1 1 510,88 510,88"
+    """
+    item_data = invoice_data.copy()
+    item_data["page"] = page_num + 1
+
+    # Regex: Pos, ItemNo, Description, Qty, Unit, UnitPrice, Total
+    match = _ITEM_END_RE.match(line)
+    if match:
+        pos, item_no, desc, qty, unit, unit_price, total = match.groups()
+        item_data.update({
+            "item_number": item_no.strip(),
+            "description": desc.strip(),
+            "quantity": qty.strip(),
+            "unit": unit.strip(),
+            "unit_price": unit_price.strip()
+        })
+
+        # Optional: Article Reference
+        art_no_match = _YOUR_ARTICLE_REF_RE.search(full_text)
+        if art_no_match:
+            item_data["article_number"] = art_no_match.group(1)
+
+        # Optional: Lot Number
+        lot_match = _LOT_RE.search(full_text)
+        if lot_match:
+            item_data["lot_number"] = lot_match.group(1)
+
+        return item_data
+
+    return None
@@ -0,0 +1,229 @@
+"""Siema invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ARTICLE_DESCRIPTION_RE = re.compile(r'POS\s+ARTICLE\s+description', re.IGNORECASE)
+_TOTAL_NET_EUR_RE = re.compile(r'total\s+net|total/EUR|total\/EUR', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.\s*(\d+)\s*-\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CARRY_OVER_RE = re.compile(r'carry-over', re.IGNORECASE)
+_SM_ITEM_LINE_RE = re.compile(r'^\d+\s+SM\b.*\s+\d+\s+[\d\.,]+\s+[\d\.,]+$')
+_INVOICE_NO_RE = re.compile(r'INVOICE NO\.\s*:\s*([A0-9-]+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUST_NO_RE = re.compile(r'Cust\.-No\.\s*:\s*([0-9\-]+)', re.IGNORECASE)
+_TAIL_RE = re.compile(r'(\d+)\s+([\d\.,]+)\s+[\d\.,]+\s*$')
+_SM_PREFIX_RE = re.compile(r'^\d+\s+SM\s+', re.IGNORECASE)
+_INLINE_RE = re.compile(r'\bSM\s+([0-9]{2,5}(?:[-/][\dA-Za-z\.\-/]+)?)', re.IGNORECASE)
+_LST_RE = re.compile(r'\bLST[:\s]*([A-Za-z0-9 \-\/]+)', re.IGNORECASE)
+_YOUR_REF_NO_RE = re.compile(r'your ref\.no\.\s*[:\s]*([A-Za-z0-9\-\/]+)', re.IGNORECASE)
+_LOT_NUMBER_RE = re.compile(r'Lot\s*number\s*[:\s]*([A-Za-z0-9\-/]+)', re.IGNORECASE)
+_ITEMNUM_RE = re.compile(r'^([0-9]{2,5}[-/][\dA-Za-z\.\-/]+)\b(.*)$')
+_ITEMNUM_LOOSE_RE = re.compile(r'([0-9]{2,5}[-/][\dA-Za-z\.\-/]+)')
+_CUSTOMS_TARIFF_COUNTRY_RE = re.compile(r'Customs tariff|Country of origin|special item|carry-over', re.IGNORECASE)
+_DRAWING_NO_RE = re.compile(r'Drawing\s+No\.', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_LAYOUT = TableLayout(
+    header=_POS_ARTICLE_DESCRIPTION_RE,
+    header_words=('POS', 'ARTICLE', 'description'),
+    # e.g. "1 SM ... 5 59,15 295,75"
+    item_start=_SM_ITEM_LINE_RE,
+    rules=(
+        LineRule(Action.STOP, _TOTAL_NET_EUR_RE),
+        # Order, LST and ref context applies to the items below it
+        LineRule(Action.SET, _YOUR_ORDER_NO_RE, ('order_number', 'order_date')),
+        LineRule(Action.SET, _LST_RE, ('lst_number',)),
+        LineRule(Action.SET, _YOUR_REF_NO_RE, ('ref_no',)),
+        LineRule(Action.CLOSE, _CARRY_OVER_RE),
+    ),
+    skip_blank=True,
+)
+
+# The last line of the items table on a page, searched without spaces: pages
+# are read down to it, so the bank and legal footer below is never laid out.
+# A carry-over only closes the table after an item ("1SM..."), as the amount
+# brought forward is printed above the items under the same label.
+_TEXT_END_RE = re.compile(r'totalnet|total/EUR|\dSM.*carry-over', re.IGNORECASE)
+
+
+def iter_siema_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Siema (Siegfried Martin) invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.text_through(_TEXT_END_RE)
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            invoice_info = _extract_siema_invoice_info(lines)
+
+            context = {'order_number': '', 'order_date': '', 'lst_number': '', 'ref_no': ''}
+            for block, block_context in iter_item_blocks(lines, _LAYOUT, context):
+                item_data = _parse_siema_item_block(block, {**invoice_info, **block_context}, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_siema_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_siema_invoice_rows()."""
+    return list(iter_siema_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_siema_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice-level metadata from Siema invoice (invoice number, date, cust-no)."""
+    invoice_data = {
+        "invoice_number": "",
+        "invoice_date": "",
+        "customer_number": ""
+    }
+
+    for line in lines:
+        lc = line.strip()
+
+        inv_match = _INVOICE_NO_RE.search(lc)
+        if inv_match and not invoice_data["invoice_number"]:
+            invoice_data["invoice_number"] = inv_match.group(1).strip()
+
+        date_match = _DATE_RE.search(lc)
+        if date_match and not invoice_data["invoice_date"]:
+            invoice_data["invoice_date"] = date_match.group(1).strip()
+
+        cust_match = _CUST_NO_RE.search(lc)
+        if cust_match and not invoice_data["customer_number"]:
+            invoice_data["customer_number"] = cust_match.group(1).strip()
+
+    return invoice_data
+
+@timed("parse")
+def _parse_siema_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """
+    Parse a multi-line Siema item block and return a dict.
+
+    Expected block example:
+      [
+        '1 SM Diethrich-Hegemann Scissors 13.5 cm, 5 59,15 295,75',
+        '0402-13.5/600 laterally angled, 60 degrees,',
+        'sharp, round',
+        'satin finish crosswise/satin finish crosswise',
+        'Lot number 91312',
+        'Drawing No./versionZG X402-13.5 / E'
+      ]
+    """
+    if not block:
+        return None
+
+    out = {
+        "invoice_number": invoice_data.get("invoice_number", ""),
+        "invoice_date": invoice_data.get("invoice_date", ""),
+        "customer_number": invoice_data.get("customer_number", ""),
+        "order_number": invoice_data.get("order_number", ""),
+        "order_date": invoice_data.get("order_date", ""),
+        "lst_number": invoice_data.get("lst_number", ""),
+        "ref_no": invoice_data.get("ref_no", ""),
+        "item_number": "",
+        "description": "",
+        "quantity": "",
+        "unit_price": "",
+        "lot_number": "",
+        "page": page_num + 1
+    }
+
+    first_line = block[0].strip()
+
+    # Extract trailing qty and unit price from first line (we ignore line-total).
+    # The price keeps its German format ("1.086,12"); schema.canonical_frame() converts it.
+    tail_match = _TAIL_RE.search(first_line)
+    if tail_match:
+        out['quantity'] = tail_match.group(1)
+        out['unit_price'] = tail_match.group(2)
+        left = first_line[:tail_match.start()].strip()
+    else:
+        # fallback if qty/price not found
+        left = _SM_PREFIX_RE.sub('', first_line).strip()
+
+    # remove leading position + "SM" token if present
+    left = _SM_PREFIX_RE.sub('', left).strip()
+    description_parts: List[str] = [left] if left else []
+
+    # Try inline item number (Case 2), e.g. "5 SM 0754/600 ..."
+    inline_match = _INLINE_RE.search(first_line)
+    if inline_match:
+        code = inline_match.group(1).strip()
+        out['item_number'] = f"SM {code}"
+        # remove code from description if it remained
+        description_parts = [re.sub(re.escape(code), '', p, flags=re.IGNORECASE).strip() for p in description_parts]
+
+    # scan continuation lines to find item-number on next line (Case 1), ref_no, lst, lot, drawing, etc.
+    for i, ln in enumerate(block[1:], start=1):
+        ln_strip = ln.strip()
+
+        # LST inside block (rare) - override invoice-level if present
+        lst_m = _LST_RE.search(ln_strip)
+        if lst_m:
+            out['lst_number'] = lst_m.group(1).strip()
+            continue
+
+        # reference number inside block (rare) - override
+        ref_m = _YOUR_REF_NO_RE.search(ln_strip)
+        if ref_m:
+            out['ref_no'] = ref_m.group(1).strip()
+            continue
+
+        # lot number
+        lot_m = _LOT_NUMBER_RE.search(ln_strip)
+        if lot_m:
+            out['lot_number'] = lot_m.group(1).strip()
+            continue
+
+        # Case 1: second line starts with item code like "0402-13.5/600 ..."
+        itemnum_m = _ITEMNUM_RE.match(ln_strip)
+        if itemnum_m and not out['item_number']:
+            code = itemnum_m.group(1).strip()
+            rest = itemnum_m.group(2).strip()
+            out['item_number'] = f"SM {code}"
+            if rest:
+                description_parts.append(rest)
+            continue
+
+        # If a line starts with something like "0402-13.5/600" that got split differently, handle it
+        itemnum_loose = _ITEMNUM_LOOSE_RE.search(ln_strip)
+        if itemnum_loose and not out['item_number']:
+            # be conservative: accept only if it's near start
+            if ln_strip.startswith(itemnum_loose.group(1)):
+                out['item_number'] = f"SM {itemnum_loose.group(1).strip()}"
+                rest = ln_strip.replace(itemnum_loose.group(1), '').strip()
+                if rest:
+                    description_parts.append(rest)
+                continue
+
+        # skip known meta-lines that we do not want in description
+        if _CUSTOMS_TARIFF_COUNTRY_RE.search(ln_strip):
+            continue
+
+        # drawing line -> include in description
+        if _DRAWING_NO_RE.search(ln_strip):
+            description_parts.append(ln_strip)
+            continue
+
+        # otherwise treat as description continuation
+        description_parts.append(ln_strip)
+
+    # Finalize description
+    description_clean = " - ".join([p for p in description_parts if p]).strip()
+    out['description'] = _WHITESPACE_RE.sub(' ', description_clean).strip()
+
+    # Only return if we have essential data
+    if out['quantity'] and out['description']:
+        return out
+
+    return None
@@ -0,0 +1,219 @@
+"""SignTech invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_QTY_ORD_SHIP_RE = re.compile(r'qty\.\s+ord\s+qty\.\s+ship\.|qty\.\s+ord\s+qty\.', re.IGNORECASE)
+_SALES_AMT_TOTAL_RE = re.compile(r'Sales Amt\.|Total/\$|Total \$', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\d+\s+\d+\s+\S+\s+[A-Z0-9-]+\b')
+_M_DATE_NO_RE = re.compile(r'^\s*(\d{1,2}/\d{1,2}/\d{4})\s+(\d+)\s+\d+')
+_M_ORDERLINE_RE = re.compile(r'^\s*(\d+)\s+(\d{1,2}/\d{1,2}/\d{4})\s+(\d+)\s+([^\s]+)\s+([^\s]+)\s+(\d{1,2}/\d{1,2}/\d{4})\s+(.+)$')
+_ORDER_NO_RE = re.compile(r'ORDER NO\.', re.IGNORECASE)
+_ITEM_LINE_RE = re.compile(r'^\s*(\d+)\s+(\d+)\s+(\d+)\s+(\S+)\s+([A-Z0-9-]+)\s+(.+?)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s*$')
+_TAIL_RE = re.compile(r'([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s*$')
+_M2_RE = re.compile(r'^\s*(\d+)\s+(\d+)\s+(\d+)\s+(\S+)\s+([A-Z0-9-]+)\s*(.*)$')
+_LOT_NO_RE = re.compile(r'Lot\s*No\.?\s*[:\s]*([A-Za-z0-9\-]+)', re.IGNORECASE)
+_COUNTRY_OF_ORIGIN_RE = re.compile(r'Country of origin[:\s]*([A-Za-z ]+)', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_LAYOUT = TableLayout(
+    header=_QTY_ORD_SHIP_RE,
+    header_words=('qty.', 'ord'),
+    # e.g. "3 3 0 EACH G1080-76 three-way luer-lock, ... 58.00 174.00"
+    item_start=_ITEM_START_RE,
+    # Totals end the table
+    rules=(
+        LineRule(Action.STOP, _SALES_AMT_TOTAL_RE),
+    ),
+    skip_blank=True,
+)
+
+
+def iter_sigtech_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from SignTech invoice format (SignTech).
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            invoice_data = _extract_sigtech_invoice_info(lines)
+
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_sigtech_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_sigtech_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_sigtech_invoice_rows()."""
+    return list(iter_sigtech_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_sigtech_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """
+    Extract invoice-level info for SignTech invoices.
+    Returns dict with keys:
+      invoice_number, invoice_date, order_number, order_date,
+      customer_number, customer_po, purchase_order_no, ship_date, ship_via
+    """
+    invoice_data = {
+        "invoice_number": "",
+        "invoice_date": "",
+        "order_number": "",
+        "order_date": "",
+        "customer_number": "",
+        "customer_po": "",
+        "purchase_order_no": "",
+        "ship_date": "",
+        "ship_via": ""
+    }
+
+    for i, line in enumerate(lines):
+        lc = line.strip()
+
+        # Line that follows header "INVOICE DATE INVOICE NO. PAGE"
+        m_date_no = _M_DATE_NO_RE.match(lc)
+        if m_date_no:
+            invoice_data["invoice_date"] = m_date_no.group(1)
+            invoice_data["invoice_number"] = m_date_no.group(2)
+            continue
+
+        # The ORDER line containing many fields (Order No, Order Date, Customer No, Customer P.O., Purchase Order No, Ship Date, Ship Via)
+        # e.g. "32850 4/29/2024 12146 0016497 0016497 4/29/2024 UPS Ground"
+        m_orderline = _M_ORDERLINE_RE.match(lc)
+        if m_orderline:
+            invoice_data["order_number"] = m_orderline.group(1)
+            invoice_data["order_date"] = m_orderline.group(2)
+            invoice_data["customer_number"] = m_orderline.group(3)
+            invoice_data["customer_po"] = m_orderline.group(4)
+            invoice_data["purchase_order_no"] = m_orderline.group(5)
+            invoice_data["ship_date"] = m_orderline.group(6)
+            invoice_data["ship_via"] = m_orderline.group(7).strip()
+            continue
+
+        # fallback: small variations like extra whitespace or missing fields
+        # try to catch "ORDER NO." header followed by data on next line
+        if _ORDER_NO_RE.search(lc) and i + 1 < len(lines):
+            next_line = lines[i + 1].strip()
+            m = _M_ORDERLINE_RE.match(next_line)
+            if m:
+                invoice_data["order_number"] = m.group(1)
+                invoice_data["order_date"] = m.group(2)
+                invoice_data["customer_number"] = m.group(3)
+                invoice_data["customer_po"] = m.group(4)
+                invoice_data["purchase_order_no"] = m.group(5)
+                invoice_data["ship_date"] = m.group(6)
+                invoice_data["ship_via"] = m.group(7).strip()
+
+    return invoice_data
+
+@timed("parse")
+def _parse_sigtech_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """
+    Parse a SignTech item block (multi-line).
+    Returns structured dict with invoice + item details.
+    """
+    if not block:
+        return None
+
+    out: Dict[str, str] = {
+        "invoice_number": invoice_data.get("invoice_number", ""),
+        "invoice_date": invoice_data.get("invoice_date", ""),
+        "order_number": invoice_data.get("order_number", ""),
+        "order_date": invoice_data.get("order_date", ""),
+        "customer_number": invoice_data.get("customer_number", ""),
+        "customer_po": invoice_data.get("customer_po", ""),
+        "purchase_order_no": invoice_data.get("purchase_order_no", ""),
+        "ship_date": invoice_data.get("ship_date", ""),
+        "ship_via": invoice_data.get("ship_via", ""),
+        "qty_ordered": "",
+        "qty_shipped": "",
+        "qty_backorder": "",
+        "unit": "",
+        "item_number": "",
+        "description": "",
+        "unit_price": "",
+        "ext_price": "",
+        "lot_number": "",
+        "country_of_origin": "",
+        "page": page_num + 1
+    }
+
+    first_line = block[0].strip()
+    description_parts: List[str] = []
+
+    # primary pattern: qtys, unit, item_no, description, prices
+    m = _ITEM_LINE_RE.match(first_line)
+    if m:
+        out['qty_ordered'] = m.group(1)
+        out['qty_shipped'] = m.group(2)
+        out['qty_backorder'] = m.group(3)
+        out['unit'] = m.group(4)
+        out['item_number'] = m.group(5)
+        desc_fragment = m.group(6).strip()
+        out['unit_price'] = m.group(7)
+        out['ext_price'] = m.group(8)
+        description_parts.append(desc_fragment)
+    else:
+        # fallback: try extracting trailing prices
+        combined = " ".join(block)
+        tail = _TAIL_RE.search(combined)
+        if tail:
+            out['unit_price'] = tail.group(1)
+            out['ext_price'] = tail.group(2)
+            head = combined[:tail.start()].strip()
+            head_first_line = head.splitlines()[0]
+            m2 = _M2_RE.match(head_first_line)
+            if m2:
+                out['qty_ordered'] = m2.group(1)
+                out['qty_shipped'] = m2.group(2)
+                out['qty_backorder'] = m2.group(3)
+                out['unit'] = m2.group(4)
+                out['item_number'] = m2.group(5)
+                description_parts.append(m2.group(6).strip())
+                description_parts += head.splitlines()[1:]
+            else:
+                description_parts.append(head)
+        else:
+            description_parts.append(first_line)
+
+    # handle continuation lines
+    for ln in block[1:]:
+        ln_s = ln.strip()
+        lot_m = _LOT_NO_RE.search(ln_s)
+        if lot_m:
+            out['lot_number'] = lot_m.group(1).strip()
+            continue
+        co_m = _COUNTRY_OF_ORIGIN_RE.search(ln_s)
+        if co_m:
+            out['country_of_origin'] = co_m.group(1).strip()
+            continue
+        description_parts.append(ln_s)
+
+    # finalize description
+    desc_clean = " - ".join([d for d in description_parts if d])
+    desc_clean = _WHITESPACE_RE.sub(' ', desc_clean).strip()
+    out['description'] = desc_clean
+
+    # Defensive: check that at least item number + some qty exist
+    if out['item_number'] and not (out['qty_ordered'] or out['qty_shipped'] or out['qty_backorder']):
+        # still allow but loggable point – qtys missing
+        pass
+
+    # Must have at least item_number + description
+    if out['item_number'] and out['description']:
+        return out
+
+    return None
@@ -0,0 +1,155 @@
+"""SIS invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_ITEM_QTY_PRICE_RE = re.compile(r'^Item\s+Qty\.\s+Price\s+Ext\.?', re.IGNORECASE)
+_SUBTOTAL_TOTAL_DUE_RE = re.compile(r'Subtotal|Total Due', re.IGNORECASE)
+_ITEM_LINE_START_RE = re.compile(r'^.+\s+\d+\s+\$\d+[\d,]*\.\d{2}\s+\$\d+[\d,]*\.\d{2}$')
+_DATE_SHIPPED_RE = re.compile(r'Date Shipped\s+\.{5,}\s*([\d/]+)')
+_M_INV_RE = re.compile(r'Invoice #\s+\.{5,}\s*(\S+)')
+_M_PO_RE = re.compile(r'P\.O\.\s+\.{5,}\s*(\S+)')
+_ORDER_DATE_RE = re.compile(r'Order Date\s+\.{5,}\s*([\d/]+)')
+_HEADER_START_RE = re.compile(r'^[_]{5,}')
+_ITEM_LINE_RE = re.compile(r'^(.+?)\s+(\d+)\s+\$([\d,]+\.\d{2})\s+\$([\d,]+\.\d{2})$')
+
+_LAYOUT = TableLayout(
+    header=_ITEM_QTY_PRICE_RE,
+    header_words=('Item', 'Qty.', 'Price'),
+    # A description ending with quantity, price and extension
+    item_start=_ITEM_LINE_START_RE,
+    # Totals end the table
+    rules=(
+        LineRule(Action.STOP, _SUBTOTAL_TOTAL_DUE_RE),
+    ),
+    skip_blank=True,
+)
+
+
+def iter_sis_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from SIS invoice format.
+    Yields one dict per item line.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            invoice_data = _extract_sis_invoice_info(lines)
+
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_sis_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_sis_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_sis_invoice_rows()."""
+    return list(iter_sis_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_sis_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """
+    Extract invoice-level info for SIS invoices.
+    """
+    invoice_data = {
+        "invoice_number": "",
+        "invoice_date": "",
+        "po_number": "",
+        "order_date": "",
+        "ship_date": "",
+        "bill_to": "",
+        "ship_to": ""
+    }
+
+    for i, line in enumerate(lines):
+        lc = line.strip()
+
+        m_ship = _DATE_SHIPPED_RE.search(lc)
+        if m_ship:
+            invoice_data["ship_date"] = m_ship.group(1)
+            continue
+
+        m_inv = _M_INV_RE.search(lc)
+        if m_inv:
+            invoice_data["invoice_number"] = m_inv.group(1)
+            continue
+
+        m_po = _M_PO_RE.search(lc)
+        if m_po:
+            invoice_data["po_number"] = m_po.group(1)
+            continue
+
+        m_order = _ORDER_DATE_RE.search(lc)
+        if m_order:
+            invoice_data["order_date"] = m_order.group(1)
+            continue
+
+        # Bill To / Ship To block
+        if lc.startswith("Bill To:"):
+            bill_lines, ship_lines = [], []
+            # join next few lines until dashed separator
+            j = i + 1
+            while j < len(lines) and not _HEADER_START_RE.match(lines[j]):
+                if "Ship To:" in lines[j]:
+                    j += 1
+                    continue
+                if "NOVO" in lines[j] or "USA" in lines[j] or "DRIVE" in lines[j]:
+                    # heuristic: alternate bill vs ship based on indent
+                    if "Ship" in lines[i]:
+                        ship_lines.append(lines[j].strip())
+                    else:
+                        bill_lines.append(lines[j].strip())
+                j += 1
+            invoice_data["bill_to"] = " ".join(bill_lines).strip()
+            invoice_data["ship_to"] = " ".join(ship_lines).strip()
+
+    return invoice_data
+
+@timed("parse")
+def _parse_sis_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """
+    Parse SIS item block into structured dict.
+    """
+    if not block:
+        return None
+
+    out: Dict[str, str] = {
+        "invoice_number": invoice_data.get("invoice_number", ""),
+        "invoice_date": invoice_data.get("invoice_date", ""),
+        "po_number": invoice_data.get("po_number", ""),
+        "order_date": invoice_data.get("order_date", ""),
+        "ship_date": invoice_data.get("ship_date", ""),
+        "bill_to": invoice_data.get("bill_to", ""),
+        "ship_to": invoice_data.get("ship_to", ""),
+        "description": "",
+        "quantity": "",
+        "unit_price": "",
+        "ext_price": "",
+        "page": page_num + 1
+    }
+
+    first_line = block[0].strip()
+    # e.g. "Retractor Blade 1 $85.00 $85.00"
+    m = _ITEM_LINE_RE.match(first_line)
+    if m:
+        out["description"] = m.group(1).strip()
+        out["quantity"] = m.group(2)
+        out["unit_price"] = m.group(3)
+        out["ext_price"] = m.group(4)
+
+    # append continuation lines to description
+    for ln in block[1:]:
+        out["description"] += " - " + ln.strip()
+
+    return out if out["description"] else None
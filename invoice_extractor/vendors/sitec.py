@@ -0,0 +1,134 @@
+"""Sitec invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_PRODUCT_DESCRIPTION_RE = re.compile(r'^S\.\#\s+Product Description', re.IGNORECASE)
+_TOTAL_PIECES_RE = re.compile(r'^TOTAL PIECES', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+[A-Z0-9-]+')
+_INVOICE_NO_RE = re.compile(r'INVOICE NO\.\s*(\S+)', re.IGNORECASE)
+_M_DATE_RE = re.compile(r'DATE[:\s]+(\d{1,2}/\d{1,2}/\d{2,4})', re.IGNORECASE)
+_COUNTRY_OF_ORIGIN_RE = re.compile(r'Country of Origin[:\s]*(\S+)', re.IGNORECASE)
+_ITEM_LINE_RE = re.compile(r'^\d+\s+([A-Z0-9-]+)\s+(.+?)\s+(\d+)\s+(\d+)\s+([\d,]+\.\d{2})')
+
+_LAYOUT = TableLayout(
+    header=_PRODUCT_DESCRIPTION_RE,
+    header_words=('Product', 'Description'),
+    # A serial number and item number
+    item_start=_ITEM_START_RE,
+    # Totals end the table
+    rules=(
+        LineRule(Action.STOP, _TOTAL_PIECES_RE),
+    ),
+    skip_blank=True,
+)
+
+
+def iter_sitec_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Sitec invoice format.
+    Yields one dict per item line.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            invoice_data = _extract_sitec_invoice_info(lines)
+
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_sitec_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_sitec_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_sitec_invoice_rows()."""
+    return list(iter_sitec_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_sitec_invoice_info(lines: List[str]) -> Dict[str, str]:
+    invoice_data = {
+        "invoice_number": "",
+        "invoice_date": "",
+        "country_of_origin": "PAKISTAN"  # default as per samples
+    }
+
+    for line in lines:
+        lc = line.strip()
+        m_inv = _INVOICE_NO_RE.search(lc)
+        if m_inv:
+            invoice_data["invoice_number"] = m_inv.group(1).strip()
+            continue
+        m_date = _M_DATE_RE.search(lc)
+        if m_date:
+            invoice_data["invoice_date"] = m_date.group(1).strip()
+            continue
+        m_country = _COUNTRY_OF_ORIGIN_RE.search(lc)
+        if m_country:
+            invoice_data["country_of_origin"] = m_country.group(1).strip()
+            continue
+
+    return invoice_data
+
+@timed("parse")
+def _parse_sitec_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """
+    Parse Sitec item block (multi-line) into structured dict.
+    Removed columns: ext_price, serial_number, country_of_origin
+    """
+    if not block:
+        return None
+
+    out: Dict[str, str] = {
+        "invoice_number": invoice_data.get("invoice_number", ""),
+        "invoice_date": invoice_data.get("invoice_date", ""),
+        "item_number": "",
+        "description": "",
+        "order_number": "",
+        "quantity": "",
+        "unit_price": "",
+        "lst_number": "",
+        "page": page_num + 1
+    }
+
+    # first line contains item_number, description, order#, qty, unit_price
+    first_line = block[0].strip()
+
+    # pattern: item_number description order# qty unit_price ext_price
+    m = _ITEM_LINE_RE.match(first_line)
+    if m:
+        out["item_number"] = m.group(1)
+        out["description"] = m.group(2).strip()
+        out["order_number"] = m.group(3)
+        out["quantity"] = m.group(4)
+        out["unit_price"] = m.group(5)
+    else:
+        # fallback parsing
+        tokens = first_line.split()
+        if len(tokens) >= 6:
+            out["item_number"] = tokens[1]
+            out["order_number"] = tokens[-3]
+            out["quantity"] = tokens[-2]
+            out["unit_price"] = tokens[-1]
+            desc_tokens = tokens[2:-3]
+            out["description"] = " ".join(desc_tokens)
+
+    # continuation lines: description or LST
+    for ln in block[1:]:
+        ln_s = ln.strip()
+        if ln_s.upper().startswith("LST"):
+            out["lst_number"] = ln_s
+        else:
+            out["description"] += " - " + ln_s
+
+    return out if out["item_number"] else None
@@ -0,0 +1,187 @@
+"""SMT invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ARTICLE_DESCRIPTION_RE = re.compile(r'POS\s+ARTICLE\s+Description')
+_TOTAL_PIECES_EUR_RE = re.compile(r'TOTAL PIECES|Total/EUR|Value of goods', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+[A-Z0-9\-]')
+_INVOICE_NO_RE = re.compile(r'INVOICE NO\.?\s*:\s*([A-Z0-9\-]+)', re.IGNORECASE)
+_M_INV_DATE_RE = re.compile(r'Date\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'Your order no\.?\s*([A-Z0-9\-]+)\s*-\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_LST_REG_NO_RE = re.compile(r'LST Reg\. No\.?\s*:\s*(.+)', re.IGNORECASE)
+_ITEM_LINE_RE = re.compile(r'^(\d+)\s+([A-Z0-9\-]+)\s+(.+?)\s+([\d,]+)\s+([\d,]+)\s+([\d,]+)$')
+_GERMAN_AMOUNT_RE = re.compile(r'^\d+,\d{2}$')
+_LOT_NUMBER_RE = re.compile(r'Lot number\s*([A-Za-z0-9\-/\s]+)', re.IGNORECASE)
+_INDEX_RE = re.compile(r'Index:\s*[A-Z]', re.IGNORECASE)
+_VALUE_OF_GOODS_RE = re.compile(r'Value of goods|Package|Total/EUR', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_LAYOUT = TableLayout(
+    header=_POS_ARTICLE_DESCRIPTION_RE,
+    header_words=('POS', 'ARTICLE', 'Description'),
+    # e.g. "1 13-01-20-1800-10P"
+    item_start=_ITEM_START_RE,
+    # Totals end the table
+    rules=(LineRule(Action.STOP, _TOTAL_PIECES_EUR_RE),),
+)
+
+
+def iter_smt_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+            lines = text.split("\n")
+            invoice_info = _extract_smt_invoice_info(lines)
+
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_smt_item_block(block, invoice_info, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_smt_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_smt_invoice_rows()."""
+    return list(iter_smt_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_smt_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """
+    Extract invoice-level info (invoice number, invoice date, order number/date, LST number)
+    """
+    info = {
+        "invoice_number": "",
+        "invoice_date": "",
+        "order_number": "",
+        "order_date": "",
+        "lst_number": ""
+    }
+
+    for line in lines:
+        line_clean = line.strip()
+
+        # Invoice number: "INVOICE NO. : 436413"
+        m_invoice = _INVOICE_NO_RE.search(line_clean)
+        if m_invoice and not info["invoice_number"]:
+            info["invoice_number"] = m_invoice.group(1).strip()
+            continue
+
+        # Invoice date: "Date : 17.09.2024"
+        m_inv_date = _M_INV_DATE_RE.search(line_clean)
+        if m_inv_date and not info["invoice_date"]:
+            info["invoice_date"] = m_inv_date.group(1).strip()
+            continue
+
+        # Order number and order date: "Your order no. 0017037 - 13.09.2024"
+        # FIXED: Removed the colon that doesn't exist in the actual text
+        m_order = _YOUR_ORDER_NO_RE.search(line_clean)
+        if m_order and not info["order_number"]:
+            info["order_number"] = m_order.group(1).strip()
+            info["order_date"] = m_order.group(2).strip()
+            continue
+
+        # LST number: "LST Reg. No.: D104403 / 87 LXH"
+        if "LST Reg. No." in line_clean:
+            lst_m = _LST_REG_NO_RE.search(line_clean)
+            if lst_m and not info["lst_number"]:
+                info["lst_number"] = lst_m.group(1).strip()
+                continue
+
+    return info
+
+@timed("parse")
+def _parse_smt_item_block(block: List[str], invoice_info: Dict[str, str], page_num: int) -> Optional[Dict]:
+    if not block:
+        return None
+
+    out: Dict[str, str] = {
+        "invoice_number": invoice_info.get("invoice_number", ""),
+        "invoice_date": invoice_info.get("invoice_date", ""),
+        "order_number": invoice_info.get("order_number", ""),
+        "order_date": invoice_info.get("order_date", ""),
+        "lst_number": invoice_info.get("lst_number", ""),
+        "item_number": "",
+        "description": "",
+        "quantity": "",
+        "unit_price": "",
+        "total_price": "",
+        "lot_number": "",
+        "page": str(page_num + 1)
+    }
+
+    # Parse first line - examples:
+    # "1 13-01-20-1800-10P Kirschner Bow, Hooks for 10 Pack 8,35 83,50"
+    # "1 13-01-20-1800 kirschner bow, large, 4 pcs. 203,27 813,08"
+    first_line = block[0].strip()
+    
+    # More flexible pattern to handle different formats
+    # The format is: POS ITEM_NUMBER DESCRIPTION QUANTITY UNIT_PRICE TOTAL_PRICE
+    m = _ITEM_LINE_RE.match(first_line)
+    if m:
+        out["item_number"] = m.group(2).strip()
+        out["description"] = m.group(3).strip()
+        out["quantity"] = m.group(4)
+        out["unit_price"] = m.group(5)
+        out["total_price"] = m.group(6)
+    else:
+        # Alternative pattern for when total price might be missing or different spacing
+        parts = first_line.split()
+        if len(parts) >= 5:
+            out["item_number"] = parts[1]
+            
+            # Find where prices start (look for numbers with commas)
+            price_indices = []
+            for i, part in enumerate(parts):
+                if _GERMAN_AMOUNT_RE.match(part):
+                    price_indices.append(i)
+            
+            if len(price_indices) >= 2:
+                # Description is everything between item number and first price
+                desc_start = 2
+                desc_end = price_indices[0]
+                out["description"] = ' '.join(parts[desc_start:desc_end])
+                out["quantity"] = parts[price_indices[0]]
+                out["unit_price"] = parts[price_indices[1]]
+                if len(price_indices) >= 3:
+                    out["total_price"] = parts[price_indices[2]]
+
+    # Process continuation lines for lot number and additional description
+    description_parts = [out["description"]] if out["description"] else []
+    
+    for ln in block[1:]:
+        ln_s = ln.strip()
+
+        # Lot number: "Lot number 00981164"
+        lot_m = _LOT_NUMBER_RE.search(ln_s)
+        if lot_m and not out["lot_number"]:
+            out["lot_number"] = lot_m.group(1).strip()
+            continue
+
+        # Skip lines that are just "Index: A" or other metadata
+        if _INDEX_RE.match(ln_s):
+            continue
+            
+        # Skip empty lines and price-related lines
+        if ln_s and not _VALUE_OF_GOODS_RE.search(ln_s):
+            description_parts.append(ln_s)
+
+    # Combine description parts
+    if description_parts:
+        desc_clean = " - ".join([d for d in description_parts if d])
+        desc_clean = _WHITESPACE_RE.sub(' ', desc_clean).strip()
+        out["description"] = desc_clean
+
+    # Only return if we have essential data
+    if out["item_number"] and out["description"] and out["quantity"]:
+        return out
+
+    return None
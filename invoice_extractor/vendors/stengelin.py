@@ -0,0 +1,180 @@
+"""Stengelin invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ITEM_NO_RE = re.compile(r'POS\s+ITEM NO\.\s+Article\s+piece\s+U-Price\s+EUR')
+_ITEM_AMOUNT_PACKAGE_RE = re.compile(r'item amount|package|total amount/EUR|Country of origin', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.\s*([^\s/]+)(?:/(\d{2}\.\d{2}\.\d{4}))?\s*-\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\d{2}\.\d{3}-\d{2}')
+_INV_RE = re.compile(r'I N V O I C E\s*NO\.?\s*:\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUST_NO_RE = re.compile(r'Cust\.?-No\.?\s*:\s*(\d+)', re.IGNORECASE)
+_DEV_NO_RE = re.compile(r'DEV-?No\.?\s*(\d+)', re.IGNORECASE)
+_ITEM_RE = re.compile(r'^\d+\s+(\d{2}\.\d{3}-\d{2})\s+([^\s]+)\s+(.+?)\s+(\d+)\s+([\d,]+)\s+([\d,]+)$')
+_ALT_RE = re.compile(r'^\d+\s+(\d{2}\.\d{3}-\d{2})\s+(.+?)\s+(\d+)\s+([\d,]+)\s+([\d,]+)$')
+_LOT_NUMBER_RE = re.compile(r'lot number\s*([A-Za-z0-9\-]+)', re.IGNORECASE)
+_LST_NO_RE = re.compile(r'LST-?NO::?\s*(.+)', re.IGNORECASE)
+_LOT_NUMBER_LST_RE = re.compile(r'lot number|LST-?NO|Datecode|Package No', re.IGNORECASE)
+
+_LAYOUT = TableLayout(
+    header=_POS_ITEM_NO_RE,
+    header_words=('POS', 'Article', 'U-Price'),
+    # e.g. "10 03.510-38"
+    item_start=_ITEM_START_RE,
+    rules=(
+        # Summary sections end the table
+        LineRule(Action.STOP, _ITEM_AMOUNT_PACKAGE_RE),
+        # Each order starts a new block
+        LineRule(Action.CLOSE_SET, _YOUR_ORDER_NO_RE, ('order_no',)),
+    ),
+    skip_blank=True,
+)
+
+
+def iter_stengelin_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Stengelin invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_stengelin_invoice_info(lines)
+            
+            for block, order_info in iter_item_blocks(lines, _LAYOUT, {'order_no': ''}):
+                item_data = _parse_stengelin_item_block(block, invoice_data, order_info['order_no'], page_num)
+                if item_data:
+                    yield item_data
+
+def extract_stengelin_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_stengelin_invoice_rows()."""
+    return list(iter_stengelin_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_stengelin_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Stengelin invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'dev_no': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number: "USA - WESTMONT, IL 60559 I N V O I C E NO. : 4500357"
+        # The invoice number can appear in the middle of the address line
+        inv_match = _INV_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date: "Date : 25.02.2025"
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number: "Cust.-No. : 12413"
+        cust_match = _CUST_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract DEV number: "DEV-No. 9611278"
+        dev_match = _DEV_NO_RE.search(line_clean)
+        if dev_match and not invoice_data['dev_no']:
+            invoice_data['dev_no'] = dev_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_stengelin_item_block(block: List[str], invoice_data: Dict, order_no: str, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Stengelin invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'dev_no': invoice_data.get('dev_no', ''),
+        'order_no': order_no,
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'total_price': '',
+        'lot_number': '',
+        'lst_number': '',
+        'page': page_num + 1
+    }
+    
+    # Parse first line: "10 03.510-38 N8821-17 Shoulder Retractor, 38 mm 3 40,57 121,71"
+    first_line = block[0].strip()
+    
+    # Parse the item line
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1)  # e.g., "03.510-38"
+        item_data['description'] = item_match.group(3).strip()
+        item_data['quantity'] = item_match.group(4)
+        item_data['unit_price'] = item_match.group(5)
+        item_data['total_price'] = item_match.group(6)
+    
+    # Alternative pattern for different formatting
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = alt_match.group(1)
+            item_data['description'] = alt_match.group(2).strip()
+            item_data['quantity'] = alt_match.group(3)
+            item_data['unit_price'] = alt_match.group(4)
+            item_data['total_price'] = alt_match.group(5)
+    
+    # Extract lot number and LST number from the block
+    for line in block:
+        # Lot number: "lot number 04404842"
+        lot_match = _LOT_NUMBER_RE.search(line)
+        if lot_match and not item_data['lot_number']:
+            item_data['lot_number'] = lot_match.group(1).strip()
+        
+        # LST number: "LST-NO:: A 337061 - GAD"
+        lst_match = _LST_NO_RE.search(line)
+        if lst_match and not item_data['lst_number']:
+            item_data['lst_number'] = lst_match.group(1).strip()
+    
+    # For multi-line descriptions, combine additional lines
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for i in range(1, len(block)):
+            line = block[i].strip()
+            # Skip lines that contain lot numbers, LST numbers, or other metadata
+            if (line and 
+                not _LOT_NUMBER_LST_RE.search(line) and
+                not _ITEM_START_RE.match(line)):
+                additional_desc.append(line)
+        
+        if additional_desc:
+            item_data['description'] += ' - ' + ' '.join(additional_desc)
+    
+    # Only return if we have essential data and non-zero quantity
+    if (item_data['item_code'] and item_data['description'] and 
+        item_data['quantity'] and item_data['quantity'] != '0'):
+        return item_data
+    
+    return None
@@ -0,0 +1,203 @@
+"""Steris invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_ORDERED_BACK_SHIPPED_RE = re.compile(r'ORDERED BACK ORD\. SHIPPED')
+_SHIPPING_HANDLING_CHARGES_RE = re.compile(r'SHIPPING & HANDLING CHARGES|SUBTOTAL|TAX TOTAL|Visit shop.steris.com', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\d+\.\d+\s+\d+')
+_INV_RE = re.compile(r'Phone 440-354-2600\s*(\d{8})')
+_DATE_RE = re.compile(r'(\d{2}-[A-Z]{3}-\d{2})')
+_CUST_RE = re.compile(r'(\d+)\s+\d+')
+_DIGITS_ONLY_RE = re.compile(r'^\d+$')
+_SHIP_DATE_RE = re.compile(r'SHIP DATE\s*(\d{2}-[A-Z]{3}-\d{2})', re.IGNORECASE)
+_TRACKING_RE = re.compile(r'(1Z[A-Z0-9]{16})')
+_ITEM_RE = re.compile(r'^\d+\s+\d+\.\d+\s+(\d+)\s+(.+?)\s+(\d+)\s+(\d+)\s+[\d.]+\s+([\d.]+)\s+([\d.]+)$')
+_FIVE_DIGIT_RE = re.compile(r'^\d{5}$')
+_NUMBER_RE = re.compile(r'^\d+\.?\d*$')
+_SHIPPING_SUBTOTAL_TAX_RE = re.compile(r'SHIPPING|SUBTOTAL|TAX', re.IGNORECASE)
+
+_LAYOUT = TableLayout(
+    header=_ORDERED_BACK_SHIPPED_RE,
+    header_words=('ORDERED', 'BACK', 'SHIPPED'),
+    # e.g. "1 1.1 30808"
+    item_start=_ITEM_START_RE,
+    # Totals end the table
+    rules=(
+        LineRule(Action.STOP, _SHIPPING_HANDLING_CHARGES_RE),
+    ),
+    skip_blank=True,
+)
+
+
+def iter_steris_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from STERIS invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_steris_invoice_info(lines)
+            
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_steris_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_steris_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_steris_invoice_rows()."""
+    return list(iter_steris_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_steris_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from STERIS invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'order_no': '',
+        'sales_order_no': '',
+        'ship_date': '',
+        'tracking_number': ''
+    }
+    
+    for i, line in enumerate(lines):
+        line_clean = line.strip()
+        
+        # Extract invoice number: "Phone 440-354-2600 12858942"
+        if 'Phone 440-354-2600' in line_clean and not invoice_data['invoice_number']:
+            # Extract the 8-digit number after the phone number
+            inv_match = _INV_RE.search(line_clean)
+            if inv_match:
+                invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date: "20-SEP-24" from the DATE PAGE line
+        if 'DATE PAGE' in line_clean and i + 1 < len(lines):
+            next_line = lines[i + 1].strip()
+            date_match = _DATE_RE.search(next_line)
+            if date_match and not invoice_data['invoice_date']:
+                invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number: "399024" from the CUSTOMER NUMBER line
+        if 'CUSTOMER NUMBER' in line_clean and i + 1 < len(lines):
+            next_line = lines[i + 1].strip()
+            cust_match = _CUST_RE.search(next_line)  # "399024 52247"
+            if cust_match and not invoice_data['customer_number']:
+                invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract purchase order number: "0017068" from PURCHASE ORDER NUMBER
+        if 'PURCHASE ORDER NUMBER' in line_clean and i + 1 < len(lines):
+            next_line = lines[i + 1].strip()
+            if _DIGITS_ONLY_RE.match(next_line):
+                invoice_data['order_no'] = next_line
+        
+        # Extract sales order number: "18009881" from SALES ORDER NUMBER
+        if 'SALES ORDER NUMBER' in line_clean and i + 1 < len(lines):
+            next_line = lines[i + 1].strip()
+            if _DIGITS_ONLY_RE.match(next_line):
+                invoice_data['sales_order_no'] = next_line
+        
+        # Extract ship date: "SHIP DATE 20-SEP-24"
+        if 'SHIP DATE' in line_clean:
+            ship_match = _SHIP_DATE_RE.search(line_clean)
+            if ship_match:
+                invoice_data['ship_date'] = ship_match.group(1)
+        
+        # Extract tracking number: "1Z67X3680394280668"
+        tracking_match = _TRACKING_RE.search(line_clean)
+        if tracking_match and not invoice_data['tracking_number']:
+            invoice_data['tracking_number'] = tracking_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_steris_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from STERIS invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': invoice_data.get('order_no', ''),
+        'sales_order_no': invoice_data.get('sales_order_no', ''),
+        'ship_date': invoice_data.get('ship_date', ''),
+        'tracking_number': invoice_data.get('tracking_number', ''),
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'total_price': '',
+        'page': page_num + 1
+    }
+    
+    # First line: "1 1.1 30808 FLAT CAP VENT BROWN TINT DIA 0.625 X 25 25 0.00 14.84 371.00"
+    first_line = block[0]
+    
+    # Parse using specific pattern for STERIS format
+    # Format: ITEM ORDER ITEM_CODE DESCRIPTION QTY_ORDERED QTY_SHIPPED QTY_BACKORDER UNIT_PRICE TOTAL
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1)  # "30808"
+        item_data['description'] = item_match.group(2).strip()  # "FLAT CAP VENT BROWN TINT DIA 0.625 X"
+        item_data['quantity'] = item_match.group(4)  # Second "25" is quantity shipped
+        item_data['unit_price'] = item_match.group(5)  # "14.84"
+        item_data['total_price'] = item_match.group(6)  # "371.00"
+    
+    # If regex fails, try manual parsing
+    if not item_data['item_code']:
+        parts = first_line.split()
+        if len(parts) >= 10:
+            # Find the 5-digit item code
+            for i, part in enumerate(parts):
+                if _FIVE_DIGIT_RE.match(part) and i >= 2:
+                    item_data['item_code'] = part
+                    
+                    # Find where the numbers start (quantities and prices)
+                    num_indices = []
+                    for j in range(i+1, len(parts)):
+                        if _NUMBER_RE.match(parts[j]):
+                            num_indices.append(j)
+                    
+                    if len(num_indices) >= 5:
+                        # The pattern is: description QTY_ORDERED QTY_SHIPPED QTY_BACKORDER UNIT_PRICE TOTAL
+                        item_data['quantity'] = parts[num_indices[1]]  # Quantity shipped
+                        item_data['unit_price'] = parts[num_indices[3]]  # Unit price
+                        item_data['total_price'] = parts[num_indices[4]]  # Total price
+                    
+                    # Extract description
+                    desc_end = num_indices[0] if num_indices else len(parts)
+                    desc_parts = parts[i+1:desc_end]
+                    item_data['description'] = ' '.join(desc_parts)
+                    break
+    
+    # Add continuation lines to description (like "1IN [100/PK]")
+    if len(block) > 1 and item_data['description']:
+        for i in range(1, len(block)):
+            line = block[i].strip()
+            if line and not _SHIPPING_SUBTOTAL_TAX_RE.search(line):
+                item_data['description'] += ' - ' + line
+    
+    # Only return if we have essential data
+    if (item_data['item_code'] and item_data['description'] and 
+        item_data['quantity'] and item_data['quantity'] != '0'):
+        return item_data
+    
+    return None
@@ -0,0 +1,169 @@
+"""Stork invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ARTICLE_NO_RE = re.compile(r'Pos\.\s+Article\s+No\.\s+description\s+qty\.\s+each\s+price')
+_TOTAL_NET_SHIPPING_RE = re.compile(r'total net|Shipping charges|total/EUR|payment', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.\s*([^\s-]+)\s*-\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_LST_NO_RE = re.compile(r'LST\.\s*No\.:\s*(.+)', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\d{2}\.\d{3}-\d{2}')
+_INVOICE_NO_RE = re.compile(r'INVOICE\s*NO\.?\s*:\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUST_NO_RE = re.compile(r'Cust\.?-No\.?\s*:\s*(\d+)', re.IGNORECASE)
+_ITEM_RE = re.compile(r'^\d+\s+(\d{2}\.\d{3}-\d{2})\s+(.+?)\s+(\d+)\s+([\d,]+)\s+([\d,]+)$')
+_ALT_RE = re.compile(r'^\d+\s+(\d{2}\.\d{3}-\d{2})\s+(.+?)\s+(\d+)\s+([\d,]+)')
+_NR_SCHMELZE_RE = re.compile(r'S\.Nr\.\s*([^/\s]+)(?:\s*/\s*Schmelze:\s*([^/\s]+))?', re.IGNORECASE)
+_TOTAL_NET_OR_SHIPPING_RE = re.compile(r'total net|Shipping charges', re.IGNORECASE)
+
+_LAYOUT = TableLayout(
+    header=_POS_ARTICLE_NO_RE,
+    header_words=('Pos.', 'Article', 'description'),
+    # e.g. "1 54.468-01"
+    item_start=_ITEM_START_RE,
+    rules=(
+        # Summary sections end the table
+        LineRule(Action.STOP, _TOTAL_NET_SHIPPING_RE),
+        # Each order starts a new block
+        LineRule(Action.CLOSE_SET, _YOUR_ORDER_NO_RE, ('order_no',)),
+        LineRule(Action.SET, _LST_NO_RE, ('lst_no',)),
+    ),
+    skip_blank=True,
+)
+
+
+def iter_stork_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Stork invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_stork_invoice_info(lines)
+            
+            context = {'order_no': '', 'lst_no': ''}
+            for block, item_context in iter_item_blocks(lines, _LAYOUT, context):
+                item_data = _parse_stork_item_block(block, invoice_data, item_context['order_no'],
+                                                    item_context['lst_no'], page_num)
+                if item_data:
+                    yield item_data
+
+def extract_stork_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_stork_invoice_rows()."""
+    return list(iter_stork_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_stork_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Stork invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number: "INVOICE NO. : 2230535"
+        inv_match = _INVOICE_NO_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date: "Date : 25.09.2023"
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number: "Cust.-No. : 12410"
+        cust_match = _CUST_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_stork_item_block(block: List[str], invoice_data: Dict, order_no: str, lst_no: str, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Stork invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'order_no': order_no,
+        'lst_no': lst_no,
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'serial_number': '',
+        'page': page_num + 1
+    }
+    
+    # Parse first line: "1 54.468-01 Day Ear Hook Blunt 16.0cm 10 13,30 133,00"
+    first_line = block[0].strip()
+    
+    # Parse the item line
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1)  # e.g., "54.468-01"
+        item_data['description'] = item_match.group(2).strip()  # e.g., "Day Ear Hook Blunt 16.0cm"
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(4)
+        # Removed total_price extraction
+    
+    # Alternative pattern for different formatting
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = alt_match.group(1)
+            item_data['description'] = alt_match.group(2).strip()
+            item_data['quantity'] = alt_match.group(3)
+            item_data['unit_price'] = alt_match.group(4)
+    
+    # Extract serial number from the block: "S.Nr. 02182119 / Schmelze: 4021-5,0-011"
+    for line in block:
+        serial_match = _NR_SCHMELZE_RE.search(line)
+        if serial_match and not item_data['serial_number']:
+            item_data['serial_number'] = serial_match.group(1).strip()
+            if serial_match.group(2):
+                item_data['serial_number'] += ' / ' + serial_match.group(2).strip()
+    
+    # For multi-line descriptions, combine additional lines (like "E7327-62")
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for i in range(1, len(block)):
+            line = block[i].strip()
+            # Skip lines that contain serial numbers or look like new items
+            if (line and 
+                not _NR_SCHMELZE_RE.search(line) and
+                not _ITEM_START_RE.match(line) and
+                not _TOTAL_NET_OR_SHIPPING_RE.search(line)):
+                additional_desc.append(line)
+        
+        if additional_desc:
+            item_data['description'] += ' - ' + ' '.join(additional_desc)
+    
+    # Only return if we have essential data and non-zero quantity
+    if (item_data['item_code'] and item_data['description'] and 
+        item_data['quantity'] and item_data['quantity'] != '0'):
+        return item_data
+    
+    return None
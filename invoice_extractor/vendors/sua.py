@@ -0,0 +1,162 @@
+"""S.u.A. Martin invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ARTICLE_DESCRIPTION_RE = re.compile(r'POS\.\s+ARTICLE\s+description\s+qty', re.IGNORECASE)
+_TOTAL_NET_EUR_RE = re.compile(r'total\s+net|total/EUR|package|payment', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\S+\s+\S+')
+_INVOICE_NO_RE = re.compile(r'INVOICE NO.\s*:(\S+)')
+_CUST_NO_RE = re.compile(r'Cust.-No.\s*:(\S+)')
+_DATE_RE = re.compile(r'Date\s*:(\S+)')
+_DEV_NO_RE = re.compile(r'DEV-No.\s*:(\S+)')
+_DII_NO_RE = re.compile(r'DII-NO.\s*:(\S+)')
+_YOUR_ORDER_NO_RE = re.compile(r"your order no\. (\d+)\s*-\s*(\d{2}\.\d{2}\.\d{4})", re.I)
+_MATCH_ITEM_RE = re.compile(r"^\d+\s+SAM\s+[A-Z0-9/ ]+\s+(\d+)\s+([\d,.]+)\s+[\d,.]+$")
+_YOUR_ART_RE = re.compile(r"your art\.:\s*([A-Za-z0-9-]+)", re.I)
+_LOT_NUMBER_RE = re.compile(r"Lot number\s+([A-Za-z0-9/ ]+)", re.I)
+
+_LAYOUT = TableLayout(
+    header=_POS_ARTICLE_DESCRIPTION_RE,
+    header_words=('POS.', 'ARTICLE', 'description'),
+    # A position number followed by the item code
+    item_start=_ITEM_START_RE,
+    # Totals end the table
+    rules=(LineRule(Action.STOP, _TOTAL_NET_EUR_RE),),
+    skip_blank=True,
+)
+
+
+def iter_sua_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from S.u.A. Martin invoice format.
+    Yields a dictionary for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            invoice_data = _extract_sua_invoice_info(lines)
+
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_sua_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_sua_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_sua_invoice_rows()."""
+    return list(iter_sua_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_sua_invoice_info(lines: List[str]) -> Dict:
+    """Extract invoice-level metadata from S.u.A. Martin invoice."""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'dev_no': '',
+        'dii_no': ''
+    }
+
+    for line in lines:
+        if "INVOICE NO." in line:
+            m = _INVOICE_NO_RE.search(line)
+            if m:
+                invoice_data['invoice_number'] = m.group(1)
+
+        if "Cust.-No." in line:
+            m = _CUST_NO_RE.search(line)
+            if m:
+                invoice_data['customer_number'] = m.group(1)
+
+        if "Date" in line:
+            m = _DATE_RE.search(line)
+            if m:
+                invoice_data['invoice_date'] = m.group(1)
+
+        if "DEV-No." in line:
+            m = _DEV_NO_RE.search(line)
+            if m:
+                invoice_data['dev_no'] = m.group(1)
+
+        if "DII-NO." in line:
+            m = _DII_NO_RE.search(line)
+            if m:
+                invoice_data['dii_no'] = m.group(1)
+
+    return invoice_data
+
+@timed("parse")
+def _parse_sua_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """
+    Parse an item block from S.u.A. Martin invoices.
+    Each block may span multiple lines, starting with "your order no.".
+    """
+    if not block:
+        return None
+
+    order_number = ""
+    order_date = ""
+    art_number = ""
+    lot_number = ""
+    description_lines = []
+    qty = ""
+    unit_price = ""
+
+    for line in block:
+        line = line.strip()
+
+        # Extract order no. and date
+        match_order = _YOUR_ORDER_NO_RE.match(line)
+        if match_order:
+            order_number, order_date = match_order.groups()
+            continue
+
+        # Extract line with qty + unit price (ignore total)
+        match_item = _MATCH_ITEM_RE.match(line)
+        if match_item:
+            qty, unit_price = match_item.groups()
+            continue
+
+        # Extract art number
+        match_art = _YOUR_ART_RE.search(line)
+        if match_art:
+            art_number = match_art.group(1)
+            continue
+
+        # Extract lot number
+        match_lot = _LOT_NUMBER_RE.search(line)
+        if match_lot:
+            lot_number = match_lot.group(1)
+            continue
+
+        # Otherwise treat as description
+        if line and not line.lower().startswith("lot-code"):
+            description_lines.append(line)
+
+    description = " ".join(description_lines).strip()
+
+    return {
+        "invoice_number": invoice_data.get("invoice_number", ""),
+        "invoice_date": invoice_data.get("invoice_date", ""),
+        "customer_number": invoice_data.get("customer_number", ""),
+        "order_number": order_number,
+        "order_date": order_date,
+        "art_number": art_number,
+        "lot_number": lot_number,
+        "description": description,
+        "quantity": qty,
+        "unit_price": unit_price,
+        "page_number": page_num + 1
+    }
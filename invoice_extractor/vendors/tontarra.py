@@ -0,0 +1,199 @@
+"""Tontarra invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..header import HeaderScanner
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ART_NO_RE = re.compile(r'Pos\.\s+Art\.No\.\s+Description\s+Lot number\s+qty\.\s+each\s+price')
+_TOTAL_NET_PACKAGING_RE = re.compile(r'total net|packaging|total/EUR|terms of payment', re.IGNORECASE)
+_YOUR_ORDER_RE = re.compile(r'your order\s*([^\s-]+)\s*-\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_LST_RE = re.compile(r'LST:\s*(.+)', re.IGNORECASE)
+_HS_CODE_RE = re.compile(r'HS code:\s*([^\s]+)', re.IGNORECASE)
+_YOUR_ART_NO_RE = re.compile(r'your art\.no\.:\s*([^\s]+)', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+[A-Z0-9/-]')
+_ITEM_RE = re.compile(r'^\d+\s+([A-Z0-9/-]+)\s+(.+?)\s+([A-Z0-9-]+)\s+(\d+)\s+([\d.,]+)\s+([\d.,]+)$')
+_ALT_RE = re.compile(r'^\d+\s+([A-Z0-9/-]+)\s+(.+?)\s+([A-Z0-9-]+)\s+(\d+)\s+([\d.,]+)')
+_ITEM_LINE_RE = re.compile(r'^[A-Z0-9-]+$')
+_TOTAL_OR_PACKAGING_RE = re.compile(r'total net|packaging|total/EUR', re.IGNORECASE)
+
+_LAYOUT = TableLayout(
+    header=_POS_ART_NO_RE,
+    header_words=('Pos.', 'Art.No.', 'Description'),
+    # e.g. "10 249-072-05ATCC" or "20 TONO/249-072-04"
+    item_start=_ITEM_START_RE,
+    rules=(
+        # Summary sections end the table
+        LineRule(Action.STOP, _TOTAL_NET_PACKAGING_RE),
+        # Each order starts a new block
+        LineRule(Action.CLOSE_SET, _YOUR_ORDER_RE, ('order_no',)),
+        LineRule(Action.SET, _LST_RE, ('lst',)),
+        LineRule(Action.SET, _HS_CODE_RE, ('hs_code',)),
+        LineRule(Action.SET, _YOUR_ART_NO_RE, ('art_no',)),
+    ),
+    skip_blank=True,
+)
+
+_HEADER = HeaderScanner({
+    # "INVOICE No. : 24243554"
+    'invoice_number': re.compile(r'INVOICE\s*No\.?\s*:\s*(\d+)', re.IGNORECASE),
+    # "DATE : 24.09.2024"
+    'invoice_date': re.compile(r'DATE\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE),
+    # "Customer : 17096"
+    'customer_number': re.compile(r'Customer\s*:\s*(\d+)', re.IGNORECASE),
+    # "Our ref. : SUS"
+    'our_ref': re.compile(r'Our ref\.?\s*:\s*([^\s]+)', re.IGNORECASE),
+    # "DEV: 9680515"
+    'dev_no': re.compile(r'DEV:\s*(\d+)', re.IGNORECASE),
+    # "DELIVERY NOTE No. 23244261 date 23.09.2024"
+    ('delivery_note', 'delivery_date'): re.compile(
+        r'DELIVERY NOTE\s*No\.?\s*(\d+)\s*date\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE),
+})
+
+
+def iter_tontarra_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Tontarra invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_tontarra_invoice_info(lines)
+            
+            context = {'order_no': '', 'lst': '', 'hs_code': '', 'art_no': ''}
+            for block, item_context in iter_item_blocks(lines, _LAYOUT, context):
+                item_data = _parse_tontarra_item_block(block, invoice_data, item_context['order_no'], item_context['lst'],
+                                                       item_context['hs_code'], item_context['art_no'], page_num)
+                if item_data:
+                    yield item_data
+
+def extract_tontarra_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_tontarra_invoice_rows()."""
+    return list(iter_tontarra_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_tontarra_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Tontarra invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'our_ref': '',
+        'dev_no': '',
+        'delivery_note': '',
+        'delivery_date': ''
+    }
+    
+    invoice_data.update(_HEADER.scan(line.strip() for line in lines))
+    return invoice_data
+
+@timed("parse")
+def _parse_tontarra_item_block(block: List[str], invoice_data: Dict, order_no: str, lst_no: str, hs_code: str, art_no: str, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Tontarra invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'our_ref': invoice_data.get('our_ref', ''),
+        'dev_no': invoice_data.get('dev_no', ''),
+        'delivery_note': invoice_data.get('delivery_note', ''),
+        'delivery_date': invoice_data.get('delivery_date', ''),
+        'order_no': order_no,
+        'lst_no': lst_no,
+        'hs_code': hs_code,
+        'art_no': art_no,
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot_number': '',
+        'page': page_num + 1
+    }
+    
+    # Parse first line: "10 249-072-05ATCC SWING-SYSTEM ® KERRISON Punch 82402970 3 699,40 1.154,01"
+    # Or: "20 TONO/249-072-04 KERRISON SWING Rongeur; 40° up cut; T01-82102604 2 402,34 804,68"
+    first_line = block[0].strip()
+    
+    # KEEP ORIGINAL REGEX PATTERNS BUT MAKE THEM MORE FLEXIBLE
+    # Original pattern with extended character set for item codes
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1)  # e.g., "249-072-05ATCC" or "TONO/249-072-04"
+        item_data['description'] = item_match.group(2).strip()  # e.g., "SWING-SYSTEM ® KERRISON Punch"
+        item_data['lot_number'] = item_match.group(3)  # e.g., "82402970" or "T01-82102604"
+        item_data['quantity'] = item_match.group(4)
+        item_data['unit_price'] = item_match.group(5)  # "699,40" or "1.399,40"
+    
+    # Alternative pattern for different formatting - KEEP ORIGINAL BUT EXTEND CHARACTER SET
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = alt_match.group(1)
+            item_data['description'] = alt_match.group(2).strip()
+            item_data['lot_number'] = alt_match.group(3)
+            item_data['quantity'] = alt_match.group(4)
+            item_data['unit_price'] = alt_match.group(5)
+    
+    # FALLBACK: If still no match, use the original manual parsing approach
+    if not item_data['item_code']:
+        parts = first_line.split()
+        if len(parts) >= 7:
+            # The first part is the position number, second part is the item code
+            item_data['item_code'] = parts[1]
+            
+            # Find where the lot number starts (look for alphanumeric codes)
+            lot_number_index = -1
+            for i in range(2, len(parts)):
+                if _ITEM_LINE_RE.match(parts[i]) and len(parts[i]) >= 6:
+                    lot_number_index = i
+                    break
+            
+            if lot_number_index != -1:
+                # Description is everything between item code and lot number
+                desc_parts = parts[2:lot_number_index]
+                item_data['description'] = ' '.join(desc_parts)
+                item_data['lot_number'] = parts[lot_number_index]
+                
+                # Quantities and prices come after lot number
+                if len(parts) >= lot_number_index + 4:
+                    item_data['quantity'] = parts[lot_number_index + 1]
+                    item_data['unit_price'] = parts[lot_number_index + 2]
+    
+    # For multi-line descriptions, combine additional lines - KEEP ORIGINAL LOGIC
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for i in range(1, len(block)):
+            line = block[i].strip()
+            # Skip lines that look like new items or summary sections
+            if (line and 
+                not _ITEM_START_RE.match(line) and
+                not _TOTAL_OR_PACKAGING_RE.search(line)):
+                additional_desc.append(line)
+        
+        if additional_desc:
+            item_data['description'] += ' - ' + ' '.join(additional_desc)
+    
+    # Only return if we have essential data and non-zero quantity - KEEP ORIGINAL LOGIC
+    if (item_data['item_code'] and item_data['description'] and 
+        item_data['quantity'] and item_data['quantity'] != '0'):
+        return item_data
+    
+    return None
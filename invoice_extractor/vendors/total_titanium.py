@@ -0,0 +1,184 @@
+"""Total Titanium invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_PART_DESCRIPTION_RE = re.compile(r'-{20,}Part # / Description-{20,}')
+_SUB_TOTAL_SHIPPING_RE = re.compile(r'Sub-total:|Shipping/Handling Charges:|Invoice Total:', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^[A-Z]-\d{4}\s+-')
+_INV_RE = re.compile(r'Invoice\s*#?:\s*(\d+)', re.IGNORECASE)
+_INVOICE_DATE_RE = re.compile(r'Invoice Date:\s*(\d{1,2}/\d{1,2}/\d{4})', re.IGNORECASE)
+_PO_NUMBER_RE = re.compile(r'PO Number:\s*(\d+)', re.IGNORECASE)
+_ITEM_RE = re.compile(r'^([A-Z]-\d{4})\s+-\s+(.+?)\s+(\d+)\s+\$([\d.]+)/\s*EA\s+\$([\d.]+)$')
+_ALT_RE = re.compile(r'^([A-Z]-\d{4})\s+-\s+(.+?)\s+(\d+)\s+\$([\d.]+)/')
+_ITEM_LINE_RE = re.compile(r'^[A-Z]-\d{4}$')
+_DIGITS_ONLY_RE = re.compile(r'^\d+$')
+_PRICE_RE = re.compile(r'\$([\d.]+)')
+_JOB_TRAVELER_RE = re.compile(r'^Job Traveler', re.IGNORECASE)
+_SUBTOTAL_LINE_RE = re.compile(r'Sub-total:|Shipping/Handling|Invoice Total:', re.IGNORECASE)
+
+_LAYOUT = TableLayout(
+    header=_PART_DESCRIPTION_RE,
+    header_words=('Part', 'Description'),
+    # e.g. "H-0397 -"
+    item_start=_ITEM_START_RE,
+    # Totals end the table; job traveler notes are not part of an item
+    rules=(
+        LineRule(Action.STOP, _SUB_TOTAL_SHIPPING_RE),
+        LineRule(Action.SKIP, _JOB_TRAVELER_RE),
+    ),
+    skip_blank=True,
+)
+
+
+def iter_total_titanium_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Total Titanium invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_total_titanium_invoice_info(lines)
+            
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_total_titanium_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_total_titanium_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_total_titanium_invoice_rows()."""
+    return list(iter_total_titanium_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_total_titanium_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Total Titanium invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'order_no': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number: "Invoice #: 515947"
+        inv_match = _INV_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date: "Invoice Date: 11/27/2024"
+        date_match = _INVOICE_DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            # Convert US date format to European format DD.MM.YYYY
+            us_date = date_match.group(1)
+            parts = us_date.split('/')
+            if len(parts) == 3:
+                invoice_data['invoice_date'] = f"{parts[1]}.{parts[0]}.{parts[2]}"
+        
+        # Extract order number: "PO Number:0017242"
+        po_match = _PO_NUMBER_RE.search(line_clean)
+        if po_match and not invoice_data['order_no']:
+            invoice_data['order_no'] = po_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_total_titanium_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Total Titanium invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'order_no': invoice_data.get('order_no', ''),
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'page': page_num + 1
+    }
+    
+    # Parse first line: "H-0397 - Paton Spatula and Spoon DBL-Ended 6mm Teardrop- 3 $64.68/ EA $194.04"
+    first_line = block[0].strip()
+    
+    # Parse the item line
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1)  # e.g., "H-0397"
+        item_data['description'] = item_match.group(2).strip()  # e.g., "Paton Spatula and Spoon DBL-Ended 6mm Teardrop-"
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(4)
+    
+    # Alternative pattern for different formatting
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = alt_match.group(1)
+            item_data['description'] = alt_match.group(2).strip()
+            item_data['quantity'] = alt_match.group(3)
+            item_data['unit_price'] = alt_match.group(4)
+    
+    # If still no match, try a more flexible approach
+    if not item_data['item_code']:
+        parts = first_line.split()
+        if len(parts) >= 4:
+            # Look for the item code pattern "H-0397"
+            for i, part in enumerate(parts):
+                if _ITEM_LINE_RE.match(part):
+                    item_data['item_code'] = part
+                    
+                    # Find quantity and price (look for numbers and dollar signs)
+                    for j in range(i+1, len(parts)-2):
+                        if (parts[j+1].startswith('$') and 
+                            _DIGITS_ONLY_RE.match(parts[j]) and 
+                            '/ EA' in ' '.join(parts[j+1:j+3])):
+                            item_data['quantity'] = parts[j]
+                            # Extract price from "$64.68/ EA"
+                            price_match = _PRICE_RE.search(parts[j+1])
+                            if price_match:
+                                item_data['unit_price'] = price_match.group(1)
+                            
+                            # Description is everything between code and quantity
+                            desc_parts = parts[i+1:j]
+                            item_data['description'] = ' '.join(desc_parts)
+                            break
+                    break
+    
+    # For multi-line descriptions, combine additional lines
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for i in range(1, len(block)):
+            line = block[i].strip()
+            # Skip lines that look like new items or summary sections
+            if (line and 
+                not _ITEM_START_RE.match(line) and
+                not _JOB_TRAVELER_RE.match(line) and
+                not _SUBTOTAL_LINE_RE.search(line)):
+                additional_desc.append(line)
+        
+        if additional_desc:
+            item_data['description'] += ' - ' + ' '.join(additional_desc)
+    
+    # Only return if we have essential data and non-zero quantity
+    if (item_data['item_code'] and item_data['description'] and 
+        item_data['quantity'] and item_data['quantity'] != '0'):
+        return item_data
+    
+    return None
@@ -0,0 +1,198 @@
+"""Vinzenz Sattler invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_ORDER_ITEM_QTY_RE = re.compile(r'Order\s+Item\s+Qty\.\s+each\s+Total')
+_LINE_VALUE_PACKAGE_RE = re.compile(r'Line Value|Package|Gross|Mandatory Notes', re.IGNORECASE)
+_ORDER_RE = re.compile(r'(\d{7})(?:\s+corrected)?\s*/\s*\d+\s*-\s*\d{2}\.\d{2}\.\d{4}')
+_LISTING_NO_RE = re.compile(r'Listing No\.\s*([^\s]+)', re.IGNORECASE)
+_YOUR_ITEM_NO_RE = re.compile(r'Your Item No\.\s*([^\s]+)', re.IGNORECASE)
+_ITEM_NO_RE = re.compile(r'^\d+\s+Item No\.')
+_INVOICE_NO_RE = re.compile(r'Invoice No\.?\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'from\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUSTOMER_NO_RE = re.compile(r'Customer No\.?\s*(\d+)', re.IGNORECASE)
+_DEV_RE = re.compile(r'DEV\s*:\s*(\d+)', re.IGNORECASE)
+_ITEM_NO_PCS_RE = re.compile(r'^\d+\s+Item No\.\s+([A-Z]\s+\d+\s+\d+(?:\s+[A-Z]+)?)\s+(\d+)pcs\.\s+([\d,]+)\s+[\d,]+$')
+_ITEM_NO_PCS_LOOSE_RE = re.compile(r'^\d+\s+Item No\.\s+([^\s]+(?:\s+[^\s]+)*)\s+(\d+)pcs\.\s+([\d,]+)')
+_LOT_RE = re.compile(r'Lot\s+\d+\s*x\s*([^\s/]+(?:\s*[^\s/]+)*)', re.IGNORECASE)
+_DESC_RE = re.compile(r'Desc\.\s*(.+)', re.IGNORECASE)
+_LOT_ITEM_NO_RE = re.compile(r'Lot\s+\d+\s*x|Item No\.|Listing No\.|Your Item No\.', re.IGNORECASE)
+_LOT_LABEL_RE = re.compile(r'Lot\s+\d+\s*x', re.IGNORECASE)
+_LOT_LISTING_NO_RE = re.compile(r'Lot\s+\d+\s*x|Listing No\.|Your Item No\.', re.IGNORECASE)
+
+_LAYOUT = TableLayout(
+    header=_ORDER_ITEM_QTY_RE,
+    header_words=('Order', 'Item', 'Qty.'),
+    # e.g. "10 Item No. S 315 3206"
+    item_start=_ITEM_NO_RE,
+    rules=(
+        LineRule(Action.STOP, _LINE_VALUE_PACKAGE_RE),
+        # e.g. "0016929 / 10 - 22.08.2024" starts a new order section
+        LineRule(Action.CLOSE_SET, _ORDER_RE, ('order_no',)),
+        # e.g. "Listing No. B115819/79GAD" and "Your Item No. C6668-50G"
+        LineRule(Action.SET, _LISTING_NO_RE, ('listing_no',)),
+        LineRule(Action.SET, _YOUR_ITEM_NO_RE, ('your_item_no',)),
+    ),
+    skip_blank=True,
+)
+
+
+def iter_vinzenz_sattler_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Vinzenz Sattler invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_vinzenz_sattler_invoice_info(lines)
+            
+            context = {'order_no': '', 'listing_no': '', 'your_item_no': ''}
+            for block, item_info in iter_item_blocks(lines, _LAYOUT, context):
+                item_data = _parse_vinzenz_sattler_item_block(
+                    block, invoice_data, item_info['order_no'], item_info['listing_no'],
+                    item_info['your_item_no'], page_num)
+                if item_data:
+                    yield item_data
+
+def extract_vinzenz_sattler_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_vinzenz_sattler_invoice_rows()."""
+    return list(iter_vinzenz_sattler_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_vinzenz_sattler_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Vinzenz Sattler invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'dev_no': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number: "Invoice No. 2240447"
+        inv_match = _INVOICE_NO_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date: "from 18.09.2024"
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number: "Customer No. 24004"
+        cust_match = _CUSTOMER_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract DEV number: "DEV : 8010376"
+        dev_match = _DEV_RE.search(line_clean)
+        if dev_match and not invoice_data['dev_no']:
+            invoice_data['dev_no'] = dev_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_vinzenz_sattler_item_block(block: List[str], invoice_data: Dict, order_no: str, listing_no: str, your_item_no: str, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Vinzenz Sattler invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'dev_no': invoice_data.get('dev_no', ''),
+        'order_no': order_no,
+        'listing_no': listing_no,
+        'your_item_no': your_item_no,
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot_number': '',
+        'page': page_num + 1
+    }
+    
+    # Parse first line: "10 Item No. S 315 3206 10pcs. 15,26 152,60"
+    first_line = block[0].strip()
+    
+    # Parse the item line - more flexible pattern
+    item_match = _ITEM_NO_PCS_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = item_match.group(1).strip()  # e.g., "S 315 3206"
+        item_data['quantity'] = item_match.group(2)
+        item_data['unit_price'] = item_match.group(3)
+    
+    # Alternative pattern for different item code formats
+    if not item_data['item_code']:
+        alt_match = _ITEM_NO_PCS_LOOSE_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = alt_match.group(1).strip()
+            item_data['quantity'] = alt_match.group(2)
+            item_data['unit_price'] = alt_match.group(3)
+    
+    # Extract lot number from the block: "Lot 10 x F 315 3206/88"
+    for line in block:
+        lot_match = _LOT_RE.search(line)
+        if lot_match and not item_data['lot_number']:
+            item_data['lot_number'] = lot_match.group(1).strip()
+            break
+    
+    # Extract description from the entire block
+    description_parts = []
+    in_description = False
+    
+    for line in block:
+        line_clean = line.strip()
+        
+        # Look for "Desc." lines
+        if 'Desc.' in line_clean:
+            desc_match = _DESC_RE.search(line_clean)
+            if desc_match:
+                description_parts.append(desc_match.group(1).strip())
+            in_description = True
+        # Continue description if we're in a description section and line doesn't contain other metadata
+        elif in_description and line_clean and not _LOT_ITEM_NO_RE.search(line_clean):
+            description_parts.append(line_clean)
+        # Stop description if we hit lot number or other metadata
+        elif _LOT_LABEL_RE.search(line_clean):
+            in_description = False
+    
+    # If no explicit "Desc." found, try to extract from continuation lines after item line
+    if not description_parts and len(block) > 1:
+        for i in range(1, len(block)):
+            line = block[i].strip()
+            # Skip lines that contain metadata
+            if (line and 
+                not _LOT_LISTING_NO_RE.search(line) and
+                not _ITEM_NO_RE.match(line)):
+                description_parts.append(line)
+    
+    if description_parts:
+        item_data['description'] = ' - '.join(description_parts)
+    
+    # Only return if we have essential data and non-zero quantity
+    if (item_data['item_code'] and item_data['description'] and 
+        item_data['quantity'] and item_data['quantity'] != '0'):
+        return item_data
+    
+    return None
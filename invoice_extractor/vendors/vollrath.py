@@ -0,0 +1,219 @@
+"""Vollrath invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_ORDERED_SHIPPED_CATALOG_RE = re.compile(r'Ordered\s+Shipped\s+U/M\s+Catalog No\.\s+Item Description')
+_THE_FOLLOWING_PICKING_RE = re.compile(r'The following picking lists|Terms|Conditions|Seller warrants', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\d+\s+[A-Z]{2}\s+')
+_CUSTOMER_ORDER_NUMBER_RE = re.compile(r'Customer Order Number.*Invoice No\.')
+_HEADER_START_RE = re.compile(r'^\d{7}\s+')
+_SEVEN_DIGIT_RE = re.compile(r'^\d{7}$')
+_SHORT_DATE_RE = re.compile(r'^\d{2}/\d{2}/\d{2}$')
+_INV_RE = re.compile(r'(\d{7})(?:\s+[A-Z]+\s+\d{2}/\d{2}/\d{2})?$')
+_DATE_RE = re.compile(r'(\d{2}/\d{2}/\d{2})$')
+_ITEM_RE = re.compile(r'^(\d+)\s+\d+\s+EA\s+([A-Z0-9]+)\s+(.+?)\s+([\d.]+)\s+EA\s+[\d.]+$')
+_TERMS_SECTION_RE = re.compile(r'The following picking lists|Terms|Conditions', re.IGNORECASE)
+_BROKEN_CASE_CHARGE_RE = re.compile(r'Broken Case Charge', re.IGNORECASE)
+
+_LAYOUT = TableLayout(
+    header=_ORDERED_SHIPPED_CATALOG_RE,
+    header_words=('Ordered', 'Shipped', 'U/M'),
+    # e.g. "11 11 EA 30042M"
+    item_start=_ITEM_START_RE,
+    # Totals end the table
+    rules=(
+        LineRule(Action.STOP, _THE_FOLLOWING_PICKING_RE),
+    ),
+    skip_blank=True,
+)
+
+
+def iter_vollrath_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Vollrath invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_vollrath_invoice_info(lines)
+            
+            for block, _ in iter_item_blocks(lines, _LAYOUT, {}):
+                item_data = _parse_vollrath_item_block(block, invoice_data, page_num)
+                if item_data:
+                    yield item_data
+
+def extract_vollrath_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_vollrath_invoice_rows()."""
+    return list(iter_vollrath_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_vollrath_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Vollrath invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'order_no': '',
+        'order_date': ''
+    }
+    
+    # Look for the header line first
+    header_found = False
+    for i, line in enumerate(lines):
+        line_clean = line.strip()
+        
+        # Find the header line
+        if _CUSTOMER_ORDER_NUMBER_RE.search(line_clean):
+            header_found = True
+            continue
+        
+        # The next line after the header contains the data
+        if header_found and _HEADER_START_RE.match(line_clean):
+            # This is the data line: "0016052 01/17/24 Sales Order 4468802 RI 01/19/24"
+            parts = line_clean.split()
+            
+            # Extract fields based on expected positions
+            if len(parts) >= 6:
+                # Order number: "0016052" (first field)
+                invoice_data['order_no'] = parts[0]
+                
+                # Order date: "01/17/24" (second field)
+                if _SHORT_DATE_RE.match(parts[1]):
+                    invoice_data['order_date'] = parts[1]
+                
+                # Find invoice number - look for 7-digit number after "Sales Order"
+                for j, part in enumerate(parts):
+                    if part == 'Sales' and j + 2 < len(parts):
+                        if _SEVEN_DIGIT_RE.match(parts[j + 2]):
+                            invoice_data['invoice_number'] = parts[j + 2]
+                            break
+                
+                # If not found with "Sales Order", look for any 7-digit number
+                if not invoice_data['invoice_number']:
+                    for part in parts:
+                        if _SEVEN_DIGIT_RE.match(part) and part != invoice_data['order_no']:
+                            invoice_data['invoice_number'] = part
+                            break
+                
+                # Find invoice date - look for date pattern at the end
+                for part in reversed(parts):
+                    if _SHORT_DATE_RE.match(part):
+                        invoice_data['invoice_date'] = part
+                        break
+            
+            # Reset header flag after processing
+            header_found = False
+    
+    # Alternative approach if the above fails - look for specific patterns
+    if not invoice_data['invoice_number'] or not invoice_data['invoice_date']:
+        for line in lines:
+            line_clean = line.strip()
+            
+            # Look for invoice number pattern
+            if not invoice_data['invoice_number']:
+                inv_match = _INV_RE.search(line_clean)
+                if inv_match and inv_match.group(1) != invoice_data['order_no']:
+                    invoice_data['invoice_number'] = inv_match.group(1)
+            
+            # Look for invoice date pattern at the end of lines
+            if not invoice_data['invoice_date']:
+                date_match = _DATE_RE.search(line_clean)
+                if date_match:
+                    invoice_data['invoice_date'] = date_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_vollrath_item_block(block: List[str], invoice_data: Dict, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from Vollrath invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'order_no': invoice_data.get('order_no', ''),
+        'order_date': invoice_data.get('order_date', ''),
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'page': page_num + 1
+    }
+    
+    # Parse first line: "11 11 EA 30042M STERILIZATION TRAY/BATH SET 4" PAN 22 GA 45.9000 EA 504.90"
+    first_line = block[0].strip()
+    
+    # Use regex to parse the specific structure
+    # Format: QTY QTY EA ITEM_CODE DESCRIPTION UNIT_PRICE EA TOTAL
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['quantity'] = item_match.group(1)  # First number is quantity
+        item_data['item_code'] = item_match.group(2)  # e.g., "30042M"
+        item_data['description'] = item_match.group(3).strip()  # e.g., "STERILIZATION TRAY/BATH SET 4" PAN 22 GA"
+        item_data['unit_price'] = item_match.group(4)  # e.g., "45.9000"
+    
+    # Alternative pattern if the first one fails
+    if not item_data['item_code']:
+        # Try splitting and manual parsing
+        parts = first_line.split()
+        if len(parts) >= 7:
+            # First part is quantity: "11"
+            item_data['quantity'] = parts[0]
+            
+            # Find "EA" positions to locate fields
+            ea_positions = [i for i, part in enumerate(parts) if part == 'EA']
+            
+            if len(ea_positions) >= 2:
+                # Item code is after first "EA"
+                if ea_positions[0] + 1 < len(parts):
+                    item_data['item_code'] = parts[ea_positions[0] + 1]
+                
+                # Unit price is before second "EA"
+                if ea_positions[1] - 1 >= 0:
+                    item_data['unit_price'] = parts[ea_positions[1] - 1]
+                
+                # Description is between item code and unit price
+                desc_start = ea_positions[0] + 2
+                desc_end = ea_positions[1] - 1
+                if desc_end > desc_start:
+                    item_data['description'] = ' '.join(parts[desc_start:desc_end])
+    
+    # For multi-line descriptions, combine additional lines (like "9393-09")
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for i in range(1, len(block)):
+            line = block[i].strip()
+            # Skip lines that look like new items or summary sections
+            if (line and 
+                not _ITEM_START_RE.match(line) and
+                not _TERMS_SECTION_RE.search(line)):
+                additional_desc.append(line)
+        
+        if additional_desc:
+            item_data['description'] += ' - ' + ' '.join(additional_desc)
+    
+    # Only return if we have essential data and non-zero quantity
+    # Skip broken case charges and other non-product items
+    if (item_data['item_code'] and item_data['description'] and 
+        item_data['quantity'] and item_data['quantity'] != '0' and
+        not _BROKEN_CASE_CHARGE_RE.search(item_data['description'])):
+        return item_data
+    
+    return None
@@ -0,0 +1,194 @@
+"""WEBA invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..segment import Action, LineRule, TableLayout, iter_item_blocks
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_POS_ARTICLE_DESCRIPTION_RE = re.compile(r'POS\s+ARTICLE/\s+description\s+qty\.\s+each\s+price')
+_TOTAL_NET_PACKAGE_RE = re.compile(r'total net|package:|total/EUR|carry-over|T O T A L:', re.IGNORECASE)
+_YOUR_ORDER_NO_RE = re.compile(r'your order no\.\s*([^\s-]+)\s*-\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_LST_RE = re.compile(r'LST:\s*([^\s-]+(?:\s*-\s*[^\s]+)?)', re.IGNORECASE)
+_YOUR_ART_NO_RE = re.compile(r'your art\.-?no\.:\s*([^\s]+)', re.IGNORECASE)
+_WB_RE = re.compile(r'^\d+\s+WB\s+')
+_INVOICE_NO_RE = re.compile(r'INVOICE\s*NO\.?\s*:\s*(\d+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'Date\s*:\s*(\d{2}\.\d{2}\.\d{4})', re.IGNORECASE)
+_CUST_NO_RE = re.compile(r'Cust\.?-No\.?\s*:\s*(\d+)', re.IGNORECASE)
+_DEV_RE = re.compile(r'DEV\s*:\s*(\d+)', re.IGNORECASE)
+_OUR_SIGN_RE = re.compile(r'Our sign\s*:\s*([^\s]+)', re.IGNORECASE)
+_CRED_NO_RE = re.compile(r'Cred\.?No\.?\s*:\s*([^\s]+)', re.IGNORECASE)
+_ITEM_RE = re.compile(r'^\d+\s+WB\s+([^\s]+)\s+(.+?)\s+(\d+)\s+([\d,]+)\s+[\d,]+$')
+_ALT_RE = re.compile(r'^\d+\s+WB\s+([^\s]+)\s+(.+?)\s+(\d+)\s+([\d,]+)')
+_LOT_NUMBER_RE = re.compile(r'Lot number\s*([^/\n]+(?:\s*/\s*[^/\n]+)*)', re.IGNORECASE)
+_TOTAL_NET_OR_PACKAGE_RE = re.compile(r'total net|package:|carry-over', re.IGNORECASE)
+
+_LAYOUT = TableLayout(
+    header=_POS_ARTICLE_DESCRIPTION_RE,
+    header_words=('POS', 'ARTICLE/', 'description'),
+    # e.g. "10 WB 70-013"
+    item_start=_WB_RE,
+    rules=(
+        # Summary sections end the table
+        LineRule(Action.STOP, _TOTAL_NET_PACKAGE_RE),
+        # Each order starts a new block
+        LineRule(Action.CLOSE_SET, _YOUR_ORDER_NO_RE, ('order_no',)),
+        LineRule(Action.SET, _LST_RE, ('lst',)),
+        LineRule(Action.SET, _YOUR_ART_NO_RE, ('art_no',)),
+    ),
+    skip_blank=True,
+)
+
+
+def iter_weba_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from WEBA invoice format.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # Pages without the items table hold no items
+            if not page.may_contain(*_LAYOUT.header_words):
+                continue
+            text = page.extract_text()
+            if not text:
+                continue
+
+            lines = text.split("\n")
+            
+            # Extract invoice-level info
+            invoice_data = _extract_weba_invoice_info(lines)
+            
+            context = {'order_no': '', 'lst': '', 'art_no': ''}
+            for block, item_context in iter_item_blocks(lines, _LAYOUT, context):
+                item_data = _parse_weba_item_block(block, invoice_data, item_context['order_no'],
+                                                   item_context['lst'], item_context['art_no'], page_num)
+                if item_data:
+                    yield item_data
+
+def extract_weba_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_weba_invoice_rows()."""
+    return list(iter_weba_invoice_rows(pdf_content))
+
+@timed("header")
+def _extract_weba_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from WEBA invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer_number': '',
+        'dev_no': '',
+        'our_sign': '',
+        'cred_no': ''
+    }
+    
+    for line in lines:
+        line_clean = line.strip()
+        
+        # Extract invoice number: "INVOICE NO. : 510916"
+        inv_match = _INVOICE_NO_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date: "Date : 27.06.2023"
+        date_match = _DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer number: "Cust.-No. : 56644"
+        cust_match = _CUST_NO_RE.search(line_clean)
+        if cust_match and not invoice_data['customer_number']:
+            invoice_data['customer_number'] = cust_match.group(1)
+        
+        # Extract DEV number: "DEV : 8010282"
+        dev_match = _DEV_RE.search(line_clean)
+        if dev_match and not invoice_data['dev_no']:
+            invoice_data['dev_no'] = dev_match.group(1)
+        
+        # Extract our sign: "Our sign : TSC"
+        sign_match = _OUR_SIGN_RE.search(line_clean)
+        if sign_match and not invoice_data['our_sign']:
+            invoice_data['our_sign'] = sign_match.group(1)
+        
+        # Extract credit number: "Cred.No. : 02-2500101"
+        cred_match = _CRED_NO_RE.search(line_clean)
+        if cred_match and not invoice_data['cred_no']:
+            invoice_data['cred_no'] = cred_match.group(1)
+    
+    return invoice_data
+
+@timed("parse")
+def _parse_weba_item_block(block: List[str], invoice_data: Dict, order_no: str, lst_no: str, art_no: str, page_num: int) -> Optional[Dict]:
+    """Parse an individual item block from WEBA invoice"""
+    if not block:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer_number': invoice_data['customer_number'],
+        'dev_no': invoice_data.get('dev_no', ''),
+        'our_sign': invoice_data.get('our_sign', ''),
+        'cred_no': invoice_data.get('cred_no', ''),
+        'order_no': order_no,
+        'lst_no': lst_no,
+        'art_no': art_no,
+        'item_code': '',
+        'description': '',
+        'quantity': '',
+        'unit_price': '',
+        'lot_number': '',
+        'page': page_num + 1
+    }
+    
+    # Parse first line: "10 WB 70-013 Citelly Rongeur 2,0 mm bite 1 185,60 185,60"
+    first_line = block[0].strip()
+    
+    # Parse the item line
+    item_match = _ITEM_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_code'] = "WB " + item_match.group(1)  # e.g., "WB 70-013"
+        item_data['description'] = item_match.group(2).strip()  # e.g., "Citelly Rongeur 2,0 mm bite"
+        item_data['quantity'] = item_match.group(3)
+        item_data['unit_price'] = item_match.group(4)
+    
+    # Alternative pattern for different formatting
+    if not item_data['item_code']:
+        alt_match = _ALT_RE.search(first_line)
+        if alt_match:
+            item_data['item_code'] = "WB " + alt_match.group(1)
+            item_data['description'] = alt_match.group(2).strip()
+            item_data['quantity'] = alt_match.group(3)
+            item_data['unit_price'] = alt_match.group(4)
+    
+    # Extract lot number from the block: "Lot number 07/2016-023 / WE"
+    for line in block:
+        lot_match = _LOT_NUMBER_RE.search(line)
+        if lot_match and not item_data['lot_number']:
+            item_data['lot_number'] = lot_match.group(1).strip()
+            break
+    
+    # For multi-line descriptions, combine additional lines
+    if len(block) > 1 and item_data['description']:
+        additional_desc = []
+        for i in range(1, len(block)):
+            line = block[i].strip()
+            # Skip lines that contain lot numbers or look like new items
+            if (line and 
+                not _LOT_NUMBER_RE.search(line) and
+                not _WB_RE.match(line) and
+                not _TOTAL_NET_OR_PACKAGE_RE.search(line)):
+                additional_desc.append(line)
+        
+        if additional_desc:
+            item_data['description'] += ' - ' + ' '.join(additional_desc)
+    
+    # Only return if we have essential data and non-zero quantity
+    if (item_data['item_code'] and item_data['description'] and 
+        item_data['quantity'] and item_data['quantity'] != '0'):
+        return item_data
+    
+    return None
@@ -0,0 +1,423 @@
+"""Y&W invoice extractor."""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from ..document import DocumentSource, open_document
+from ..timing import timed
+
+
+# Patterns, compiled once at import time
+_ITEM_QUANTITY_DESCRIPTION_RE = re.compile(r'Item\s+Quantity\s+Description\s+Revision\s+Unit Price\s+Amount')
+_SUB_TOTAL_SALES_RE = re.compile(r'Sub-total:|Sales Tax:|Shipping Charges:|Invoice Total:', re.IGNORECASE)
+_ITEM_START_RE = re.compile(r'^\d+\s+\d+\s+[A-Z]')
+_REPORT_GENERATED_RE = re.compile(r'Report Generated:', re.IGNORECASE)
+_PAGE_OF_RE = re.compile(r'Page \d+ of \d+', re.IGNORECASE)
+_HEADER_FIELD_RE = re.compile(r'\d{1,2}:\d{2}:\d{2}[AP]M', re.IGNORECASE)
+_ITEM_RE = re.compile(r'^(\d+)\s+(\d+)\s+([A-Z][A-Z0-9-]+)\s*-?\s*(.+?)\s*\$?([\d,]+\.\d{2})/?\s*[A-Z]+\s*\$?[\d,]+\.\d{2}')
+_ITEM_LOOSE_RE = re.compile(r'^(\d+)\s+(\d+)\s+([A-Z][A-Z0-9-]+)\s*(.+?)\s*\$?([\d,]+\.\d{2})')
+_ORDER_NO_RE = re.compile(r'Order No:\s*(\d+)', re.IGNORECASE)
+_PACKING_LIST_RE = re.compile(r'Packing List:\s*(\d+)', re.IGNORECASE)
+_ORDER_NO_PACKING_RE = re.compile(r'Order No:|Packing List:', re.IGNORECASE)
+_ITEM_FIELD_RE = re.compile(r'\$?[\d,]+\.\d{2}/?\s*[A-Z]*\s*\$?[\d,]*\.?\d*')
+_WHITESPACE_RE = re.compile(r'\s+')
+_ITEM_QTY_LOT_RE = re.compile(r'ITEM#\s+QTY\s+LOT#\s+DESCRIPTION')
+_NOVO_ITEM_START_RE = re.compile(r'^\d+\s+\d+\s+NOVO SURGICAL INSTRUMENTS')
+_NOVO_SURGICAL_INSTRUMENTS_RE = re.compile(r'^(\d+)\s+(\d+)\s+NOVO SURGICAL INSTRUMENTS\s*-?\s*(.+?)\s*\$?([\d,]+\.\d{2})/?\s*[A-Z]+\s*\$?[\d,]+\.\d{2}')
+_INVOICE_NUMBER_RE = re.compile(r'Invoice Number:\s*(\d+)', re.IGNORECASE)
+_INVOICE_DATE_RE = re.compile(r'Invoice Date:\s*(\d{2}/\d{2}/\d{4})', re.IGNORECASE)
+_CUST_RE = re.compile(r'Customer:\s*([^\n]+)', re.IGNORECASE)
+_PO_NUMBER_RE = re.compile(r'PO Number:\s*([^\n]+)', re.IGNORECASE)
+_JOB_LOT_RE = re.compile(r'JOB/LOT#\s*([^\n]+)', re.IGNORECASE)
+_TERMS_RE = re.compile(r'Terms:\s*([^\n]+)', re.IGNORECASE)
+_SALESMAN_RE = re.compile(r'Salesman:\s*([^\n]+)', re.IGNORECASE)
+
+
+def iter_yw_invoice_rows(pdf_content: DocumentSource) -> Iterator[Dict]:
+    """
+    Extract data from Y&W invoice format.
+    Handles both layout variations automatically.
+    Yields a dictionary containing the extracted data for each line item.
+    """
+    with open_document(pdf_content) as pdf:
+        full_text = pdf.full_text
+        
+        # Determine invoice format based on content
+        if "ITEM# QTY LOT# DESCRIPTION" in full_text:
+            yield from _extract_yw_format_v2(full_text)
+        else:
+            yield from _extract_yw_format_v1(full_text)
+
+def extract_yw_invoice_data(pdf_content: DocumentSource) -> List[Dict]:
+    """List-returning wrapper around iter_yw_invoice_rows()."""
+    return list(iter_yw_invoice_rows(pdf_content))
+
+def _extract_yw_format_v1(full_text: str) -> List[Dict]:
+    """Extract data from Y&W Format V1 (like Invoice #95597)"""
+    extracted_data = []
+    lines = full_text.split("\n")
+    
+    # Extract invoice-level info
+    invoice_data = _extract_yw_invoice_info(lines)
+    
+    # Find all item sections across all pages
+    item_sections = _extract_item_sections_v1(lines)
+    
+    # Track processed items to avoid duplicates
+    processed_items = set()
+    
+    # Process each item section
+    for item_lines in item_sections:
+        item_data = _parse_yw_item_lines_v1(item_lines, invoice_data)
+        if item_data:
+            # Create a unique key for this item to avoid duplicates
+            item_key = f"{item_data['item_number']}_{item_data['item_code']}_{item_data['order_no']}_{item_data['packing_list']}"
+            
+            if item_key not in processed_items:
+                processed_items.add(item_key)
+                extracted_data.append(item_data)
+    
+    return extracted_data
+
+@timed("segment")
+def _extract_item_sections_v1(lines: List[str]) -> List[List[str]]:
+    """Extract item sections from V1 format"""
+    item_sections = []
+    current_section = []
+    in_items_section = False
+    found_items = False
+    
+    for i, line in enumerate(lines):
+        line_clean = line.strip()
+        
+        # Look for the start of the items section
+        if _ITEM_QUANTITY_DESCRIPTION_RE.search(line_clean):
+            in_items_section = True
+            found_items = True
+            continue
+        
+        if not in_items_section:
+            continue
+        
+        # Stop at summary sections (but only after we've found items)
+        if found_items and _SUB_TOTAL_SALES_RE.search(line_clean):
+            if current_section:
+                item_sections.append(current_section)
+                current_section = []
+            in_items_section = False
+            continue
+        
+        # Look for item lines (they start with numbers like "1 2 E7210-44E")
+        if _ITEM_START_RE.match(line_clean):  # e.g., "1 2 E7210-44E"
+            if current_section:
+                item_sections.append(current_section)
+            current_section = [line_clean]
+        elif current_section and line_clean:
+            # Continue collecting lines for the current item
+            # Skip page headers/footers
+            if not _is_page_header_footer(line_clean):
+                current_section.append(line_clean)
+    
+    if current_section:
+        item_sections.append(current_section)
+    
+    return item_sections
+
+def _is_page_header_footer(line: str) -> bool:
+    """Check if a line is a page header or footer"""
+    line_clean = line.strip()
+    # Page headers/footers typically contain dates, page numbers, or report generated info
+    if (_REPORT_GENERATED_RE.search(line_clean) or
+        _PAGE_OF_RE.search(line_clean) or
+        _HEADER_FIELD_RE.search(line_clean)):
+        return True
+    return False
+
+@timed("parse")
+def _parse_yw_item_lines_v1(item_lines: List[str], invoice_data: Dict) -> Optional[Dict]:
+    """Parse item lines from V1 format"""
+    if not item_lines:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer': invoice_data['customer'],
+        'po_number': invoice_data['po_number'],
+        'lot_no': invoice_data['lot_no'],
+        'order_no': '',
+        'packing_list': '',
+        'item_number': '',
+        'quantity': '',
+        'item_code': '',
+        'description': '',
+        'unit_price': '',
+    }
+    
+    # Parse first line (main item line)
+    first_line = item_lines[0].strip()
+    
+    # Improved regex pattern for V1 format
+    # Pattern for: "1 2 E7210-44E - FARRIOR EAR SPEC, OVAL ANGLED $200.00/ LOT $200.00"
+    item_match = _ITEM_RE.search(first_line)
+    
+    if not item_match:
+        # Alternative pattern for different formatting
+        item_match = _ITEM_LOOSE_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_number'] = item_match.group(1)
+        item_data['quantity'] = item_match.group(2)
+        item_data['item_code'] = item_match.group(3)
+        item_data['description'] = item_match.group(4).strip()
+        item_data['unit_price'] = item_match.group(5)
+    
+    # Process additional lines for description continuation and order/packing info
+    for line in item_lines[1:]:
+        line_clean = line.strip()
+        
+        # Skip page headers/footers
+        if _is_page_header_footer(line_clean):
+            continue
+            
+        # Look for order number
+        order_match = _ORDER_NO_RE.search(line_clean)
+        if order_match and not item_data['order_no']:
+            item_data['order_no'] = order_match.group(1)
+            continue
+        
+        # Look for packing list
+        packing_match = _PACKING_LIST_RE.search(line_clean)
+        if packing_match and not item_data['packing_list']:
+            item_data['packing_list'] = packing_match.group(1)
+            continue
+        
+        # If line doesn't contain order/packing info and is not empty, add to description
+        if (line_clean and 
+            not _ORDER_NO_PACKING_RE.search(line_clean) and
+            not _ITEM_START_RE.match(line_clean) and
+            not _is_page_header_footer(line_clean)):
+            item_data['description'] += ' ' + line_clean
+    
+    # Clean up description - remove price patterns if they ended up in description
+    item_data['description'] = _ITEM_FIELD_RE.sub('', item_data['description']).strip()
+    item_data['description'] = _WHITESPACE_RE.sub(' ', item_data['description']).strip()
+    
+    return item_data if item_data['item_code'] and item_data['quantity'] else None
+
+def _extract_yw_format_v2(full_text: str) -> List[Dict]:
+    """Extract data from Y&W Format V2 (like Invoice #96833)"""
+    extracted_data = []
+    lines = full_text.split("\n")
+    
+    # Extract invoice-level info
+    invoice_data = _extract_yw_invoice_info(lines)
+    
+    # Find all item sections
+    item_sections = _extract_item_sections_v2(lines)
+    
+    # Track processed items to avoid duplicates
+    processed_items = set()
+    
+    # Process each item section
+    for item_lines in item_sections:
+        item_data = _parse_yw_item_lines_v2(item_lines, invoice_data)
+        if item_data:
+            # Create a unique key for this item to avoid duplicates
+            item_key = f"{item_data['item_number']}_{item_data['item_code']}_{item_data['order_no']}_{item_data['packing_list']}"
+            
+            if item_key not in processed_items:
+                processed_items.add(item_key)
+                extracted_data.append(item_data)
+    
+    return extracted_data
+
+@timed("segment")
+def _extract_item_sections_v2(lines: List[str]) -> List[List[str]]:
+    """Extract item sections from V2 format"""
+    item_sections = []
+    current_section = []
+    in_items_section = False
+    found_items = False
+    
+    for i, line in enumerate(lines):
+        line_clean = line.strip()
+        
+        # Look for the start of the items section in V2 format
+        if _ITEM_QUANTITY_DESCRIPTION_RE.search(line_clean):
+            in_items_section = True
+            found_items = True
+            continue
+        
+        if not in_items_section:
+            # Also check for the ITEM# QTY LOT# DESCRIPTION format
+            if _ITEM_QTY_LOT_RE.search(line_clean):
+                in_items_section = True
+                found_items = True
+            continue
+        
+        # Stop at summary sections (but only after we've found items)
+        if found_items and _SUB_TOTAL_SALES_RE.search(line_clean):
+            if current_section:
+                item_sections.append(current_section)
+                current_section = []
+            in_items_section = False
+            continue
+        
+        # Look for item lines in V2 format
+        if _NOVO_ITEM_START_RE.match(line_clean):
+            if current_section:
+                item_sections.append(current_section)
+            current_section = [line_clean]
+        elif current_section and line_clean:
+            # Continue collecting lines for the current item
+            # Skip page headers/footers
+            if not _is_page_header_footer(line_clean):
+                current_section.append(line_clean)
+    
+    if current_section:
+        item_sections.append(current_section)
+    
+    return item_sections
+
+@timed("parse")
+def _parse_yw_item_lines_v2(item_lines: List[str], invoice_data: Dict) -> Optional[Dict]:
+    """Parse item lines from V2 format"""
+    if not item_lines:
+        return None
+    
+    item_data = {
+        'invoice_date': invoice_data['invoice_date'],
+        'invoice_number': invoice_data['invoice_number'],
+        'customer': invoice_data['customer'],
+        'po_number': invoice_data['po_number'],
+        'lot_no': invoice_data['lot_no'],
+        'order_no': '',
+        'packing_list': '',
+        'item_number': '',
+        'quantity': '',
+        'item_code': 'NOVO SURGICAL INSTRUMENTS',
+        'description': '',
+        'unit_price': '',
+    }
+    
+    # Parse first line
+    first_line = item_lines[0].strip()
+    
+    # Pattern for: "1 6 NOVO SURGICAL INSTRUMENTS - Ebonize $200.00/ LOT $200.00"
+    item_match = _NOVO_SURGICAL_INSTRUMENTS_RE.search(first_line)
+    
+    if item_match:
+        item_data['item_number'] = item_match.group(1)
+        item_data['quantity'] = item_match.group(2)
+        item_data['description'] = f"NOVO SURGICAL INSTRUMENTS - {item_match.group(3).strip()}"
+        item_data['unit_price'] = item_match.group(4)
+    
+    # Process additional lines for order/packing info
+    for line in item_lines[1:]:
+        line_clean = line.strip()
+        
+        # Skip page headers/footers
+        if _is_page_header_footer(line_clean):
+            continue
+            
+        # Look for order number
+        order_match = _ORDER_NO_RE.search(line_clean)
+        if order_match and not item_data['order_no']:
+            item_data['order_no'] = order_match.group(1)
+            continue
+        
+        # Look for packing list
+        packing_match = _PACKING_LIST_RE.search(line_clean)
+        if packing_match and not item_data['packing_list']:
+            item_data['packing_list'] = packing_match.group(1)
+            continue
+    
+    return item_data if item_data['quantity'] else None
+
+@timed("header")
+def _extract_yw_invoice_info(lines: List[str]) -> Dict[str, str]:
+    """Extract invoice information from Y&W invoice"""
+    invoice_data = {
+        'invoice_number': '',
+        'invoice_date': '',
+        'customer': '',
+        'po_number': '',
+        'lot_no': '',
+        'ship_to_address': '',
+        'sold_to_address': '',
+        'terms': '',
+        'salesman': ''
+    }
+    
+    ship_to_lines = []
+    sold_to_lines = []
+    in_ship_to = False
+    in_sold_to = False
+    
+    for i, line in enumerate(lines):
+        line_clean = line.strip()
+        
+        # Skip page headers/footers
+        if _is_page_header_footer(line_clean):
+            continue
+            
+        # Extract invoice number
+        inv_match = _INVOICE_NUMBER_RE.search(line_clean)
+        if inv_match and not invoice_data['invoice_number']:
+            invoice_data['invoice_number'] = inv_match.group(1)
+        
+        # Extract invoice date
+        date_match = _INVOICE_DATE_RE.search(line_clean)
+        if date_match and not invoice_data['invoice_date']:
+            invoice_data['invoice_date'] = date_match.group(1)
+        
+        # Extract customer
+        cust_match = _CUST_RE.search(line_clean)
+        if cust_match and not invoice_data['customer']:
+            invoice_data['customer'] = cust_match.group(1).strip()
+        
+        # Extract PO number
+        po_match = _PO_NUMBER_RE.search(line_clean)
+        if po_match and not invoice_data['po_number']:
+            invoice_data['po_number'] = po_match.group(1).strip()
+        
+        # Extract JOB/LOT numbers - renamed to lot_no
+        job_match = _JOB_LOT_RE.search(line_clean)
+        if job_match and not invoice_data['lot_no']:
+            invoice_data['lot_no'] = job_match.group(1).strip()
+        
+        # Extract terms
+        terms_match = _TERMS_RE.search(line_clean)
+        if terms_match and not invoice_data['terms']:
+            invoice_data['terms'] = terms_match.group(1).strip()
+        
+        # Extract salesman
+        salesman_match = _SALESMAN_RE.search(line_clean)
+        if salesman_match and not invoice_data['salesman']:
+            invoice_data['salesman'] = salesman_match.group(1).strip()
+        
+        # Extract ship to address
+        if 'Ship' in line_clean and 'To:' in line_clean:
+            in_ship_to = True
+            in_sold_to = False
+            continue
+        elif 'Sold' in line_clean and 'To:' in line_clean:
+            in_sold_to = True
+            in_ship_to = False
+            continue
+        elif 'Invoice Number:' in line_clean:
+            in_ship_to = False
+            in_sold_to = False
+        
+        if in_ship_to and line_clean and not any(x in line_clean for x in ['Ship', 'To:']):
+            ship_to_lines.append(line_clean)
+        elif in_sold_to and line_clean and not any(x in line_clean for x in ['Sold', 'To:']):
+            sold_to_lines.append(line_clean)
+    
+    # Combine address lines
+    if ship_to_lines:
+        invoice_data['ship_to_address'] = ' '.join(ship_to_lines).strip()
+    if sold_to_lines:
+        invoice_data['sold_to_address'] = ' '.join(sold_to_lines).strip()
+    
+    return invoice_data